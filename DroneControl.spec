@@ -1,34 +1,40 @@
 # -*- mode: python ; coding: utf-8 -*-
+# Сборка onedir: программа запускается прямо из dist\DroneControl, без распаковки
+# всего архива во временный каталог при каждом запуске (как у --onefile).
+# Перед сборкой: python compile_ui.py (скомпилированный интерфейс ui_hud.py)
+# и python mavlink_dialect.py (облегченный диалект MAVLink в mavlink_dialects).
 
 
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('UI_HUD.ui', '.')],
-    hiddenimports=[],
+    # Облегченный диалект импортируется из mavlink_dialects как pymavlink.dialects.*.dronecontrol
+    datas=[('UI_HUD.ui', '.'), ('mavlink_dialects', 'mavlink_dialects')],
+    # Диалекты, которые mavutil импортирует по имени во время работы
+    hiddenimports=['pymavlink.dialects.v10.all', 'pymavlink.dialects.v20.all'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=['tkinter'],
     noarchive=False,
-    optimize=0,
+    # Байткод собирается заранее с -O (без assert)
+    optimize=1,
 )
 pyz = PYZ(a.pure)
 
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='DroneControl',
+    icon='icon.ico',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    # Библиотеки, сжатые UPX, распаковываются в память при каждой загрузке
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -36,3 +42,12 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='DroneControl',
+)
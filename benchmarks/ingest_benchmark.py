@@ -0,0 +1,266 @@
+"""Сквозной бенчмарк приема телеметрии: симулятор -> MAVLinkConnection -> coalescer -> HUD
+
+Для каждой комбинации числа аппаратов и частоты потоков запускается
+simulator.py в отдельном процессе (чтобы не делить с приложением GIL), окно
+DroneControlApp (offscreen) подключается к нему и в течение duration секунд
+считаются:
+  - msgs_per_s      - принятые линками сообщения в секунду;
+  - dropped         - потери по счетчику seq MAVLink;
+  - latency p50/p99 - от декодирования значения до отрисовки кадра в GUI потоке;
+  - gui_cpu_percent - процессорное время GUI потока к длительности замера;
+  - rss_mb          - память процесса в конце замера.
+
+Результаты пишутся в JSON; с --compare сравниваются с сохраненной базовой
+линией, регрессии печатаются и дают код выхода 1.
+
+    python benchmarks/ingest_benchmark.py --vehicles 1,10,50 --rates 1,10,50,200
+    python benchmarks/ingest_benchmark.py --output benchmarks/baselines/my-pc.json
+    python benchmarks/ingest_benchmark.py --compare benchmarks/baselines/my-pc.json
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication
+
+import main
+from simulator import DEFAULT_RATES, SimulatorFleet
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+# Потоки телеметрии симулятора с частотой --rate (HEARTBEAT всегда 1 Гц)
+TELEMETRY_STREAMS = len(DEFAULT_RATES) - 1
+# Допуски при сравнении с базовой линией
+THROUGHPUT_TOLERANCE = 0.10  # падение msgs/s больше чем на 10%
+LATENCY_TOLERANCE = 0.25  # рост p99 больше чем на 25% ...
+LATENCY_SLACK_MS = 2.0  # ... и больше чем на 2 мс (шум таймеров)
+
+
+def rss_mb():
+    """Текущий RSS процесса (пиковый, если /proc недоступен)"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux отдает КБ, macOS - байты
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 1024
+
+
+def wait(seconds, until=None):
+    """Прокрутка цикла событий Qt (GUI поток продолжает работать как в приложении)"""
+    deadline = time.monotonic() + seconds
+    loop = QEventLoop()
+    while time.monotonic() < deadline:
+        if until is not None and until():
+            return True
+        QTimer.singleShot(int(min(50, max(1, (deadline - time.monotonic()) * 1000))), loop.quit)
+        loop.exec_()
+    return until() if until is not None else True
+
+
+def start_simulator(vehicles, rate, protocol):
+    links = -(-vehicles // SimulatorFleet.MAX_VEHICLES_PER_LINK)
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "simulator.py"), "--vehicles", str(vehicles), "--links", str(links),
+         "--protocol", protocol, "--port", "0", "--rate", str(rate)],
+        stdout=subprocess.PIPE, text=True
+    )
+    addresses = []
+    for _ in range(links):
+        line = proc.stdout.readline().strip()
+        proto, rest = line.split("://")
+        host, port = rest.rsplit(":", 1)
+        addresses.append((proto, host, int(port)))
+    return proc, addresses
+
+
+def link_counters(link_manager):
+    received = lost = 0
+    for link in link_manager.links.values():
+        connection = link.connection
+        if connection is not None:
+            received += connection.mav_count
+            lost += connection.mav_loss
+    return received, lost
+
+
+def run_case(window, vehicles, rate, protocol, duration, warmup):
+    link_manager = window.link_manager
+    proc, addresses = start_simulator(vehicles, rate, protocol)
+    latencies = []
+    measuring = [False]
+
+    def on_frame(vehicle_id, changed):
+        # Подключен после слотов окна - вызывается уже после отрисовки HUD
+        if not measuring[0]:
+            return
+        link = link_manager.links.get(vehicle_id[0])
+        vehicle = link.vehicles.get(vehicle_id[1:]) if link else None
+        if vehicle is not None:
+            latencies.append(time.time() - vehicle.telemetry.timestamp)
+
+    link_manager.vehicle_telemetry_updated.connect(on_frame)
+    try:
+        for address in addresses:
+            link_manager.create_link(*address).connect()
+        wait(warmup + 10, until=lambda: len(link_manager.vehicle_ids()) >= vehicles)
+        wait(warmup)
+        discovered = len(link_manager.vehicle_ids())
+
+        received0, lost0 = link_counters(link_manager)
+        cpu0 = time.thread_time()
+        start = time.monotonic()
+        measuring[0] = True
+        wait(duration)
+        measuring[0] = False
+        elapsed = time.monotonic() - start
+        cpu = time.thread_time() - cpu0
+        received, lost = link_counters(link_manager)
+    finally:
+        link_manager.vehicle_telemetry_updated.disconnect(on_frame)
+        window.disconnect_drone()
+        proc.terminate()
+        proc.wait(timeout=5)
+        wait(0.2)
+
+    latency_ms = np.array(latencies) * 1000.0
+    memory = rss_mb()
+    return {
+        "vehicles": vehicles,
+        "rate_hz": rate,
+        "protocol": protocol,
+        "discovered": discovered,
+        "expected_msgs_per_s": vehicles * (1 + TELEMETRY_STREAMS * rate),
+        "msgs_per_s": round((received - received0) / elapsed, 1),
+        "dropped": lost - lost0,
+        "frames": len(latencies),
+        "latency_p50_ms": round(float(np.percentile(latency_ms, 50)), 2) if len(latency_ms) else None,
+        "latency_p99_ms": round(float(np.percentile(latency_ms, 99)), 2) if len(latency_ms) else None,
+        "gui_cpu_percent": round(100.0 * cpu / elapsed, 1),
+        "rss_mb": round(memory, 1) if memory is not None else None,
+    }
+
+
+def compare(results, baseline):
+    """Список регрессий относительно базовой линии"""
+    reference = {(r["vehicles"], r["rate_hz"], r["protocol"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        key = (result["vehicles"], result["rate_hz"], result["protocol"])
+        base = reference.get(key)
+        if base is None:
+            continue
+        name = f"{key[0]} апаратів @ {key[1]} Гц ({key[2]})"
+        if result["msgs_per_s"] < base["msgs_per_s"] * (1 - THROUGHPUT_TOLERANCE):
+            regressions.append(f"{name}: msgs/s {base['msgs_per_s']} -> {result['msgs_per_s']}")
+        if result["dropped"] > base["dropped"] and result["dropped"] > 0.01 * result["msgs_per_s"]:
+            regressions.append(f"{name}: втрати {base['dropped']} -> {result['dropped']}")
+        old, new = base.get("latency_p99_ms"), result.get("latency_p99_ms")
+        if old is not None and new is not None and new > old * (1 + LATENCY_TOLERANCE) and new - old > LATENCY_SLACK_MS:
+            regressions.append(f"{name}: p99 {old} мс -> {new} мс")
+    return regressions
+
+
+def print_row(result):
+    print(f"{result['vehicles']:>5} {result['rate_hz']:>6g} {result['msgs_per_s']:>10.0f} "
+          f"{result['expected_msgs_per_s']:>10.0f} {result['dropped']:>7} "
+          f"{result['latency_p50_ms'] if result['latency_p50_ms'] is not None else '-':>8} "
+          f"{result['latency_p99_ms'] if result['latency_p99_ms'] is not None else '-':>8} "
+          f"{result['gui_cpu_percent']:>6} {result['rss_mb'] if result['rss_mb'] is not None else '-':>7}", flush=True)
+
+
+def parse_list(text, cast):
+    return [cast(item) for item in text.split(",") if item]
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Бенчмарк приему телеметрії")
+    parser.add_argument("--vehicles", default="1,10,50,100", help="кількість апаратів, через кому")
+    parser.add_argument("--rates", default="1,10,50,200", help="частоти потоків телеметрії, Гц, через кому")
+    parser.add_argument("--protocol", choices=("TCP", "UDP", "SERIAL"), default="TCP")
+    parser.add_argument("--duration", type=float, default=5.0, help="тривалість заміру, с")
+    parser.add_argument("--warmup", type=float, default=2.0, help="прогрів після підключення, с")
+    parser.add_argument("--output", help="файл результатів JSON (за замовчуванням benchmarks/results/)")
+    parser.add_argument("--compare", help="базова лінія JSON для пошуку регресій")
+    args = parser.parse_args()
+
+    # Ссылка держит QApplication до конца замеров: без нее PyQt сразу удалит приложение
+    app = QApplication.instance() or QApplication(sys.argv)
+    # Записи tlog, журнал и кеш параметров бенчмарка не должны попадать в каталоги пользователя
+    workdir = tempfile.mkdtemp(prefix="bench-")
+    main.TLOG_DIR = os.path.join(workdir, "tlogs")
+    main.LOG_DIR = os.path.join(workdir, "logs")
+    main.PARAM_DIR = os.path.join(workdir, "params")
+    window = main.DroneControlApp()
+    window.add_log = lambda message: None
+    # Частоты задает --rate симулятора, профиль приложения их не переопределяет
+    window.link_manager.stream_profile = None
+    # Загрузка параметров нагружала бы линки сверх потоков телеметрии
+    window.link_manager.parameter_directory = None
+    window.link_manager.parameter_cache = None
+    # Кнопки ARM/DISARM инициализируются отложенно
+    wait(0.7)
+
+    print(f"{'апар.':>5} {'Гц':>6} {'msgs/s':>10} {'очік.':>10} {'втрати':>7} {'p50 мс':>8} {'p99 мс':>8} {'GUI %':>6} {'RSS МБ':>7}")
+    results = []
+    for vehicles in parse_list(args.vehicles, int):
+        for rate in parse_list(args.rates, float):
+            result = run_case(window, vehicles, rate, args.protocol, args.duration, args.warmup)
+            results.append(result)
+            print_row(result)
+    window.link_manager.shutdown()
+    window.log_sink.stop()
+    shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "machine": platform.node(),
+            "duration_s": args.duration,
+            "coalescer_rate_hz": window.link_manager.coalescer.rate_hz,
+        },
+        "results": results,
+    }
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"ingest-{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Результати: {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f))
+        for regression in regressions:
+            print(f"❌ Регресія: {regression}")
+        if regressions:
+            return 1
+        print("✅ Регресій немає")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
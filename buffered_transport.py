@@ -0,0 +1,117 @@
+import errno
+import socket
+import time
+from collections import deque
+from mavlink_dialect import mavutil
+
+
+class BufferedReader:
+    """Чтение транспорта mavutil крупными блоками с пакетным разбором
+
+    mavutil читает ровно столько байт, сколько парсеру не хватает до конца
+    кадра: на каждое сообщение - несколько системных вызовов и вызовов
+    parse_char. Здесь за один вызов _read_chunk() забирается все, что уже
+    принято (до READ_SIZE), блок целиком разбирается parse_buffer, а
+    recv_batch() отдает все готовые сообщения блока одним списком.
+    Наследники реализуют _read_chunk() (пустой блок - данных пока нет).
+    """
+    READ_SIZE = 65536
+    # Получатель сырых блоков до разбора (маршрутизатор), вызывается с каждым блоком
+    raw_sink = None
+
+    def _init_buffer(self):
+        self._messages = deque()
+        self.bytes_read = 0
+        self.reads = 0
+
+    def _read_chunk(self):
+        raise NotImplementedError
+
+    def _parse_chunk(self):
+        data = self._read_chunk()
+        if not data:
+            return None
+        self.reads += 1
+        self.bytes_read += len(data)
+        if self.raw_sink is not None:
+            self.raw_sink(data)
+        if self.first_byte:
+            # Может заменить self.mav парсером MAVLink 2 - до разбора блока
+            self.auto_mavlink_version(data)
+        return self.mav.parse_buffer(data) or []
+
+    def recv_batch(self):
+        """Все готовые сообщения очередного блока ([] - данных пока нет)"""
+        self.pre_message()
+        batch = list(self._messages)
+        self._messages.clear()
+        while not batch:
+            messages = self._parse_chunk()
+            if messages is None:
+                break
+            batch = messages
+        for msg in batch:
+            self.post_message(msg)
+        return batch
+
+    def recv_msg(self):
+        self.pre_message()
+        while not self._messages:
+            messages = self._parse_chunk()
+            if messages is None:
+                return None
+            self._messages.extend(messages)
+        msg = self._messages.popleft()
+        self.post_message(msg)
+        return msg
+
+
+class BufferedTCP(BufferedReader, mavutil.mavtcp):
+    """TCP клиент (tcp:host:port) с чтением блоками"""
+
+    def __init__(self, device, source_system=255, source_component=0, retries=3, reconnect_delay=1):
+        super().__init__(device, source_system=source_system, source_component=source_component, retries=retries,
+                         reconnect_delay=reconnect_delay)
+        self._init_buffer()
+
+    def _read_chunk(self):
+        if self.port is None:
+            self.reconnect()
+        try:
+            data = self.port.recv(self.READ_SIZE)
+        except socket.error as e:
+            if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return b""
+            if e.errno in (errno.ECONNRESET, errno.EPIPE):
+                self.handle_disconnect()
+            raise
+        if not data:
+            self.handle_eof()
+        return data
+
+
+class BufferedUDP(BufferedReader, mavutil.mavudp):
+    """UDP (udpin:host:port) с чтением всех накопленных датаграмм за раз"""
+    MAX_DATAGRAMS = 256  # датаграмм в одном блоке, чтобы поток линка не захватывал пул надолго
+
+    def __init__(self, device, source_system=255, source_component=0):
+        super().__init__(device, input=True, source_system=source_system, source_component=source_component)
+        self._init_buffer()
+
+    def _read_chunk(self):
+        chunks = []
+        size = 0
+        while len(chunks) < self.MAX_DATAGRAMS and size < self.READ_SIZE:
+            try:
+                data, address = self.port.recvfrom(mavutil.UDP_MAX_PACKET_LEN)
+            except socket.error as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK, errno.ECONNREFUSED):
+                    break
+                raise
+            # Как mavudp.recv: ответы уходят всем, кто присылал данные
+            if self.udp_server:
+                self.clients.add(address)
+                self.clients_last_alive[address] = time.time()
+            chunks.append(data)
+            size += len(data)
+        return b"".join(chunks)
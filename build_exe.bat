@@ -5,20 +5,25 @@ echo.
 REM Удаляем старые файлы сборки
 if exist "build" rmdir /s /q "build"
 if exist "dist" rmdir /s /q "dist"
-if exist "*.spec" del "*.spec"
 
-REM Создаем exe файл
-pyinstaller --onefile --windowed --noconsole --add-data "UI_HUD.ui;." --icon=icon.ico --name="DroneControl" main.py
+REM Компилируем интерфейс (ui_hud.py): окно не разбирает UI_HUD.ui при запуске
+python compile_ui.py
+
+REM Генерируем облегченный диалект MAVLink (только сообщения программы)
+python mavlink_dialect.py
+
+REM Собираем по DroneControl.spec: папка программы (onedir) без распаковки при каждом запуске
+pyinstaller --noconfirm DroneControl.spec
 
 REM Проверяем результат
-if exist "dist\DroneControl.exe" (
+if exist "dist\DroneControl\DroneControl.exe" (
     echo.
-    echo ✅ Успішно створено DroneControl.exe у папці dist\
+    echo ✅ Успішно створено DroneControl.exe у папці dist\DroneControl\
     echo.
     echo Файли:
-    dir dist\
+    dir dist\DroneControl\
     echo.
-    echo Запустіть DroneControl.exe з папки dist\
+    echo Запустіть DroneControl.exe з папки dist\DroneControl\ ^(переносити потрібно всю папку^)
 ) else (
     echo.
     echo ❌ Помилка створення .exe файлу
@@ -5,21 +5,27 @@ echo.
 REM Очищаємо попередні збірки
 if exist "build" rmdir /s /q "build"
 if exist "dist" rmdir /s /q "dist"
-if exist "*.spec" del "*.spec"
 
-REM Створюємо .exe файл без консолі
+REM Компілюємо інтерфейс заздалегідь (ui_hud.py)
+python compile_ui.py
+
+REM Генеруємо полегшений діалект MAVLink
+python mavlink_dialect.py
+
+REM Створюємо папку програми без консолі (onedir: без розпакування при кожному запуску)
+REM .spec пишеться в build\, DroneControl.spec проєкту не перезаписується
 echo Збірка файлу...
-pyinstaller --onefile --windowed --add-data "UI_HUD.ui;." --name "DroneControl" main.py
+pyinstaller --onedir --windowed --noupx --optimize 1 --specpath build --add-data "%~dp0UI_HUD.ui;." --add-data "%~dp0mavlink_dialects;mavlink_dialects" --hidden-import pymavlink.dialects.v10.all --hidden-import pymavlink.dialects.v20.all --name "DroneControl" main.py
 
-if exist "dist\DroneControl.exe" (
+if exist "dist\DroneControl\DroneControl.exe" (
     echo.
     echo ✅ УСПІШНО! Створено DroneControl.exe
     echo.
-    echo Розташування: dist\DroneControl.exe
+    echo Розташування: dist\DroneControl\DroneControl.exe
     echo Розмір файлу:
-    dir "dist\DroneControl.exe" | findstr DroneControl
+    dir "dist\DroneControl\DroneControl.exe" | findstr DroneControl
     echo.
-    echo Щоб запустити додаток, перейдіть до папки dist\ і запустіть DroneControl.exe
+    echo Щоб запустити додаток, перейдіть до папки dist\DroneControl\ і запустіть DroneControl.exe
     echo Консоль не буде з'являтися при запуску.
 ) else (
     echo.
@@ -0,0 +1,180 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, InvalidStateError
+from mavlink_dialect import mavutil
+
+
+class CommandTimeoutError(Exception):
+    """Автопилот не подтвердил команду за отведенное число попыток"""
+
+
+class PendingCommand(Future):
+    """Команда в полете; результат future - код MAV_RESULT из COMMAND_ACK"""
+
+    def __init__(self, target, command, params, timeout, retries):
+        super().__init__()
+        self.target = target
+        self.command = command
+        self.params = params
+        self.timeout = timeout
+        self.retries = retries
+        self.confirmation = 0
+        self.deadline = 0.0
+        self.progress = None
+
+    @property
+    def key(self):
+        return (self.target[0], self.target[1], self.command)
+
+    @property
+    def name(self):
+        return command_name(self.command)
+
+
+def command_name(command):
+    entry = mavutil.mavlink.enums['MAV_CMD'].get(command)
+    return entry.name if entry else f"CMD_{command}"
+
+
+def result_name(result):
+    entry = mavutil.mavlink.enums['MAV_RESULT'].get(result)
+    return entry.name if entry else f"RESULT_{result}"
+
+
+class CommandDispatcher:
+    """Отправка COMMAND_LONG и сопоставление входящих COMMAND_ACK с ожидающими командами
+
+    Команды ключуются по (sysid, compid, command): ACK в MAVLink не несет
+    идентификатора запроса, поэтому вторая такая же команда тому же аппарату
+    ставится в очередь за первой. Разные команды и разные аппараты
+    обрабатываются параллельно. handle_ack() и tick() вызываются из потока
+    ввода-вывода, submit() - из любого потока.
+    """
+    DEFAULT_TIMEOUT = 1.5  # секунд на одну попытку
+    DEFAULT_RETRIES = 3
+    # MAV_RESULT_IN_PROGRESS продлевает ожидание вместо завершения команды
+    IN_PROGRESS_TIMEOUT = 5.0
+
+    def __init__(self, send, source_system=255, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES):
+        self._send = send
+        self.source_system = source_system
+        self.timeout = timeout
+        self.retries = retries
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._queued = {}
+
+    def submit(self, target, command, params=(0, 0, 0, 0, 0, 0, 0), timeout=None, retries=None, callback=None):
+        """Отправка команды; возвращает PendingCommand без ожидания ответа"""
+        pending = PendingCommand(
+            target, command, tuple(params),
+            self.timeout if timeout is None else timeout,
+            self.retries if retries is None else retries
+        )
+        if callback is not None:
+            pending.add_done_callback(callback)
+
+        with self._lock:
+            if pending.key in self._in_flight:
+                self._queued.setdefault(pending.key, deque()).append(pending)
+                return pending
+            self._in_flight[pending.key] = pending
+        self._transmit(pending)
+        return pending
+
+    def in_flight_count(self):
+        with self._lock:
+            return len(self._in_flight) + sum(len(q) for q in self._queued.values())
+
+    def handle_ack(self, msg):
+        """Разбор COMMAND_ACK из потока приема"""
+        target_system = getattr(msg, 'target_system', 0)
+        if target_system not in (0, self.source_system):
+            # Подтверждение для другой наземной станции
+            return
+
+        sysid, compid = msg.get_srcSystem(), msg.get_srcComponent()
+        with self._lock:
+            pending = self._in_flight.get((sysid, compid, msg.command))
+            if pending is None:
+                # Команду могли отправить на MAV_COMP_ID_ALL (0), а ответил конкретный компонент
+                pending = self._in_flight.get((sysid, 0, msg.command))
+            if pending is None:
+                return
+            if msg.result == mavutil.mavlink.MAV_RESULT_IN_PROGRESS:
+                pending.progress = getattr(msg, 'progress', None)
+                pending.deadline = time.monotonic() + self.IN_PROGRESS_TIMEOUT
+                return
+        self._finish(pending, result=msg.result)
+
+    def tick(self, now):
+        """Повторы и таймауты; вызывается периодически из потока ввода-вывода"""
+        retransmit = []
+        expired = []
+        with self._lock:
+            for pending in self._in_flight.values():
+                if pending.done():
+                    # Команду отменил вызывающий код
+                    expired.append(pending)
+                elif now >= pending.deadline:
+                    if pending.confirmation < pending.retries:
+                        # Повтор с увеличенным счетчиком confirmation
+                        pending.confirmation += 1
+                        pending.deadline = now + pending.timeout
+                        retransmit.append(pending)
+                    else:
+                        expired.append(pending)
+
+        for pending in retransmit:
+            self._transmit(pending, reset_deadline=False)
+        for pending in expired:
+            self._finish(pending, error=CommandTimeoutError(
+                f"{pending.name}: немає відповіді після {pending.confirmation + 1} спроб"))
+
+    def cancel_all(self, error):
+        """Завершение всех команд ошибкой (например, при потере линка)"""
+        with self._lock:
+            pending = list(self._in_flight.values())
+            for queue in self._queued.values():
+                pending.extend(queue)
+            self._in_flight.clear()
+            self._queued.clear()
+        for command in pending:
+            if not command.done():
+                command.set_exception(error)
+
+    def _transmit(self, pending, reset_deadline=True):
+        if reset_deadline:
+            pending.deadline = time.monotonic() + pending.timeout
+        try:
+            self._send(pending.target, pending.command, pending.confirmation, pending.params)
+        except Exception as e:
+            self._finish(pending, error=e)
+
+    def _finish(self, pending, result=None, error=None):
+        next_pending = None
+        with self._lock:
+            if self._in_flight.get(pending.key) is pending:
+                del self._in_flight[pending.key]
+                queue = self._queued.get(pending.key)
+                while queue:
+                    candidate = queue.popleft()
+                    if not candidate.done():
+                        next_pending = candidate
+                        self._in_flight[pending.key] = candidate
+                        break
+                if not queue:
+                    self._queued.pop(pending.key, None)
+
+        # cancel() из GUI потока может успеть между проверкой и установкой результата
+        try:
+            if error is not None:
+                pending.set_exception(error)
+            else:
+                pending.set_result(result)
+        except InvalidStateError:
+            pass
+
+        if next_pending is not None:
+            self._transmit(next_pending)
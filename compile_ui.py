@@ -0,0 +1,30 @@
+# Компиляция UI_HUD.ui в модуль ui_hud.py: окно не разбирает XML при каждом запуске
+import hashlib
+import io
+import os
+
+UI_FILE = 'UI_HUD.ui'
+UI_MODULE = 'ui_hud.py'
+
+
+def ui_source_hash(path):
+    """Хеш .ui, с которым скомпилирован модуль: по нему main.py видит устаревший ui_hud.py"""
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def compile_ui(directory=None):
+    from PyQt5 import uic
+    directory = directory or os.path.dirname(os.path.abspath(__file__))
+    ui_path = os.path.join(directory, UI_FILE)
+    module = io.StringIO()
+    with open(ui_path, encoding='utf-8') as f:
+        uic.compileUi(f, module)
+    module.write(f"\n\nUI_SOURCE_HASH = '{ui_source_hash(ui_path)}'\n")
+    with open(os.path.join(directory, UI_MODULE), 'w', encoding='utf-8') as f:
+        f.write(module.getvalue().replace(ui_path, UI_FILE))
+    return os.path.join(directory, UI_MODULE)
+
+
+if __name__ == "__main__":
+    print(f"Створено {compile_ui()}")
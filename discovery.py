@@ -0,0 +1,327 @@
+import asyncio
+import ipaddress
+import socket
+import threading
+import mavlink_dialect
+from mavlink_dialect import mavutil
+from PyQt5.QtCore import QObject, pyqtSignal
+from serial_transport import list_serial_ports
+
+
+mavlink = mavutil.mavlink
+
+DEFAULT_TCP_PORTS = "5760-5763"
+DEFAULT_UDP_PORTS = "14550-14551"
+DEFAULT_SERIAL_BAUDS = (57600, 115200)
+
+
+def parse_ports(text):
+    """'5760-5763, 14550' -> [5760, 5761, 5762, 5763, 14550]"""
+    ports = []
+    for part in text.replace(";", ",").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            first, last = (int(p) for p in part.split("-", 1))
+            ports.extend(range(first, last + 1))
+        else:
+            ports.append(int(part))
+    for port in ports:
+        if not 0 < port < 65536:
+            raise ValueError(f"недійсний порт {port}")
+    return list(dict.fromkeys(ports))
+
+
+def parse_hosts(text):
+    """Хосты через запятую: адреса, имена и подсети ('192.168.1.0/24')"""
+    hosts = []
+    for part in text.replace(";", ",").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "/" in part:
+            network = ipaddress.ip_network(part, strict=False)
+            addresses = list(network.hosts()) or [network.network_address]
+            hosts.extend(str(address) for address in addresses)
+        else:
+            hosts.append(part)
+    return list(dict.fromkeys(hosts))
+
+
+def local_subnet():
+    """Подсеть /24 основного сетевого интерфейса (адрес без отправки пакетов)"""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.connect(("10.255.255.255", 1))
+            address = sock.getsockname()[0]
+    except OSError:
+        return "127.0.0.1"
+    return str(ipaddress.ip_network(f"{address}/24", strict=False))
+
+
+def _enum_name(enum, value, prefix):
+    entry = mavlink.enums[enum].get(value)
+    return entry.name[len(prefix):] if entry is not None and entry.name.startswith(prefix) else str(value)
+
+
+class DiscoveredEndpoint:
+    """Точка подключения, с которой пришел heartbeat аппарата"""
+
+    def __init__(self, protocol, host, port, sysid, compid, autopilot, mav_type):
+        self.protocol = protocol
+        self.host = host
+        self.port = port  # для SERIAL - скорость, бод
+        self.sysid = sysid
+        self.compid = compid
+        self.autopilot = autopilot
+        self.mav_type = mav_type
+
+    @property
+    def key(self):
+        return (self.protocol, self.host, self.port, self.sysid, self.compid)
+
+    @property
+    def link_params(self):
+        """(protocol, host, port) для LinkManager.create_link"""
+        return (self.protocol, self.host, self.port)
+
+    @property
+    def address(self):
+        if self.protocol == "SERIAL":
+            return f"{self.host} @ {self.port}"
+        return f"{self.host}:{self.port}"
+
+    @property
+    def autopilot_name(self):
+        return _enum_name('MAV_AUTOPILOT', self.autopilot, "MAV_AUTOPILOT_")
+
+    @property
+    def type_name(self):
+        return _enum_name('MAV_TYPE', self.mav_type, "MAV_TYPE_")
+
+    def __str__(self):
+        return f"{self.protocol} {self.address}: system={self.sysid} {self.autopilot_name} {self.type_name}"
+
+
+class _HeartbeatParser:
+    """Поиск heartbeat аппаратов в потоке байт (MAVLink 1 и 2)"""
+
+    def __init__(self):
+        self.mav = mavlink_dialect.mavlink2().MAVLink(None)
+        self.mav.robust_parsing = True
+
+    def feed(self, data):
+        heartbeats = []
+        for msg in self.mav.parse_buffer(data) or ():
+            # Другие наземные станции аппаратами не считаем
+            if msg.get_type() == 'HEARTBEAT' and msg.type != mavlink.MAV_TYPE_GCS:
+                heartbeats.append(msg)
+        return heartbeats
+
+
+def _gcs_heartbeat():
+    """Heartbeat наземной станции: часть автопилотов начинает передачу только после него"""
+    mav = mavlink.MAVLink(None, srcSystem=255, srcComponent=0)
+    return mav.heartbeat_encode(mavlink.MAV_TYPE_GCS, mavlink.MAV_AUTOPILOT_INVALID, 0, 0, 0).pack(mav)
+
+
+class _UDPListener(asyncio.DatagramProtocol):
+    def __init__(self, on_data):
+        self.on_data = on_data
+
+    def datagram_received(self, data, addr):
+        self.on_data(data, addr)
+
+
+async def scan_endpoints(tcp_hosts=(), tcp_ports=(), udp_ports=(), serial_devices=(), serial_bauds=DEFAULT_SERIAL_BAUDS,
+                         exclude=(), on_found=None, on_progress=None, max_concurrent=512, connect_timeout=1.0,
+                         listen_time=1.5):
+    """Параллельная проверка точек подключения; возвращает список DiscoveredEndpoint
+
+    TCP: подключение к каждому host:port (не больше max_concurrent
+    одновременно) и ожидание heartbeat listen_time секунд. UDP: прослушивание
+    портов (куда аппараты шлют телеметрию). SERIAL: каждый порт проверяется
+    на скоростях serial_bauds по очереди, разные порты - параллельно.
+    exclude - (protocol, host, port) уже открытых линков, их не трогаем.
+    """
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(max_concurrent)
+    exclude = set(exclude)
+    found = {}
+    heartbeat = _gcs_heartbeat()
+
+    def report(protocol, host, port, msg):
+        endpoint = DiscoveredEndpoint(protocol, host, port, msg.get_srcSystem(), msg.get_srcComponent(),
+                                      msg.autopilot, msg.type)
+        if endpoint.key not in found:
+            found[endpoint.key] = endpoint
+            if on_found is not None:
+                on_found(endpoint)
+
+    async def probe_tcp(host, port):
+        async with limit:
+            try:
+                reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), connect_timeout)
+            except (OSError, asyncio.TimeoutError):
+                return
+            parser = _HeartbeatParser()
+            deadline = loop.time() + listen_time
+            try:
+                writer.write(heartbeat)
+                while loop.time() < deadline:
+                    data = await asyncio.wait_for(reader.read(4096), deadline - loop.time())
+                    if not data:
+                        break
+                    for msg in parser.feed(data):
+                        report("TCP", host, port, msg)
+            except (OSError, asyncio.TimeoutError):
+                pass
+            finally:
+                writer.close()
+
+    async def probe_udp(port):
+        parsers = {}
+
+        def on_data(data, addr):
+            parser = parsers.setdefault(addr, _HeartbeatParser())
+            for msg in parser.feed(data):
+                # Линк слушает все интерфейсы, как udpin
+                report("UDP", "0.0.0.0", port, msg)
+
+        try:
+            transport, _ = await loop.create_datagram_endpoint(lambda: _UDPListener(on_data), local_addr=("0.0.0.0", port))
+        except OSError:
+            # Порт уже слушает другая программа или наш линк
+            return
+        try:
+            await asyncio.sleep(listen_time)
+        finally:
+            transport.close()
+
+    def read_serial(device, baud):
+        import serial
+        try:
+            port = serial.Serial(device, baud, timeout=0.1)
+        except (serial.SerialException, OSError, ValueError):
+            return []
+        parser = _HeartbeatParser()
+        heartbeats = []
+        try:
+            port.write(heartbeat)
+            deadline = loop.time() + listen_time
+            while loop.time() < deadline and not heartbeats:
+                heartbeats = parser.feed(port.read(4096))
+        except (serial.SerialException, OSError):
+            pass
+        finally:
+            port.close()
+        return heartbeats
+
+    async def probe_serial(device):
+        # Один порт нельзя открыть дважды, поэтому скорости перебираются по очереди
+        for baud in serial_bauds:
+            heartbeats = await loop.run_in_executor(None, read_serial, device, baud)
+            for msg in heartbeats:
+                report("SERIAL", device, baud, msg)
+            if heartbeats:
+                return
+
+    probes = []
+    for host in tcp_hosts:
+        for port in tcp_ports:
+            if ("TCP", host, port) not in exclude:
+                probes.append(probe_tcp(host, port))
+    for port in udp_ports:
+        probes.append(probe_udp(port))
+    busy_devices = {host for protocol, host, _ in exclude if protocol == "SERIAL"}
+    for device in serial_devices:
+        if device not in busy_devices:
+            probes.append(probe_serial(device))
+
+    total = len(probes)
+    done = 0
+
+    async def tracked(probe):
+        nonlocal done
+        try:
+            await probe
+        finally:
+            done += 1
+            if on_progress is not None:
+                on_progress(done, total)
+
+    await asyncio.gather(*(tracked(probe) for probe in probes))
+    return list(found.values())
+
+
+class DiscoveryScanner(QObject):
+    """Поиск аппаратов в фоновом потоке со своим циклом asyncio
+
+    Результаты приходят сигналами по мере нахождения; scan() возвращается сразу.
+    """
+    endpoint_found = pyqtSignal(object)
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._thread = None
+        self._loop = None
+        self._task = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def scan(self, **targets):
+        """Запуск поиска (аргументы - как у scan_endpoints, без колбэков)"""
+        if self.running:
+            return False
+        self._thread = threading.Thread(target=self._run, args=(targets,), name="mavlink-discovery", daemon=True)
+        self._thread.start()
+        return True
+
+    def cancel(self):
+        loop, task = self._loop, self._task
+        if loop is not None and task is not None:
+            loop.call_soon_threadsafe(task.cancel)
+
+    def _run(self, targets):
+        count = 0
+        try:
+            count = len(asyncio.run(self._scan(targets)))
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._loop = self._task = None
+            self.finished.emit(count)
+
+    async def _scan(self, targets):
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        return await scan_endpoints(on_found=self.endpoint_found.emit, on_progress=self.progress.emit, **targets)
+
+
+def default_serial_devices():
+    return [device for device, _ in list_serial_ports()]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Пошук MAVLink апаратів у мережі та на послідовних портах")
+    parser.add_argument("hosts", nargs="?", default=None, help="хости/підмережі TCP, напр. 192.168.1.0/24")
+    parser.add_argument("--tcp-ports", default=DEFAULT_TCP_PORTS)
+    parser.add_argument("--udp-ports", default=DEFAULT_UDP_PORTS)
+    parser.add_argument("--serial", action="store_true", help="перевірити послідовні порти")
+    args = parser.parse_args()
+
+    results = asyncio.run(scan_endpoints(
+        tcp_hosts=parse_hosts(args.hosts or local_subnet()),
+        tcp_ports=parse_ports(args.tcp_ports),
+        udp_ports=parse_ports(args.udp_ports),
+        serial_devices=default_serial_devices() if args.serial else (),
+        on_found=lambda endpoint: print(endpoint, flush=True),
+    ))
+    print(f"Знайдено: {len(results)}")
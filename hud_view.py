@@ -0,0 +1,68 @@
+STATE_PROPERTY = "hudState"
+
+
+def state_style(widget_class, states):
+    """Одна таблица стилей для всех состояний виджета
+
+    states: состояние -> {"": правила, "hover": правила, ...}. Таблица
+    назначается виджету один раз, а состояние переключается динамическим
+    свойством hudState, поэтому Qt не разбирает стили заново при каждой смене.
+    """
+    blocks = []
+    for state, pseudo_rules in states.items():
+        for pseudo, rules in pseudo_rules.items():
+            selector = f'{widget_class}[{STATE_PROPERTY}="{state}"]' + (f":{pseudo}" if pseudo else "")
+            blocks.append(f"{selector} {{ {rules} }}")
+    return "\n".join(blocks)
+
+
+class HudView:
+    """Слой представления HUD: виджет обновляется, только если показанное значение изменилось
+
+    Все записи в метки, прогресс-бар и кнопки идут через этот слой; он помнит,
+    что уже показано, и пропускает setText/setValue/setEnabled с тем же
+    значением. Методы возвращают True, если виджет действительно изменился.
+    """
+
+    def __init__(self):
+        self._shown = {}  # (виджет, свойство) -> показанное значение
+        self.updates = 0
+        self.skipped = 0
+
+    def _changed(self, widget, kind, value):
+        key = (widget, kind)
+        if self._shown.get(key, self) == value:
+            self.skipped += 1
+            return False
+        self._shown[key] = value
+        self.updates += 1
+        return True
+
+    def set_text(self, widget, text):
+        if self._changed(widget, "text", text):
+            widget.setText(text)
+            return True
+        return False
+
+    def set_value(self, widget, value):
+        if self._changed(widget, "value", value):
+            widget.setValue(value)
+            return True
+        return False
+
+    def set_enabled(self, widget, enabled):
+        if self._changed(widget, "enabled", enabled):
+            widget.setEnabled(enabled)
+            return True
+        return False
+
+    def set_state(self, widget, state):
+        """Переключение стиля через динамическое свойство (без новой таблицы стилей)"""
+        if not self._changed(widget, "state", state):
+            return False
+        widget.setProperty(STATE_PROPERTY, state)
+        # Перерасчет стиля по уже разобранной таблице
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        return True
@@ -0,0 +1,502 @@
+import functools
+import multiprocessing
+import queue
+import threading
+import time
+from multiprocessing import shared_memory
+import numpy as np
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+from mavlink_connection import MAVLinkConnection, VehicleState
+from telemetry_store import FIELD_TYPECODES, TELEMETRY_FIELDS, TelemetrySnapshot
+
+
+# Числовые поля телеметрии, которые передаются через кольцо; строки и поля
+# сторонних декодеров идут очередью событий
+RING_FIELDS = tuple(field for field, default in TELEMETRY_FIELDS.items() if not isinstance(default, str))
+_FIELD_INDEX = {field: index for index, field in enumerate(RING_FIELDS)}
+_FIELD_TYPES = tuple({'b': bool, 'i': int}.get(FIELD_TYPECODES.get(field), float) for field in RING_FIELDS)
+# Служебная запись "получен heartbeat" (значение - его время)
+HEARTBEAT_FIELD = len(RING_FIELDS)
+
+RECORD_DTYPE = np.dtype([('link', '<u2'), ('sysid', 'u1'), ('compid', 'u1'), ('field', '<u4'),
+                         ('time', '<f8'), ('value', '<f8')])
+HEADER_SIZE = 64  # счетчик записей (uint64) с выравниванием
+
+# Сигналы линка, которые процесс приема пересылает в GUI
+FORWARDED_SIGNALS = ('vehicle_discovered', 'connection_status_changed', 'message_received', 'state_changed',
+                     'command_finished', 'status_text', 'vehicle_lost', 'vehicle_restored')
+# Методы линка, которые GUI может вызвать в процессе приема
+REMOTE_METHODS = ('send_command', 'arm_disarm', 'takeoff', 'land', 'set_mode')
+
+
+class TelemetryRing:
+    """Кольцо записей телеметрии в multiprocessing.shared_memory
+
+    Пишет процесс приема, читает GUI. Запись - одно числовое поле отсчета
+    аппарата: (линк, sysid, compid, поле, время, значение). Счетчик в
+    заголовке увеличивается после записи данных, поэтому читатель видит
+    только готовые записи и берет их срезами прямо из общей памяти, без
+    сериализации и копирования в очередь. Если читатель отстал больше чем
+    на емкость кольца, старые записи теряются - read() сообщает их число.
+    """
+    DEFAULT_CAPACITY = 65536  # записей (1.5 МБ)
+
+    def __init__(self, name=None, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.owner = name is None
+        if self.owner:
+            size = HEADER_SIZE + capacity * RECORD_DTYPE.itemsize
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+        self._head = np.ndarray((1,), dtype='<u8', buffer=self.shm.buf)
+        self.records = np.ndarray((capacity,), dtype=RECORD_DTYPE, buffer=self.shm.buf, offset=HEADER_SIZE)
+        # Писателей несколько: потоки пула ввода-вывода процесса приема
+        self._lock = threading.Lock()
+
+    def write(self, link, sysid, compid, values, timestamp):
+        """Запись числовых полей; возвращает словарь полей, которые в кольцо не попали (или None)"""
+        rest = None
+        with self._lock:
+            head = int(self._head[0])
+            for field, value in values.items():
+                index = _FIELD_INDEX.get(field)
+                if index is None or isinstance(value, str):
+                    if rest is None:
+                        rest = {}
+                    rest[field] = value
+                    continue
+                self.records[head % self.capacity] = (link, sysid, compid, index, timestamp, value)
+                head += 1
+                self._head[0] = head
+        return rest
+
+    def heartbeat(self, link, sysid, compid, timestamp):
+        with self._lock:
+            head = int(self._head[0])
+            self.records[head % self.capacity] = (link, sysid, compid, HEARTBEAT_FIELD, timestamp, timestamp)
+            self._head[0] = head + 1
+
+    def read(self, cursor):
+        """Записи после cursor: (колонки или None, новый cursor, потеряно записей)
+
+        Колонки (link, sysid, compid, field, time, value) - списки значений из
+        срезов общей памяти.
+        """
+        end = int(self._head[0])
+        lost = 0
+        if end - cursor > self.capacity:
+            lost = end - self.capacity - cursor
+            cursor = end - self.capacity
+        if end == cursor:
+            return None, cursor, lost
+        start = cursor % self.capacity
+        stop = start + end - cursor
+        if stop <= self.capacity:
+            views = (self.records[start:stop],)
+        else:
+            views = (self.records[start:], self.records[:stop - self.capacity])
+        columns = [sum((view[name].tolist() for view in views), []) for name in RECORD_DTYPE.names]
+        # Пока шло чтение, писатель мог пройти круг: такие записи уже перезаписаны
+        # (следующая запись писателя может быть недописана - ее слот тоже не доверяем)
+        overwritten = int(self._head[0]) + 1 - self.capacity - cursor
+        if overwritten > 0:
+            lost += overwritten
+            columns = [column[overwritten:] for column in columns]
+        return columns, end, lost
+
+    def close(self):
+        self._head = self.records = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class _RingSink:
+    """История и приемник телеметрии линка в процессе приема (вместо TelemetryStore и TelemetryCoalescer)
+
+    В кольцо уходят все значения отсчета, как в историю: изменившиеся поля
+    для кадров UI выделяет IngestLink.
+    """
+
+    def __init__(self, ring, events):
+        self.ring = ring
+        self.events = events
+
+    def append(self, vehicle_id, values, timestamp):
+        link, sysid, compid = vehicle_id
+        rest = self.ring.write(link, sysid, compid, values, timestamp)
+        if rest:
+            self.events.put((link, "telemetry", (sysid, compid, rest, timestamp)))
+
+    def update(self, vehicle_id, changed):
+        # Значения уже переданы append()
+        pass
+
+
+def _forward(events, index, name, *args):
+    events.put((index, name, args))
+
+
+def _open_link(index, protocol, host, port, options, pool, ring, events):
+    from message_handlers import MessageHandlerRegistry
+    handlers = MessageHandlerRegistry.with_defaults()
+    # Время heartbeat нужно окну (диагностика), а сам heartbeat разбирается здесь
+    handlers.register('HEARTBEAT', lambda msg: ring.heartbeat(index, msg.get_srcSystem(), msg.get_srcComponent(),
+                                                             time.time()))
+    link = MAVLinkConnection(io_pool=pool, handlers=handlers)
+    link.link_id = index
+    link.telemetry_store = link.telemetry_sink = _RingSink(ring, events)
+    link.stream_rates.profile = options['stream_profile']
+    if link.heartbeat_timeout is not None and options['heartbeat_timeout'] is not None:
+        link.heartbeat_timeout = options['heartbeat_timeout']
+    link.set_connection_params(protocol, host, port)
+    for name in FORWARDED_SIGNALS:
+        # Цикла событий Qt в процессе нет: сигналы пересылаются сразу из потока пула
+        getattr(link, name).connect(functools.partial(_forward, events, index, name), Qt.DirectConnection)
+    link.connect()
+    return link
+
+
+def _worker_main(ring_name, capacity, commands, events):
+    """Процесс приема: линки MAVLinkConnection на своем пуле ввода-вывода
+
+    Команды GUI - кортежи (индекс линка, метод, args, kwargs), None - выход.
+    """
+    from io_pool import IOPool
+    ring = TelemetryRing(ring_name, capacity)
+    pool = IOPool()
+    links = {}
+    try:
+        while True:
+            request = commands.get()
+            if request is None:
+                break
+            index, method, args, kwargs = request
+            try:
+                if method == "open":
+                    links[index] = _open_link(index, *args, pool, ring, events)
+                elif method == "close":
+                    link = links.pop(index, None)
+                    if link is not None:
+                        link.disconnect()
+                elif method == "resync":
+                    # GUI потерял записи кольца: все текущие значения заново
+                    for link in list(links.values()):
+                        for vehicle in list(link.vehicles.values()):
+                            link.telemetry_store.append((link.link_id, vehicle.sysid, vehicle.compid),
+                                                        vehicle.telemetry.as_dict(), time.time())
+                elif method in REMOTE_METHODS and index in links:
+                    getattr(links[index], method)(*args, **kwargs)
+            except Exception as e:
+                events.put((index, "message_received", (f"❌ Процес прийому: {method}: {str(e)}",)))
+    finally:
+        for link in links.values():
+            link.disconnect()
+        pool.stop()
+        ring.close()
+        # GUI может уже не читать очередь - не ждем, пока она опустеет
+        events.cancel_join_thread()
+
+
+class IngestWorker(QObject):
+    """Процесс приема: ввод-вывод и разбор MAVLink вне процесса окна
+
+    Разбор не делит с GUI потоком GIL. Процесс пишет числовую телеметрию в
+    TelemetryRing, а редкие события (сигналы линков, строковые поля) - в
+    очередь. Таймер GUI потока забирает новые записи кольца и события и
+    раздает их линкам IngestLink; команды уходят в процесс второй очередью.
+    """
+    POLL_INTERVAL_MS = 20
+    MAX_EVENTS = 500  # событий за такт, чтобы поток окна не застревал в очереди
+
+    def __init__(self, capacity=TelemetryRing.DEFAULT_CAPACITY, parent=None):
+        super().__init__(parent)
+        # spawn и в Linux: fork процесса с потоками Qt небезопасен
+        context = multiprocessing.get_context("spawn")
+        self.ring = TelemetryRing(capacity=capacity)
+        self.commands = context.SimpleQueue()
+        self.events = context.Queue()
+        self.process = context.Process(target=_worker_main, name="mavlink-ingest", daemon=True,
+                                       args=(self.ring.name, capacity, self.commands, self.events))
+        self.process.start()
+        self.links = {}  # индекс линка в процессе -> IngestLink
+        self._next_index = 0
+        self._cursor = 0
+        self.lost_records = 0
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self.poll)
+        self._timer.start(self.POLL_INTERVAL_MS)
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    def attach(self, link, protocol, host, port, options):
+        """Открытие линка в процессе приема; возвращает его индекс"""
+        index = self._next_index
+        self._next_index = (index + 1) % 65536
+        self.links[index] = link
+        self.send(index, "open", protocol, host, port, options)
+        return index
+
+    def detach(self, index):
+        """Закрытие линка; его события, еще идущие из процесса, отбрасываются"""
+        self.links.pop(index, None)
+        self.send(index, "close")
+
+    def send(self, index, method, *args, **kwargs):
+        if self.process.is_alive():
+            self.commands.put((index, method, args, kwargs))
+
+    def poll(self):
+        """Новые события и записи кольца (GUI поток)"""
+        for _ in range(self.MAX_EVENTS):
+            try:
+                index, name, args = self.events.get_nowait()
+            except queue.Empty:
+                break
+            link = self.links.get(index)
+            if link is not None:
+                link._on_event(name, args)
+
+        columns, self._cursor, lost = self.ring.read(self._cursor)
+        if lost:
+            self.lost_records += lost
+            # Среди потерянных могли быть последние значения полей - процесс пришлет все заново
+            self.send(None, "resync")
+        if columns:
+            self._dispatch(columns)
+
+        if not self.process.is_alive():
+            self._on_process_exit()
+
+    def _dispatch(self, columns):
+        # Поля одного обновления аппарата записаны подряд с одним временем
+        updates = {}
+        for index, sysid, compid, field, timestamp, value in zip(*columns):
+            link = self.links.get(index)
+            if link is None:
+                continue
+            if field == HEARTBEAT_FIELD:
+                link._vehicle(sysid, compid).last_heartbeat = value
+                continue
+            values = updates.get((index, sysid, compid, timestamp))
+            if values is None:
+                values = updates[(index, sysid, compid, timestamp)] = {}
+            values[RING_FIELDS[field]] = _FIELD_TYPES[field](value)
+        for (index, sysid, compid, timestamp), values in updates.items():
+            link = self.links.get(index)
+            if link is not None:
+                link._apply_telemetry(sysid, compid, values, timestamp)
+
+    def _on_process_exit(self):
+        self._timer.stop()
+        links, self.links = self.links, {}
+        for link in links.values():
+            link._on_worker_exit(f"❌ Процес прийому завершився (код {self.process.exitcode})")
+
+    def stop(self):
+        self._timer.stop()
+        if self.process.is_alive():
+            self.commands.put(None)
+            self.process.join(3)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join(1)
+        self.links.clear()
+        self.ring.close()
+
+
+class IngestLink(QObject):
+    """Линк, принимающий и разбирающий MAVLink в процессе приема (IngestWorker)
+
+    Для LinkManager и окна выглядит как MAVLinkConnection: те же сигналы,
+    состояния, аппараты и команды. Команды уходят в процесс очередью и
+    возвращают True, если отправлены (callback не передается - результат
+    приходит сигналом command_finished). Декодеры процесса - стандартные;
+    параметры, миссии, запись tlog и трассировка задержек доступны только
+    линкам в процессе окна.
+    """
+    telemetry_updated = pyqtSignal(int, int, dict)
+    vehicle_discovered = pyqtSignal(int, int)
+    connection_status_changed = pyqtSignal(bool)
+    message_received = pyqtSignal(str)
+    state_changed = pyqtSignal(str)
+    command_finished = pyqtSignal(int, int, str, bool, str)
+    status_text = pyqtSignal(int, int, int, str)
+    vehicle_lost = pyqtSignal(int, int)
+    vehicle_restored = pyqtSignal(int, int)
+    # Не испускаются: параметры и миссии доступны только линкам процесса окна
+    parameters_progress = pyqtSignal(int, int, int, int)
+    parameters_ready = pyqtSignal(int, int, int, bool)
+    parameters_failed = pyqtSignal(int, int, str)
+    mission_progress = pyqtSignal(int, int, int, int)
+    mission_finished = pyqtSignal(int, int, str, bool, str)
+
+    STATE_IDLE = MAVLinkConnection.STATE_IDLE
+    STATE_RESOLVING = MAVLinkConnection.STATE_RESOLVING
+    STATE_WAITING_HEARTBEAT = MAVLinkConnection.STATE_WAITING_HEARTBEAT
+    STATE_STREAMING = MAVLinkConnection.STATE_STREAMING
+    STATE_RECONNECTING = MAVLinkConnection.STATE_RECONNECTING
+    STATE_FAILED = MAVLinkConnection.STATE_FAILED
+    ACTIVE_STATES = MAVLinkConnection.ACTIVE_STATES
+
+    REPLAY = False
+    IN_PROCESS = False
+    connection = None  # транспорт открыт в процессе приема
+
+    def __init__(self, worker):
+        super().__init__()
+        self.worker = worker
+        self._index = None
+        self.link_id = None
+        self.state = self.STATE_IDLE
+        self.connected = False
+        self.running = False
+        self.vehicles = {}
+        self.telemetry = TelemetrySnapshot()
+
+        # Настройки передаются в процесс при подключении
+        self.heartbeat_timeout = MAVLinkConnection.HEARTBEAT_TIMEOUT_MS
+        self.stream_profile = None
+        self.telemetry_sink = None
+        self.telemetry_store = None
+        # Не используются: трассировка, запись tlog и маршрутизатор - только в процессе окна
+        self.tracer = None
+        self.recorder = None
+        self.router = None
+
+        self.protocol = "TCP"
+        self.host = "192.168.1.118"
+        self.port = 5760
+        self.connection_string = "tcp:192.168.1.118:5760"
+
+    def set_connection_params(self, protocol, host, port):
+        self.protocol = protocol
+        self.host = host
+        self.port = port
+        self.connection_string = {"UDP": f"udpin:{host}:{port}", "TCP": f"tcp:{host}:{port}"}.get(protocol, host)
+
+    def connect(self):
+        """Асинхронное подключение в процессе приема (ход - сигналом state_changed)"""
+        if self.state in self.ACTIVE_STATES:
+            return False
+        self.running = True
+        self.connected = False
+        options = {'heartbeat_timeout': self.heartbeat_timeout, 'stream_profile': self.stream_profile}
+        self._index = self.worker.attach(self, self.protocol, self.host, self.port, options)
+        return True
+
+    def cancel(self):
+        if self.state in (self.STATE_RESOLVING, self.STATE_WAITING_HEARTBEAT, self.STATE_RECONNECTING):
+            self._detach()
+            self.message_received.emit("⏹ Підключення скасовано")
+            self._set_state(self.STATE_IDLE)
+
+    def disconnect(self):
+        self._detach()
+        self._set_state(self.STATE_IDLE)
+        self.connection_status_changed.emit(False)
+        self.vehicles.clear()
+        self.message_received.emit("📡 Відключено від дрона")
+
+    def _detach(self):
+        self.running = False
+        self.connected = False
+        if self._index is not None:
+            self.worker.detach(self._index)
+            self._index = None
+
+    def _set_state(self, state):
+        self.state = state
+        self.state_changed.emit(state)
+
+    # --- События процесса приема (GUI поток) ---
+
+    def _on_event(self, name, args):
+        if name == "telemetry":
+            self._apply_telemetry(*args)
+            return
+        if name == "state_changed":
+            self.state = args[0]
+        elif name == "connection_status_changed":
+            self.connected = args[0]
+        elif name == "vehicle_discovered":
+            self._vehicle(*args)
+        elif name in ("vehicle_lost", "vehicle_restored"):
+            self._vehicle(*args).lost = name == "vehicle_lost"
+        getattr(self, name).emit(*args)
+        if name == "state_changed" and args[0] == self.STATE_FAILED:
+            # Линк в процессе уже остановлен - освобождаем его индекс
+            self._detach()
+
+    def _on_worker_exit(self, message):
+        was_connected = self.connected
+        self._index = None
+        self._detach()
+        self.message_received.emit(message)
+        if was_connected:
+            self.connection_status_changed.emit(False)
+        self._set_state(self.STATE_FAILED)
+
+    def _vehicle(self, sysid, compid):
+        # Записи кольца могут опередить событие vehicle_discovered из очереди
+        vehicle = self.vehicles.get((sysid, compid))
+        if vehicle is None:
+            vehicle = self.vehicles[(sysid, compid)] = VehicleState(sysid, compid)
+            if len(self.vehicles) == 1:
+                self.telemetry = vehicle.telemetry
+        return vehicle
+
+    def _apply_telemetry(self, sysid, compid, values, timestamp):
+        vehicle = self._vehicle(sysid, compid)
+        vehicle_id = (self.link_id, sysid, compid)
+        store = self.telemetry_store
+        if store is not None:
+            store.append(vehicle_id, values, timestamp)
+        # Кольцо несет все значения отсчета, кадрам UI - только изменившиеся
+        record = vehicle.telemetry
+        changed = {field: value for field, value in values.items() if record.get(field) != value}
+        if not changed:
+            return
+        record.update(changed, timestamp)
+        sink = self.telemetry_sink
+        if sink is not None:
+            sink.update(vehicle_id, changed)
+        else:
+            self.telemetry_updated.emit(sysid, compid, changed)
+
+    # --- Команды (выполняются в процессе приема) ---
+
+    def _remote(self, method, *args, **kwargs):
+        if not self.connected or self._index is None:
+            self.message_received.emit("❌ Немає з'єднання для відправки команд")
+            return False
+        kwargs.pop('callback', None)
+        self.worker.send(self._index, method, *args, **kwargs)
+        return True
+
+    def send_command(self, command, *args, **kwargs):
+        return self._remote("send_command", command, *args, **kwargs)
+
+    def arm_disarm(self, arm=True, target=None, callback=None):
+        return self._remote("arm_disarm", arm=arm, target=target)
+
+    def takeoff(self, altitude=10, target=None):
+        return self._remote("takeoff", altitude=altitude, target=target)
+
+    def land(self, target=None):
+        return self._remote("land", target=target)
+
+    def set_mode(self, mode_name, target=None):
+        return self._remote("set_mode", mode_name, target=target)
+
+    def get_telemetry(self, target=None):
+        if target is not None:
+            vehicle = self.vehicles.get(target)
+            return vehicle.telemetry.copy() if vehicle else TelemetrySnapshot()
+        return self.telemetry.copy()
@@ -0,0 +1,248 @@
+import os
+import selectors
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class IOPool:
+    """Фиксированный набор потоков ввода-вывода, обслуживающий все MAVLink линки
+
+    Линк должен предоставлять fileno() (или None, если дескриптор нельзя
+    передать в select - тогда линк опрашивается на каждом такте),
+    _on_readable(), _on_tick(now) и _on_io_error(exc).
+    """
+
+    def __init__(self, workers=2, poll_interval=0.05, connect_workers=4):
+        self.poll_interval = poll_interval
+        self.connect_workers = connect_workers
+        self._workers = [_IOWorker(i, poll_interval) for i in range(workers)]
+        self._assignment = {}
+        self._lock = threading.Lock()
+        self._started = False
+        # Блокирующие операции (открытие сокета, TCP connect) не должны задерживать select
+        self._executor = ThreadPoolExecutor(max_workers=connect_workers, thread_name_prefix="mavlink-connect")
+
+    def _ensure_started(self):
+        if not self._started:
+            for worker in self._workers:
+                worker.start()
+            self._started = True
+
+    def register(self, link):
+        """Передача линка наименее загруженному потоку"""
+        with self._lock:
+            self._ensure_started()
+            if link in self._assignment:
+                return
+            worker = min(self._workers, key=lambda w: w.link_count)
+            self._assignment[link] = worker
+            worker.add(link)
+
+    def refresh(self, link):
+        """Повторная регистрация дескриптора линка (например, после открытия сокета)
+
+        Линк, снятый потоком с обслуживания после ошибки, при этом возвращается.
+        """
+        with self._lock:
+            worker = self._assignment.get(link)
+        if worker is not None:
+            worker.refresh(link)
+
+    def submit(self, fn, *args):
+        """Выполнение блокирующей операции вне потоков ввода-вывода"""
+        return self._executor.submit(fn, *args)
+
+    def unregister(self, link, then=None):
+        """Снятие линка с обслуживания
+
+        then вызывается в потоке пула уже после того, как дескриптор убран из
+        select, поэтому в нем можно безопасно закрывать соединение.
+        """
+        with self._lock:
+            worker = self._assignment.pop(link, None)
+        if worker is not None and worker.is_alive():
+            worker.remove(link, then)
+        elif then is not None:
+            then()
+
+    def link_count(self):
+        with self._lock:
+            return len(self._assignment)
+
+    def stop(self):
+        """Остановка всех потоков пула"""
+        with self._lock:
+            self._assignment.clear()
+            workers = self._workers if self._started else []
+            self._started = False
+        for worker in workers:
+            worker.stop()
+        self._executor.shutdown(wait=False)
+        self._workers = [_IOWorker(i, self.poll_interval) for i in range(len(self._workers))]
+        self._executor = ThreadPoolExecutor(max_workers=self.connect_workers, thread_name_prefix="mavlink-connect")
+
+
+class _IOWorker(threading.Thread):
+    """Один поток пула: select по сокетам линков + периодический такт"""
+
+    def __init__(self, index, poll_interval):
+        super().__init__(name=f"mavlink-io-{index}", daemon=True)
+        self.poll_interval = poll_interval
+        self.link_count = 0
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._links = set()
+        self._polled = set()
+        # Линки, назначенные потоку (в т.ч. временно снятые с select после ошибки)
+        self._assigned = set()
+        self._running = True
+
+    def add(self, link):
+        self.link_count += 1
+        self._post(('add', link, None))
+
+    def remove(self, link, then=None):
+        self.link_count -= 1
+        self._post(('remove', link, then))
+
+    def refresh(self, link):
+        self._post(('refresh', link, None))
+
+    def stop(self):
+        self._running = False
+        self._wake()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout=2)
+
+    def _post(self, op):
+        with self._pending_lock:
+            self._pending.append(op)
+        self._wake()
+
+    def _wake(self):
+        try:
+            self._wake_w.send(b'\0')
+        except OSError:
+            pass
+
+    def _apply_pending(self):
+        with self._pending_lock:
+            ops, self._pending = self._pending, []
+        for action, link, then in ops:
+            if action == 'add':
+                self._assigned.add(link)
+                self._attach(link)
+                continue
+            if action == 'refresh':
+                # Линк после ошибки чтения возвращается в обслуживание (переподключение)
+                if link in self._assigned:
+                    self._detach(link)
+                    self._attach(link)
+                continue
+            self._assigned.discard(link)
+            self._detach(link)
+            if then is not None:
+                try:
+                    then()
+                except Exception:
+                    pass
+
+    def _attach(self, link):
+        self._links.add(link)
+        fd = link.fileno()
+        if fd is None:
+            self._polled.add(link)
+            return
+        try:
+            self._selector.register(fd, selectors.EVENT_READ, link)
+        except (ValueError, OSError):
+            # Дескриптор не поддерживается select (например, COM-порт в Windows)
+            self._polled.add(link)
+
+    def _detach(self, link):
+        self._links.discard(link)
+        self._polled.discard(link)
+        for key in list(self._selector.get_map().values()):
+            if key.data is link:
+                try:
+                    self._selector.unregister(key.fileobj)
+                except (KeyError, ValueError, OSError):
+                    pass
+
+    def _service(self, link):
+        try:
+            link._on_readable()
+        except Exception as e:
+            self._detach(link)
+            link._on_io_error(e)
+
+    def run(self):
+        next_tick = time.monotonic()
+        while self._running:
+            try:
+                events = self._selector.select(self.poll_interval)
+            except OSError:
+                # Дескриптор закрыли из другого потока - пересобираем на следующем шаге
+                events = []
+                self._drop_dead_fds()
+
+            for key, _ in events:
+                if key.data is None:
+                    try:
+                        while self._wake_r.recv(4096):
+                            pass
+                    except OSError:
+                        pass
+                    continue
+                if key.data in self._links:
+                    self._service(key.data)
+
+            self._apply_pending()
+
+            for link in list(self._polled):
+                self._service(link)
+
+            now = time.monotonic()
+            if now >= next_tick:
+                next_tick = now + self.poll_interval
+                for link in list(self._links):
+                    try:
+                        link._on_tick(now)
+                    except Exception as e:
+                        self._detach(link)
+                        link._on_io_error(e)
+
+        self._apply_pending()
+        self._selector.close()
+        self._wake_r.close()
+        self._wake_w.close()
+
+    def _drop_dead_fds(self):
+        for key in list(self._selector.get_map().values()):
+            if key.data is None:
+                continue
+            try:
+                os.fstat(key.fd)
+            except OSError as e:
+                self._detach(key.data)
+                key.data._on_io_error(e)
+
+
+_shared_pool = None
+_shared_lock = threading.Lock()
+
+
+def shared_pool():
+    """Общий пул ввода-вывода процесса"""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = IOPool()
+        return _shared_pool
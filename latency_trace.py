@@ -0,0 +1,174 @@
+import bisect
+import json
+import math
+import threading
+import time
+from array import array
+
+
+# Этапы пути значения телеметрии от сокета до HUD
+STAGE_READ = "read"  # вызов recv_msg, вернувший сообщение
+STAGE_PARSE = "parse"  # сообщение разобрано pymavlink
+STAGE_DECODE = "decode"  # декодеры отработали, изменения отданы в coalescer
+STAGE_EMIT = "emit"  # coalescer отправил кадр в GUI поток
+STAGE_SLOT = "slot"  # вход в слот окна
+STAGE_RENDER = "render"  # метки HUD обновлены
+STAGES = (STAGE_READ, STAGE_PARSE, STAGE_DECODE, STAGE_EMIT, STAGE_SLOT, STAGE_RENDER)
+
+
+def stage_order(interval):
+    """Ключ сортировки интервала "этап→этап": по порядку этапов, полный путь последним"""
+    start, end = interval.split("→")
+    return (STAGES.index(end) - STAGES.index(start) > 1, STAGES.index(start), STAGES.index(end))
+
+# Границы корзин гистограммы: 10 на декаду от 1 мкс до 100 с
+HISTOGRAM_EDGES = [1e-6 * 10 ** (i / 10) for i in range(8 * 10 + 1)]
+
+
+class LatencyHistogram:
+    """Гистограмма длительностей с логарифмическими корзинами (1 мкс - 100 с)
+
+    Запись - поиск корзины и инкремент счетчика, без хранения отсчетов.
+    """
+    EDGES = HISTOGRAM_EDGES
+
+    def __init__(self):
+        # Последняя корзина - все, что больше верхней границы
+        self.counts = array('Q', bytes(8 * (len(self.EDGES) + 1)))
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        self.counts[bisect.bisect_left(self.EDGES, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p):
+        """Верхняя граница корзины, в которую попадает p-й процентиль (секунды)"""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * p / 100.0)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.EDGES[index], self.max) if index < len(self.EDGES) else self.max
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "mean_ms": self.mean * 1000,
+            "p50_ms": self.percentile(50) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000,
+            # Ненулевые корзины: верхняя граница (мс) -> число отсчетов
+            "buckets": {
+                (f"{self.EDGES[i] * 1000:.6g}" if i < len(self.EDGES) else "inf"): c
+                for i, c in enumerate(self.counts) if c
+            },
+        }
+
+
+class LatencyTracer:
+    """Трассировка задержек по этапам для каждого аппарата и типа сообщения
+
+    Пока трассировка выключена, линки и coalescer не получают ссылку на
+    трассировщик (tracer = None), поэтому на пути данных остается одна
+    проверка на None. Включенная трассировка отслеживает для каждого
+    аппарата самое старое еще не показанное изменение: оно и определяет
+    задержку кадра, в который попадет.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.histograms = {}  # (vehicle_id, тип сообщения, этап) -> LatencyHistogram
+        self.started = time.time()
+        self._pending = {}  # vehicle_id -> [тип, время этапов...]
+        self._lock = threading.Lock()
+
+    def decoded(self, vehicle_id, msg):
+        """Изменение телеметрии передано в coalescer (поток ввода-вывода)"""
+        if vehicle_id in self._pending:
+            return
+        now = time.time()
+        # У воспроизведения tlog нет чтения из сокета, а время сообщения - время записи
+        read_time = getattr(msg, '_read_time', None)
+        parse_time = msg._timestamp if read_time is not None else None
+        with self._lock:
+            self._pending.setdefault(vehicle_id, [msg.get_type(), read_time, parse_time, now, None, None])
+
+    def emitted(self, vehicle_id):
+        """Кадр аппарата отправлен в GUI поток"""
+        with self._lock:
+            trace = self._pending.get(vehicle_id)
+            if trace is not None and trace[4] is None:
+                trace[4] = time.time()
+
+    def slot_entered(self, vehicle_id):
+        with self._lock:
+            trace = self._pending.get(vehicle_id)
+            if trace is not None and trace[4] is not None:
+                trace[5] = time.time()
+
+    def rendered(self, vehicle_id, rendered=True):
+        """Кадр обработан окном; rendered=False - аппарат не выбран и HUD не обновлялся"""
+        now = time.time()
+        with self._lock:
+            trace = self._pending.get(vehicle_id)
+            if trace is None or trace[5] is None:
+                return
+            del self._pending[vehicle_id]
+            msg_type = trace[0]
+            times = trace[1:] + [now if rendered else None]
+            marks = [(stage, moment) for stage, moment in zip(STAGES, times) if moment is not None]
+            for (stage, moment), (next_stage, next_moment) in zip(marks, marks[1:]):
+                self._record(vehicle_id, msg_type, f"{stage}→{next_stage}", next_moment - moment)
+            if len(marks) > 2:
+                # Полный путь от первого до последнего отмеченного этапа
+                self._record(vehicle_id, msg_type, f"{marks[0][0]}→{marks[-1][0]}", marks[-1][1] - marks[0][1])
+
+    def _record(self, vehicle_id, msg_type, stage, seconds):
+        key = (vehicle_id, msg_type, stage)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = LatencyHistogram()
+        histogram.record(max(0.0, seconds))
+
+    def forget(self, vehicle_id):
+        with self._lock:
+            self._pending.pop(vehicle_id, None)
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}
+            self._pending.clear()
+            self.started = time.time()
+
+    def summary(self):
+        """Строки (vehicle_id, тип сообщения, этап, гистограмма), отсортированные для показа"""
+        with self._lock:
+            items = list(self.histograms.items())
+        items.sort(key=lambda item: (str(item[0][0]), item[0][1], stage_order(item[0][2])))
+        return [(vehicle_id, msg_type, stage, histogram) for (vehicle_id, msg_type, stage), histogram in items]
+
+    def export(self, path):
+        """Сохранение гистограмм в JSON"""
+        report = {
+            "started": self.started,
+            "exported": time.time(),
+            "stages": list(STAGES),
+            "histograms": [
+                dict(histogram.as_dict(), vehicle=list(vehicle_id), message=msg_type, stage=stage)
+                for vehicle_id, msg_type, stage, histogram in self.summary()
+            ],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
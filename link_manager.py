@@ -0,0 +1,425 @@
+import os
+from PyQt5.QtCore import QObject, pyqtSignal
+from io_pool import IOPool
+from latency_trace import LatencyTracer
+from telemetry_coalescer import TelemetryCoalescer
+from telemetry_store import TelemetrySnapshot, TelemetryStore
+from tlog import RecordingSession
+
+
+class LinkManager(QObject):
+    """Менеджер всех MAVLink линков и аппаратов на них
+
+    Аппарат идентифицируется кортежем (link_id, sysid, compid), поэтому на одном
+    линке может быть несколько аппаратов, а линков - сколько угодно. Все линки
+    обслуживаются одним небольшим пулом потоков ввода-вывода. Телеметрия
+    приходит в UI кадрами фиксированной частоты, только с изменившимися полями.
+
+    Модули линков (pymavlink с диалектом - заметная часть запуска программы)
+    импортируются с первым линком, а не при создании менеджера.
+
+    С out_of_process новые линки принимают и разбирают MAVLink в отдельном
+    процессе (IngestWorker), который запускается с первым линком.
+    """
+    vehicle_added = pyqtSignal(object, str)
+    vehicle_removed = pyqtSignal(object)
+    vehicle_telemetry_updated = pyqtSignal(object, dict)
+    link_status_changed = pyqtSignal(str, bool)
+    link_state_changed = pyqtSignal(str, str)
+    command_finished = pyqtSignal(object, str, bool, str)
+    # Каждое STATUSTEXT аппарата: severity, текст
+    status_text = pyqtSignal(object, int, str)
+    # Аппарат перестал присылать heartbeat / снова на связи (данные аппарата сохраняются)
+    vehicle_lost = pyqtSignal(object)
+    vehicle_restored = pyqtSignal(object)
+    # Параметры аппарата: получено/всего; число параметров и из кеша ли; причина отказа
+    parameters_progress = pyqtSignal(object, int, int)
+    parameters_ready = pyqtSignal(object, int, bool)
+    parameters_failed = pyqtSignal(object, str)
+    # Передача миссии: передано/всего; направление (upload, download), успех, описание
+    mission_progress = pyqtSignal(object, int, int)
+    mission_finished = pyqtSignal(object, str, bool, str)
+    message_received = pyqtSignal(str)
+
+    def __init__(self, io_workers=2, frame_rate=TelemetryCoalescer.DEFAULT_RATE, out_of_process=False):
+        super().__init__()
+        self.io_pool = IOPool(workers=io_workers)
+        self.links = {}
+        # Общий реестр декодеров для всех линков (создается при первом обращении)
+        self._handlers = None
+        self.coalescer = TelemetryCoalescer(rate_hz=frame_rate, parent=self)
+        self.coalescer.frame_ready.connect(self.vehicle_telemetry_updated)
+        # История телеметрии для трендов, графиков и послеполетного анализа
+        self.history = TelemetryStore()
+        self.recording = None
+        # Раздача сырых кадров другим программам (MAVLinkRouter), необязательна
+        self.router = None
+        # Трассировка задержек от сокета до HUD (выключена по умолчанию)
+        self.tracer = LatencyTracer()
+        # Частоты сообщений для новых аппаратов (создаются при первом обращении)
+        self._stream_profile = self._DEFAULT_PROFILE
+        # Таймаут heartbeat для новых линков, мс (None - таймаут линка по умолчанию)
+        self.heartbeat_timeout = None
+        # Кеш таблиц параметров; пока он не задан, параметры не загружаются автоматически
+        self.parameter_cache = None
+        self.parameter_directory = None
+        self._dialect_reported = False
+        # Прием в отдельном процессе (IngestWorker создается с первым линком)
+        self.out_of_process = out_of_process
+        self._ingest = None
+
+    # Метка "профиль еще не задан": DEFAULT_PROFILE берется из stream_rates при первом обращении
+    _DEFAULT_PROFILE = object()
+
+    @property
+    def handlers(self):
+        """Общий реестр декодеров для всех линков (register() для своих сообщений)"""
+        if self._handlers is None:
+            from message_handlers import MessageHandlerRegistry
+            self._handlers = MessageHandlerRegistry.with_defaults()
+        return self._handlers
+
+    @property
+    def stream_profile(self):
+        """Частоты сообщений для новых аппаратов, Гц (None - частоты аппаратов не меняются)"""
+        if self._stream_profile is self._DEFAULT_PROFILE:
+            from stream_rates import DEFAULT_PROFILE
+            self._stream_profile = dict(DEFAULT_PROFILE)
+        return self._stream_profile
+
+    @stream_profile.setter
+    def stream_profile(self, profile):
+        self._stream_profile = profile
+
+    @staticmethod
+    def make_link_id(protocol, host, port):
+        return f"{protocol}://{host}:{port}"
+
+    def has_link(self, protocol, host, port):
+        link = self.links.get(self.make_link_id(protocol, host, port))
+        return link is not None and link.state in link.ACTIVE_STATES
+
+    def create_link(self, protocol, host, port):
+        """Создание (или получение существующего) линка к указанной точке"""
+        link_id = self.make_link_id(protocol, host, port)
+        link = self.links.get(link_id)
+        if link is not None:
+            return link
+
+        if self.out_of_process:
+            from ingest_process import IngestLink
+            link = IngestLink(self._ingest_worker())
+        else:
+            from mavlink_connection import MAVLinkConnection
+            link = MAVLinkConnection(io_pool=self.io_pool, handlers=self.handlers)
+            if self.recording is not None:
+                link.recorder = self.recording.recorder_for(link_id)
+            if self.router is not None:
+                self.router.attach(link)
+        link.set_connection_params(protocol, host, port)
+        return self._add_link(link_id, link)
+
+    def _ingest_worker(self):
+        if self._ingest is not None and not self._ingest.process.is_alive():
+            # Процесс приема аварийно завершился - новый линк запускает новый процесс
+            self._ingest.stop()
+            self._ingest = None
+        if self._ingest is None:
+            from ingest_process import IngestWorker
+            self._ingest = IngestWorker(parent=self)
+            self.message_received.emit(f"🧵 Прийом MAVLink в окремому процесі (pid {self._ingest.pid})")
+        return self._ingest
+
+    def create_replay(self, path, speed=1.0):
+        """Линк воспроизведения tlog (подключается как обычный линк через connect())"""
+        link_id = f"tlog://{os.path.basename(path)}"
+        link = self.links.get(link_id)
+        if link is not None:
+            return link
+        from replay import ReplayConnection
+        # Воспроизведение повторно не записывается
+        return self._add_link(link_id, ReplayConnection(path, speed, io_pool=self.io_pool, handlers=self.handlers))
+
+    def replay_links(self):
+        return [link for link in self.links.values() if link.REPLAY]
+
+    @staticmethod
+    def _local(link):
+        """Живой линк процесса окна: параметры, миссии и запись tlog"""
+        return link.IN_PROCESS and not link.REPLAY
+
+    def _add_link(self, link_id, link):
+        if not self._dialect_reported:
+            self._dialect_reported = True
+            self.message_received.emit(self._dialect_status())
+        link.link_id = link_id
+        link.telemetry_sink = self.coalescer
+        link.telemetry_store = self.history
+        link.tracer = self.tracer if self.tracer.enabled else None
+        if link.IN_PROCESS:
+            link.stream_rates.profile = self.stream_profile
+        else:
+            link.stream_profile = self.stream_profile
+        if link.heartbeat_timeout is not None and self.heartbeat_timeout is not None:
+            link.heartbeat_timeout = self.heartbeat_timeout
+
+        link.vehicle_discovered.connect(self._on_vehicle_discovered)
+        link.connection_status_changed.connect(self._on_link_status_changed)
+        link.state_changed.connect(self._on_link_state_changed)
+        link.command_finished.connect(self._on_command_finished)
+        link.status_text.connect(self._on_status_text)
+        link.vehicle_lost.connect(self._on_vehicle_lost)
+        link.vehicle_restored.connect(self._on_vehicle_restored)
+        link.parameters_progress.connect(self._on_parameters_progress)
+        link.parameters_ready.connect(self._on_parameters_ready)
+        link.parameters_failed.connect(self._on_parameters_failed)
+        link.mission_progress.connect(self._on_mission_progress)
+        link.mission_finished.connect(self._on_mission_finished)
+        link.message_received.connect(self.message_received)
+        if self._local(link):
+            link.parameters.cache = self._parameter_cache()
+            link.auto_parameters = self.parameter_cache is not None
+
+        self.links[link_id] = link
+        return link
+
+    @staticmethod
+    def _dialect_status():
+        import mavlink_dialect
+        if mavlink_dialect.is_slim():
+            return f"📦 Діалект MAVLink: полегшений ({len(mavlink_dialect.APP_MESSAGES)} повідомлень)"
+        return f"📦 Діалект MAVLink: повний ({mavlink_dialect.fallback_reason})"
+
+    def remove_link(self, link_id):
+        """Отключение и удаление линка"""
+        link = self.links.get(link_id)
+        if link is None:
+            return
+        if link.running or link.connection:
+            link.disconnect()
+        if link.router is not None:
+            link.router.detach(link)
+        self._drop_vehicles(link)
+        link.vehicle_discovered.disconnect(self._on_vehicle_discovered)
+        link.connection_status_changed.disconnect(self._on_link_status_changed)
+        link.state_changed.disconnect(self._on_link_state_changed)
+        link.command_finished.disconnect(self._on_command_finished)
+        link.status_text.disconnect(self._on_status_text)
+        link.vehicle_lost.disconnect(self._on_vehicle_lost)
+        link.vehicle_restored.disconnect(self._on_vehicle_restored)
+        link.parameters_progress.disconnect(self._on_parameters_progress)
+        link.parameters_ready.disconnect(self._on_parameters_ready)
+        link.parameters_failed.disconnect(self._on_parameters_failed)
+        link.mission_progress.disconnect(self._on_mission_progress)
+        link.mission_finished.disconnect(self._on_mission_finished)
+        link.message_received.disconnect(self.message_received)
+        del self.links[link_id]
+
+    def connecting_links(self):
+        """Линки, подключение (или переподключение) которых еще не завершилось"""
+        return [link for link in self.links.values()
+                if link.state in (link.STATE_RESOLVING, link.STATE_WAITING_HEARTBEAT, link.STATE_RECONNECTING)]
+
+    def disconnect_all(self):
+        """Отключение всех линков"""
+        for link_id in list(self.links):
+            self.remove_link(link_id)
+
+    def set_tracing(self, enabled):
+        """Включение трассировки задержек; выключенная ничего не стоит на пути данных"""
+        self.tracer.enabled = enabled
+        tracer = self.tracer if enabled else None
+        self.coalescer.tracer = tracer
+        for link in self.links.values():
+            link.tracer = tracer
+
+    def start_recording(self, directory):
+        """Запись сырых кадров всех линков в tlog-файлы каталога"""
+        if self.recording is not None:
+            return self.recording
+        self.recording = RecordingSession(directory)
+        for link_id, link in self.links.items():
+            if self._local(link):
+                link.recorder = self.recording.recorder_for(link_id)
+        return self.recording
+
+    def stop_recording(self):
+        if self.recording is None:
+            return
+        for link in self.links.values():
+            link.recorder = None
+        self.recording.close()
+        self.recording = None
+
+    def start_router(self, tcp_port=None, udp_port=None, udp_targets=()):
+        """Раздача сырых кадров живых линков локальным клиентам по TCP/UDP (OSError - порт занят)
+
+        Кадры клиентов (вторая наземная станция, скрипты анализа) уходят в линки.
+        """
+        if self.router is not None:
+            return self.router
+        from mavlink_router import MAVLinkRouter
+        router = MAVLinkRouter(self.io_pool, tcp_port=tcp_port, udp_port=udp_port, udp_targets=udp_targets,
+                               log=self.message_received.emit)
+        router.start()
+        self.router = router
+        for link in self.links.values():
+            if self._local(link):
+                router.attach(link)
+        return router
+
+    def stop_router(self):
+        if self.router is None:
+            return
+        self.router.stop()
+        self.router = None
+
+    def enable_parameters(self, directory):
+        """Автоматическая загрузка параметров новых аппаратов с кешем таблиц в каталоге
+
+        Кеш создается с первым линком (модуль parameters импортирует pymavlink).
+        """
+        self.parameter_directory = directory
+        self.parameter_cache = None
+        for link in self.links.values():
+            if self._local(link):
+                link.parameters.cache = self._parameter_cache()
+                link.auto_parameters = True
+        return self.parameter_cache
+
+    def _parameter_cache(self):
+        if self.parameter_cache is None and self.parameter_directory is not None:
+            from parameters import ParameterCache
+            self.parameter_cache = ParameterCache(self.parameter_directory)
+        return self.parameter_cache
+
+    def fetch_parameters(self, vehicle_ids=None, force=False):
+        """Загрузка таблиц параметров (по умолчанию - всех аппаратов), параллельно по аппаратам"""
+        started = 0
+        for vehicle_id in (self.vehicle_ids() if vehicle_ids is None else vehicle_ids):
+            link = self.get_link(vehicle_id)
+            if link is None or not link.connected or not self._local(link):
+                continue
+            if link.parameters.fetch(vehicle_id[1:], force=force):
+                started += 1
+        return started
+
+    def get_parameters(self, vehicle_id):
+        """Загруженная таблица параметров аппарата (ParameterTable) или None"""
+        link = self.get_link(vehicle_id)
+        return link.parameters.table(vehicle_id[1:]) if link is not None and link.IN_PROCESS else None
+
+    def _mission_clients(self, vehicle_ids):
+        for vehicle_id in vehicle_ids:
+            link = self.get_link(vehicle_id)
+            if link is not None and link.connected and self._local(link):
+                yield vehicle_id, link.missions
+
+    def upload_mission(self, vehicle_ids, items):
+        """Загрузка миссии в аппараты (одновременно); возвращает число начатых передач"""
+        return sum(1 for vehicle_id, missions in self._mission_clients(vehicle_ids)
+                   if missions.upload(vehicle_id[1:], items))
+
+    def download_mission(self, vehicle_ids):
+        """Скачивание миссий аппаратов (одновременно); результат - get_mission() после mission_finished"""
+        return sum(1 for vehicle_id, missions in self._mission_clients(vehicle_ids)
+                   if missions.download(vehicle_id[1:]))
+
+    def get_mission(self, vehicle_id):
+        """Последняя загруженная или скачанная миссия аппарата ([MissionItem]) или None"""
+        link = self.get_link(vehicle_id)
+        return link.missions.mission(vehicle_id[1:]) if link is not None and link.IN_PROCESS else None
+
+    def shutdown(self):
+        self.disconnect_all()
+        self.stop_recording()
+        self.stop_router()
+        self.coalescer.stop()
+        self.io_pool.stop()
+        if self._ingest is not None:
+            self._ingest.stop()
+            self._ingest = None
+
+    def connected_links(self):
+        return [link for link in self.links.values() if link.connected]
+
+    def vehicle_ids(self):
+        return [(link_id, sysid, compid)
+                for link_id, link in self.links.items()
+                for (sysid, compid) in list(link.vehicles)]
+
+    def get_link(self, vehicle_id):
+        """Линк, через который доступен аппарат"""
+        if vehicle_id is None:
+            return None
+        return self.links.get(vehicle_id[0])
+
+    def get_telemetry(self, vehicle_id):
+        link = self.get_link(vehicle_id)
+        if link is None:
+            return TelemetrySnapshot()
+        return link.get_telemetry(target=vehicle_id[1:])
+
+    def vehicle_name(self, vehicle_id):
+        link_id, sysid, compid = vehicle_id
+        return f"🚁 Дрон {sysid}:{compid} ({link_id})"
+
+    # --- Слоты линков (выполняются в GUI потоке) ---
+
+    def _on_vehicle_discovered(self, sysid, compid):
+        link = self.sender()
+        vehicle_id = (link.link_id, sysid, compid)
+        self.vehicle_added.emit(vehicle_id, self.vehicle_name(vehicle_id))
+
+    def _on_link_status_changed(self, connected):
+        link = self.sender()
+        if not connected:
+            self._drop_vehicles(link)
+        self.link_status_changed.emit(link.link_id, connected)
+
+    def _on_link_state_changed(self, state):
+        link = self.sender()
+        self.link_state_changed.emit(link.link_id, state)
+
+    def _on_command_finished(self, sysid, compid, name, accepted, description):
+        link = self.sender()
+        self.command_finished.emit((link.link_id, sysid, compid), name, accepted, description)
+
+    def _on_status_text(self, sysid, compid, severity, text):
+        link = self.sender()
+        self.status_text.emit((link.link_id, sysid, compid), severity, text)
+
+    def _on_vehicle_lost(self, sysid, compid):
+        link = self.sender()
+        self.vehicle_lost.emit((link.link_id, sysid, compid))
+
+    def _on_vehicle_restored(self, sysid, compid):
+        link = self.sender()
+        self.vehicle_restored.emit((link.link_id, sysid, compid))
+
+    def _on_parameters_progress(self, sysid, compid, received, total):
+        link = self.sender()
+        self.parameters_progress.emit((link.link_id, sysid, compid), received, total)
+
+    def _on_parameters_ready(self, sysid, compid, count, from_cache):
+        link = self.sender()
+        self.parameters_ready.emit((link.link_id, sysid, compid), count, from_cache)
+
+    def _on_parameters_failed(self, sysid, compid, reason):
+        link = self.sender()
+        self.parameters_failed.emit((link.link_id, sysid, compid), reason)
+
+    def _on_mission_progress(self, sysid, compid, done, total):
+        link = self.sender()
+        self.mission_progress.emit((link.link_id, sysid, compid), done, total)
+
+    def _on_mission_finished(self, sysid, compid, direction, ok, description):
+        link = self.sender()
+        self.mission_finished.emit((link.link_id, sysid, compid), direction, ok, description)
+
+    def _drop_vehicles(self, link):
+        for sysid, compid in list(link.vehicles):
+            self.coalescer.forget((link.link_id, sysid, compid))
+            self.tracer.forget((link.link_id, sysid, compid))
+            self.vehicle_removed.emit((link.link_id, sysid, compid))
+        link.vehicles.clear()
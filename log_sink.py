@@ -0,0 +1,117 @@
+import datetime
+import logging
+import os
+import time
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from PyQt5.QtCore import QObject, QTimer
+
+
+class LogSink(QObject):
+    """Буферизованный журнал: виджет обновляется пачками по таймеру
+
+    add() только ставит запись в очередь. Раз в flush_interval мс накопленные
+    строки добавляются в QPlainTextEdit одним вызовом; виджет хранит не больше
+    max_blocks строк, полная история пишется в ротируемый файл. Одинаковые
+    сообщения чаще, чем раз в repeat_window секунд, в виджет не выводятся -
+    вместо них печатается число повторов.
+    """
+    FLUSH_INTERVAL = 250  # мс
+    MAX_BLOCKS = 2000  # строк в виджете
+    REPEAT_WINDOW = 5.0  # секунд
+    FILE_MAX_BYTES = 5 * 1024 * 1024
+    FILE_BACKUPS = 5
+
+    def __init__(self, widget=None, log_dir=None, flush_interval=FLUSH_INTERVAL, max_blocks=MAX_BLOCKS,
+                 repeat_window=REPEAT_WINDOW, parent=None):
+        super().__init__(parent)
+        self.widget = widget
+        self.repeat_window = repeat_window
+        self.suppressed_total = 0
+        self._pending = deque()
+        self._file_pending = deque()
+        self._recent = {}  # сообщение -> [время первого показа, число подавленных повторов]
+
+        if widget is not None:
+            widget.setMaximumBlockCount(max_blocks)
+
+        self.file_handler = None
+        self._file_logger = None
+        if log_dir:
+            try:
+                os.makedirs(log_dir, exist_ok=True)
+                self.file_handler = RotatingFileHandler(
+                    os.path.join(log_dir, "drone_control.log"),
+                    maxBytes=self.FILE_MAX_BYTES, backupCount=self.FILE_BACKUPS, encoding="utf-8"
+                )
+            except OSError as e:
+                print(f"Log: файл журналу недоступний: {e}")
+            else:
+                self.file_handler.setFormatter(logging.Formatter("%(message)s"))
+                self._file_logger = logging.getLogger(f"drone_control.{id(self)}")
+                self._file_logger.propagate = False
+                self._file_logger.setLevel(logging.INFO)
+                self._file_logger.addHandler(self.file_handler)
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.flush)
+        self._timer.start(flush_interval)
+
+    def add(self, message):
+        """Постановка сообщения в очередь (вызывается из GUI потока)"""
+        now = time.time()
+        moment = datetime.datetime.fromtimestamp(now)
+        if self._file_logger is not None:
+            self._file_pending.append(f"{moment.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]} {message}")
+
+        recent = self._recent.get(message)
+        if recent is not None and now - recent[0] < self.repeat_window:
+            recent[1] += 1
+            self.suppressed_total += 1
+            return
+        if recent is not None and recent[1]:
+            self._pending.append(self._repeat_line(message, recent[1]))
+        self._recent[message] = [now, 0]
+        self._pending.append(f"[{moment.strftime('%H:%M:%S')}] {message}")
+
+    def _repeat_line(self, message, count):
+        return f"[{datetime.datetime.now().strftime('%H:%M:%S')}] ↻ ще {count}× за {self.repeat_window:g} с: {message}"
+
+    def flush(self):
+        """Вывод накопленных строк в виджет и в файл"""
+        now = time.time()
+        # Повторы, окно которых закончилось, выводим одной строкой
+        expired = [m for m, (t, _) in self._recent.items() if now - t >= self.repeat_window]
+        for message in expired:
+            count = self._recent.pop(message)[1]
+            if count:
+                self._pending.append(self._repeat_line(message, count))
+
+        if self._file_pending:
+            lines, self._file_pending = self._file_pending, deque()
+            self._file_logger.info("\n".join(lines))
+
+        if not self._pending:
+            return
+        lines, self._pending = self._pending, deque()
+        widget = self.widget
+        if widget is None:
+            for line in lines:
+                print(f"Log: {line}")
+            return
+
+        scrollbar = widget.verticalScrollBar()
+        # Прокручиваем вниз, только если пользователь не листает историю
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 2
+        widget.appendPlainText("\n".join(lines))
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def stop(self):
+        self._timer.stop()
+        self.flush()
+        if self.file_handler is not None:
+            self._file_logger.removeHandler(self.file_handler)
+            self.file_handler.close()
+            self.file_handler = None
+            self._file_logger = None
@@ -1,49 +1,111 @@
 import sys
+from startup_profile import StartupProfile
+# Отчет о запуске (--startup-report): профиль создается до остальных импортов, чтобы учесть и их
+STARTUP = StartupProfile(track_imports="--startup-report" in sys.argv)
 import os
-from PyQt5 import QtWidgets, uic, QtCore, QtGui
-from PyQt5.QtWidgets import QMainWindow, QApplication, QMessageBox, QVBoxLayout, QHBoxLayout, QLabel, QListWidget, QProgressBar, QTextEdit, QPlainTextEdit, QDialog, QLineEdit, QComboBox, QPushButton, QSpinBox
+import multiprocessing
+from PyQt5 import QtWidgets, QtCore, QtGui
+from PyQt5.QtWidgets import QMainWindow, QApplication, QMessageBox, QVBoxLayout, QHBoxLayout, QLabel, QListWidget, QProgressBar, QTextEdit, QPlainTextEdit, QDialog, QLineEdit, QComboBox, QPushButton, QSpinBox, QSlider, QFileDialog, QCheckBox, QTableWidget, QTableWidgetItem, QHeaderView
 from PyQt5.QtCore import QTimer, pyqtSignal
-import random
+import time
 import datetime
-from mavlink_connection import MAVLinkConnection
+from link_manager import LinkManager
+from log_sink import LogSink
+from hud_view import HudView, state_style
+from map_view import MapView
+from tlog import REPLAY_MAX_SPEED
+from compile_ui import UI_FILE, ui_source_hash
+# Модули MAVLink (mavlink_connection, replay, serial_transport, simulator, discovery)
+# импортируют pymavlink с диалектом и загружаются при первом подключении, а не при запуске
+
+# Каталог записей телеметрии (tlog) - вне папки программы: папка сборки заменяется при обновлении
+TLOG_DIR = os.path.join(os.path.expanduser("~"), "DroneControl", "tlogs")
+# Полный журнал сообщений (ротируемые файлы)
+LOG_DIR = os.path.join(os.path.expanduser("~"), "DroneControl", "logs")
+# Кеш таблиц параметров аппаратов: повторное подключение только сверяет таблицу
+PARAM_DIR = os.path.join(os.path.expanduser("~"), "DroneControl", "params")
+# Тайлы карты (z/x/y.png), подготовленные заранее - карта работает без сети
+TILE_DIR = os.path.join(os.path.expanduser("~"), "DroneControl", "tiles")
+# Маршрутизатор MAVLink (--router): порты для второй станции и скриптов на этом компьютере
+ROUTER_TCP_PORT = 5770
+ROUTER_UDP_PORT = 14552
+
+# Число аппаратов локального симулятора (кнопка "Симулятор")
+SIMULATOR_VEHICLES = 3
+
+
+def load_ui(window):
+    """Виджеты главного окна из заранее скомпилированного ui_hud.py (compile_ui.py)
+
+    Если модуля нет или он собран из другой версии UI_HUD.ui, файл .ui
+    разбирается через uic, как раньше. Возвращает способ загрузки для лога.
+    """
+    ui_file = os.path.join(os.path.dirname(__file__), UI_FILE)
+    try:
+        import ui_hud
+    except ImportError:
+        ui_hud = None
+    if ui_hud is not None and (not os.path.exists(ui_file) or ui_source_hash(ui_file) == ui_hud.UI_SOURCE_HASH):
+        ui = ui_hud.Ui_DroneControlWindow()
+        ui.setupUi(window)
+        # Как uic.loadUi: виджеты - атрибуты самого окна
+        for name, widget in vars(ui).items():
+            setattr(window, name, widget)
+        return "ui_hud.py"
+    from PyQt5 import uic
+    uic.loadUi(ui_file, window)
+    return UI_FILE
 
 class DroneControlApp(QMainWindow):
     def __init__(self):
         super().__init__()
         
-        # Загружаем UI файл
-        ui_file = os.path.join(os.path.dirname(__file__), 'UI_HUD.ui')
-        uic.loadUi(ui_file, self)
+        # Загружаем интерфейс (скомпилированный модуль или UI файл)
+        with STARTUP.step("інтерфейс"):
+            self.ui_source = load_ui(self)
         
         # Скрываем проблемный statusLabel с черным текстом
         if hasattr(self, 'statusLabel'):
             self.statusLabel.hide()
         
+        # Журнал выводится в logsTextEdit пачками по таймеру, полная история - в файл
+        with STARTUP.step("журнал"):
+            self.log_sink = LogSink(getattr(self, 'logsTextEdit', None), LOG_DIR, parent=self)
+        
         # Інициализация переменных
         self.connected = False
         self.drones_list = []
-        self.connected_drones = []  # Список підключених дронів
+        self.connected_drones = {}  # Підключені дрони: назва -> (link_id, sysid, compid)
         self.selected_drone = None  # Выбранный дрон из списка
+        self.selected_vehicle = None  # Идентификатор выбранного аппарата
+        self.vehicle_telemetry = {}  # Последняя известная телеметрия каждого аппарата (TelemetrySnapshot)
         self.simulated_armed = False  # Статус вооружения в режиме симуляции
         self.current_status = "Готовий"
+        self.replay = None  # Активное воспроизведение tlog (ReplayConnection)
+        self.simulator = None  # Локальный флот симулированных аппаратов (SimulatorFleet)
+        self.diagnostics_dialog = None  # Окно задержек по этапам (создается по требованию)
+        self.discovery_dialog = None  # Окно поиска дронов
+        self.map_dialog = None  # Карта с треками аппаратов
         self.battery_display_mode = "percent"  # "percent" або "voltage"
         
-        # Инициализация MAVLink соединения
-        self.mavlink = MAVLinkConnection()
-        self.setup_mavlink_signals()
+        # Инициализация менеджера MAVLink линков (много линков и аппаратов)
+        with STARTUP.step("LinkManager"):
+            # --ingest-process: прием и разбор MAVLink в отдельном процессе (не делит GIL с окном)
+            self.link_manager = LinkManager(out_of_process="--ingest-process" in sys.argv)
+            self.setup_mavlink_signals()
         
         # Реальные данные телеметрии
         self.real_telemetry = False  # Флаг использования реальных данных
+        # Все обновления HUD идут через слой, пропускающий неизменившиеся значения
+        self.hud = HudView()
         
         # Настройка соединений сигналов
-        self.setup_connections()
+        with STARTUP.step("сигнали"):
+            self.setup_connections()
         
         # Настройка интерфейса
-        self.setup_interface()
-        
-        # Таймер для обновления телеметрии
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_telemetry)
+        with STARTUP.step("панелі"):
+            self.setup_interface()
         
         # Обновление статуса
         self.update_status("Готовий до роботи")
@@ -70,62 +132,64 @@ class DroneControlApp(QMainWindow):
     
     def setup_button_styles(self):
         """Настройка базовых стилей кнопок"""
-        # Стиль активной кнопки ARM (зеленая)
-        self.arm_active_style = """
-            QPushButton {
-                background-color: #2e7d32 !important;
-                color: white !important;
-                border: none !important;
-                border-radius: 8px !important;
-                padding: 8px 16px !important;
-                font-size: 12pt !important;
-                font-weight: bold !important;
-            }
-            QPushButton:hover {
-                background-color: #388e3c !important;
-            }
-            QPushButton:pressed {
-                background-color: #1b5e20 !important;
-            }
-        """
-        
-        # Стиль активной кнопки DISARM (красная)
-        self.disarm_active_style = """
-            QPushButton {
-                background-color: #d32f2f !important;
-                color: white !important;
-                border: none !important;
-                border-radius: 8px !important;
-                padding: 8px 16px !important;
-                font-size: 12pt !important;
-                font-weight: bold !important;
-            }
-            QPushButton:hover {
-                background-color: #f44336 !important;
-            }
-            QPushButton:pressed {
-                background-color: #b71c1c !important;
-            }
-        """
-        
-        # Стиль неактивной кнопки (серая)
-        self.inactive_style = """
-            QPushButton {
-                background-color: #424242 !important;
-                color: #9e9e9e !important;
-                border: none !important;
-                border-radius: 8px !important;
-                padding: 8px 16px !important;
-                font-size: 12pt !important;
-                font-weight: bold !important;
-            }
-        """
+        # Одна таблица стилей на все состояния; состояние переключается свойством hudState
+        self.arm_buttons_style = state_style("QPushButton", {
+            # Активная кнопка ARM (зеленая)
+            "arm": {
+                "": """
+                    background-color: #2e7d32 !important;
+                    color: white !important;
+                    border: none !important;
+                    border-radius: 8px !important;
+                    padding: 8px 16px !important;
+                    font-size: 12pt !important;
+                    font-weight: bold !important;
+                """,
+                "hover": "background-color: #388e3c !important;",
+                "pressed": "background-color: #1b5e20 !important;",
+            },
+            # Активная кнопка DISARM (красная)
+            "disarm": {
+                "": """
+                    background-color: #d32f2f !important;
+                    color: white !important;
+                    border: none !important;
+                    border-radius: 8px !important;
+                    padding: 8px 16px !important;
+                    font-size: 12pt !important;
+                    font-weight: bold !important;
+                """,
+                "hover": "background-color: #f44336 !important;",
+                "pressed": "background-color: #b71c1c !important;",
+            },
+            # Неактивная кнопка (серая)
+            "inactive": {
+                "": """
+                    background-color: #424242 !important;
+                    color: #9e9e9e !important;
+                    border: none !important;
+                    border-radius: 8px !important;
+                    padding: 8px 16px !important;
+                    font-size: 12pt !important;
+                    font-weight: bold !important;
+                """,
+            },
+        })
+        self.armButton.setStyleSheet(self.arm_buttons_style)
+        self.disarmButton.setStyleSheet(self.arm_buttons_style)
             
     def setup_mavlink_signals(self):
         """Настройка сигналов MAVLink"""
-        self.mavlink.telemetry_updated.connect(self.update_real_telemetry)
-        self.mavlink.connection_status_changed.connect(self.on_mavlink_connection_changed)
-        self.mavlink.message_received.connect(self.add_log)
+        self.link_manager.vehicle_telemetry_updated.connect(self.on_vehicle_telemetry)
+        self.link_manager.vehicle_added.connect(self.add_connected_drone)
+        self.link_manager.vehicle_removed.connect(self.on_vehicle_removed)
+        self.link_manager.link_status_changed.connect(self.on_mavlink_connection_changed)
+        self.link_manager.link_state_changed.connect(self.on_link_state_changed)
+        self.link_manager.command_finished.connect(self.on_command_finished)
+        self.link_manager.status_text.connect(self.on_status_text)
+        self.link_manager.vehicle_lost.connect(self.on_vehicle_lost)
+        self.link_manager.vehicle_restored.connect(self.on_vehicle_restored)
+        self.link_manager.message_received.connect(self.add_log)
         
     def setup_connections(self):
         """Настройка соединений кнопок с функциями"""
@@ -160,9 +224,7 @@ class DroneControlApp(QMainWindow):
         
         # Индикатор подключения
         self.connection_status_button = QtWidgets.QPushButton("● ВІДКЛЮЧЕНО")
-        self.connection_status_button.setStyleSheet("""
-            QPushButton {
-                background-color: #d32f2f;
+        indicator_rules = """
                 color: white;
                 border: none;
                 border-radius: 8px;
@@ -172,8 +234,12 @@ class DroneControlApp(QMainWindow):
                 margin: 5px;
                 max-width: 180px;
                 min-width: 140px;
-            }
-        """)
+        """
+        self.connection_status_button.setStyleSheet(state_style("QPushButton", {
+            "connected": {"": "background-color: #4CAF50;" + indicator_rules},
+            "reconnecting": {"": "background-color: #f57c00;" + indicator_rules},
+            "disconnected": {"": "background-color: #d32f2f;" + indicator_rules},
+        }))
         self.connection_status_button.setEnabled(False)  # Делаем кнопку неактивной (только индикатор)
         
         # Координаты
@@ -253,8 +319,91 @@ class DroneControlApp(QMainWindow):
         layout.addWidget(self.speed_label)
         layout.addWidget(battery_container)
         layout.addWidget(self.battery_progress)
+        layout.addWidget(self.setup_replay_controls())
         layout.addStretch()
         
+    def setup_replay_controls(self):
+        """Панель воспроизведения записанных tlog"""
+        button_style = """
+            QPushButton {
+                background-color: #1e2a30;
+                color: #dbe7f3;
+                border: 1px solid rgba(255,255,255,0.1);
+                border-radius: 6px;
+                padding: 4px 8px;
+                font-size: 10pt;
+                margin: 2px;
+            }
+            QPushButton:hover {
+                background-color: #26343d;
+            }
+            QPushButton:disabled {
+                color: #6c7a84;
+            }
+        """
+        self.replay_open_button = QtWidgets.QPushButton("📼 Відтворити запис")
+        self.replay_open_button.setStyleSheet(button_style)
+        self.replay_open_button.clicked.connect(self.open_replay)
+        
+        # Локальные симулированные аппараты вместо демо-данных
+        self.simulator_button = QtWidgets.QPushButton("🧪 Симулятор")
+        self.simulator_button.setStyleSheet(button_style)
+        self.simulator_button.clicked.connect(self.start_simulator)
+        
+        # Поиск аппаратов в сети и на последовательных портах
+        self.discovery_button = QtWidgets.QPushButton("🔍 Пошук")
+        self.discovery_button.setStyleSheet(button_style)
+        self.discovery_button.clicked.connect(self.open_discovery)
+        
+        # Задержки по этапам от сокета до HUD
+        self.diagnostics_button = QtWidgets.QPushButton("📈 Діагностика")
+        self.diagnostics_button.setStyleSheet(button_style)
+        self.diagnostics_button.clicked.connect(self.open_diagnostics)
+        
+        # Треки аппаратов на карте
+        self.map_button = QtWidgets.QPushButton("🗺 Карта")
+        self.map_button.setStyleSheet(button_style)
+        self.map_button.clicked.connect(self.open_map)
+        
+        self.replay_pause_button = QtWidgets.QPushButton("⏸")
+        self.replay_pause_button.setStyleSheet(button_style)
+        self.replay_pause_button.setCheckable(True)
+        self.replay_pause_button.toggled.connect(self.toggle_replay_pause)
+        
+        # Скорость: реальное время, N× или без ожидания (нагрузочный тест UI)
+        self.replay_speed_combo = QComboBox()
+        for text, speed in (("1×", 1.0), ("2×", 2.0), ("5×", 5.0), ("10×", 10.0), ("Макс", REPLAY_MAX_SPEED)):
+            self.replay_speed_combo.addItem(text, speed)
+        self.replay_speed_combo.currentIndexChanged.connect(self.on_replay_speed_changed)
+        
+        self.replay_slider = QSlider(QtCore.Qt.Horizontal)
+        self.replay_slider.sliderReleased.connect(self.on_replay_seek)
+        
+        self.replay_time_label = QLabel("")
+        self.replay_time_label.setStyleSheet("color: #dbe7f3; font-size: 10pt; margin: 2px;")
+        
+        replay_container = QtWidgets.QWidget()
+        replay_layout = QVBoxLayout(replay_container)
+        replay_layout.setContentsMargins(0, 0, 0, 0)
+        tools_layout = QHBoxLayout()
+        tools_layout.addWidget(self.discovery_button)
+        tools_layout.addWidget(self.simulator_button)
+        tools_layout.addWidget(self.diagnostics_button)
+        tools_layout.addWidget(self.map_button)
+        tools_layout.addStretch()
+        replay_layout.addLayout(tools_layout)
+        buttons_layout = QHBoxLayout()
+        buttons_layout.addWidget(self.replay_open_button)
+        buttons_layout.addWidget(self.replay_pause_button)
+        buttons_layout.addWidget(self.replay_speed_combo)
+        buttons_layout.addStretch()
+        replay_layout.addLayout(buttons_layout)
+        replay_layout.addWidget(self.replay_slider)
+        replay_layout.addWidget(self.replay_time_label)
+        
+        self.reset_replay_controls()
+        return replay_container
+        
     def setup_drones_panel(self):
         """Настройка панели списка дронов"""
         # Список дронов
@@ -290,8 +439,27 @@ class DroneControlApp(QMainWindow):
         # Теперь логи встроены в UI через logsTextEdit - просто добавляем начальное сообщение
         self.add_log("Система ініціалізована")
         
+        # Все принятые кадры пишутся в tlog
+        try:
+            self.link_manager.start_recording(TLOG_DIR)
+            self.add_log(f"💾 Запис телеметрії: {TLOG_DIR}")
+        except OSError as e:
+            self.add_log(f"⚠️ Запис телеметрії недоступний: {str(e)}")
+        
+        # Параметры каждого нового аппарата загружаются автоматически
+        self.link_manager.enable_parameters(PARAM_DIR)
+        
+        # Кадры линков доступны другим программам (QGroundControl, скрипты анализа)
+        if "--router" in sys.argv:
+            try:
+                self.link_manager.start_router(tcp_port=ROUTER_TCP_PORT, udp_port=ROUTER_UDP_PORT)
+            except OSError as e:
+                self.add_log(f"⚠️ Маршрутизатор MAVLink недоступний: {str(e)}")
+        
     def update_drones_list(self):
         """Оновлення списку підключених дронів"""
+        # Пересборка списка не должна сбрасывать выбор оператора через on_drone_selected
+        self.drones_list_widget.blockSignals(True)
         self.drones_list_widget.clear()
         
         if not self.connected_drones:
@@ -307,16 +475,23 @@ class DroneControlApp(QMainWindow):
             # Додаємо підключені дрони
             for drone in self.connected_drones:
                 self.drones_list_widget.addItem(drone)
+                if drone == self.selected_drone:
+                    self.drones_list_widget.setCurrentItem(self.drones_list_widget.item(self.drones_list_widget.count() - 1))
+        self.drones_list_widget.blockSignals(False)
                 
-    def add_connected_drone(self, drone_info):
+    def add_connected_drone(self, vehicle_id, drone_info):
         """Додавання підключеного дрона до списку"""
         if drone_info not in self.connected_drones:
-            self.connected_drones.append(drone_info)
+            self.connected_drones[drone_info] = vehicle_id
+            self.vehicle_telemetry[vehicle_id] = self.link_manager.get_telemetry(vehicle_id)
             self.update_drones_list()
             self.add_log(f"✅ Дрон додано до списку: {drone_info}")
             
-            # Автоматически выбираем подключенный дрон
+            # Автоматически выбираем первый подключенный дрон, остальные - вручную
+            if self.selected_vehicle is not None:
+                return
             self.selected_drone = drone_info
+            self.selected_vehicle = vehicle_id
             self.add_log(f"🎯 Автоматично вибрано дрон: {drone_info}")
             
             # Выделяем дрон в списке
@@ -332,10 +507,34 @@ class DroneControlApp(QMainWindow):
     def remove_connected_drone(self, drone_info):
         """Видалення дрона зі списку"""
         if drone_info in self.connected_drones:
-            self.connected_drones.remove(drone_info)
+            vehicle_id = self.connected_drones.pop(drone_info)
+            self.vehicle_telemetry.pop(vehicle_id, None)
+            if vehicle_id == self.selected_vehicle:
+                self.selected_drone = None
+                self.selected_vehicle = None
+                self.enable_arm_disarm_buttons(False)
             self.update_drones_list()
             self.add_log(f"❌ Дрон видалено зі списку: {drone_info}")
             
+    def on_vehicle_lost(self, vehicle_id):
+        """Аппарат перестал присылать heartbeat (остается в списке)"""
+        name = self.link_manager.vehicle_name(vehicle_id)
+        self.add_log(f"⚠️ Немає зв'язку з {name}")
+        if vehicle_id == self.selected_vehicle:
+            self.update_status("⚠️ Немає зв'язку з вибраним дроном")
+    
+    def on_vehicle_restored(self, vehicle_id):
+        name = self.link_manager.vehicle_name(vehicle_id)
+        self.add_log(f"✅ Зв'язок з {name} відновлено")
+        if vehicle_id == self.selected_vehicle:
+            self.update_status("Підключено")
+            
+    def on_vehicle_removed(self, vehicle_id):
+        """Аппарат пропал вместе со своим линком"""
+        for drone_info, known_id in list(self.connected_drones.items()):
+            if known_id == vehicle_id:
+                self.remove_connected_drone(drone_info)
+            
     def on_drone_selected(self):
         """Обробка вибору дрона"""
         selected_items = self.drones_list_widget.selectedItems()
@@ -346,6 +545,7 @@ class DroneControlApp(QMainWindow):
             if drone_name.startswith("🚁"):
                 self.add_log(f"✅ Вибрано дрон: {drone_name}")
                 self.selected_drone = drone_name
+                self.selected_vehicle = self.connected_drones.get(drone_name)
                 
                 # Активируем кнопки ARM/DISARM для выбранного дрона
                 self.add_log("🔧 Активуємо кнопки ARM/DISARM...")
@@ -354,8 +554,8 @@ class DroneControlApp(QMainWindow):
                 if self.connected:
                     self.add_log(f"✅ Активний дрон з MAVLink: {drone_name}")
                     # Если есть реальное подключение, обновляем согласно телеметрии
-                    telemetry = self.mavlink.get_telemetry()
-                    self.update_arm_buttons_state(telemetry.get('armed', False))
+                    telemetry = self.link_manager.get_telemetry(self.selected_vehicle)
+                    self.update_real_telemetry(telemetry)
                 else:
                     self.add_log(f"📱 Дрон вибрано (симуляція): {drone_name}")
                     # Если нет реального подключения, используем состояние симуляции
@@ -363,10 +563,12 @@ class DroneControlApp(QMainWindow):
             else:
                 # Інформаційні повідомлення не обробляємо
                 self.selected_drone = None
+                self.selected_vehicle = None
                 self.enable_arm_disarm_buttons(False)
         else:
             # Ничего не выбрано
             self.selected_drone = None
+            self.selected_vehicle = None
             self.enable_arm_disarm_buttons(False)
                 
     def toggle_battery_mode(self):
@@ -382,91 +584,85 @@ class DroneControlApp(QMainWindow):
     
     def quick_connect_drone(self):
         """Быстрое подключение к дрону с дефолтными настройками"""
-        if not self.connected:
-            # Используем дефолтные настройки: TCP 192.168.1.118:5760
-            protocol, host, port = "TCP", "192.168.1.118", 5760
-            
-            self.mavlink.set_connection_params(protocol, host, port)
+        # Используем дефолтные настройки: TCP 192.168.1.118:5760
+        protocol, host, port = "TCP", "192.168.1.118", 5760
+        
+        if not self.link_manager.has_link(protocol, host, port):
             self.update_status("Підключення до дрона...")
             self.add_log(f"🚁 Швидке підключення до дрона {host}:{port}...")
             
-            # Пытаемся подключиться
-            if self.mavlink.connect():
-                self.connected = True
-                self.real_telemetry = True
-                
-                # Обновляем индикатор подключения ПОСЛЕ установки connected
-                self.update_connection_indicator(True)
-                # Таймер для реальных данных не нужен
-                self.timer.stop()
-                self.update_status("Підключено до дрона")
-                self.add_log("✅ Швидке підключення встановлено!")
-                
-                # Инициализируем состояние кнопок ARM/DISARM (по умолчанию разоружен)
-                self.update_arm_buttons_state(False)
-                
-                # Додаємо дрон до списку підключених
-                drone_name = f"🚁 Дрон ({protocol}://{host}:{port})"
-                self.add_connected_drone(drone_name)
-            else:
-                self.connected = False
-                self.real_telemetry = False
-                self.update_connection_indicator(False)
-                self.update_status("❌ Помилка підключення")
-                self.add_log("❌ Не вдалося підключитися до дрона")
+            # Подключение асинхронное: результат придет через on_link_state_changed
+            self.link_manager.create_link(protocol, host, port).connect()
         else:
             self.add_log("⚠️ Дрон уже підключено!")
             
     def connect_drone(self):
         """Підключення до дрона"""
-        if not self.connected:
-            # Показываем диалог настройки подключения
-            connection_dialog = ConnectionDialog(self)
-            if connection_dialog.exec_() == QDialog.Accepted:
-                protocol, host, port = connection_dialog.get_connection_params()
-                
-                self.mavlink.set_connection_params(protocol, host, port)
-                self.update_status("Підключення...")
-                self.add_log("Спроба підключення до дрона...")
-                
-                # Пытаемся подключиться
-                if self.mavlink.connect():
-                    self.connected = True
-                    self.real_telemetry = True
-                    
-                    # Обновляем индикатор подключения ПОСЛЕ установки connected
-                    self.update_connection_indicator(True)
-                    # Таймер для реальных данных не нужен
-                    self.timer.stop()
-                    self.update_status("Підключено")
-                    self.add_log("Підключення встановлено")
-                    
-                    # Инициализируем состояние кнопок ARM/DISARM (по умолчанию разоружен)
-                    self.update_arm_buttons_state(False)
-                    
-                    # Додаємо дрон до списку підключених
-                    drone_name = f"🚁 Дрон ({protocol}://{host}:{port})"
-                    self.add_connected_drone(drone_name)
-                else:
-                    self.connected = False
-                    self.real_telemetry = False
-                    self.update_connection_indicator(False)
-                    self.update_status("Помилка підключення")
-        else:
-            self.add_log("Вже підключено!")
+        # Показываем диалог настройки подключения (можно добавлять новые линки к уже подключенным)
+        connection_dialog = ConnectionDialog(self)
+        if connection_dialog.exec_() == QDialog.Accepted:
+            protocol, host, port = connection_dialog.get_connection_params()
+            
+            if self.link_manager.has_link(protocol, host, port):
+                self.add_log("Вже підключено!")
+                return
+            
+            self.update_status("Підключення...")
+            self.add_log("Спроба підключення до дрона...")
+            
+            # Подключение асинхронное: результат придет через on_link_state_changed
+            self.link_manager.create_link(protocol, host, port).connect()
+            
+    def on_link_state_changed(self, link_id, state):
+        """Ход асинхронного подключения линка"""
+        from mavlink_connection import MAVLinkConnection
+        if state == MAVLinkConnection.STATE_WAITING_HEARTBEAT:
+            self.update_status(f"Очікування heartbeat ({link_id})...")
+        elif state == MAVLinkConnection.STATE_STREAMING:
+            self.connected = True
+            self.real_telemetry = True
+            
+            # Обновляем индикатор подключения ПОСЛЕ установки connected
+            self.update_connection_indicator(True)
+            self.update_status("Підключено")
+            self.add_log(f"✅ Підключення встановлено: {link_id}")
+            
+            # Инициализируем состояние кнопок ARM/DISARM (по умолчанию разоружен)
+            self.update_arm_buttons_state(False)
+            
+            # Дрони додаються до списку за їх heartbeat (сигнал vehicle_added)
+        elif state == MAVLinkConnection.STATE_RECONNECTING:
+            # Список дронов и их телеметрия сохраняются до восстановления связи
+            if not self.link_manager.connected_links():
+                self.hud.set_text(self.connection_status_button, "● ПЕРЕПІДКЛЮЧЕННЯ")
+                self.hud.set_state(self.connection_status_button, "reconnecting")
+            self.update_status(f"⚠️ Зв'язок втрачено, перепідключення ({link_id})...")
+        elif state == MAVLinkConnection.STATE_FAILED:
+            if self.replay is not None and self.replay.link_id == link_id:
+                self.reset_replay_controls()
+            self.link_manager.remove_link(link_id)
+            self.connected = bool(self.link_manager.connected_links())
+            self.real_telemetry = self.connected
+            self.update_connection_indicator(self.connected)
+            self.update_status("❌ Помилка підключення")
+            self.add_log(f"❌ Не вдалося підключитися до {link_id}")
             
     def disconnect_drone(self):
-        """Відключення від дрона"""
-        if self.connected:
+        """Відключення від дрона (також скасовує підключення, що ще тривають)"""
+        if self.connected or self.link_manager.connecting_links():
             self.connected = False
             self.real_telemetry = False
             
-            # Отключаемся от MAVLink
-            self.mavlink.disconnect()
+            # Отключаемся от всех MAVLink линков (в т.ч. от воспроизведения)
+            self.link_manager.disconnect_all()
+            self.reset_replay_controls()
+            self.stop_simulator()
             
             # Видаляємо всі дрони зі списку при відключенні
             self.connected_drones.clear()
+            self.vehicle_telemetry.clear()
             self.selected_drone = None  # Сбрасываем выбранный дрон
+            self.selected_vehicle = None
             self.update_drones_list()
             
             # Деактивируем кнопки ARM/DISARM
@@ -478,26 +674,66 @@ class DroneControlApp(QMainWindow):
             # Обновляем индикатор подключения
             self.update_connection_indicator(False)
             
-            # Возвращаемся к демонстрационным данным
-            self.timer.start(1000)
-            
             # Сброс телеметрии
-            self.coord_label.setText("Координати: Н/Д")
-            self.altitude_label.setText("Висота: Н/Д")
-            self.speed_label.setText("Швидкість: Н/Д")
-            self.battery_progress.setValue(0)
+            self.hud.set_text(self.coord_label, "Координати: Н/Д")
+            self.hud.set_text(self.altitude_label, "Висота: Н/Д")
+            self.hud.set_text(self.speed_label, "Швидкість: Н/Д")
+            self.hud.set_value(self.battery_progress, 0)
+            
+    def start_simulator(self):
+        """Запуск локальных симулированных аппаратов (MAVLink по TCP на localhost) и подключение к ним"""
+        if self.simulator is not None:
+            self.add_log("⚠️ Симулятор уже запущено")
+            return
+        from simulator import SimulatorFleet
+        try:
+            self.simulator = SimulatorFleet(vehicles=SIMULATOR_VEHICLES).start()
+        except OSError as e:
+            self.add_log(f"❌ Не вдалося запустити симулятор: {str(e)}")
+            return
+        self.add_log(f"🧪 Симулятор: {len(self.simulator.vehicles)} апарати(ів)")
+        self.update_status("Підключення до симулятора...")
+        for protocol, host, port in self.simulator.addresses:
+            self.link_manager.create_link(protocol, host, port).connect()
+            
+    def stop_simulator(self):
+        if self.simulator is not None:
+            self.simulator.stop()
+            self.simulator = None
+            self.add_log("🧪 Симулятор зупинено")
             
     def check_system(self):
-        """Перевірка системи"""
+        """Перевірка системи по реальній телеметрії підключених апаратів"""
         self.update_status("Перевірка системи...")
         self.add_log("Запуск діагностики системи...")
         
-        # Имитация проверки
-        QtCore.QTimer.singleShot(3000, self.system_check_complete)
+        vehicle_ids = self.link_manager.vehicle_ids()
+        if not vehicle_ids:
+            self.update_status("Немає апаратів для перевірки")
+            self.add_log("⚠️ Діагностика: немає підключених апаратів (підключіться або запустіть симулятор)")
+            return
+        
+        problems = 0
+        now = time.time()
+        for vehicle_id in vehicle_ids:
+            link = self.link_manager.get_link(vehicle_id)
+            vehicle = link.vehicles.get(vehicle_id[1:]) if link else None
+            telemetry = self.link_manager.get_telemetry(vehicle_id)
+            issues = []
+            if vehicle is None or now - vehicle.last_heartbeat > 3:
+                issues.append("немає heartbeat")
+            if telemetry.gps_fix < 3:
+                issues.append(f"GPS fix {telemetry.gps_fix}")
+            if 0 < telemetry.battery_remaining < 20:
+                issues.append(f"батарея {telemetry.battery_remaining}%")
+            name = self.link_manager.vehicle_name(vehicle_id)
+            if issues:
+                problems += 1
+                self.add_log(f"❌ {name}: {', '.join(issues)}")
+            else:
+                self.add_log(f"✅ {name}: в нормі")
         
-    def system_check_complete(self):
-        """Завершення перевірки системи"""
-        status = "Система в нормі" if random.choice([True, False, True]) else "Виявлено проблеми"
+        status = "Система в нормі" if not problems else "Виявлено проблеми"
         self.update_status(status)
         self.add_log(f"Діагностика завершена: {status}")
         
@@ -523,14 +759,15 @@ class DroneControlApp(QMainWindow):
                 self.add_log(f"🔫 Реальна команда ARM для {drone_info}...")
                 
                 # Проверяем текущий статус вооружения
-                telemetry = self.mavlink.get_telemetry()
-                if telemetry.get('armed', False):
+                link = self.link_manager.get_link(self.selected_vehicle)
+                telemetry = self.link_manager.get_telemetry(self.selected_vehicle)
+                if telemetry.armed:
                     self.add_log("⚠️ Дрон уже вооружен!")
                     QMessageBox.information(self, "Увага", "Дрон уже вооружений!")
                     return
                 
-                if self.mavlink.arm_disarm(arm=True):
-                    self.add_log("✅ Реальна команда ARM відправлена успішно")
+                if link and link.arm_disarm(arm=True, target=self.selected_vehicle[1:]):
+                    self.add_log("📤 Реальна команда ARM відправлена, очікуємо підтвердження")
                 else:
                     self.add_log("❌ Помилка відправки реальної команди ARM")
                     QMessageBox.critical(self, "Помилка", "Не вдалося відправити команду ARM!")
@@ -570,14 +807,15 @@ class DroneControlApp(QMainWindow):
                 self.add_log(f"🛡️ Реальна команда DISARM для {drone_info}...")
                 
                 # Проверяем текущий статус вооружения
-                telemetry = self.mavlink.get_telemetry()
-                if not telemetry.get('armed', True):
+                link = self.link_manager.get_link(self.selected_vehicle)
+                telemetry = self.link_manager.get_telemetry(self.selected_vehicle)
+                if not telemetry.armed:
                     self.add_log("⚠️ Дрон уже розброєний!")
                     QMessageBox.information(self, "Увага", "Дрон уже розброєний!")
                     return
                 
-                if self.mavlink.arm_disarm(arm=False):
-                    self.add_log("✅ Реальна команда DISARM відправлена успішно")
+                if link and link.arm_disarm(arm=False, target=self.selected_vehicle[1:]):
+                    self.add_log("📤 Реальна команда DISARM відправлена, очікуємо підтвердження")
                 else:
                     self.add_log("❌ Помилка відправки реальної команди DISARM")
                     QMessageBox.critical(self, "Помилка", "Не вдалося відправити команду DISARM!")
@@ -595,81 +833,166 @@ class DroneControlApp(QMainWindow):
                 QMessageBox.information(self, "Успіх", f"Дрон {drone_info} розброєний!")
                 self.update_status("Дрон розброєний (симуляція)")
         
+    def on_command_finished(self, vehicle_id, command_name, accepted, description):
+        """Результат команды, подтвержденный (или нет) автопилотом"""
+        if command_name == "MAV_CMD_COMPONENT_ARM_DISARM" and not accepted:
+            drone_name = self.link_manager.vehicle_name(vehicle_id)
+            QMessageBox.warning(self, "Помилка", f"Автопілот не виконав ARM/DISARM:\n\n{drone_name}\n{description}")
+        
+    def on_status_text(self, vehicle_id, severity, text):
+        """STATUSTEXT от автопилота (preflight, помилки EKF тощо) - каждое сообщение в журнал"""
+        if text:
+            self.add_log(f"📢 {self.link_manager.vehicle_name(vehicle_id)}: {text}")
+        
     def open_settings(self):
         """Відкриття вікна налаштувань"""
         QMessageBox.information(self, "Налаштування", "Вікно налаштувань (в розробці)")
         self.add_log("Відкрито вікно налаштувань")
         
-    def update_telemetry(self):
-        """Оновлення телеметрії"""
-        if self.connected and not self.real_telemetry:
-            # Генерируем случайные данные для демонстрации (когда нет реального подключения)
-            lat = round(random.uniform(49.0, 51.0), 6)
-            lon = round(random.uniform(30.0, 35.0), 6)
-            altitude = round(random.uniform(10, 500), 1)
-            speed = round(random.uniform(0, 80), 1)
-            
-            self.coord_label.setText(f"Координати: {lat}°, {lon}°")
-            self.altitude_label.setText(f"Висота: {altitude} м")
-            self.speed_label.setText(f"Швидкість: {speed} км/год")
-            
-            # Обновление батареи в зависимости от режима
-            if self.battery_display_mode == "percent":
-                battery_percent = random.randint(20, 100)
-                self.battery_progress.setValue(battery_percent)
-                self.battery_label.setText(f"Батарея: {battery_percent}%")
-            else:
-                # Режим напряжения (обычно 11.1V - 16.8V для Li-Po батарей)
-                voltage = round(random.uniform(11.1, 16.8), 1)
-                battery_percent = int(((voltage - 11.1) / (16.8 - 11.1)) * 100)
-                self.battery_progress.setValue(battery_percent)
-                self.battery_label.setText(f"Батарея: {voltage}V")
-                
-    def update_real_telemetry(self, telemetry_data):
+    def open_replay(self):
+        """Выбор tlog и запуск его воспроизведения через общий конвейер телеметрии"""
+        path, _ = QFileDialog.getOpenFileName(self, "Відтворити запис", TLOG_DIR, "Telemetry log (*.tlog)")
+        if not path:
+            return
+        if self.replay is not None:
+            self.link_manager.remove_link(self.replay.link_id)
+            
+        self.replay = self.link_manager.create_replay(path, self.replay_speed_combo.currentData())
+        self.replay.replay_progress.connect(self.on_replay_progress)
+        self.replay.replay_finished.connect(self.on_replay_finished)
+        self.update_status("Відтворення запису...")
+        self.add_log(f"📼 Відтворення {os.path.basename(path)}")
+        self.replay_pause_button.setEnabled(True)
+        self.replay_slider.setEnabled(True)
+        self.replay.connect()
+        
+    def reset_replay_controls(self):
+        self.replay = None
+        self.replay_pause_button.setChecked(False)
+        self.replay_pause_button.setEnabled(False)
+        self.replay_slider.setEnabled(False)
+        self.replay_slider.setValue(0)
+        self.replay_time_label.setText("")
+        
+    def toggle_replay_pause(self, paused):
+        self.replay_pause_button.setText("▶" if paused else "⏸")
+        if self.replay is None:
+            return
+        if paused:
+            self.replay.pause()
+        else:
+            self.replay.resume()
+            
+    def on_replay_speed_changed(self, index):
+        if self.replay is not None:
+            self.replay.set_speed(self.replay_speed_combo.itemData(index))
+            
+    def on_replay_seek(self):
+        if self.replay is not None:
+            # Позиция ползунка - десятые доли секунды
+            self.replay.seek(self.replay_slider.value() / 10.0)
+            
+    def on_replay_progress(self, position, duration):
+        if self.sender() is not self.replay:
+            return
+        if not self.replay_slider.isSliderDown():
+            self.replay_slider.setMaximum(int(duration * 10))
+            self.replay_slider.setValue(int(position * 10))
+        self.replay_time_label.setText(f"{self.format_duration(position)} / {self.format_duration(duration)}")
+        
+    def on_replay_finished(self):
+        if self.sender() is self.replay:
+            self.update_status("Відтворення завершено")
+            
+    @staticmethod
+    def format_duration(seconds):
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+        
+    def on_vehicle_telemetry(self, vehicle_id, changed):
+        """Кадр телеметрии аппарата (только изменившиеся поля); на HUD выводим только выбранный"""
+        tracer = self.link_manager.tracer
+        if tracer.enabled:
+            tracer.slot_entered(vehicle_id)
+        telemetry = self.vehicle_telemetry.get(vehicle_id)
+        if telemetry is None:
+            return
+        telemetry.update(changed)
+        selected = vehicle_id == self.selected_vehicle
+        if selected:
+            self.update_real_telemetry(telemetry)
+        if tracer.enabled:
+            tracer.rendered(vehicle_id, rendered=selected)
+            
+    def open_diagnostics(self):
+        """Окно задержек по этапам (не модальное)"""
+        if self.diagnostics_dialog is None:
+            self.diagnostics_dialog = LatencyDiagnosticsDialog(self.link_manager, self)
+        self.diagnostics_dialog.show()
+        self.diagnostics_dialog.raise_()
+        
+    def open_map(self):
+        """Карта с треками (не модальное окно), центр - на выбранном дроне"""
+        if self.map_dialog is None:
+            self.map_dialog = MapDialog(self.link_manager, self)
+        self.map_dialog.show()
+        self.map_dialog.raise_()
+        if self.selected_vehicle is not None:
+            self.map_dialog.map_view.follow(self.selected_vehicle)
+        
+    def open_discovery(self):
+        """Окно поиска дронов (не модальное)"""
+        if self.discovery_dialog is None:
+            self.discovery_dialog = DiscoveryDialog(self.link_manager, self)
+        self.discovery_dialog.show()
+        self.discovery_dialog.raise_()
+            
+    def update_real_telemetry(self, telemetry):
         """Обновление реальных данных телеметрии от MAVLink"""
         if not self.real_telemetry:
             return
             
         # Обновляем координаты
-        lat = telemetry_data.get('lat', 0)
-        lon = telemetry_data.get('lon', 0)
+        lat = telemetry.lat
+        lon = telemetry.lon
         if lat != 0 and lon != 0:
-            self.coord_label.setText(f"Координати: {lat:.6f}°, {lon:.6f}°")
+            self.hud.set_text(self.coord_label, f"Координати: {lat:.6f}°, {lon:.6f}°")
         else:
-            self.coord_label.setText("Координати: GPS недоступний")
+            self.hud.set_text(self.coord_label, "Координати: GPS недоступний")
         
         # Обновляем высоту
-        altitude = telemetry_data.get('relative_alt', 0)
-        self.altitude_label.setText(f"Висота: {altitude:.1f} м")
+        altitude = telemetry.relative_alt
+        self.hud.set_text(self.altitude_label, f"Висота: {altitude:.1f} м")
         
         # Обновляем скорость
-        speed = telemetry_data.get('groundspeed', 0)
-        self.speed_label.setText(f"Швидкість: {speed:.1f} км/год")
+        speed = telemetry.groundspeed
+        self.hud.set_text(self.speed_label, f"Швидкість: {speed:.1f} км/год")
         
         # Обновляем батарею
         if self.battery_display_mode == "percent":
-            battery_percent = telemetry_data.get('battery_remaining', 0)
+            battery_percent = telemetry.battery_remaining
             if battery_percent > 0:
-                self.battery_progress.setValue(battery_percent)
-                self.battery_label.setText(f"Батарея: {battery_percent}%")
+                self.hud.set_value(self.battery_progress, battery_percent)
+                self.hud.set_text(self.battery_label, f"Батарея: {battery_percent}%")
             else:
-                self.battery_progress.setValue(0)
-                self.battery_label.setText("Батарея: Н/Д")
+                self.hud.set_value(self.battery_progress, 0)
+                self.hud.set_text(self.battery_label, "Батарея: Н/Д")
         else:
-            voltage = telemetry_data.get('battery_voltage', 0)
+            voltage = telemetry.battery_voltage
             if voltage > 0:
                 # Преобразуем напряжение в проценты для прогресс-бара
                 battery_percent = min(100, max(0, int(((voltage - 11.1) / (16.8 - 11.1)) * 100)))
-                self.battery_progress.setValue(battery_percent)
-                self.battery_label.setText(f"Батарея: {voltage:.1f}V")
+                self.hud.set_value(self.battery_progress, battery_percent)
+                self.hud.set_text(self.battery_label, f"Батарея: {voltage:.1f}V")
             else:
-                self.battery_progress.setValue(0)
-                self.battery_label.setText("Батарея: Н/Д")
+                self.hud.set_value(self.battery_progress, 0)
+                self.hud.set_text(self.battery_label, "Батарея: Н/Д")
                 
         # Дополнительная информация в логи
-        mode = telemetry_data.get('mode', 'UNKNOWN')
-        armed = telemetry_data.get('armed', False)
-        gps_sats = telemetry_data.get('satellites', 0)
+        mode = telemetry.mode
+        armed = telemetry.armed
+        gps_sats = telemetry.satellites
         
         status_info = f"Режим: {mode} | Озброєний: {'Так' if armed else 'Ні'} | GPS сат: {gps_sats}"
         
@@ -681,9 +1004,14 @@ class DroneControlApp(QMainWindow):
         # Обновляем состояние кнопок ARM/DISARM в зависимости от статуса вооружения
         self.update_arm_buttons_state(armed)
         
-    def on_mavlink_connection_changed(self, connected):
+    def on_mavlink_connection_changed(self, link_id, connected):
         """Обработка изменения состояния MAVLink подключения"""
         if not connected and self.connected:
+            if self.link_manager.connected_links():
+                # Пропал один из линков, остальные продолжают работать
+                self.add_log(f"❌ З'єднання {link_id} втрачено")
+                return
+            
             # Соединение потеряно
             self.connected = False
             self.real_telemetry = False
@@ -693,10 +1021,29 @@ class DroneControlApp(QMainWindow):
             
             # Очищаємо список дронів
             self.connected_drones.clear()
+            self.vehicle_telemetry.clear()
             self.update_drones_list()
             
-            # Возвращаемся к демонстрационным данным
-            self.timer.start(1000)
+    def closeEvent(self, event):
+        # Закрываем линки и дописываем tlog до конца
+        self.link_manager.shutdown()
+        self.stop_simulator()
+        self.log_sink.stop()
+        super().closeEvent(event)
+        
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.link_manager.coalescer.set_visible(True)
+        
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # Пока окно скрыто, кадры телеметрии публикуются реже
+        self.link_manager.coalescer.set_visible(False)
+        
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QtCore.QEvent.WindowStateChange:
+            self.link_manager.coalescer.set_visible(not self.isMinimized())
             
     def update_status(self, status):
         """Обновление статуса"""
@@ -706,65 +1053,35 @@ class DroneControlApp(QMainWindow):
     def update_connection_indicator(self, connected):
         """Обновление индикатора подключения"""
         if connected:
-            self.connection_status_button.setText("● ПІДКЛЮЧЕНО")
-            self.connection_status_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 10px 15px;
-                    font-size: 14pt;
-                    font-weight: bold;
-                    margin: 5px;
-                    max-width: 180px;
-                    min-width: 140px;
-                }
-            """)
+            self.hud.set_text(self.connection_status_button, "● ПІДКЛЮЧЕНО")
+            self.hud.set_state(self.connection_status_button, "connected")
         else:
-            self.connection_status_button.setText("● ВІДКЛЮЧЕНО")
-            self.connection_status_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #d32f2f;
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 10px 15px;
-                    font-size: 14pt;
-                    font-weight: bold;
-                    margin: 5px;
-                    max-width: 180px;
-                    min-width: 140px;
-                }
-            """)
+            self.hud.set_text(self.connection_status_button, "● ВІДКЛЮЧЕНО")
+            self.hud.set_state(self.connection_status_button, "disconnected")
         
         # Кнопки ARM/DISARM теперь управляются отдельно через выбор дрона
     
     def enable_arm_disarm_buttons(self, enabled):
         """Включение/отключение кнопок ARM/DISARM"""
-        if hasattr(self, 'armButton') and hasattr(self, 'disarmButton') and hasattr(self, 'arm_active_style'):
+        if hasattr(self, 'armButton') and hasattr(self, 'disarmButton') and hasattr(self, 'arm_buttons_style'):
             self.add_log(f"🔧 Оновлення кнопок ARM/DISARM: enabled={enabled}")
             
             if enabled:
                 # Кнопки доступны, но состояние зависит от статуса вооружения
                 # По умолчанию дрон разоружен, поэтому ARM активна, DISARM неактивна
-                self.armButton.setEnabled(True)
-                self.disarmButton.setEnabled(False)
-                
-                # Используем предопределенные стили с !important
-                self.armButton.setStyleSheet(self.arm_active_style)
-                self.disarmButton.setStyleSheet(self.inactive_style)
+                self.hud.set_enabled(self.armButton, True)
+                self.hud.set_enabled(self.disarmButton, False)
+                self.hud.set_state(self.armButton, "arm")
+                self.hud.set_state(self.disarmButton, "inactive")
                 
                 self.add_log("✅ ARM активна (зелена), DISARM неактивна (сіра)")
                 
             else:
-                # Кнопки недоступны
-                self.armButton.setEnabled(False)
-                self.disarmButton.setEnabled(False)
-                
-                # Обе кнопки неактивны
-                self.armButton.setStyleSheet(self.inactive_style)
-                self.disarmButton.setStyleSheet(self.inactive_style)
+                # Кнопки недоступны, обе неактивны
+                self.hud.set_enabled(self.armButton, False)
+                self.hud.set_enabled(self.disarmButton, False)
+                self.hud.set_state(self.armButton, "inactive")
+                self.hud.set_state(self.disarmButton, "inactive")
         else:
             self.add_log("❌ ПОМИЛКА: Кнопки ARM/DISARM або стилі не знайдено!")
     
@@ -776,59 +1093,38 @@ class DroneControlApp(QMainWindow):
         # Если есть реальное подключение ИЛИ выбран дрон, кнопки должны быть активны
         if not self.connected and not self.selected_drone:
             self.add_log("⚠️ Кнопки деактивовані: немає підключення та не вибрано дрон")
-            self.armButton.setEnabled(False)
-            self.disarmButton.setEnabled(False)
+            self.hud.set_enabled(self.armButton, False)
+            self.hud.set_enabled(self.disarmButton, False)
             return
             
+        # Виджеты меняются только при смене статуса вооружения
         if armed:
             # Дрон вооружен - ARM неактивна, DISARM активна
-            self.armButton.setEnabled(False)
-            self.disarmButton.setEnabled(True)
-            
-            # Визуальная индикация
-            self.armButton.setText("🔫 ВООРУЖЕНО")
-            self.disarmButton.setText("🛡️ DISARM")
-            
-            # Используем предопределенные стили
-            self.armButton.setStyleSheet(self.inactive_style)
-            self.disarmButton.setStyleSheet(self.disarm_active_style)
+            self.hud.set_enabled(self.armButton, False)
+            self.hud.set_enabled(self.disarmButton, True)
+            self.hud.set_text(self.armButton, "🔫 ВООРУЖЕНО")
+            self.hud.set_text(self.disarmButton, "🛡️ DISARM")
+            self.hud.set_state(self.armButton, "inactive")
+            self.hud.set_state(self.disarmButton, "disarm")
         else:
             # Дрон разоружен - ARM активна, DISARM неактивна
-            self.armButton.setEnabled(True)
-            self.disarmButton.setEnabled(False)
-            
-            # Визуальная индикация
-            self.armButton.setText("🔫 ARM")
-            self.disarmButton.setText("🛡️ РОЗБРОЄНО")
-            
-            # Используем предопределенные стили с !important
-            self.armButton.setStyleSheet(self.arm_active_style)
-            self.disarmButton.setStyleSheet(self.inactive_style)
-            
-        # Принудительное обновление интерфейса
-        self.armButton.update()
-        self.disarmButton.update()
+            self.hud.set_enabled(self.armButton, True)
+            self.hud.set_enabled(self.disarmButton, False)
+            self.hud.set_text(self.armButton, "🔫 ARM")
+            self.hud.set_text(self.disarmButton, "🛡️ РОЗБРОЄНО")
+            self.hud.set_state(self.armButton, "arm")
+            self.hud.set_state(self.disarmButton, "inactive")
         
     def add_log(self, message):
         """Добавление сообщения в лог"""
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
-        
-        # Используем новый QPlainTextEdit из UI
-        if hasattr(self, 'logsTextEdit'):
-            self.logsTextEdit.appendPlainText(log_entry)
-            
-            # Прокрутка вниз
-            scrollbar = self.logsTextEdit.verticalScrollBar()
-            scrollbar.setValue(scrollbar.maximum())
-        else:
-            print(f"Log: {log_entry}")  # Fallback в консоль если виджет не найден
+        # Запись попадет в logsTextEdit (или в консоль, если виджета нет) при ближайшем сбросе
+        self.log_sink.add(message)
 
 class ConnectionDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Налаштування підключення до дрона")
-        self.setFixedSize(500, 450)  # Збільшено з 400x300 до 500x450
+        self.setFixedSize(500, 480)
         self.setStyleSheet("""
             QDialog {
                 background-color: #0f1619;
@@ -868,6 +1164,7 @@ class ConnectionDialog(QDialog):
         self.setup_ui()
         
     def setup_ui(self):
+        from serial_transport import BAUD_RATES, DEFAULT_BAUD
         layout = QVBoxLayout(self)
         layout.setSpacing(20)  # Збільшено відступи
         layout.setContentsMargins(25, 25, 25, 25)  # Збільшено поля
@@ -881,18 +1178,24 @@ class ConnectionDialog(QDialog):
         protocol_layout = QHBoxLayout()
         protocol_layout.addWidget(QLabel("Протокол:"))
         self.protocol_combo = QComboBox()
-        self.protocol_combo.addItems(["UDP", "TCP"])
+        self.protocol_combo.addItems(["UDP", "TCP", "SERIAL"])
         self.protocol_combo.setCurrentText("TCP")  # Дефолт TCP
+        self.protocol_combo.currentTextChanged.connect(self.on_protocol_changed)
         protocol_layout.addWidget(self.protocol_combo)
         layout.addLayout(protocol_layout)
         
+        # Сетевые параметры (UDP/TCP)
+        self.network_widget = QtWidgets.QWidget()
+        network_layout = QVBoxLayout(self.network_widget)
+        network_layout.setContentsMargins(0, 0, 0, 0)
+        
         # Хост
         host_layout = QHBoxLayout()
         host_layout.addWidget(QLabel("IP адреса:"))
         self.host_input = QLineEdit("192.168.1.118")  # Дефолт IP дрона
         self.host_input.setPlaceholderText("Введіть IP адресу дрона")
         host_layout.addWidget(self.host_input)
-        layout.addLayout(host_layout)
+        network_layout.addLayout(host_layout)
         
         # Порт
         port_layout = QHBoxLayout()
@@ -901,7 +1204,36 @@ class ConnectionDialog(QDialog):
         self.port_input.setRange(1, 65535)
         self.port_input.setValue(5760)  # Дефолт порт дрона
         port_layout.addWidget(self.port_input)
-        layout.addLayout(port_layout)
+        network_layout.addLayout(port_layout)
+        layout.addWidget(self.network_widget)
+        
+        # Последовательный порт (радиомодем, USB)
+        self.serial_widget = QtWidgets.QWidget()
+        serial_layout = QVBoxLayout(self.serial_widget)
+        serial_layout.setContentsMargins(0, 0, 0, 0)
+        
+        device_layout = QHBoxLayout()
+        device_layout.addWidget(QLabel("Порт:"))
+        self.device_combo = QComboBox()
+        self.device_combo.setEditable(True)  # pty и нестандартные устройства вводятся вручную
+        device_layout.addWidget(self.device_combo, 1)
+        refresh_button = QPushButton("🔄")
+        refresh_button.setToolTip("Оновити список портів")
+        refresh_button.clicked.connect(self.refresh_serial_ports)
+        device_layout.addWidget(refresh_button)
+        serial_layout.addLayout(device_layout)
+        
+        baud_layout = QHBoxLayout()
+        baud_layout.addWidget(QLabel("Швидкість, бод:"))
+        self.baud_combo = QComboBox()
+        self.baud_combo.setEditable(True)
+        self.baud_combo.addItems([str(baud) for baud in BAUD_RATES])
+        self.baud_combo.setCurrentText(str(DEFAULT_BAUD))
+        self.baud_combo.setValidator(QtGui.QIntValidator(1200, 12000000, self))
+        baud_layout.addWidget(self.baud_combo)
+        serial_layout.addLayout(baud_layout)
+        layout.addWidget(self.serial_widget)
+        self.serial_widget.hide()
         
         # Предустановки
         presets_layout = QVBoxLayout()
@@ -934,6 +1266,7 @@ class ConnectionDialog(QDialog):
 • UDP 14550 - стандартний порт QGroundControl
 • UDP 14551 - Mission Planner
 • TCP 5760 - SITL симулятор
+• SERIAL - радіомодем 57600 бод, USB автопілота до 921600 бод
 • Для реального дрона використовуйте його IP""")
         info_label.setStyleSheet("font-size: 10pt; color: #a0a0a0; margin: 10px 0;")
         info_label.setWordWrap(True)
@@ -975,23 +1308,408 @@ class ConnectionDialog(QDialog):
         self.port_input.setValue(port)
         self.protocol_combo.setCurrentText(protocol)
         
+    def on_protocol_changed(self, protocol):
+        serial = protocol == "SERIAL"
+        self.network_widget.setVisible(not serial)
+        self.serial_widget.setVisible(serial)
+        if serial and not self.device_combo.count():
+            self.refresh_serial_ports()
+        
+    def refresh_serial_ports(self):
+        """Список последовательных портов системы"""
+        from serial_transport import list_serial_ports
+        current = self.device_combo.currentText()
+        self.device_combo.clear()
+        for device, description in list_serial_ports():
+            self.device_combo.addItem(device)
+            self.device_combo.setItemData(self.device_combo.count() - 1, description, QtCore.Qt.ToolTipRole)
+        if current:
+            self.device_combo.setCurrentText(current)
+        
     def get_connection_params(self):
-        """Получение параметров подключения"""
+        """Получение параметров подключения (для SERIAL: устройство и скорость в бодах)"""
+        if self.protocol_combo.currentText() == "SERIAL":
+            from serial_transport import DEFAULT_BAUD
+            baud = self.baud_combo.currentText().strip()
+            return (
+                "SERIAL",
+                self.device_combo.currentText().strip(),
+                int(baud) if baud.isdigit() else DEFAULT_BAUD
+            )
         return (
             self.protocol_combo.currentText(),
             self.host_input.text().strip(),
             self.port_input.value()
         )
 
-def main():
-    app = QApplication(sys.argv)
+class DiscoveryDialog(QDialog):
+    """Поиск аппаратов: одновременная проверка сети, UDP портов и последовательных портов"""
     
-    # Устанавливаем стиль приложения
-    app.setStyle('Fusion')
+    def __init__(self, link_manager, parent=None):
+        super().__init__(parent)
+        from discovery import DEFAULT_TCP_PORTS, DEFAULT_UDP_PORTS, DiscoveryScanner, local_subnet
+        self.link_manager = link_manager
+        self.endpoints = []
+        self.setWindowTitle("Пошук дронів")
+        self.resize(720, 480)
+        self.setStyleSheet("""
+            QDialog {
+                background-color: #0f1619;
+                color: #dbe7f3;
+                font-family: "Inter", "Roboto", "Segoe UI", sans-serif;
+            }
+            QLabel, QCheckBox {
+                color: #dbe7f3;
+                font-size: 11pt;
+            }
+            QLineEdit {
+                background-color: #1e2a30;
+                color: #dbe7f3;
+                border: 1px solid rgba(255,255,255,0.1);
+                border-radius: 6px;
+                padding: 6px;
+                font-size: 11pt;
+            }
+            QTableWidget {
+                background-color: rgba(30,42,48,0.7);
+                color: #dbe7f3;
+                gridline-color: rgba(255,255,255,0.05);
+                font-size: 10pt;
+            }
+            QHeaderView::section {
+                background-color: #1e2a30;
+                color: #dbe7f3;
+                border: none;
+                padding: 4px;
+            }
+            QPushButton {
+                background-color: #1e2a30;
+                color: #dbe7f3;
+                border: 1px solid rgba(255,255,255,0.1);
+                border-radius: 6px;
+                padding: 6px 12px;
+                font-size: 11pt;
+            }
+            QPushButton:hover {
+                background-color: #26343d;
+            }
+        """)
+        
+        self.scanner = DiscoveryScanner(self)
+        self.scanner.endpoint_found.connect(self.on_endpoint_found)
+        self.scanner.progress.connect(self.on_progress)
+        self.scanner.finished.connect(self.on_finished)
+        
+        layout = QVBoxLayout(self)
+        
+        form_layout = QtWidgets.QFormLayout()
+        self.hosts_input = QLineEdit(local_subnet())
+        self.hosts_input.setPlaceholderText("192.168.1.0/24, 10.0.0.5")
+        self.tcp_ports_input = QLineEdit(DEFAULT_TCP_PORTS)
+        self.udp_ports_input = QLineEdit(DEFAULT_UDP_PORTS)
+        self.serial_check = QCheckBox("Послідовні порти (57600 / 115200 бод)")
+        self.serial_check.setChecked(True)
+        form_layout.addRow("TCP хости:", self.hosts_input)
+        form_layout.addRow("TCP порти:", self.tcp_ports_input)
+        form_layout.addRow("UDP порти:", self.udp_ports_input)
+        form_layout.addRow("", self.serial_check)
+        layout.addLayout(form_layout)
+        
+        self.table = QTableWidget(0, 5)
+        self.table.setHorizontalHeaderLabels(["Протокол", "Адреса", "Апарат", "Автопілот", "Тип"])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table.doubleClicked.connect(self.connect_selected)
+        layout.addWidget(self.table)
+        
+        buttons_layout = QHBoxLayout()
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: #a0a0a0; font-size: 10pt;")
+        self.scan_button = QPushButton("🔍 Сканувати")
+        self.scan_button.clicked.connect(self.toggle_scan)
+        connect_button = QPushButton("🔗 Підключити")
+        connect_button.clicked.connect(self.connect_selected)
+        buttons_layout.addWidget(self.status_label, 1)
+        buttons_layout.addWidget(self.scan_button)
+        buttons_layout.addWidget(connect_button)
+        layout.addLayout(buttons_layout)
+        
+    def toggle_scan(self):
+        from discovery import default_serial_devices, parse_hosts, parse_ports
+        if self.scanner.running:
+            self.scanner.cancel()
+            return
+        try:
+            targets = {
+                "tcp_hosts": parse_hosts(self.hosts_input.text()),
+                "tcp_ports": parse_ports(self.tcp_ports_input.text()),
+                "udp_ports": parse_ports(self.udp_ports_input.text()),
+                "serial_devices": default_serial_devices() if self.serial_check.isChecked() else (),
+                # Уже открытые линки не трогаем: второй клиент помешал бы им
+                "exclude": [(link.protocol, link.host, link.port) for link in self.link_manager.links.values()],
+            }
+        except ValueError as e:
+            QMessageBox.warning(self, "Помилка", f"Недійсні параметри пошуку:\n{str(e)}")
+            return
+        self.endpoints = []
+        self.table.setRowCount(0)
+        self.scanner.scan(**targets)
+        self.scan_button.setText("⏹ Зупинити")
+        self.status_label.setText("Пошук...")
+        
+    def on_endpoint_found(self, endpoint):
+        self.endpoints.append(endpoint)
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        values = (endpoint.protocol, endpoint.address, f"{endpoint.sysid}:{endpoint.compid}",
+                  endpoint.autopilot_name, endpoint.type_name)
+        for column, value in enumerate(values):
+            self.table.setItem(row, column, QTableWidgetItem(value))
+            
+    def on_progress(self, done, total):
+        self.status_label.setText(f"Перевірено {done}/{total} • знайдено {len(self.endpoints)}")
+        
+    def on_finished(self, count):
+        self.scan_button.setText("🔍 Сканувати")
+        self.status_label.setText(f"Пошук завершено • знайдено {len(self.endpoints)}")
+        
+    def connect_selected(self):
+        """Подключение к выбранным точкам (несколько аппаратов одной точки - один линк)"""
+        rows = sorted({index.row() for index in self.table.selectedIndexes()})
+        params = list(dict.fromkeys(self.endpoints[row].link_params for row in rows))
+        parent = self.parent()
+        for protocol, host, port in params:
+            if self.link_manager.has_link(protocol, host, port):
+                continue
+            if parent is not None:
+                parent.add_log(f"🔗 Підключення до знайденого {protocol} {host}:{port}...")
+            self.link_manager.create_link(protocol, host, port).connect()
+            
+    def closeEvent(self, event):
+        self.scanner.cancel()
+        super().closeEvent(event)
+
+class MapDialog(QDialog):
+    """Карта с треками всех аппаратов из истории телеметрии"""
+    STATS_INTERVAL = 1000  # мс
+    
+    def __init__(self, link_manager, parent=None):
+        super().__init__(parent)
+        self.link_manager = link_manager
+        self.setWindowTitle("Карта")
+        self.resize(900, 640)
+        self.setStyleSheet("""
+            QDialog {
+                background-color: #0f1619;
+                color: #dbe7f3;
+                font-family: "Inter", "Roboto", "Segoe UI", sans-serif;
+            }
+            QLabel {
+                color: #a0a0a0;
+                font-size: 10pt;
+            }
+            QPushButton {
+                background-color: #1e2a30;
+                color: #dbe7f3;
+                border: 1px solid rgba(255,255,255,0.1);
+                border-radius: 8px;
+                padding: 6px 14px;
+                font-size: 11pt;
+            }
+            QPushButton:hover {
+                background-color: #26343d;
+            }
+        """)
+        
+        layout = QVBoxLayout(self)
+        
+        controls_layout = QHBoxLayout()
+        fit_button = QPushButton("⌖ Усі дрони")
+        fit_button.clicked.connect(lambda: self.map_view.fit_tracks())
+        clear_button = QPushButton("Очистити треки")
+        clear_button.clicked.connect(lambda: self.map_view.clear_tracks())
+        controls_layout.addWidget(fit_button)
+        controls_layout.addWidget(clear_button)
+        controls_layout.addStretch()
+        layout.addLayout(controls_layout)
+        
+        self.map_view = MapView(link_manager.history, TILE_DIR, self)
+        layout.addWidget(self.map_view, 1)
+        
+        self.stats_label = QLabel("")
+        layout.addWidget(self.stats_label)
+        
+        self.stats_timer = QTimer(self)
+        self.stats_timer.timeout.connect(self.update_stats)
+        
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.stats_timer.start(self.STATS_INTERVAL)
+        
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.stats_timer.stop()
+        
+    def update_stats(self):
+        tracks = self.map_view.tracks.values()
+        raw = sum(track.raw_points for track in tracks)
+        kept = sum(track.point_count for track in tracks)
+        tiles = self.map_view.tiles
+        self.stats_label.setText(
+            f"Треків: {len(self.map_view.tracks)}, точок: {kept} з {raw} · "
+            f"масштаб {self.map_view.zoom} · відмальовка {self.map_view.last_render_ms:.1f} мс · "
+            f"тайлів у пам'яті: {len(tiles)}")
+
+
+class LatencyDiagnosticsDialog(QDialog):
+    """Гистограммы задержек по аппаратам, типам сообщений и этапам"""
+    REFRESH_INTERVAL = 1000  # мс
+    
+    def __init__(self, link_manager, parent=None):
+        super().__init__(parent)
+        self.link_manager = link_manager
+        self.setWindowTitle("Діагностика затримок")
+        self.resize(760, 480)
+        self.setStyleSheet("""
+            QDialog {
+                background-color: #0f1619;
+                color: #dbe7f3;
+                font-family: "Inter", "Roboto", "Segoe UI", sans-serif;
+            }
+            QLabel, QCheckBox {
+                color: #dbe7f3;
+                font-size: 11pt;
+            }
+            QTableWidget {
+                background-color: rgba(30,42,48,0.7);
+                color: #dbe7f3;
+                gridline-color: rgba(255,255,255,0.05);
+                font-size: 10pt;
+            }
+            QHeaderView::section {
+                background-color: #1e2a30;
+                color: #dbe7f3;
+                border: none;
+                padding: 4px;
+            }
+            QPushButton {
+                background-color: #1e2a30;
+                color: #dbe7f3;
+                border: 1px solid rgba(255,255,255,0.1);
+                border-radius: 8px;
+                padding: 6px 14px;
+                font-size: 11pt;
+            }
+            QPushButton:hover {
+                background-color: #26343d;
+            }
+        """)
+        
+        layout = QVBoxLayout(self)
+        
+        controls_layout = QHBoxLayout()
+        self.enabled_check = QCheckBox("Трасування увімкнено")
+        self.enabled_check.setChecked(link_manager.tracer.enabled)
+        self.enabled_check.toggled.connect(self.set_tracing)
+        reset_button = QPushButton("Скинути")
+        reset_button.clicked.connect(self.reset)
+        export_button = QPushButton("💾 Експорт")
+        export_button.clicked.connect(self.export)
+        controls_layout.addWidget(self.enabled_check)
+        controls_layout.addStretch()
+        controls_layout.addWidget(reset_button)
+        controls_layout.addWidget(export_button)
+        layout.addLayout(controls_layout)
+        
+        self.table = QTableWidget(0, 7)
+        self.table.setHorizontalHeaderLabels(["Апарат", "Повідомлення", "Етап", "N", "p50, мс", "p99, мс", "max, мс"])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        layout.addWidget(self.table)
+        
+        self.hint_label = QLabel("Етапи: read → parse → decode → emit → slot → render")
+        self.hint_label.setStyleSheet("color: #a0a0a0; font-size: 10pt;")
+        layout.addWidget(self.hint_label)
+        
+        # Таблица обновляется только пока окно открыто
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start(self.REFRESH_INTERVAL)
+        
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+        
+    def set_tracing(self, enabled):
+        self.link_manager.set_tracing(enabled)
+        
+    def reset(self):
+        self.link_manager.tracer.reset()
+        self.refresh()
+        
+    def refresh(self):
+        rows = self.link_manager.tracer.summary()
+        self.table.setRowCount(len(rows))
+        for row, (vehicle_id, msg_type, stage, histogram) in enumerate(rows):
+            values = (
+                f"{vehicle_id[1]}:{vehicle_id[2]} ({vehicle_id[0]})",
+                msg_type,
+                stage,
+                str(histogram.count),
+                f"{histogram.percentile(50) * 1000:.2f}",
+                f"{histogram.percentile(99) * 1000:.2f}",
+                f"{histogram.max * 1000:.2f}",
+            )
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+                
+    def export(self):
+        default = os.path.join(os.path.expanduser("~"), f"latency_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        path, _ = QFileDialog.getSaveFileName(self, "Експорт затримок", default, "JSON (*.json)")
+        if not path:
+            return
+        try:
+            self.link_manager.tracer.export(path)
+        except OSError as e:
+            QMessageBox.critical(self, "Помилка", f"Не вдалося зберегти файл:\n{str(e)}")
+
+def report_startup(window):
+    """Время запуска в журнал; с --startup-report - подробный отчет по импортам и этапам"""
+    STARTUP.stop_imports()
+    elapsed = STARTUP.mark("перший показ вікна")
+    window.add_log(f"🚀 Запуск: вікно за {elapsed:.0f} мс (інтерфейс з {window.ui_source})")
+    if "--startup-report" in sys.argv:
+        for line in STARTUP.report():
+            print(line)
+            window.add_log(line)
+
+
+def main():
+    # Процесс приема (--ingest-process) в собранном exe запускается этим же файлом
+    multiprocessing.freeze_support()
+    # Полный диалект pymavlink вместо облегченного (выбирается при первом подключении)
+    if "--full-dialect" in sys.argv:
+        os.environ["DRONECONTROL_DIALECT"] = "full"
+    with STARTUP.step("QApplication"):
+        app = QApplication(sys.argv)
+        
+        # Устанавливаем стиль приложения
+        app.setStyle('Fusion')
     
     # Создаем и показываем окно
     window = DroneControlApp()
-    window.show()
+    with STARTUP.step("показ вікна"):
+        window.show()
+    # Первый проход цикла событий - окно уже отрисовано
+    QTimer.singleShot(0, lambda: report_startup(window))
     
     sys.exit(app.exec_())
 
@@ -0,0 +1,510 @@
+import math
+import os
+import time
+from collections import OrderedDict
+import numpy as np
+from PyQt5.QtCore import QPointF, QRectF, Qt, QTimer
+from PyQt5.QtGui import QColor, QPainter, QPainterPath, QPen, QPixmap, QTransform
+from PyQt5.QtWidgets import QWidget
+
+
+TILE_SIZE = 256
+MIN_ZOOM = 2
+MAX_ZOOM = 19
+EARTH_RADIUS = 6378137.0
+
+# Цвета треков по порядку появления аппаратов
+TRACK_COLORS = ('#4fc3f7', '#ffb74d', '#81c784', '#e57373', '#ba68c8', '#fff176', '#4db6ac', '#f06292')
+
+
+def project(lat, lon):
+    """Web Mercator в долях мира [0, 1): (x, y); принимает числа или массивы NumPy"""
+    x = (np.asarray(lon) + 180.0) / 360.0
+    lat_rad = np.radians(np.clip(lat, -85.05112878, 85.05112878))
+    y = 0.5 - np.log(np.tan(np.pi / 4 + lat_rad / 2)) / (2 * np.pi)
+    return x, y
+
+
+def meters_to_world(meters, lat):
+    """Длина в метрах на широте lat в долях мира"""
+    return meters / (2 * math.pi * EARTH_RADIUS * math.cos(math.radians(lat)))
+
+
+def _segment_distance(px, py, ax, ay, bx, by):
+    """Расстояние от точки (массивов точек) до отрезка AB"""
+    dx, dy = bx - ax, by - ay
+    length = dx * dx + dy * dy
+    if length == 0:
+        return np.hypot(px - ax, py - ay)
+    t = np.clip(((px - ax) * dx + (py - ay) * dy) / length, 0.0, 1.0)
+    return np.hypot(px - (ax + t * dx), py - (ay + t * dy))
+
+
+def douglas_peucker(xs, ys, tolerance):
+    """Индексы точек, оставшихся после упрощения ломаной (первая и последняя - всегда)"""
+    count = len(xs)
+    if count < 3:
+        return list(range(count))
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        distances = _segment_distance(xs[first + 1:last], ys[first + 1:last], xs[first], ys[first], xs[last], ys[last])
+        index = int(np.argmax(distances))
+        if distances[index] > tolerance:
+            split = first + 1 + index
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return np.flatnonzero(keep).tolist()
+
+
+class TrackSimplifier:
+    """Потоковое упрощение трека (Дуглас-Пекер по скользящему окну)
+
+    Новые точки копятся в окне после последней зафиксированной (якоря).
+    Пока все точки окна ближе tolerance к хорде якорь-последняя точка,
+    ничего не фиксируется. Когда хорда перестает описывать окно (или окно
+    заполнилось), окно упрощается Дугласом-Пекером, внутренние оставшиеся
+    точки фиксируются, а хвост после последней из них остается в окне.
+    """
+    MAX_WINDOW = 128
+
+    def __init__(self, tolerance):
+        self.tolerance = tolerance
+        self.anchor = None
+        # Окно: элемент 0 - якорь, затем незафиксированные точки (массивы без перевыделения)
+        self._xs = np.empty(self.MAX_WINDOW + 1)
+        self._ys = np.empty(self.MAX_WINDOW + 1)
+        self._size = 0
+
+    @property
+    def pending(self):
+        """Еще не зафиксированные точки окна: [(x, y)]"""
+        return list(zip(self._xs[1:self._size].tolist(), self._ys[1:self._size].tolist()))
+
+    def add(self, x, y):
+        """Новая точка; возвращает список зафиксированных точек [(x, y)]"""
+        if self.anchor is None:
+            self.anchor = (x, y)
+            self._xs[0], self._ys[0] = x, y
+            self._size = 1
+            return [self.anchor]
+        size = self._size
+        self._xs[size], self._ys[size] = x, y
+        size += 1
+        self._size = size
+        if size < 3:
+            return []
+        xs, ys = self._xs[:size], self._ys[:size]
+        if size <= self.MAX_WINDOW:
+            distances = _segment_distance(xs[1:-1], ys[1:-1], xs[0], ys[0], x, y)
+            if distances.max() <= self.tolerance:
+                return []
+        kept = douglas_peucker(xs, ys, self.tolerance)[1:-1]
+        if not kept:
+            # Окно заполнено прямым участком: фиксируем предпоследнюю точку
+            kept = [size - 2]
+        committed = list(zip(xs[kept].tolist(), ys[kept].tolist()))
+        self.anchor = committed[-1]
+        # Новый якорь и хвост после него - в начало окна
+        tail = size - kept[-1]
+        self._xs[:tail] = xs[kept[-1]:].copy()
+        self._ys[:tail] = ys[kept[-1]:].copy()
+        self._size = tail
+        return committed
+
+
+class _Segment:
+    """Зафиксированный участок трека с путями по уровням детализации
+
+    Уровень 0 - точки трека как есть, уровень k - упрощение с допуском в
+    2**k раз больше. Пути уровней строятся при первой отрисовке на нужном
+    масштабе и дальше только перерисовываются.
+    """
+
+    def __init__(self, points, tolerance):
+        self.xs = np.array([p[0] for p in points])
+        self.ys = np.array([p[1] for p in points])
+        self.tolerance = tolerance
+        self.paths = {0: _make_path(points)}
+        self.bounds = self.paths[0].boundingRect()
+        self.points = len(points)
+
+    def path(self, level):
+        path = self.paths.get(level)
+        if path is None:
+            kept = douglas_peucker(self.xs, self.ys, self.tolerance * 2 ** level)
+            path = _make_path(list(zip(self.xs[kept].tolist(), self.ys[kept].tolist())))
+            self.paths[level] = path
+        return path
+
+
+def _make_path(points):
+    path = QPainterPath()
+    if points:
+        path.moveTo(*points[0])
+        for x, y in points[1:]:
+            path.lineTo(x, y)
+    return path
+
+
+class VehicleTrack:
+    """Трек одного аппарата в координатах мира
+
+    Зафиксированные точки собираются в участки по SEGMENT_POINTS: путь
+    участка строится один раз и при панорамировании и масштабе только
+    перерисовывается с другим преобразованием. Заново строится лишь
+    короткий открытый хвост.
+    """
+    SEGMENT_POINTS = 256
+    MAX_LEVEL = 8
+    PIXEL_TOLERANCE = 0.75  # допустимая погрешность упрощенного пути на экране, пикселей
+
+    def __init__(self, tolerance_m=1.0):
+        self.tolerance_m = tolerance_m
+        self.simplifier = None
+        self.segments = []
+        self.open_points = []
+        self.position = None
+        self.last_time = 0.0
+        self.last_latlon = None
+        self.raw_points = 0
+        self._tail = None
+
+    @property
+    def tolerance(self):
+        return self.simplifier.tolerance if self.simplifier is not None else 0.0
+
+    def extend(self, xs, ys):
+        """Новые точки трека (координаты мира)"""
+        if not len(xs):
+            return
+        if self.simplifier is None:
+            # Допуск в долях мира зависит от широты: считаем по первой точке
+            lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * ys[0]))))
+            self.simplifier = TrackSimplifier(meters_to_world(self.tolerance_m, lat))
+        add = self.simplifier.add
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            committed = add(x, y)
+            if committed:
+                self.open_points.extend(committed)
+        self.raw_points += len(xs)
+        self.position = (float(xs[-1]), float(ys[-1]))
+        while len(self.open_points) > self.SEGMENT_POINTS:
+            # Последняя точка участка - первая следующего, чтобы трек был непрерывным
+            chunk = self.open_points[:self.SEGMENT_POINTS + 1]
+            self.segments.append(_Segment(chunk, self.tolerance))
+            del self.open_points[:self.SEGMENT_POINTS]
+        self._tail = None
+
+    def tail_path(self):
+        """Открытый хвост: незамороженные точки, окно упрощения и текущее положение"""
+        if self._tail is None:
+            points = list(self.open_points)
+            if self.simplifier is not None:
+                points.extend(self.simplifier.pending)
+            self._tail = _make_path(points)
+        return self._tail
+
+    def level_for(self, scale):
+        """Самый грубый уровень детализации, погрешность которого на экране не видна"""
+        error = self.tolerance * scale
+        if error <= 0 or error >= self.PIXEL_TOLERANCE:
+            return 0
+        return min(self.MAX_LEVEL, int(math.log2(self.PIXEL_TOLERANCE / error)))
+
+    @property
+    def point_count(self):
+        return sum(segment.points for segment in self.segments) + len(self.open_points)
+
+
+class TileCache:
+    """Тайлы карты из локального каталога {z}/{x}/{y}.png с LRU в памяти
+
+    Отсутствующие тайлы тоже кешируются (как None), чтобы не обращаться к
+    диску на каждой перерисовке.
+    """
+    EXTENSIONS = ('png', 'jpg', 'jpeg')
+
+    def __init__(self, directory, capacity=512):
+        self.directory = directory
+        self.capacity = capacity
+        self._tiles = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._tiles)
+
+    def get(self, zoom, x, y):
+        key = (zoom, x, y)
+        if key in self._tiles:
+            self._tiles.move_to_end(key)
+            self.hits += 1
+            return self._tiles[key]
+        self.misses += 1
+        pixmap = self._load(zoom, x, y)
+        self._tiles[key] = pixmap
+        while len(self._tiles) > self.capacity:
+            self._tiles.popitem(last=False)
+        return pixmap
+
+    def _load(self, zoom, x, y):
+        if not self.directory:
+            return None
+        for extension in self.EXTENSIONS:
+            path = os.path.join(self.directory, str(zoom), str(x), f"{y}.{extension}")
+            if os.path.exists(path):
+                pixmap = QPixmap(path)
+                return None if pixmap.isNull() else pixmap
+        return None
+
+    def clear(self):
+        self._tiles.clear()
+
+
+class MapView(QWidget):
+    """Карта с треками аппаратов из истории телеметрии
+
+    Треки дополняются по таймеру только новыми отсчетами lat/lon из
+    TelemetryStore и хранят всю историю полета в упрощенном виде (история
+    хранилища ограничена несколькими минутами). Колесо - масштаб, левая
+    кнопка - перетаскивание.
+    """
+    REFRESH_INTERVAL = 200  # мс
+    TRACK_TOLERANCE = 1.0  # м, допуск упрощения трека
+
+    def __init__(self, history, tile_directory=None, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.tiles = TileCache(tile_directory)
+        self.tracks = {}  # vehicle_id -> VehicleTrack
+        self.colors = {}
+        self._sources = {}  # vehicle_id -> VehicleHistory, из которой построен трек
+        self.zoom = 15
+        self.center = None  # координаты мира; None - по первому аппарату
+        self.selected = None
+        self.last_render_ms = 0.0
+        self._drag_start = None
+        self.setMinimumSize(320, 240)
+        self.setMouseTracking(False)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start(self.REFRESH_INTERVAL)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+
+    # --- Данные ---
+
+    def refresh(self):
+        if self.poll_history():
+            self.update()
+
+    def poll_history(self):
+        """Дополнение треков отсчетами, пришедшими с прошлого опроса; True - что-то изменилось"""
+        changed = False
+        now = time.time()
+        for vehicle_id in self.history.vehicle_ids():
+            history = self.history.vehicle(vehicle_id)
+            track = self.tracks.get(vehicle_id)
+            if track is None or self._sources.get(vehicle_id) is not history:
+                # Новый аппарат или история, начатая заново (переход по записи): трек строится с нуля
+                track = VehicleTrack(self.TRACK_TOLERANCE)
+                self.tracks[vehicle_id] = track
+                self._sources[vehicle_id] = history
+                if vehicle_id not in self.colors:
+                    self.colors[vehicle_id] = QColor(TRACK_COLORS[(len(self.tracks) - 1) % len(TRACK_COLORS)])
+            lat_t, lat_v = history.window('lat', now - track.last_time + 1, now)
+            lon_t, lon_v = history.window('lon', now - track.last_time + 1, now)
+            lat_t, lat_v = lat_t[lat_t > track.last_time], lat_v[lat_t > track.last_time]
+            lon_t, lon_v = lon_t[lon_t > track.last_time], lon_v[lon_t > track.last_time]
+            if not len(lat_t) and not len(lon_t):
+                continue
+            # lat и lon могут прийти в разных отсчетах: выравниваем их по общим моментам
+            times = np.union1d(lat_t, lon_t)
+            last_lat, last_lon = track.last_latlon or (np.nan, np.nan)
+            lats = self._forward_fill(times, lat_t, lat_v, last_lat)
+            lons = self._forward_fill(times, lon_t, lon_v, last_lon)
+            track.last_time = float(times[-1])
+            track.last_latlon = (float(lats[-1]), float(lons[-1]))
+            # Без GPS автопилот шлет нули
+            valid = ~(np.isnan(lats) | np.isnan(lons) | ((lats == 0) & (lons == 0)))
+            if not valid.any():
+                continue
+            xs, ys = project(lats[valid], lons[valid])
+            track.extend(xs, ys)
+            if self.center is None:
+                self.center = track.position
+            changed = True
+        return changed
+
+    @staticmethod
+    def _forward_fill(times, field_times, field_values, previous):
+        index = np.searchsorted(field_times, times, side='right') - 1
+        values = field_values[np.clip(index, 0, None)] if len(field_values) else np.full(len(times), previous)
+        return np.where(index >= 0, values, previous)
+
+    def clear_tracks(self):
+        self.tracks.clear()
+        self.colors.clear()
+        self._sources.clear()
+        self.update()
+
+    # --- Вид ---
+
+    @property
+    def scale(self):
+        """Пикселей экрана на долю мира"""
+        return TILE_SIZE * 2 ** self.zoom
+
+    def world_to_screen(self, x, y):
+        scale = self.scale
+        return (QPointF((x - self.center[0]) * scale + self.width() / 2,
+                        (y - self.center[1]) * scale + self.height() / 2))
+
+    def screen_to_world(self, point):
+        scale = self.scale
+        return ((point.x() - self.width() / 2) / scale + self.center[0],
+                (point.y() - self.height() / 2) / scale + self.center[1])
+
+    def visible_world(self):
+        scale = self.scale
+        return QRectF(self.center[0] - self.width() / 2 / scale, self.center[1] - self.height() / 2 / scale,
+                      self.width() / scale, self.height() / scale)
+
+    def set_zoom(self, zoom, anchor=None):
+        """Целочисленный масштаб тайлов; anchor - точка экрана, остающаяся на месте"""
+        zoom = max(MIN_ZOOM, min(MAX_ZOOM, zoom))
+        if zoom == self.zoom or self.center is None:
+            self.zoom = zoom
+            return
+        if anchor is not None:
+            before = self.screen_to_world(anchor)
+            self.zoom = zoom
+            after = self.screen_to_world(anchor)
+            self.center = (self.center[0] + before[0] - after[0], self.center[1] + before[1] - after[1])
+        else:
+            self.zoom = zoom
+        self.update()
+
+    def fit_tracks(self):
+        """Масштаб и центр, при которых видны все треки"""
+        bounds = QRectF()
+        for track in self.tracks.values():
+            for segment in track.segments:
+                bounds = bounds.united(segment.bounds)
+            tail = track.tail_path().boundingRect()
+            if not tail.isNull():
+                bounds = bounds.united(tail)
+            if track.position is not None:
+                bounds = bounds.united(QRectF(track.position[0], track.position[1], 1e-9, 1e-9))
+        if bounds.isNull():
+            return
+        self.center = (bounds.center().x(), bounds.center().y())
+        span = max(bounds.width() / max(1, self.width()), bounds.height() / max(1, self.height()), 1e-12)
+        self.zoom = max(MIN_ZOOM, min(MAX_ZOOM, int(math.floor(math.log2(1.0 / (span * 1.2) / TILE_SIZE)))))
+        self.update()
+
+    def follow(self, vehicle_id):
+        """Центрирование на аппарате (и выделение его трека)"""
+        self.selected = vehicle_id
+        track = self.tracks.get(vehicle_id)
+        if track is not None and track.position is not None:
+            self.center = track.position
+        self.update()
+
+    # --- Отрисовка ---
+
+    def paintEvent(self, event):
+        started = time.perf_counter()
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor('#0f1619'))
+        if self.center is None:
+            painter.setPen(QColor('#6c7a84'))
+            painter.drawText(self.rect(), Qt.AlignCenter, "Немає координат апаратів")
+            painter.end()
+            return
+        self._draw_tiles(painter)
+        self._draw_tracks(painter)
+        painter.end()
+        self.last_render_ms = (time.perf_counter() - started) * 1000
+
+    def _draw_tiles(self, painter):
+        count = 2 ** self.zoom
+        view = self.visible_world()
+        first_x, last_x = int(math.floor(view.left() * count)), int(math.floor(view.right() * count))
+        first_y, last_y = max(0, int(math.floor(view.top() * count))), min(count - 1, int(math.floor(view.bottom() * count)))
+        grid = QPen(QColor(255, 255, 255, 20))
+        for tile_y in range(first_y, last_y + 1):
+            for tile_x in range(first_x, last_x + 1):
+                corner = self.world_to_screen(tile_x / count, tile_y / count)
+                target = QRectF(corner.x(), corner.y(), TILE_SIZE, TILE_SIZE)
+                pixmap = self.tiles.get(self.zoom, tile_x % count, tile_y)
+                if pixmap is not None:
+                    painter.drawPixmap(target, pixmap, QRectF(pixmap.rect()))
+                else:
+                    # Тайла нет в каталоге - сетка вместо подложки
+                    painter.setPen(grid)
+                    painter.drawRect(target)
+
+    def _draw_tracks(self, painter):
+        view = self.visible_world()
+        scale = self.scale
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.save()
+        painter.setTransform(QTransform(scale, 0, 0, scale,
+                                        self.width() / 2 - self.center[0] * scale,
+                                        self.height() / 2 - self.center[1] * scale))
+        for vehicle_id, track in self.tracks.items():
+            # Толщина в пикселях экрана, а не в долях мира; линии в 1 пиксель рисуются
+            # без построения контура и на порядок быстрее толстых
+            pen = QPen(self.colors[vehicle_id], 2 if vehicle_id == self.selected else 1)
+            pen.setCosmetic(True)
+            painter.setPen(pen)
+            level = track.level_for(scale)
+            for segment in track.segments:
+                if segment.bounds.intersects(view):
+                    painter.drawPath(segment.path(level))
+            painter.drawPath(track.tail_path())
+        painter.restore()
+
+        for vehicle_id, track in self.tracks.items():
+            if track.position is None:
+                continue
+            point = self.world_to_screen(*track.position)
+            painter.setPen(QPen(QColor('#0f1619'), 2))
+            painter.setBrush(self.colors[vehicle_id])
+            radius = 7 if vehicle_id == self.selected else 5
+            painter.drawEllipse(point, radius, radius)
+
+    # --- Мышь ---
+
+    def wheelEvent(self, event):
+        step = 1 if event.angleDelta().y() > 0 else -1
+        self.set_zoom(self.zoom + step, event.pos())
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton and self.center is not None:
+            self._drag_start = (event.pos(), self.center)
+
+    def mouseMoveEvent(self, event):
+        if self._drag_start is None:
+            return
+        origin, center = self._drag_start
+        delta = event.pos() - origin
+        self.center = (center[0] - delta.x() / self.scale, center[1] - delta.y() / self.scale)
+        self.update()
+
+    def mouseReleaseEvent(self, event):
+        self._drag_start = None
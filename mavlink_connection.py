@@ -1,48 +1,156 @@
-import socket
 import threading
 import time
-from pymavlink import mavutil
+import mavlink_dialect
+from mavlink_dialect import mavutil
 from PyQt5.QtCore import QObject, pyqtSignal
+from io_pool import shared_pool
+from buffered_transport import BufferedTCP, BufferedUDP
+from command_dispatcher import CommandDispatcher, CommandTimeoutError, command_name, result_name
+from message_handlers import MessageHandlerRegistry, statustext_text
+from mission import MISSION_MESSAGE_IDS, MissionClient
+from parameters import ParameterClient
+from serial_transport import DEFAULT_BAUD, BufferedSerial
+from stream_rates import StreamRateController
+from telemetry_store import TelemetrySnapshot
+from timer_wheel import TimerWheel
+
+
+class VehicleState:
+    """Состояние одного аппарата на линке (определяется парой sysid/compid)"""
+
+    def __init__(self, sysid, compid):
+        self.sysid = sysid
+        self.compid = compid
+        self.mav_type = None
+        self.autopilot = None
+        self.last_heartbeat = 0.0
+        # Heartbeat не приходил дольше таймаута (данные аппарата сохраняются)
+        self.lost = False
+        self.telemetry = TelemetrySnapshot()
+
+    @property
+    def key(self):
+        return (self.sysid, self.compid)
+
 
 class MAVLinkConnection(QObject):
-    # Сигналы для обновления UI
-    telemetry_updated = pyqtSignal(dict)
+    # Сигналы для обновления UI (sysid, compid, изменившиеся поля телеметрии аппарата)
+    telemetry_updated = pyqtSignal(int, int, dict)
+    vehicle_discovered = pyqtSignal(int, int)
     connection_status_changed = pyqtSignal(bool)
     message_received = pyqtSignal(str)
+    state_changed = pyqtSignal(str)
+    # sysid, compid, имя команды, принята ли, описание результата
+    command_finished = pyqtSignal(int, int, str, bool, str)
+    # Каждое STATUSTEXT аппарата: sysid, compid, severity, текст
+    status_text = pyqtSignal(int, int, int, str)
+    # Аппарат перестал присылать heartbeat / снова появился
+    vehicle_lost = pyqtSignal(int, int)
+    vehicle_restored = pyqtSignal(int, int)
+    # Загрузка параметров: sysid, compid, получено, всего / число параметров, из кеша ли / причина отказа
+    parameters_progress = pyqtSignal(int, int, int, int)
+    parameters_ready = pyqtSignal(int, int, int, bool)
+    parameters_failed = pyqtSignal(int, int, str)
+    # Передача миссии: sysid, compid, передано, всего / направление (upload, download), успех, описание
+    mission_progress = pyqtSignal(int, int, int, int)
+    mission_finished = pyqtSignal(int, int, str, bool, str)
     
-    def __init__(self):
+    # Состояния подключения
+    STATE_IDLE = "idle"
+    STATE_RESOLVING = "resolving"
+    STATE_WAITING_HEARTBEAT = "waiting_heartbeat"
+    STATE_STREAMING = "streaming"
+    STATE_RECONNECTING = "reconnecting"
+    STATE_FAILED = "failed"
+    ACTIVE_STATES = (STATE_RESOLVING, STATE_WAITING_HEARTBEAT, STATE_STREAMING, STATE_RECONNECTING)
+    
+    HEARTBEAT_TIMEOUT_MS = 3000
+    REPLAY = False  # воспроизведение записи (ReplayConnection), а не живой линк
+    IN_PROCESS = True  # разбор в процессе окна (False - IngestLink процесса приема)
+    # Пауза перед повторным подключением: удваивается с каждой попыткой до предела
+    RECONNECT_DELAY = 0.5
+    RECONNECT_DELAY_MAX = 30.0
+    
+    # Сообщения, которые линк обрабатывает сам, даже без подписчиков
+    LINK_MESSAGE_IDS = frozenset((
+        mavutil.mavlink.MAVLINK_MSG_ID_HEARTBEAT,
+        mavutil.mavlink.MAVLINK_MSG_ID_COMMAND_ACK,
+        mavutil.mavlink.MAVLINK_MSG_ID_PARAM_VALUE,
+        mavutil.mavlink.MAVLINK_MSG_ID_AUTOPILOT_VERSION,
+        mavutil.mavlink.MAVLINK_MSG_ID_STATUSTEXT,
+    )) | MISSION_MESSAGE_IDS
+    
+    def __init__(self, io_pool=None, handlers=None):
         super().__init__()
         self.connection = None
+        self._dialect = mavlink_dialect.generation  # выбор диалекта, с которым создан парсер
         self.connected = False
         self.running = False
-        self.thread = None
+        # Чтение выполняет общий пул потоков, а не отдельный поток на линк
+        self.io_pool = io_pool if io_pool is not None else shared_pool()
+        self.link_id = None
+        
+        # Состояние асинхронного подключения
+        self.state = self.STATE_IDLE
+        self.connect_timeout = 10.0  # секунд на heartbeat
+        self._state_lock = threading.Lock()
+        self._attempt = 0
+        self._deadline = 0.0
+        
+        # Контроль heartbeat аппаратов и автоматическое переподключение
+        self.heartbeat_timeout = self.HEARTBEAT_TIMEOUT_MS  # мс; None - без контроля
+        self.auto_reconnect = True
+        self._watchdog = TimerWheel(tick=self.io_pool.poll_interval)
+        self._reconnecting = False
+        self._reconnect_count = 0
+        self._reconnect_at = None
+        
+        # Команды в полете и их сопоставление с COMMAND_ACK
+        self._send_lock = threading.Lock()
+        self.commands = CommandDispatcher(self._send_command_long)
+        # Частоты сообщений аппаратов (SET_MESSAGE_INTERVAL) и их понижение на медленном линке
+        self.stream_rates = StreamRateController(self)
+        # Пропускная способность линка, байт/с (None - неизвестна, понижение только по потерям)
+        self.bandwidth_limit = None
+        # Таблицы параметров аппаратов (PARAM_REQUEST_LIST с дозапросом пропусков и кешем на диске)
+        self.parameters = ParameterClient(self)
+        # Загружать параметры каждого нового аппарата автоматически
+        self.auto_parameters = False
+        # Загрузка и скачивание миссий
+        self.missions = MissionClient(self)
+        
+        # Аппараты на линке: (sysid, compid) -> VehicleState
+        self.vehicles = {}
+        # Декодеры сообщений по id; подписчики могут добавлять свои
+        self.handlers = handlers if handlers is not None else MessageHandlerRegistry.with_defaults()
+        # Подписчики, уже упавшие с исключением (сообщаем о каждом один раз)
+        self._failed_handlers = set()
+        # Приемник изменений телеметрии (TelemetryCoalescer); без него - сигнал telemetry_updated
+        self.telemetry_sink = None
+        # История телеметрии (TelemetryStore), необязательна
+        self.telemetry_store = None
+        # Запись сырых кадров в tlog (TlogRecorder), необязательна
+        self.recorder = None
+        # Трассировка задержек по этапам (LatencyTracer), только пока включена
+        self.tracer = None
+        # Маршрутизатор сырых кадров для других программ (MAVLinkRouter), необязателен
+        self.router = None
         
         # Параметры подключения по умолчанию
         self.connection_string = "tcp:192.168.1.118:5760"  # Реальный дрон
-        self.protocol = "TCP"  # UDP или TCP
+        self.protocol = "TCP"  # UDP, TCP или SERIAL
         self.host = "192.168.1.118"
         self.port = 5760
+        self.baud = DEFAULT_BAUD
         
-        # Данные телеметрии
-        self.telemetry_data = {
-            'lat': 0.0,
-            'lon': 0.0,
-            'alt': 0.0,
-            'relative_alt': 0.0,
-            'heading': 0.0,
-            'groundspeed': 0.0,
-            'airspeed': 0.0,
-            'battery_voltage': 0.0,
-            'battery_current': 0.0,
-            'battery_remaining': 0,
-            'mode': 'UNKNOWN',
-            'armed': False,
-            'gps_fix': 0,
-            'satellites': 0
-        }
+        # Данные телеметрии основного аппарата (target_system)
+        self.telemetry = TelemetrySnapshot()
     
     def set_connection_params(self, protocol, host, port):
-        """Установка параметров подключения"""
+        """Установка параметров подключения
+
+        Для SERIAL host - устройство (/dev/ttyUSB0, COM3), port - скорость в бодах.
+        """
         self.protocol = protocol
         self.host = host
         self.port = port
@@ -51,196 +159,524 @@ class MAVLinkConnection(QObject):
             self.connection_string = f"udpin:{host}:{port}"
         elif protocol == "TCP":
             self.connection_string = f"tcp:{host}:{port}"
+        elif protocol == "SERIAL":
+            self.connection_string = host
+            self.baud = port
+            # Понижение частот потоков учитывает скорость порта
+            self.bandwidth_limit = port / 10
+            self.message_received.emit(f"Параметри з'єднання: {host} @ {port} бод")
+            return
         
         self.message_received.emit(f"Параметри з'єднання: {protocol}://{host}:{port}")
     
     def connect(self):
-        """Подключение к дрону"""
-        try:
-            self.message_received.emit(f"Підключення до {self.connection_string}...")
-            
-            # Создаем MAVLink соединение
-            self.connection = mavutil.mavlink_connection(
-                self.connection_string,
-                baud=57600,
-                source_system=255,
-                source_component=0
-            )
-            
-            # Ждем первое heartbeat сообщение
-            self.message_received.emit("Очікування heartbeat...")
-            
-            # Запускаем поток для получения данных
+        """Асинхронное подключение к дрону
+
+        Возвращается сразу; ход подключения сообщается сигналом state_changed
+        (resolving -> waiting_heartbeat -> streaming или failed).
+        """
+        with self._state_lock:
+            if self.state in self.ACTIVE_STATES:
+                return False
+            self._attempt += 1
+            attempt = self._attempt
+            self.connected = False
             self.running = True
-            self.thread = threading.Thread(target=self._receive_loop, daemon=True)
-            self.thread.start()
-            
-            # Ждем подключения (максимум 10 секунд)
-            start_time = time.time()
-            while not self.connected and (time.time() - start_time) < 10:
-                time.sleep(0.1)
-            
-            if self.connected:
-                self.message_received.emit("✅ Підключення встановлено!")
-                self.connection_status_changed.emit(True)
-                
-                # Запрашиваем поток данных
-                self._request_data_stream()
-                return True
+            self._deadline = time.monotonic() + self.connect_timeout
+            self._reconnecting = False
+            self._reconnect_count = 0
+            self._reconnect_at = None
+        
+        self.message_received.emit(f"Підключення до {self.connection_string}...")
+        self._set_state(self.STATE_RESOLVING)
+        
+        # Пул следит за таймаутом подключения еще до появления сокета
+        self.io_pool.register(self)
+        self.io_pool.submit(self._open_connection, attempt)
+        return True
+    
+    def cancel(self):
+        """Отмена подключения, которое еще не завершилось"""
+        if self.state in (self.STATE_RESOLVING, self.STATE_WAITING_HEARTBEAT, self.STATE_RECONNECTING):
+            self._teardown()
+            self.message_received.emit("⏹ Підключення скасовано")
+            self._set_state(self.STATE_IDLE)
+    
+    def _create_connection(self):
+        """Открытие транспорта (наследники подменяют источник кадров, например tlog)"""
+        if self.protocol == "SERIAL":
+            return BufferedSerial(self.host, baud=self.baud, source_system=255, source_component=0)
+        if self.protocol == "TCP":
+            return BufferedTCP(f"{self.host}:{self.port}", source_system=255, source_component=0)
+        return BufferedUDP(f"{self.host}:{self.port}", source_system=255, source_component=0)
+    
+    def _open_connection(self, attempt):
+        """Создание MAVLink соединения (в фоновом потоке, т.к. может блокироваться)"""
+        try:
+            connection = self._create_connection()
+        except Exception as e:
+            if attempt == self._attempt:
+                if self._reconnecting:
+                    self._schedule_reconnect(f"⚠️ Повторне підключення не вдалося: {str(e)}")
+                else:
+                    self._fail(f"❌ Помилка підключення: {str(e)}")
+            return
+        
+        with self._state_lock:
+            if attempt != self._attempt or not self.running:
+                # Подключение отменили, пока открывалось соединение
+                stale = True
             else:
-                self.message_received.emit("❌ Таймаут підключення")
-                self.disconnect()
+                stale = False
+                self.connection = connection
+                self._dialect = mavlink_dialect.generation
+                # pymavlink сообщает о закрытии TCP через handle_eof/handle_disconnect
+                self._hook_link_errors()
+                if hasattr(connection, 'raw_sink'):
+                    connection.raw_sink = self._forward_raw
+        if stale:
+            connection.close()
+            return
+        
+        # Ждем первое heartbeat сообщение
+        self.message_received.emit("Очікування heartbeat...")
+        self._set_state(self.STATE_WAITING_HEARTBEAT)
+        self.io_pool.refresh(self)
+    
+    def _on_heartbeat_established(self):
+        """Первый heartbeat получен - линк готов (частоты потоков запрашиваются для каждого аппарата)"""
+        self.message_received.emit("✅ Підключення встановлено!")
+        self._set_state(self.STATE_STREAMING)
+        self.connection_status_changed.emit(True)
+    
+    def _on_link_restored(self, vehicle):
+        """Первый heartbeat после переподключения: аппараты и их данные уже известны"""
+        self.connected = True
+        self._reconnecting = False
+        self._reconnect_count = 0
+        self.connection.target_system = vehicle.sysid
+        self.connection.target_component = vehicle.compid
+        self.message_received.emit(f"✅ Зв'язок відновлено: {self.connection_string}")
+        self._set_state(self.STATE_STREAMING)
+    
+    def _link_lost(self, reason):
+        """Линк перестал отвечать: переподключение без потери списка аппаратов (поток ввода-вывода)"""
+        if not self.auto_reconnect:
+            self._fail(f"❌ {reason}")
+            return
+        with self._state_lock:
+            if not self.running:
+                return
+            self._attempt += 1
+            self.connected = False
+            self._reconnecting = True
+            connection, self.connection = self.connection, None
+        if connection is not None:
+            try:
+                connection.close()
+            except:
+                pass
+        self.stream_rates.reset()
+        self.parameters.reset()
+        self.missions.reset()
+        self.commands.cancel_all(ConnectionError(reason))
+        self._watchdog.clear()
+        for vehicle in self.vehicles.values():
+            if not vehicle.lost:
+                vehicle.lost = True
+                self.vehicle_lost.emit(vehicle.sysid, vehicle.compid)
+        self._schedule_reconnect(f"⚠️ {reason}")
+        # Линк остается в пуле (без дескриптора), чтобы такт запустил переподключение
+        self.io_pool.refresh(self)
+    
+    def _schedule_reconnect(self, message):
+        delay = min(self.RECONNECT_DELAY_MAX, self.RECONNECT_DELAY * 2 ** self._reconnect_count)
+        self._reconnect_count += 1
+        self._reconnect_at = time.monotonic() + delay
+        self.message_received.emit(f"{message}; повторне підключення через {delay:g} с")
+        self._set_state(self.STATE_RECONNECTING)
+    
+    def _start_reconnect(self, now):
+        with self._state_lock:
+            if not self.running:
+                return
+            self._attempt += 1
+            attempt = self._attempt
+            self._reconnect_at = None
+            self._deadline = now + self.connect_timeout
+        self.message_received.emit(f"🔄 Повторне підключення до {self.connection_string} (спроба {self._reconnect_count})...")
+        self._set_state(self.STATE_RESOLVING)
+        self.io_pool.submit(self._open_connection, attempt)
+    
+    def _fail(self, message):
+        """Переход в состояние failed с освобождением соединения"""
+        was_connected = self.connected
+        if not self._teardown():
+            return
+        self.message_received.emit(message)
+        if was_connected:
+            self.connection_status_changed.emit(False)
+        self._set_state(self.STATE_FAILED)
+    
+    def _teardown(self):
+        """Остановка линка; возвращает False, если он уже был остановлен"""
+        with self._state_lock:
+            if not self.running and self.connection is None:
                 return False
-                
-        except Exception as e:
-            self.message_received.emit(f"❌ Помилка підключення: {str(e)}")
-            self.disconnect()
-            return False
+            self._attempt += 1
+            self.running = False
+            self.connected = False
+            self._reconnecting = False
+            self._reconnect_at = None
+            connection, self.connection = self.connection, None
+        
+        def close_connection():
+            if connection:
+                try:
+                    connection.close()
+                except:
+                    pass
+        
+        # Закрываем соединение только после того, как пул перестал его читать
+        self.io_pool.unregister(self, then=close_connection)
+        # Сначала сбрасываем частоты, чтобы отмененные команды не считались отказом аппарата
+        self.stream_rates.reset()
+        self.parameters.reset()
+        self.missions.reset()
+        self.commands.cancel_all(ConnectionError("з'єднання закрито"))
+        self._watchdog.clear()
+        return True
+    
+    def _set_state(self, state):
+        self.state = state
+        self.state_changed.emit(state)
     
     def disconnect(self):
         """Отключение от дрона"""
-        self.running = False
-        self.connected = False
+        self._teardown()
+        self._set_state(self.STATE_IDLE)
         
-        if self.connection:
+        self.connection_status_changed.emit(False)
+        self.vehicles.clear()
+        self.message_received.emit("📡 Відключено від дрона")
+    
+    def _hook_link_errors(self):
+        """Перехват обрывов TCP, которые pymavlink иначе только печатает в консоль"""
+        if isinstance(self.connection, mavutil.mavtcp) and not self.connection.autoreconnect:
+            self.connection.handle_eof = self._raise_link_closed
+            self.connection.handle_disconnect = self._raise_link_closed
+    
+    def _raise_link_closed(self):
+        raise ConnectionError("з'єднання закрито віддаленою стороною")
+    
+    def _forward_raw(self, data):
+        router = self.router
+        if router is not None:
+            router.from_link(self, data)
+    
+    def write_raw(self, data):
+        """Отправка готовых кадров (клиентов маршрутизатора) без разбора и упаковки"""
+        connection = self.connection
+        if connection is None or not self.connected:
+            return False
+        with self._send_lock:
+            connection.write(data)
+        return True
+    
+    # --- Интерфейс для IOPool (вызывается из потока пула) ---
+    
+    def fileno(self):
+        connection = self.connection
+        return getattr(connection, 'fd', None) if connection else None
+    
+    def _on_readable(self):
+        """Разбор всех сообщений, уже полученных линком"""
+        connection = self.connection
+        if connection is not None and self._dialect != mavlink_dialect.generation:
+            # Программа перешла на полный диалект: парсер линка тоже
+            self._dialect = mavlink_dialect.refresh_parser(connection)
+        while self.running and connection is not None:
+            # Все кадры, принятые одним чтением, разбираются и обрабатываются одним пакетом
+            batch = connection.recv_batch()
+            if not batch:
+                break
+            read_time = time.time() if self.tracer is not None else None
+            recorder = self.recorder
+            for msg in batch:
+                if not self.running:
+                    return
+                if read_time is not None:
+                    msg._read_time = read_time
+                if recorder is not None and msg.get_msgId() >= 0:
+                    recorder.record(msg._timestamp, msg.get_msgbuf())
+                self._handle_message(msg)
+    
+    def _on_tick(self, now):
+        if self.state in (self.STATE_RESOLVING, self.STATE_WAITING_HEARTBEAT) and now > self._deadline:
+            if self._reconnecting:
+                self._close_attempt()
+                self._schedule_reconnect("⚠️ Немає heartbeat після повторного підключення")
+            else:
+                self._fail("❌ Таймаут підключення")
+            return
+        if self._reconnect_at is not None and now >= self._reconnect_at:
+            self._start_reconnect(now)
+            return
+        if self.heartbeat_timeout is not None and self._watchdog:
+            for key in self._watchdog.advance(now):
+                self._on_heartbeat_timeout(key)
+        self.commands.tick(now)
+        self.stream_rates.tick(now)
+        self.parameters.tick(now)
+        self.missions.tick(now)
+    
+    def _close_attempt(self):
+        """Закрытие транспорта неудачной попытки переподключения (линк остается в пуле)"""
+        with self._state_lock:
+            self._attempt += 1
+            connection, self.connection = self.connection, None
+        if connection is not None:
             try:
-                self.connection.close()
+                connection.close()
             except:
                 pass
-            self.connection = None
+            self.io_pool.refresh(self)
+    
+    def _on_heartbeat_timeout(self, key):
+        vehicle = self.vehicles.get(key)
+        if vehicle is None or vehicle.lost:
+            return
+        vehicle.lost = True
+        # После перезагрузки аппарата частоты потоков нужно задать заново
+        self.stream_rates.forget(key)
+        self.message_received.emit(f"⚠️ Немає heartbeat від system={vehicle.sysid} понад {self.heartbeat_timeout} мс")
+        self.vehicle_lost.emit(vehicle.sysid, vehicle.compid)
+        if self.connected and all(v.lost for v in self.vehicles.values()):
+            self._link_lost("лінк не відповідає")
+    
+    def _on_io_error(self, error):
+        if not self.running:
+            return
+        if self.connected or self._reconnecting:
+            self._link_lost(f"Помилка отримання даних: {str(error)}")
+        else:
+            self._fail(f"Помилка отримання даних: {str(error)}")
+    
+    def _handle_message(self, msg):
+        """Разбор одного сообщения с привязкой к аппарату по sysid/compid"""
+        msgid = msg.get_msgId()
+        handlers = self.handlers.get(msgid)
+        if handlers is None and msgid not in self.LINK_MESSAGE_IDS:
+            # На сообщение никто не подписан - отбрасываем без разбора полей
+            return
         
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=2)
+        key = (msg.get_srcSystem(), msg.get_srcComponent())
+        vehicle = self.vehicles.get(key)
         
-        self.connection_status_changed.emit(False)
-        self.message_received.emit("📡 Відключено від дрона")
-    
-    def _receive_loop(self):
-        """Основной цикл получения данных"""
-        while self.running and self.connection:
+        # Обрабатываем heartbeat
+        if msgid == mavutil.mavlink.MAVLINK_MSG_ID_HEARTBEAT:
+            # Heartbeat от других наземных станций аппаратом не считаем
+            if msg.type == mavutil.mavlink.MAV_TYPE_GCS:
+                return
+            if vehicle is None:
+                vehicle = self._add_vehicle(msg)
+            elif vehicle.lost:
+                self._restore_vehicle(vehicle)
+            vehicle.last_heartbeat = time.time()
+            if self.heartbeat_timeout is not None:
+                self._watchdog.schedule(vehicle.key, time.monotonic() + self.heartbeat_timeout / 1000.0)
+        
+        elif msgid == mavutil.mavlink.MAVLINK_MSG_ID_COMMAND_ACK:
+            # Подтверждения команд уходят диспетчеру
+            self.commands.handle_ack(msg)
+        
+        elif msgid == mavutil.mavlink.MAVLINK_MSG_ID_PARAM_VALUE:
+            self.parameters.handle_param_value(key, msg)
+        
+        elif msgid == mavutil.mavlink.MAVLINK_MSG_ID_AUTOPILOT_VERSION:
+            self.parameters.handle_autopilot_version(key, msg)
+        
+        elif msgid in MISSION_MESSAGE_IDS:
+            self.missions.handle_message(key, msg)
+        
+        elif msgid == mavutil.mavlink.MAVLINK_MSG_ID_STATUSTEXT:
+            # Без слияния кадров: повторы и несколько сообщений за кадр не теряются
+            if vehicle is not None:
+                self.status_text.emit(key[0], key[1], msg.severity, statustext_text(msg))
+        
+        if vehicle is None or handlers is None:
+            # Сообщения от еще не известных аппаратов пропускаем до их heartbeat
+            return
+        
+        values = {}
+        for handler in handlers:
             try:
-                # Получаем сообщение с таймаутом
-                msg = self.connection.recv_match(blocking=True, timeout=1)
-                
-                if msg is None:
-                    continue
-                
-                # Обрабатываем heartbeat
-                if msg.get_type() == 'HEARTBEAT':
-                    if not self.connected:
-                        self.connected = True
-                        # Устанавливаем target_system и target_component из heartbeat
-                        if hasattr(self.connection, 'target_system') and self.connection.target_system is None:
-                            self.connection.target_system = msg.get_srcSystem()
-                            self.connection.target_component = msg.get_srcComponent()
-                        
-                        self.message_received.emit(f"💓 Heartbeat від system={msg.get_srcSystem()}, component={msg.get_srcComponent()}")
-                        self.message_received.emit(f"🎯 Target встановлено: system={self.connection.target_system}, component={self.connection.target_component}")
-                    
-                    # Обновляем режим и статус вооружения
-                    self.telemetry_data['mode'] = mavutil.mode_string_v10(msg)
-                    self.telemetry_data['armed'] = bool(msg.base_mode & mavutil.mavlink.MAV_MODE_FLAG_SAFETY_ARMED)
-                
-                # Обрабатываем GPS данные
-                elif msg.get_type() == 'GLOBAL_POSITION_INT':
-                    self.telemetry_data['lat'] = msg.lat / 1e7
-                    self.telemetry_data['lon'] = msg.lon / 1e7
-                    self.telemetry_data['alt'] = msg.alt / 1000.0
-                    self.telemetry_data['relative_alt'] = msg.relative_alt / 1000.0
-                    self.telemetry_data['heading'] = msg.hdg / 100.0
-                    
-                # Обрабатываем данные скорости
-                elif msg.get_type() == 'VFR_HUD':
-                    self.telemetry_data['groundspeed'] = msg.groundspeed
-                    self.telemetry_data['airspeed'] = msg.airspeed
-                    self.telemetry_data['heading'] = msg.heading
-                
-                # Обрабатываем данные батареи
-                elif msg.get_type() == 'SYS_STATUS':
-                    self.telemetry_data['battery_voltage'] = msg.voltage_battery / 1000.0
-                    self.telemetry_data['battery_current'] = msg.current_battery / 100.0
-                    self.telemetry_data['battery_remaining'] = msg.battery_remaining
-                
-                # Обрабатываем GPS статус
-                elif msg.get_type() == 'GPS_RAW_INT':
-                    self.telemetry_data['gps_fix'] = msg.fix_type
-                    self.telemetry_data['satellites'] = msg.satellites_visible
-                
-                # Отправляем обновленные данные в UI
-                self.telemetry_updated.emit(self.telemetry_data.copy())
-                
+                decoded = handler(msg)
             except Exception as e:
-                if self.running:
-                    self.message_received.emit(f"Помилка отримання даних: {str(e)}")
-                break
+                # Ошибка подписчика не должна рвать линк: остальные получают сообщение как обычно
+                self._handler_failed(handler, msg, e)
+                continue
+            if decoded:
+                values.update(decoded)
+        if values:
+            self._apply_telemetry(vehicle, values, msg)
     
-    def _request_data_stream(self):
-        """Запрос потока данных от дрона"""
-        if not self.connection:
+    def _handler_failed(self, handler, msg, error):
+        if handler in self._failed_handlers:
+            return
+        self._failed_handlers.add(handler)
+        name = getattr(handler, '__name__', repr(handler))
+        self.message_received.emit(f"⚠️ Помилка обробника {name} ({msg.get_type()}): {str(error)}")
+    
+    def _apply_telemetry(self, vehicle, values, msg=None):
+        """Запись отсчета в историю и передача дальше только изменившихся полей"""
+        # Отсчеты записи - со временем из tlog, иначе ускоренное воспроизведение сжимает ось времени
+        now = msg._timestamp if self.REPLAY and msg is not None else time.time()
+        vehicle_id = (self.link_id, vehicle.sysid, vehicle.compid)
+        store = self.telemetry_store
+        if store is not None:
+            # В историю - все значения: пока поле не меняется, окно запроса не должно пустеть
+            store.append(vehicle_id, values, now)
+        
+        record = vehicle.telemetry
+        changed = {}
+        for field, value in values.items():
+            if record.get(field) != value:
+                changed[field] = value
+        if not changed:
             return
+        record.update(changed, now)
+        
+        tracer = self.tracer
+        if tracer is not None and msg is not None:
+            tracer.decoded(vehicle_id, msg)
+        
+        sink = self.telemetry_sink
+        if sink is not None:
+            # Кадры в UI формирует coalescer с фиксированной частотой
+            sink.update(vehicle_id, changed)
+        else:
+            self.telemetry_updated.emit(vehicle.sysid, vehicle.compid, changed)
+    
+    def _restore_vehicle(self, vehicle):
+        """Heartbeat от аппарата, который считался потерянным"""
+        vehicle.lost = False
+        if not self.connected:
+            self._on_link_restored(vehicle)
+        self.message_received.emit(f"💓 Heartbeat від system={vehicle.sysid} відновлено")
+        self.vehicle_restored.emit(vehicle.sysid, vehicle.compid)
+        self._request_data_stream(vehicle)
+        self.parameters.resume(vehicle.key)
+    
+    def _add_vehicle(self, msg):
+        """Регистрация нового аппарата на линке по его первому heartbeat"""
+        vehicle = VehicleState(msg.get_srcSystem(), msg.get_srcComponent())
+        vehicle.mav_type = msg.type
+        vehicle.autopilot = msg.autopilot
+        self.vehicles[vehicle.key] = vehicle
+        
+        self.message_received.emit(f"💓 Heartbeat від system={vehicle.sysid}, component={vehicle.compid}")
         
-        # Ждем немного чтобы target_system был установлен
-        time.sleep(0.5)
+        if not self.connected:
+            self.connected = True
+            # Устанавливаем target_system и target_component из первого heartbeat
+            self.connection.target_system = vehicle.sysid
+            self.connection.target_component = vehicle.compid
+            self.message_received.emit(f"🎯 Target встановлено: system={self.connection.target_system}, component={self.connection.target_component}")
+            self._on_heartbeat_established()
+        
+        if vehicle.key == (self.connection.target_system, self.connection.target_component):
+            self.telemetry = vehicle.telemetry
+        
+        self.vehicle_discovered.emit(vehicle.sysid, vehicle.compid)
+        self._request_data_stream(vehicle)
+        if self.auto_parameters:
+            self.parameters.fetch(vehicle.key)
+        return vehicle
+    
+    def _request_data_stream(self, vehicle):
+        """Запрос частот сообщений у нового аппарата (подтверждение - COMMAND_ACK)"""
+        if not self.connection:
+            return
         
         try:
-            # Проверяем что target_system установлен
-            if not hasattr(self.connection, 'target_system') or self.connection.target_system is None:
-                self.message_received.emit("⚠️ target_system не встановлено, використовуємо 1")
-                self.connection.target_system = 1
-                self.connection.target_component = 1
-            
-            self.message_received.emit(f"📊 Запитуємо потік даних від system={self.connection.target_system}")
-            
-            # Запрашиваем различные потоки данных
-            data_streams = [
-                mavutil.mavlink.MAV_DATA_STREAM_ALL,
-                mavutil.mavlink.MAV_DATA_STREAM_POSITION,
-                mavutil.mavlink.MAV_DATA_STREAM_RAW_SENSORS,
-                mavutil.mavlink.MAV_DATA_STREAM_EXTENDED_STATUS,
-            ]
-            
-            for stream in data_streams:
-                self.connection.mav.request_data_stream_send(
-                    self.connection.target_system,
-                    self.connection.target_component,
-                    stream,
-                    1,  # Частота 1 Hz
-                    1   # Включить
-                )
-            
-            self.message_received.emit("✅ Потік телеметрії запитано")
-            
+            self.stream_rates.apply(vehicle.key)
         except Exception as e:
             self.message_received.emit(f"Помилка запиту даних: {str(e)}")
     
-    def send_command(self, command, param1=0, param2=0, param3=0, param4=0, param5=0, param6=0, param7=0):
-        """Отправка команды дрону"""
+    def _resolve_target(self, target):
+        """Адресат команды: (sysid, compid) или основной аппарат линка"""
+        if target is not None:
+            return target
+        return (self.connection.target_system, self.connection.target_component)
+    
+    def _send_command_long(self, target, command, confirmation, params):
+        """Отправка COMMAND_LONG (вызывается диспетчером команд, в т.ч. для повторов)"""
+        connection = self.connection
+        if connection is None:
+            raise ConnectionError("немає з'єднання")
+        with self._send_lock:
+            connection.mav.command_long_send(target[0], target[1], command, confirmation, *params)
+    
+    def send_command(self, command, param1=0, param2=0, param3=0, param4=0, param5=0, param6=0, param7=0,
+                     target=None, callback=None, timeout=None, retries=None):
+        """Отправка команды дрону
+
+        Не ждет ответа: возвращает PendingCommand (future с кодом MAV_RESULT),
+        результат также приходит сигналом command_finished. При отсутствии
+        соединения возвращает False.
+        """
         if not self.connected or not self.connection:
             self.message_received.emit("❌ Немає з'єднання для відправки команд")
             return False
         
         try:
             # Получаем имя команды для логирования
-            command_name = mavutil.mavlink.enums['MAV_CMD'][command].name if command in mavutil.mavlink.enums['MAV_CMD'] else f"CMD_{command}"
-            self.message_received.emit(f"📤 Відправляємо {command_name} з параметрами: {param1}, {param2}, {param3}...")
+            name = command_name(command)
+            self.message_received.emit(f"📤 Відправляємо {name} з параметрами: {param1}, {param2}, {param3}...")
             
-            self.connection.mav.command_long_send(
-                self.connection.target_system,
-                self.connection.target_component,
-                command,
-                0,  # confirmation
-                param1, param2, param3, param4, param5, param6, param7
+            target = self._resolve_target(target)
+            pending = self.commands.submit(
+                target, command,
+                (param1, param2, param3, param4, param5, param6, param7),
+                timeout=timeout, retries=retries
             )
+            pending.add_done_callback(self._report_command_result)
+            if callback is not None:
+                pending.add_done_callback(callback)
             
-            self.message_received.emit(f"✅ {command_name} відправлена на target_system={self.connection.target_system}")
-            return True
+            self.message_received.emit(f"✅ {name} відправлена на target_system={target[0]}")
+            return pending
             
         except Exception as e:
             self.message_received.emit(f"❌ Помилка відправки команди: {str(e)}")
             return False
     
-    def arm_disarm(self, arm=True):
-        """Вооружение/разоружение дрона"""
+    def _report_command_result(self, pending):
+        """Журнал и сигнал о результате команды (вызывается из потока, завершившего future)"""
+        sysid, compid = pending.target
+        if pending.cancelled():
+            self.command_finished.emit(sysid, compid, pending.name, False, "скасовано")
+            return
+        error = pending.exception()
+        if error is not None:
+            if isinstance(error, CommandTimeoutError):
+                self.message_received.emit(f"⚠️ Немає відповіді на {pending.name} (timeout)")
+            else:
+                self.message_received.emit(f"❌ {pending.name} не виконано: {str(error)}")
+            self.command_finished.emit(sysid, compid, pending.name, False, str(error))
+            return
+        
+        result = pending.result()
+        if result == mavutil.mavlink.MAV_RESULT_ACCEPTED:
+            self.message_received.emit(f"✅ {pending.name} прийнята автопілотом")
+            self.command_finished.emit(sysid, compid, pending.name, True, result_name(result))
+        else:
+            self.message_received.emit(f"❌ {pending.name} відхилена: {result_name(result)}")
+            self.command_finished.emit(sysid, compid, pending.name, False, result_name(result))
+    
+    def arm_disarm(self, arm=True, target=None, callback=None):
+        """Вооружение/разоружение дрона (без ожидания, подтверждение - через command_finished)"""
         if not self.connected or not self.connection:
             self.message_received.emit("❌ Немає з'єднання для ARM/DISARM")
             return False
@@ -250,72 +686,50 @@ class MAVLinkConnection(QObject):
         
         self.message_received.emit(f"🔫 Команда {action}...")
         
-        try:
-            # Отправляем команду ARM/DISARM с правильными параметрами
-            self.connection.mav.command_long_send(
-                self.connection.target_system,
-                self.connection.target_component,
-                mavutil.mavlink.MAV_CMD_COMPONENT_ARM_DISARM,
-                0,  # confirmation
-                param1,  # arm/disarm (1/0)
-                0,      # param2 - не используется
-                0,      # param3 - не используется  
-                0,      # param4 - не используется
-                0,      # param5 - не используется
-                0,      # param6 - не используется
-                0       # param7 - не используется
-            )
-            
-            self.message_received.emit(f"📤 ARM/DISARM команда відправлена: {param1}")
-            
-            # Ждем подтверждения от автопилота
-            start_time = time.time()
-            timeout = 3.0  # 3 секунды на ответ
-            
-            while time.time() - start_time < timeout:
-                msg = self.connection.recv_match(type='COMMAND_ACK', blocking=False, timeout=0.1)
-                if msg and msg.command == mavutil.mavlink.MAV_CMD_COMPONENT_ARM_DISARM:
-                    if msg.result == mavutil.mavlink.MAV_RESULT_ACCEPTED:
-                        self.message_received.emit(f"✅ ARM/DISARM команда прийнята автопілотом")
-                        return True
-                    else:
-                        result_name = mavutil.mavlink.enums['MAV_RESULT'].get(msg.result, {}).get('name', f"RESULT_{msg.result}")
-                        self.message_received.emit(f"❌ ARM/DISARM команда відхилена: {result_name}")
-                        return False
-                        
-                time.sleep(0.1)
-            
-            self.message_received.emit(f"⚠️ Немає відповіді на ARM/DISARM команду (timeout)")
-            return False
-            
-        except Exception as e:
-            self.message_received.emit(f"❌ Помилка ARM/DISARM: {str(e)}")
-            return False
+        return self.send_command(
+            mavutil.mavlink.MAV_CMD_COMPONENT_ARM_DISARM,
+            param1=param1,  # arm/disarm (1/0)
+            target=target,
+            callback=callback
+        )
     
-    def takeoff(self, altitude=10):
+    def takeoff(self, altitude=10, target=None):
         """Команда взлета"""
         self.message_received.emit(f"🚁 Команда зльоту на висоту {altitude}м...")
         return self.send_command(
             mavutil.mavlink.MAV_CMD_NAV_TAKEOFF,
-            param7=altitude
+            param7=altitude,
+            target=target
         )
     
-    def land(self):
+    def land(self, target=None):
         """Команда посадки"""
         self.message_received.emit("🛬 Команда посадки...")
-        return self.send_command(mavutil.mavlink.MAV_CMD_NAV_LAND)
+        return self.send_command(mavutil.mavlink.MAV_CMD_NAV_LAND, target=target)
     
-    def set_mode(self, mode_name):
+    def set_mode(self, mode_name, target=None):
         """Установка режима полета"""
         try:
             mode_id = self.connection.mode_mapping()[mode_name.upper()]
-            self.connection.set_mode(mode_id)
+            if target is None:
+                self.connection.set_mode(mode_id)
+            else:
+                # mavutil.set_mode всегда адресует target_system линка
+                self.send_command(
+                    mavutil.mavlink.MAV_CMD_DO_SET_MODE,
+                    param1=mavutil.mavlink.MAV_MODE_FLAG_CUSTOM_MODE_ENABLED,
+                    param2=mode_id,
+                    target=target
+                )
             self.message_received.emit(f"✈️ Зміна режиму на: {mode_name}")
             return True
         except Exception as e:
             self.message_received.emit(f"❌ Помилка зміни режиму: {str(e)}")
             return False
     
-    def get_telemetry(self):
-        """Получение текущих данных телеметрии"""
-        return self.telemetry_data.copy()
\ No newline at end of file
+    def get_telemetry(self, target=None):
+        """Получение текущих данных телеметрии (основного или указанного аппарата)"""
+        if target is not None:
+            vehicle = self.vehicles.get(target)
+            return vehicle.telemetry.copy() if vehicle else TelemetrySnapshot()
+        return self.telemetry.copy()
\ No newline at end of file
@@ -0,0 +1,237 @@
+import os
+import threading
+import pymavlink.dialects.v10
+import pymavlink.dialects.v20
+
+
+# Облегченный диалект: только сообщения, которые программа принимает и отправляет.
+# Генерируется заранее (python mavlink_dialect.py) в mavlink_dialects/v10 и v20.
+SLIM_DIALECT = "dronecontrol"
+FULL_DIALECT = "all"
+DIALECT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mavlink_dialects")
+
+APP_MESSAGES = (
+    # Телеметрия (DEFAULT_DECODERS) и служебные сообщения линка
+    'HEARTBEAT', 'SYS_STATUS', 'GPS_RAW_INT', 'ATTITUDE', 'GLOBAL_POSITION_INT', 'VFR_HUD',
+    'BATTERY_STATUS', 'EKF_STATUS_REPORT', 'STATUSTEXT', 'COMMAND_ACK', 'AUTOPILOT_VERSION',
+    # Команды и частоты потоков
+    'COMMAND_LONG', 'SET_MODE', 'REQUEST_DATA_STREAM',
+    # Параметры
+    'PARAM_REQUEST_LIST', 'PARAM_REQUEST_READ', 'PARAM_VALUE',
+    # Миссии (MISSION_ITEM и MISSION_REQUEST - старый протокол, его использует и mavutil)
+    'MISSION_REQUEST_LIST', 'MISSION_COUNT', 'MISSION_REQUEST', 'MISSION_REQUEST_INT', 'MISSION_ITEM',
+    'MISSION_ITEM_INT', 'MISSION_ACK', 'MISSION_CLEAR_ALL',
+)
+
+# Перечисления с таблицей имен (enums[...]): кроме них - только перечисления полей
+# сообщений диалекта. Константы (MAV_CMD_... = 16) остаются у всех перечислений.
+NAMED_ENUMS = ('MAV_CMD', 'MAV_RESULT', 'MAV_MISSION_RESULT', 'MAV_AUTOPILOT', 'MAV_TYPE')
+
+# Переменная окружения: "full" - всегда полный диалект pymavlink
+DIALECT_ENV = "DRONECONTROL_DIALECT"
+
+# Сообщения вне диалекта разбираются только до заголовка (id, seq, отправитель),
+# поэтому счетчики потерь и запись tlog работают как с полным диалектом
+_UNKNOWN_ANCHOR = """        if mapkey not in mavlink_map:
+            return MAVLink_unknown(msgId, msgbuf)
+"""
+_UNKNOWN_DECODE = """        if mapkey not in mavlink_map:
+            return _decode_skipped(msgbuf, msgId, mlen, incompat_flags, compat_flags, seq, srcSystem, srcComponent,
+                                   signature_len, self.mav_csum_unpacker)
+"""
+_SKIPPED_TEMPLATE = '''
+
+# DroneControl: облегченный диалект (mavlink_dialect.py)
+PYMAVLINK_VERSION = "{version}"
+APP_MESSAGES = {messages!r}
+# crc_extra всех сообщений полного диалекта: CRC пропущенных сообщений проверяется так же
+SKIPPED_CRC_EXTRA = {crc_extra!r}
+
+
+def _decode_skipped(msgbuf, msgId, mlen, incompat_flags, compat_flags, seq, srcSystem, srcComponent,
+                    signature_len, csum_unpacker):
+    crc_extra = SKIPPED_CRC_EXTRA.get(msgId)
+    if crc_extra is not None and not MAVLINK_IGNORE_CRC:
+        crc = csum_unpacker.unpack(msgbuf[-(2 + signature_len):][:2])[0]
+        crcbuf = msgbuf[1:-(2 + signature_len)]
+        crcbuf.append(crc_extra)
+        if crc != x25crc(crcbuf).crc:
+            raise MAVError("invalid MAVLink CRC in msgID %u" % msgId)
+    m = MAVLink_unknown(msgId, msgbuf)
+    m._header = MAVLink_header(msgId, incompat_flags, compat_flags, mlen, seq, srcSystem, srcComponent)
+    return m
+'''
+
+_lock = threading.Lock()
+# Номер выбора диалекта: линки сверяют его и пересоздают парсер после перехода на полный
+generation = 0
+current = None
+fallback_reason = None
+
+
+def _slim_available():
+    """Причина, по которой облегченный диалект нельзя использовать, или None"""
+    if os.environ.get(DIALECT_ENV, "").lower() == "full":
+        return f"{DIALECT_ENV}=full"
+    for package in (pymavlink.dialects.v10, pymavlink.dialects.v20):
+        directory = os.path.join(DIALECT_DIR, package.__name__.rsplit('.', 1)[1])
+        if not os.path.exists(os.path.join(directory, SLIM_DIALECT + ".py")):
+            return "диалект не згенеровано (python mavlink_dialect.py)"
+        if directory not in package.__path__:
+            package.__path__.append(directory)
+    from pymavlink.dialects.v10 import dronecontrol
+    if dronecontrol.PYMAVLINK_VERSION != pymavlink.__version__:
+        return f"діалект згенеровано для pymavlink {dronecontrol.PYMAVLINK_VERSION}"
+    missing = set(APP_MESSAGES) - set(dronecontrol.APP_MESSAGES)
+    if missing:
+        return f"у діалекті немає {', '.join(sorted(missing))}"
+    return None
+
+
+def _select():
+    global current, fallback_reason
+    from pymavlink import mavutil
+    fallback_reason = _slim_available()
+    current = FULL_DIALECT if fallback_reason else SLIM_DIALECT
+    mavutil.set_dialect(current)
+    return mavutil
+
+
+mavutil = _select()
+
+
+def is_slim():
+    return current == SLIM_DIALECT
+
+
+def use_full(reason):
+    """Переход на полный диалект, если облегченному не хватило сообщения
+
+    Новые соединения создаются уже с полным диалектом, открытые линки
+    пересоздают парсер (refresh_parser) при следующем чтении.
+    """
+    global current, fallback_reason, generation
+    with _lock:
+        if current == FULL_DIALECT:
+            return False
+        mavutil.set_dialect(FULL_DIALECT)
+        current = FULL_DIALECT
+        fallback_reason = reason
+        generation += 1
+    return True
+
+
+def message_id(name):
+    """Id сообщения по имени; для сообщения вне облегченного диалекта - переход на полный"""
+    msgid = getattr(mavutil.mavlink, f"MAVLINK_MSG_ID_{name.upper()}", None)
+    if msgid is None and use_full(f"немає {name.upper()}"):
+        msgid = getattr(mavutil.mavlink, f"MAVLINK_MSG_ID_{name.upper()}", None)
+    if msgid is None:
+        raise AttributeError(f"невідоме повідомлення MAVLink {name}")
+    return msgid
+
+
+def _module(wire_protocol):
+    subdir = "v20" if wire_protocol == "2.0" else "v10"
+    package = __import__(f"pymavlink.dialects.{subdir}.{current}")
+    return getattr(getattr(package.dialects, subdir), current)
+
+
+def mavlink2():
+    """Модуль текущего диалекта для MAVLink 2 (разбирает и кадры MAVLink 1)"""
+    return _module("2.0")
+
+
+# Состояние парсера, которое переносится в новый: счетчики нужны контролю потерь и частот
+_PARSER_STATE = ('seq', 'robust_parsing', 'signing', 'total_packets_sent', 'total_bytes_sent',
+                 'total_packets_received', 'total_bytes_received', 'total_receive_errors', 'startup_time',
+                 'callback', 'callback_args', 'callback_kwargs',
+                 'send_callback', 'send_callback_args', 'send_callback_kwargs')
+
+
+def refresh_parser(connection):
+    """Парсер соединения (mavutil или источник с атрибутом mav) на текущем диалекте
+
+    Версия протокола сохраняется; возвращает номер выбора диалекта.
+    """
+    old = connection.mav
+    module = _module("2.0" if old.protocol_marker == 253 else "1.0")
+    mav = module.MAVLink(old.file, srcSystem=old.srcSystem, srcComponent=old.srcComponent)
+    for name in _PARSER_STATE:
+        setattr(mav, name, getattr(old, name))
+    connection.mav = mav
+    return generation
+
+
+def generate(directory=DIALECT_DIR, source=None):
+    """Генерация облегченного диалекта (v1.0 и v2.0) из XML полного диалекта pymavlink"""
+    import contextlib
+    import io
+    from pymavlink.generator import mavgen, mavgen_python, mavparse
+
+    source = source or os.path.join(os.path.dirname(pymavlink.dialects.v20.__file__), FULL_DIALECT + ".xml")
+    wanted = set(APP_MESSAGES)
+    real_generate = mavgen_python.generate
+    crc_extra = {}
+    unnamed = set()
+
+    def slim_generate(basename, xml):
+        found = set()
+        for x in xml:
+            for m in x.message:
+                crc_extra[m.id] = m.crc_extra
+            x.message = [m for m in x.message if m.name in wanted]
+            found.update(m.name for m in x.message)
+        named = set(NAMED_ENUMS) | {f.enum for x in xml for m in x.message for f in m.fields if f.enum}
+        for x in xml:
+            # Описания и параметры команд только раздувают модуль: имена и значения остаются
+            for enum in x.enum:
+                enum.description = ""
+                if enum.name not in named:
+                    unnamed.add(enum.name)
+                for entry in enum.entry:
+                    entry.description = ""
+                    entry.param = []
+            for m in x.message:
+                m.description = ""
+                for field in m.fields:
+                    field.description = ""
+        missing = wanted - found
+        if missing:
+            raise ValueError(f"немає в {os.path.basename(source)}: {', '.join(sorted(missing))}")
+        for msgid in [m.id for x in xml for m in x.message]:
+            crc_extra.pop(msgid, None)
+        real_generate(basename, xml)
+
+    outputs = []
+    mavgen_python.generate = slim_generate
+    try:
+        for wire_protocol, subdir in ((mavparse.PROTOCOL_1_0, "v10"), (mavparse.PROTOCOL_2_0, "v20")):
+            os.makedirs(os.path.join(directory, subdir), exist_ok=True)
+            output = os.path.join(directory, subdir, SLIM_DIALECT + ".py")
+            crc_extra.clear()
+            unnamed.clear()
+            opts = mavgen.Opts(output, wire_protocol=wire_protocol, language="Python3", validate=False)
+            with contextlib.redirect_stdout(io.StringIO()):
+                if not mavgen.mavgen(opts, [source]):
+                    raise RuntimeError(f"mavgen не зміг обробити {source}")
+            with open(output, encoding='utf-8') as f:
+                code = f.read()
+            if _UNKNOWN_ANCHOR not in code:
+                raise RuntimeError("невідома версія mavgen: немає розбору невідомих повідомлень")
+            code = code.replace(_UNKNOWN_ANCHOR, _UNKNOWN_DECODE)
+            code = "".join(line for line in code.splitlines(keepends=True)
+                           if not (line.startswith('enums["') and line[7:line.index('"', 7)] in unnamed))
+            code += _SKIPPED_TEMPLATE.format(version=pymavlink.__version__, messages=tuple(sorted(wanted)),
+                                             crc_extra=dict(sorted(crc_extra.items())))
+            with open(output, 'w', encoding='utf-8') as f:
+                f.write(code)
+            outputs.append(output)
+    finally:
+        mavgen_python.generate = real_generate
+    return outputs
+
+
+if __name__ == "__main__":
+    for path in generate():
+        print(f"Створено {path} ({os.path.getsize(path) // 1024} КБ)")
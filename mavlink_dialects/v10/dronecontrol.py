@@ -0,0 +1,6026 @@
+"""
+MAVLink protocol implementation (auto-generated by mavgen.py)
+
+Generated from: ('all.xml,ardupilotmega.xml,ASLUAV.xml,common.xml,development.xml,icarous.xml,minimal.xml,python_array_test.xml,standard.xml,test.xml,ualberta.xml,uAvionix.xml,loweheiser.xml,storm32.xml,AVSSUAS.xml,cubepilot.xml,csAirLink.xml',)
+
+Note: this file has been auto-generated. DO NOT EDIT
+"""
+import hashlib
+import json
+import logging
+import os
+import struct
+import sys
+import time
+from builtins import object, range
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type, Union
+
+WIRE_PROTOCOL_VERSION = "1.0"
+DIALECT = "dronecontrol"
+
+PROTOCOL_MARKER_V1 = 0xFE
+PROTOCOL_MARKER_V2 = 0xFD
+HEADER_LEN_V1 = 6
+HEADER_LEN_V2 = 10
+
+MAVLINK_SIGNATURE_BLOCK_LEN = 13
+
+MAVLINK_IFLAG_SIGNED = 0x01
+
+logger = logging.getLogger(__name__)
+
+# allow MAV_IGNORE_CRC=1 to ignore CRC, allowing some
+# corrupted msgs to be seen
+MAVLINK_IGNORE_CRC = os.environ.get("MAV_IGNORE_CRC", 0)
+
+# some base types from mavlink_types.h
+MAVLINK_TYPE_CHAR = 0
+MAVLINK_TYPE_UINT8_T = 1
+MAVLINK_TYPE_INT8_T = 2
+MAVLINK_TYPE_UINT16_T = 3
+MAVLINK_TYPE_INT16_T = 4
+MAVLINK_TYPE_UINT32_T = 5
+MAVLINK_TYPE_INT32_T = 6
+MAVLINK_TYPE_UINT64_T = 7
+MAVLINK_TYPE_INT64_T = 8
+MAVLINK_TYPE_FLOAT = 9
+MAVLINK_TYPE_DOUBLE = 10
+
+# CRC calculation using fastcrc, falling back to a pure Python implementation
+# if fastcrc is not available
+try:
+    import fastcrc
+    mcrf4xx = fastcrc.crc16.mcrf4xx
+except Exception:
+    mcrf4xx = None  # type: ignore
+
+
+BytesLike = Union[List[int], Tuple[int], bytes, bytearray, str]
+
+
+class _x25crc_slow(object):
+    """CRC-16/MCRF4XX - based on checksum.h from mavlink library"""
+
+    crc: int
+
+    def __init__(self, buf: Optional[BytesLike] = None):
+        self.crc = 0xFFFF
+        if buf is not None:
+            self.accumulate(buf)
+
+    def accumulate(self, buf: BytesLike) -> None:
+        """add in some more bytes (it also accepts strings)"""
+        if isinstance(buf, str):
+            buf = buf.encode()
+
+        accum = self.crc
+        for b in buf:
+            tmp = b ^ (accum & 0xFF)
+            tmp = (tmp ^ (tmp << 4)) & 0xFF
+            accum = (accum >> 8) ^ (tmp << 8) ^ (tmp << 3) ^ (tmp >> 4)
+        self.crc = accum
+
+
+class _x25crc_fast(object):
+    """CRC-16/MCRF4XX - based on checksum.h from mavlink library"""
+
+    def __init__(self, buf: Optional[BytesLike] = None):
+        self.crc = 0xFFFF
+        if buf is not None:
+            self.accumulate(buf)
+
+    def accumulate(self, buf: BytesLike) -> None:
+        """add in some more bytes (it also accepts strings)"""
+        if isinstance(buf, str):
+            buf_as_bytes = bytes(buf.encode())
+        elif isinstance(buf, (list, tuple, bytearray)):
+            buf_as_bytes = bytes(buf)
+        else:
+            buf_as_bytes = buf
+        self.crc = mcrf4xx(buf_as_bytes, self.crc)
+
+
+x25crc = _x25crc_fast if mcrf4xx is not None else _x25crc_slow
+
+
+class MAVLink_header(object):
+    """MAVLink message header"""
+
+    def __init__(self, msgId: int, incompat_flags: int = 0, compat_flags: int = 0, mlen: int = 0, seq: int = 0, srcSystem: int = 0, srcComponent: int = 0) -> None:
+        self.mlen = mlen
+        self.seq = seq
+        self.srcSystem = srcSystem
+        self.srcComponent = srcComponent
+        self.msgId = msgId
+        self.incompat_flags = incompat_flags
+        self.compat_flags = compat_flags
+
+    def pack(self, force_mavlink1: bool = False) -> bytes:
+        if float(WIRE_PROTOCOL_VERSION) == 2.0 and not force_mavlink1:
+            return struct.pack(
+                "<BBBBBBBHB",
+                254,
+                self.mlen,
+                self.incompat_flags,
+                self.compat_flags,
+                self.seq,
+                self.srcSystem,
+                self.srcComponent,
+                self.msgId & 0xFFFF,
+                self.msgId >> 16,
+            )
+        return struct.pack(
+            "<BBBBBB",
+            PROTOCOL_MARKER_V1,
+            self.mlen,
+            self.seq,
+            self.srcSystem,
+            self.srcComponent,
+            self.msgId,
+        )
+
+
+class MAVLink_message(object):
+    """base MAVLink message class"""
+
+    id = 0
+    msgname = ""
+    fieldnames: List[str] = []
+    ordered_fieldnames: List[str] = []
+    fieldtypes: List[str] = []
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"")
+    orders: List[int] = []
+    lengths: List[int] = []
+    array_lengths: List[int] = []
+    crc_extra = 0
+    unpacker = struct.Struct("")
+    instance_field: Optional[str] = None
+    instance_offset = -1
+
+    def __init__(self, msgId: int, name: str) -> None:
+        self._header = MAVLink_header(msgId)
+        self._payload: Optional[Union[bytes, bytearray]] = None
+        self._msgbuf = bytearray(b"")
+        self._crc: Optional[int] = None
+        self._fieldnames: List[str] = []
+        self._type = name
+        self._signed = False
+        self._link_id: Optional[int] = None
+        self._instances: Optional[Dict[str, str]] = None
+        self._instance_field: Optional[str] = None
+
+    def format_attr(self, field: str) -> Union[str, float, int]:
+        """override field getter"""
+        raw_attr: Union[bytes, float, int] = getattr(self, field)
+        if isinstance(raw_attr, bytes):
+            return raw_attr.decode(errors="backslashreplace").rstrip("\x00")
+        return raw_attr
+
+    def get_msgbuf(self) -> bytearray:
+        return self._msgbuf
+
+    def get_header(self) -> MAVLink_header:
+        return self._header
+
+    def get_payload(self) -> Optional[Union[bytes, bytearray]]:
+        return self._payload
+
+    def get_crc(self) -> Optional[int]:
+        return self._crc
+
+    def get_fieldnames(self) -> List[str]:
+        return self._fieldnames
+
+    def get_type(self) -> str:
+        return self._type
+
+    def get_msgId(self) -> int:
+        return self._header.msgId
+
+    def get_srcSystem(self) -> int:
+        return self._header.srcSystem
+
+    def get_srcComponent(self) -> int:
+        return self._header.srcComponent
+
+    def get_seq(self) -> int:
+        return self._header.seq
+
+    def get_signed(self) -> bool:
+        return self._signed
+
+    def get_link_id(self) -> Optional[int]:
+        return self._link_id
+
+    def __str__(self) -> str:
+        ret = "%s {" % self._type
+        for a in self._fieldnames:
+            v = self.format_attr(a)
+            ret += "%s : %s, " % (a, v)
+        ret = ret[0:-2] + "}"
+        return ret
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    def __eq__(self, other: object) -> bool:
+        if other is None:
+            return False
+
+        if not isinstance(other, MAVLink_message):
+            return False
+
+        if self.get_type() != other.get_type():
+            return False
+
+        if self.get_crc() != other.get_crc():
+            return False
+
+        if self.get_seq() != other.get_seq():
+            return False
+
+        if self.get_srcSystem() != other.get_srcSystem():
+            return False
+
+        if self.get_srcComponent() != other.get_srcComponent():
+            return False
+
+        for a in self._fieldnames:
+            if self.format_attr(a) != other.format_attr(a):
+                return False
+
+        return True
+
+    def to_dict(self) -> Dict[str, Union[str, float, int]]:
+        d: Dict[str, Union[str, float, int]] = {}
+        d["mavpackettype"] = self._type
+        for a in self._fieldnames:
+            d[a] = self.format_attr(a)
+        return d
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    def sign_packet(self, mav: "MAVLink") -> None:
+        assert mav.signing.secret_key is not None
+
+        h = hashlib.new("sha256")
+        self._msgbuf += struct.pack("<BQ", mav.signing.link_id, mav.signing.timestamp)[:7]
+        h.update(mav.signing.secret_key)
+        h.update(self._msgbuf)
+        sig = h.digest()[:6]
+        self._msgbuf += sig
+        mav.signing.timestamp += 1
+
+    def _pack(self, mav: "MAVLink", crc_extra: int, payload: bytes, force_mavlink1: bool = False) -> bytes:
+        plen = len(payload)
+        if float(WIRE_PROTOCOL_VERSION) == 2.0 and not force_mavlink1:
+            # in MAVLink2 we can strip trailing zeros off payloads. This allows for simple
+            # variable length arrays and smaller packets
+            nullbyte = 0
+            while plen > 1 and payload[plen - 1] == nullbyte:
+                plen -= 1
+        self._payload = payload[:plen]
+        incompat_flags = 0
+        if mav.signing.sign_outgoing:
+            incompat_flags |= MAVLINK_IFLAG_SIGNED
+        self._header = MAVLink_header(
+            self._header.msgId,
+            incompat_flags=incompat_flags,
+            compat_flags=0,
+            mlen=len(self._payload),
+            seq=mav.seq,
+            srcSystem=mav.srcSystem,
+            srcComponent=mav.srcComponent,
+        )
+        self._msgbuf = bytearray(self._header.pack(force_mavlink1=force_mavlink1))
+        self._msgbuf += self._payload
+        crc = x25crc(self._msgbuf[1:])
+        # we are using CRC extra
+        crc.accumulate(struct.pack("B", crc_extra))
+        self._crc = crc.crc
+        self._msgbuf += struct.pack("<H", self._crc)
+        if mav.signing.sign_outgoing and not force_mavlink1:
+            self.sign_packet(mav)
+        return bytes(self._msgbuf)
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        raise NotImplementedError("MAVLink_message cannot be serialized directly")
+
+    def __getitem__(self, key: str) -> str:
+        """support indexing, allowing for multi-instance sensors in one message"""
+        if self._instances is None:
+            raise IndexError()
+        if key not in self._instances:
+            raise IndexError()
+        return self._instances[key]
+
+
+class mavlink_msg_deprecated_name_property(object):
+    """
+    This handles the class variable name change from name to msgname for
+    subclasses of MAVLink_message during a transition period.
+
+    This is used by setting the class variable to
+    `mavlink_msg_deprecated_name_property()`.
+    """
+
+    def __get__(self, instance: Optional[MAVLink_message], owner: Type[MAVLink_message]) -> str:
+        if instance is not None:
+            logger.error("Using .name on a MAVLink_message is not supported, use .get_type() instead.")
+            raise AttributeError("Class {} has no attribute 'name'".format(owner.__name__))
+        logger.warning(
+            """Using .name on a MAVLink_message class is deprecated, consider using .msgname instead.
+Note that if compatibility with pymavlink 2.4.30 and earlier is desired, use something like this:
+
+msg_name =  msg.msgname if hasattr(msg, "msgname") else msg.name"""
+        )
+        return owner.msgname
+
+
+# enums
+
+
+class EnumEntry(object):
+    def __init__(self, name: str, description: str) -> None:
+        self.name = name
+        self.description = description
+        self.param: Dict[int, str] = {}
+        self.label: Dict[int, str] = {}
+        self.has_location = False
+
+class Enum(Dict[int, EnumEntry]):
+    def __init__(self) -> None:
+        self.bitmask = False
+
+enums: Dict[str, Enum] = {}
+
+# ACCELCAL_VEHICLE_POS
+ACCELCAL_VEHICLE_POS_LEVEL = 1
+ACCELCAL_VEHICLE_POS_LEFT = 2
+ACCELCAL_VEHICLE_POS_RIGHT = 3
+ACCELCAL_VEHICLE_POS_NOSEDOWN = 4
+ACCELCAL_VEHICLE_POS_NOSEUP = 5
+ACCELCAL_VEHICLE_POS_BACK = 6
+ACCELCAL_VEHICLE_POS_SUCCESS = 16777215
+ACCELCAL_VEHICLE_POS_FAILED = 16777216
+ACCELCAL_VEHICLE_POS_ENUM_END = 16777217
+
+# MAV_CMD
+enums["MAV_CMD"] = Enum()
+enums["MAV_CMD"].bitmask = False
+MAV_CMD_NAV_WAYPOINT = 16
+enums["MAV_CMD"][16] = EnumEntry("MAV_CMD_NAV_WAYPOINT", """""")
+enums["MAV_CMD"][16].has_location = True
+MAV_CMD_NAV_LOITER_UNLIM = 17
+enums["MAV_CMD"][17] = EnumEntry("MAV_CMD_NAV_LOITER_UNLIM", """""")
+enums["MAV_CMD"][17].has_location = True
+MAV_CMD_NAV_LOITER_TURNS = 18
+enums["MAV_CMD"][18] = EnumEntry("MAV_CMD_NAV_LOITER_TURNS", """""")
+enums["MAV_CMD"][18].has_location = True
+MAV_CMD_NAV_LOITER_TIME = 19
+enums["MAV_CMD"][19] = EnumEntry("MAV_CMD_NAV_LOITER_TIME", """""")
+enums["MAV_CMD"][19].has_location = True
+MAV_CMD_NAV_RETURN_TO_LAUNCH = 20
+enums["MAV_CMD"][20] = EnumEntry("MAV_CMD_NAV_RETURN_TO_LAUNCH", """""")
+MAV_CMD_NAV_LAND = 21
+enums["MAV_CMD"][21] = EnumEntry("MAV_CMD_NAV_LAND", """""")
+enums["MAV_CMD"][21].has_location = True
+MAV_CMD_NAV_TAKEOFF = 22
+enums["MAV_CMD"][22] = EnumEntry("MAV_CMD_NAV_TAKEOFF", """""")
+enums["MAV_CMD"][22].has_location = True
+MAV_CMD_NAV_LAND_LOCAL = 23
+enums["MAV_CMD"][23] = EnumEntry("MAV_CMD_NAV_LAND_LOCAL", """""")
+enums["MAV_CMD"][23].has_location = True
+MAV_CMD_NAV_TAKEOFF_LOCAL = 24
+enums["MAV_CMD"][24] = EnumEntry("MAV_CMD_NAV_TAKEOFF_LOCAL", """""")
+enums["MAV_CMD"][24].has_location = True
+MAV_CMD_NAV_FOLLOW = 25
+enums["MAV_CMD"][25] = EnumEntry("MAV_CMD_NAV_FOLLOW", """""")
+enums["MAV_CMD"][25].has_location = True
+MAV_CMD_NAV_CONTINUE_AND_CHANGE_ALT = 30
+enums["MAV_CMD"][30] = EnumEntry("MAV_CMD_NAV_CONTINUE_AND_CHANGE_ALT", """""")
+MAV_CMD_NAV_LOITER_TO_ALT = 31
+enums["MAV_CMD"][31] = EnumEntry("MAV_CMD_NAV_LOITER_TO_ALT", """""")
+enums["MAV_CMD"][31].has_location = True
+MAV_CMD_DO_FOLLOW = 32
+enums["MAV_CMD"][32] = EnumEntry("MAV_CMD_DO_FOLLOW", """""")
+MAV_CMD_DO_FOLLOW_REPOSITION = 33
+enums["MAV_CMD"][33] = EnumEntry("MAV_CMD_DO_FOLLOW_REPOSITION", """""")
+MAV_CMD_DO_ORBIT = 34
+enums["MAV_CMD"][34] = EnumEntry("MAV_CMD_DO_ORBIT", """""")
+enums["MAV_CMD"][34].has_location = True
+MAV_CMD_DO_FIGURE_EIGHT = 35
+enums["MAV_CMD"][35] = EnumEntry("MAV_CMD_DO_FIGURE_EIGHT", """""")
+enums["MAV_CMD"][35].has_location = True
+MAV_CMD_NAV_ARC_WAYPOINT = 36
+enums["MAV_CMD"][36] = EnumEntry("MAV_CMD_NAV_ARC_WAYPOINT", """""")
+enums["MAV_CMD"][36].has_location = True
+MAV_CMD_NAV_ROI = 80
+enums["MAV_CMD"][80] = EnumEntry("MAV_CMD_NAV_ROI", """""")
+enums["MAV_CMD"][80].has_location = True
+MAV_CMD_NAV_PATHPLANNING = 81
+enums["MAV_CMD"][81] = EnumEntry("MAV_CMD_NAV_PATHPLANNING", """""")
+enums["MAV_CMD"][81].has_location = True
+MAV_CMD_NAV_SPLINE_WAYPOINT = 82
+enums["MAV_CMD"][82] = EnumEntry("MAV_CMD_NAV_SPLINE_WAYPOINT", """""")
+enums["MAV_CMD"][82].has_location = True
+MAV_CMD_NAV_ALTITUDE_WAIT = 83
+enums["MAV_CMD"][83] = EnumEntry("MAV_CMD_NAV_ALTITUDE_WAIT", """""")
+MAV_CMD_NAV_VTOL_TAKEOFF = 84
+enums["MAV_CMD"][84] = EnumEntry("MAV_CMD_NAV_VTOL_TAKEOFF", """""")
+enums["MAV_CMD"][84].has_location = True
+MAV_CMD_NAV_VTOL_LAND = 85
+enums["MAV_CMD"][85] = EnumEntry("MAV_CMD_NAV_VTOL_LAND", """""")
+enums["MAV_CMD"][85].has_location = True
+MAV_CMD_NAV_GUIDED_ENABLE = 92
+enums["MAV_CMD"][92] = EnumEntry("MAV_CMD_NAV_GUIDED_ENABLE", """""")
+MAV_CMD_NAV_DELAY = 93
+enums["MAV_CMD"][93] = EnumEntry("MAV_CMD_NAV_DELAY", """""")
+MAV_CMD_NAV_PAYLOAD_PLACE = 94
+enums["MAV_CMD"][94] = EnumEntry("MAV_CMD_NAV_PAYLOAD_PLACE", """""")
+enums["MAV_CMD"][94].has_location = True
+MAV_CMD_NAV_LAST = 95
+enums["MAV_CMD"][95] = EnumEntry("MAV_CMD_NAV_LAST", """""")
+MAV_CMD_CONDITION_DELAY = 112
+enums["MAV_CMD"][112] = EnumEntry("MAV_CMD_CONDITION_DELAY", """""")
+MAV_CMD_CONDITION_CHANGE_ALT = 113
+enums["MAV_CMD"][113] = EnumEntry("MAV_CMD_CONDITION_CHANGE_ALT", """""")
+MAV_CMD_CONDITION_DISTANCE = 114
+enums["MAV_CMD"][114] = EnumEntry("MAV_CMD_CONDITION_DISTANCE", """""")
+MAV_CMD_CONDITION_YAW = 115
+enums["MAV_CMD"][115] = EnumEntry("MAV_CMD_CONDITION_YAW", """""")
+MAV_CMD_CONDITION_LAST = 159
+enums["MAV_CMD"][159] = EnumEntry("MAV_CMD_CONDITION_LAST", """""")
+MAV_CMD_DO_SET_MODE = 176
+enums["MAV_CMD"][176] = EnumEntry("MAV_CMD_DO_SET_MODE", """""")
+MAV_CMD_DO_JUMP = 177
+enums["MAV_CMD"][177] = EnumEntry("MAV_CMD_DO_JUMP", """""")
+MAV_CMD_DO_CHANGE_SPEED = 178
+enums["MAV_CMD"][178] = EnumEntry("MAV_CMD_DO_CHANGE_SPEED", """""")
+MAV_CMD_DO_SET_HOME = 179
+enums["MAV_CMD"][179] = EnumEntry("MAV_CMD_DO_SET_HOME", """""")
+enums["MAV_CMD"][179].has_location = True
+MAV_CMD_DO_SET_PARAMETER = 180
+enums["MAV_CMD"][180] = EnumEntry("MAV_CMD_DO_SET_PARAMETER", """""")
+MAV_CMD_DO_SET_RELAY = 181
+enums["MAV_CMD"][181] = EnumEntry("MAV_CMD_DO_SET_RELAY", """""")
+MAV_CMD_DO_REPEAT_RELAY = 182
+enums["MAV_CMD"][182] = EnumEntry("MAV_CMD_DO_REPEAT_RELAY", """""")
+MAV_CMD_DO_SET_SERVO = 183
+enums["MAV_CMD"][183] = EnumEntry("MAV_CMD_DO_SET_SERVO", """""")
+MAV_CMD_DO_REPEAT_SERVO = 184
+enums["MAV_CMD"][184] = EnumEntry("MAV_CMD_DO_REPEAT_SERVO", """""")
+MAV_CMD_DO_FLIGHTTERMINATION = 185
+enums["MAV_CMD"][185] = EnumEntry("MAV_CMD_DO_FLIGHTTERMINATION", """""")
+MAV_CMD_DO_CHANGE_ALTITUDE = 186
+enums["MAV_CMD"][186] = EnumEntry("MAV_CMD_DO_CHANGE_ALTITUDE", """""")
+MAV_CMD_DO_SET_ACTUATOR = 187
+enums["MAV_CMD"][187] = EnumEntry("MAV_CMD_DO_SET_ACTUATOR", """""")
+MAV_CMD_DO_RETURN_PATH_START = 188
+enums["MAV_CMD"][188] = EnumEntry("MAV_CMD_DO_RETURN_PATH_START", """""")
+enums["MAV_CMD"][188].has_location = True
+MAV_CMD_DO_LAND_START = 189
+enums["MAV_CMD"][189] = EnumEntry("MAV_CMD_DO_LAND_START", """""")
+enums["MAV_CMD"][189].has_location = True
+MAV_CMD_DO_RALLY_LAND = 190
+enums["MAV_CMD"][190] = EnumEntry("MAV_CMD_DO_RALLY_LAND", """""")
+MAV_CMD_DO_GO_AROUND = 191
+enums["MAV_CMD"][191] = EnumEntry("MAV_CMD_DO_GO_AROUND", """""")
+MAV_CMD_DO_REPOSITION = 192
+enums["MAV_CMD"][192] = EnumEntry("MAV_CMD_DO_REPOSITION", """""")
+enums["MAV_CMD"][192].has_location = True
+MAV_CMD_DO_PAUSE_CONTINUE = 193
+enums["MAV_CMD"][193] = EnumEntry("MAV_CMD_DO_PAUSE_CONTINUE", """""")
+MAV_CMD_DO_SET_REVERSE = 194
+enums["MAV_CMD"][194] = EnumEntry("MAV_CMD_DO_SET_REVERSE", """""")
+MAV_CMD_DO_SET_ROI_LOCATION = 195
+enums["MAV_CMD"][195] = EnumEntry("MAV_CMD_DO_SET_ROI_LOCATION", """""")
+enums["MAV_CMD"][195].has_location = True
+MAV_CMD_DO_SET_ROI_WPNEXT_OFFSET = 196
+enums["MAV_CMD"][196] = EnumEntry("MAV_CMD_DO_SET_ROI_WPNEXT_OFFSET", """""")
+MAV_CMD_DO_SET_ROI_NONE = 197
+enums["MAV_CMD"][197] = EnumEntry("MAV_CMD_DO_SET_ROI_NONE", """""")
+MAV_CMD_DO_SET_ROI_SYSID = 198
+enums["MAV_CMD"][198] = EnumEntry("MAV_CMD_DO_SET_ROI_SYSID", """""")
+MAV_CMD_DO_CONTROL_VIDEO = 200
+enums["MAV_CMD"][200] = EnumEntry("MAV_CMD_DO_CONTROL_VIDEO", """""")
+MAV_CMD_DO_SET_ROI = 201
+enums["MAV_CMD"][201] = EnumEntry("MAV_CMD_DO_SET_ROI", """""")
+enums["MAV_CMD"][201].has_location = True
+MAV_CMD_DO_DIGICAM_CONFIGURE = 202
+enums["MAV_CMD"][202] = EnumEntry("MAV_CMD_DO_DIGICAM_CONFIGURE", """""")
+MAV_CMD_DO_DIGICAM_CONTROL = 203
+enums["MAV_CMD"][203] = EnumEntry("MAV_CMD_DO_DIGICAM_CONTROL", """""")
+MAV_CMD_DO_MOUNT_CONFIGURE = 204
+enums["MAV_CMD"][204] = EnumEntry("MAV_CMD_DO_MOUNT_CONFIGURE", """""")
+MAV_CMD_DO_MOUNT_CONTROL = 205
+enums["MAV_CMD"][205] = EnumEntry("MAV_CMD_DO_MOUNT_CONTROL", """""")
+MAV_CMD_DO_SET_CAM_TRIGG_DIST = 206
+enums["MAV_CMD"][206] = EnumEntry("MAV_CMD_DO_SET_CAM_TRIGG_DIST", """""")
+MAV_CMD_DO_FENCE_ENABLE = 207
+enums["MAV_CMD"][207] = EnumEntry("MAV_CMD_DO_FENCE_ENABLE", """""")
+MAV_CMD_DO_PARACHUTE = 208
+enums["MAV_CMD"][208] = EnumEntry("MAV_CMD_DO_PARACHUTE", """""")
+MAV_CMD_DO_MOTOR_TEST = 209
+enums["MAV_CMD"][209] = EnumEntry("MAV_CMD_DO_MOTOR_TEST", """""")
+MAV_CMD_DO_INVERTED_FLIGHT = 210
+enums["MAV_CMD"][210] = EnumEntry("MAV_CMD_DO_INVERTED_FLIGHT", """""")
+MAV_CMD_DO_GRIPPER = 211
+enums["MAV_CMD"][211] = EnumEntry("MAV_CMD_DO_GRIPPER", """""")
+MAV_CMD_DO_AUTOTUNE_ENABLE = 212
+enums["MAV_CMD"][212] = EnumEntry("MAV_CMD_DO_AUTOTUNE_ENABLE", """""")
+MAV_CMD_NAV_SET_YAW_SPEED = 213
+enums["MAV_CMD"][213] = EnumEntry("MAV_CMD_NAV_SET_YAW_SPEED", """""")
+MAV_CMD_DO_SET_CAM_TRIGG_INTERVAL = 214
+enums["MAV_CMD"][214] = EnumEntry("MAV_CMD_DO_SET_CAM_TRIGG_INTERVAL", """""")
+MAV_CMD_DO_SET_RESUME_REPEAT_DIST = 215
+enums["MAV_CMD"][215] = EnumEntry("MAV_CMD_DO_SET_RESUME_REPEAT_DIST", """""")
+MAV_CMD_DO_SPRAYER = 216
+enums["MAV_CMD"][216] = EnumEntry("MAV_CMD_DO_SPRAYER", """""")
+MAV_CMD_DO_SEND_SCRIPT_MESSAGE = 217
+enums["MAV_CMD"][217] = EnumEntry("MAV_CMD_DO_SEND_SCRIPT_MESSAGE", """""")
+MAV_CMD_DO_AUX_FUNCTION = 218
+enums["MAV_CMD"][218] = EnumEntry("MAV_CMD_DO_AUX_FUNCTION", """""")
+MAV_CMD_DO_MOUNT_CONTROL_QUAT = 220
+enums["MAV_CMD"][220] = EnumEntry("MAV_CMD_DO_MOUNT_CONTROL_QUAT", """""")
+MAV_CMD_DO_GUIDED_MASTER = 221
+enums["MAV_CMD"][221] = EnumEntry("MAV_CMD_DO_GUIDED_MASTER", """""")
+MAV_CMD_DO_GUIDED_LIMITS = 222
+enums["MAV_CMD"][222] = EnumEntry("MAV_CMD_DO_GUIDED_LIMITS", """""")
+MAV_CMD_DO_ENGINE_CONTROL = 223
+enums["MAV_CMD"][223] = EnumEntry("MAV_CMD_DO_ENGINE_CONTROL", """""")
+MAV_CMD_DO_SET_MISSION_CURRENT = 224
+enums["MAV_CMD"][224] = EnumEntry("MAV_CMD_DO_SET_MISSION_CURRENT", """""")
+MAV_CMD_DO_LAST = 240
+enums["MAV_CMD"][240] = EnumEntry("MAV_CMD_DO_LAST", """""")
+MAV_CMD_PREFLIGHT_CALIBRATION = 241
+enums["MAV_CMD"][241] = EnumEntry("MAV_CMD_PREFLIGHT_CALIBRATION", """""")
+MAV_CMD_PREFLIGHT_SET_SENSOR_OFFSETS = 242
+enums["MAV_CMD"][242] = EnumEntry("MAV_CMD_PREFLIGHT_SET_SENSOR_OFFSETS", """""")
+MAV_CMD_PREFLIGHT_UAVCAN = 243
+enums["MAV_CMD"][243] = EnumEntry("MAV_CMD_PREFLIGHT_UAVCAN", """""")
+MAV_CMD_PREFLIGHT_STORAGE = 245
+enums["MAV_CMD"][245] = EnumEntry("MAV_CMD_PREFLIGHT_STORAGE", """""")
+MAV_CMD_PREFLIGHT_REBOOT_SHUTDOWN = 246
+enums["MAV_CMD"][246] = EnumEntry("MAV_CMD_PREFLIGHT_REBOOT_SHUTDOWN", """""")
+MAV_CMD_OVERRIDE_GOTO = 252
+enums["MAV_CMD"][252] = EnumEntry("MAV_CMD_OVERRIDE_GOTO", """""")
+enums["MAV_CMD"][252].has_location = True
+MAV_CMD_OBLIQUE_SURVEY = 260
+enums["MAV_CMD"][260] = EnumEntry("MAV_CMD_OBLIQUE_SURVEY", """""")
+MAV_CMD_DO_SET_STANDARD_MODE = 262
+enums["MAV_CMD"][262] = EnumEntry("MAV_CMD_DO_SET_STANDARD_MODE", """""")
+MAV_CMD_MISSION_START = 300
+enums["MAV_CMD"][300] = EnumEntry("MAV_CMD_MISSION_START", """""")
+MAV_CMD_ACTUATOR_TEST = 310
+enums["MAV_CMD"][310] = EnumEntry("MAV_CMD_ACTUATOR_TEST", """""")
+MAV_CMD_CONFIGURE_ACTUATOR = 311
+enums["MAV_CMD"][311] = EnumEntry("MAV_CMD_CONFIGURE_ACTUATOR", """""")
+MAV_CMD_COMPONENT_ARM_DISARM = 400
+enums["MAV_CMD"][400] = EnumEntry("MAV_CMD_COMPONENT_ARM_DISARM", """""")
+MAV_CMD_RUN_PREARM_CHECKS = 401
+enums["MAV_CMD"][401] = EnumEntry("MAV_CMD_RUN_PREARM_CHECKS", """""")
+MAV_CMD_ILLUMINATOR_ON_OFF = 405
+enums["MAV_CMD"][405] = EnumEntry("MAV_CMD_ILLUMINATOR_ON_OFF", """""")
+MAV_CMD_DO_ILLUMINATOR_CONFIGURE = 406
+enums["MAV_CMD"][406] = EnumEntry("MAV_CMD_DO_ILLUMINATOR_CONFIGURE", """""")
+MAV_CMD_GET_HOME_POSITION = 410
+enums["MAV_CMD"][410] = EnumEntry("MAV_CMD_GET_HOME_POSITION", """""")
+MAV_CMD_INJECT_FAILURE = 420
+enums["MAV_CMD"][420] = EnumEntry("MAV_CMD_INJECT_FAILURE", """""")
+MAV_CMD_START_RX_PAIR = 500
+enums["MAV_CMD"][500] = EnumEntry("MAV_CMD_START_RX_PAIR", """""")
+MAV_CMD_GET_MESSAGE_INTERVAL = 510
+enums["MAV_CMD"][510] = EnumEntry("MAV_CMD_GET_MESSAGE_INTERVAL", """""")
+MAV_CMD_SET_MESSAGE_INTERVAL = 511
+enums["MAV_CMD"][511] = EnumEntry("MAV_CMD_SET_MESSAGE_INTERVAL", """""")
+MAV_CMD_REQUEST_MESSAGE = 512
+enums["MAV_CMD"][512] = EnumEntry("MAV_CMD_REQUEST_MESSAGE", """""")
+MAV_CMD_REQUEST_PROTOCOL_VERSION = 519
+enums["MAV_CMD"][519] = EnumEntry("MAV_CMD_REQUEST_PROTOCOL_VERSION", """""")
+MAV_CMD_REQUEST_AUTOPILOT_CAPABILITIES = 520
+enums["MAV_CMD"][520] = EnumEntry("MAV_CMD_REQUEST_AUTOPILOT_CAPABILITIES", """""")
+MAV_CMD_REQUEST_CAMERA_INFORMATION = 521
+enums["MAV_CMD"][521] = EnumEntry("MAV_CMD_REQUEST_CAMERA_INFORMATION", """""")
+MAV_CMD_REQUEST_CAMERA_SETTINGS = 522
+enums["MAV_CMD"][522] = EnumEntry("MAV_CMD_REQUEST_CAMERA_SETTINGS", """""")
+MAV_CMD_REQUEST_STORAGE_INFORMATION = 525
+enums["MAV_CMD"][525] = EnumEntry("MAV_CMD_REQUEST_STORAGE_INFORMATION", """""")
+MAV_CMD_STORAGE_FORMAT = 526
+enums["MAV_CMD"][526] = EnumEntry("MAV_CMD_STORAGE_FORMAT", """""")
+MAV_CMD_REQUEST_CAMERA_CAPTURE_STATUS = 527
+enums["MAV_CMD"][527] = EnumEntry("MAV_CMD_REQUEST_CAMERA_CAPTURE_STATUS", """""")
+MAV_CMD_REQUEST_FLIGHT_INFORMATION = 528
+enums["MAV_CMD"][528] = EnumEntry("MAV_CMD_REQUEST_FLIGHT_INFORMATION", """""")
+MAV_CMD_RESET_CAMERA_SETTINGS = 529
+enums["MAV_CMD"][529] = EnumEntry("MAV_CMD_RESET_CAMERA_SETTINGS", """""")
+MAV_CMD_SET_CAMERA_MODE = 530
+enums["MAV_CMD"][530] = EnumEntry("MAV_CMD_SET_CAMERA_MODE", """""")
+MAV_CMD_SET_CAMERA_ZOOM = 531
+enums["MAV_CMD"][531] = EnumEntry("MAV_CMD_SET_CAMERA_ZOOM", """""")
+MAV_CMD_SET_CAMERA_FOCUS = 532
+enums["MAV_CMD"][532] = EnumEntry("MAV_CMD_SET_CAMERA_FOCUS", """""")
+MAV_CMD_SET_STORAGE_USAGE = 533
+enums["MAV_CMD"][533] = EnumEntry("MAV_CMD_SET_STORAGE_USAGE", """""")
+MAV_CMD_SET_CAMERA_SOURCE = 534
+enums["MAV_CMD"][534] = EnumEntry("MAV_CMD_SET_CAMERA_SOURCE", """""")
+MAV_CMD_JUMP_TAG = 600
+enums["MAV_CMD"][600] = EnumEntry("MAV_CMD_JUMP_TAG", """""")
+MAV_CMD_DO_JUMP_TAG = 601
+enums["MAV_CMD"][601] = EnumEntry("MAV_CMD_DO_JUMP_TAG", """""")
+MAV_CMD_DO_SET_SYS_CMP_ID = 610
+enums["MAV_CMD"][610] = EnumEntry("MAV_CMD_DO_SET_SYS_CMP_ID", """""")
+MAV_CMD_DO_SET_GLOBAL_ORIGIN = 611
+enums["MAV_CMD"][611] = EnumEntry("MAV_CMD_DO_SET_GLOBAL_ORIGIN", """""")
+enums["MAV_CMD"][611].has_location = True
+MAV_CMD_DO_GIMBAL_MANAGER_PITCHYAW = 1000
+enums["MAV_CMD"][1000] = EnumEntry("MAV_CMD_DO_GIMBAL_MANAGER_PITCHYAW", """""")
+MAV_CMD_DO_GIMBAL_MANAGER_CONFIGURE = 1001
+enums["MAV_CMD"][1001] = EnumEntry("MAV_CMD_DO_GIMBAL_MANAGER_CONFIGURE", """""")
+MAV_CMD_IMAGE_START_CAPTURE = 2000
+enums["MAV_CMD"][2000] = EnumEntry("MAV_CMD_IMAGE_START_CAPTURE", """""")
+MAV_CMD_IMAGE_STOP_CAPTURE = 2001
+enums["MAV_CMD"][2001] = EnumEntry("MAV_CMD_IMAGE_STOP_CAPTURE", """""")
+MAV_CMD_REQUEST_CAMERA_IMAGE_CAPTURE = 2002
+enums["MAV_CMD"][2002] = EnumEntry("MAV_CMD_REQUEST_CAMERA_IMAGE_CAPTURE", """""")
+MAV_CMD_DO_TRIGGER_CONTROL = 2003
+enums["MAV_CMD"][2003] = EnumEntry("MAV_CMD_DO_TRIGGER_CONTROL", """""")
+MAV_CMD_CAMERA_TRACK_POINT = 2004
+enums["MAV_CMD"][2004] = EnumEntry("MAV_CMD_CAMERA_TRACK_POINT", """""")
+MAV_CMD_CAMERA_TRACK_RECTANGLE = 2005
+enums["MAV_CMD"][2005] = EnumEntry("MAV_CMD_CAMERA_TRACK_RECTANGLE", """""")
+MAV_CMD_CAMERA_STOP_TRACKING = 2010
+enums["MAV_CMD"][2010] = EnumEntry("MAV_CMD_CAMERA_STOP_TRACKING", """""")
+MAV_CMD_CAMERA_START_MTI = 2020
+enums["MAV_CMD"][2020] = EnumEntry("MAV_CMD_CAMERA_START_MTI", """""")
+MAV_CMD_CAMERA_STOP_MTI = 2021
+enums["MAV_CMD"][2021] = EnumEntry("MAV_CMD_CAMERA_STOP_MTI", """""")
+MAV_CMD_VIDEO_START_CAPTURE = 2500
+enums["MAV_CMD"][2500] = EnumEntry("MAV_CMD_VIDEO_START_CAPTURE", """""")
+MAV_CMD_VIDEO_STOP_CAPTURE = 2501
+enums["MAV_CMD"][2501] = EnumEntry("MAV_CMD_VIDEO_STOP_CAPTURE", """""")
+MAV_CMD_VIDEO_START_STREAMING = 2502
+enums["MAV_CMD"][2502] = EnumEntry("MAV_CMD_VIDEO_START_STREAMING", """""")
+MAV_CMD_VIDEO_STOP_STREAMING = 2503
+enums["MAV_CMD"][2503] = EnumEntry("MAV_CMD_VIDEO_STOP_STREAMING", """""")
+MAV_CMD_REQUEST_VIDEO_STREAM_INFORMATION = 2504
+enums["MAV_CMD"][2504] = EnumEntry("MAV_CMD_REQUEST_VIDEO_STREAM_INFORMATION", """""")
+MAV_CMD_REQUEST_VIDEO_STREAM_STATUS = 2505
+enums["MAV_CMD"][2505] = EnumEntry("MAV_CMD_REQUEST_VIDEO_STREAM_STATUS", """""")
+MAV_CMD_LOGGING_START = 2510
+enums["MAV_CMD"][2510] = EnumEntry("MAV_CMD_LOGGING_START", """""")
+MAV_CMD_LOGGING_STOP = 2511
+enums["MAV_CMD"][2511] = EnumEntry("MAV_CMD_LOGGING_STOP", """""")
+MAV_CMD_AIRFRAME_CONFIGURATION = 2520
+enums["MAV_CMD"][2520] = EnumEntry("MAV_CMD_AIRFRAME_CONFIGURATION", """""")
+MAV_CMD_CONTROL_HIGH_LATENCY = 2600
+enums["MAV_CMD"][2600] = EnumEntry("MAV_CMD_CONTROL_HIGH_LATENCY", """""")
+MAV_CMD_PANORAMA_CREATE = 2800
+enums["MAV_CMD"][2800] = EnumEntry("MAV_CMD_PANORAMA_CREATE", """""")
+MAV_CMD_DO_VTOL_TRANSITION = 3000
+enums["MAV_CMD"][3000] = EnumEntry("MAV_CMD_DO_VTOL_TRANSITION", """""")
+MAV_CMD_ARM_AUTHORIZATION_REQUEST = 3001
+enums["MAV_CMD"][3001] = EnumEntry("MAV_CMD_ARM_AUTHORIZATION_REQUEST", """""")
+MAV_CMD_SET_GUIDED_SUBMODE_STANDARD = 4000
+enums["MAV_CMD"][4000] = EnumEntry("MAV_CMD_SET_GUIDED_SUBMODE_STANDARD", """""")
+MAV_CMD_SET_GUIDED_SUBMODE_CIRCLE = 4001
+enums["MAV_CMD"][4001] = EnumEntry("MAV_CMD_SET_GUIDED_SUBMODE_CIRCLE", """""")
+enums["MAV_CMD"][4001].has_location = True
+MAV_CMD_CONDITION_GATE = 4501
+enums["MAV_CMD"][4501] = EnumEntry("MAV_CMD_CONDITION_GATE", """""")
+enums["MAV_CMD"][4501].has_location = True
+MAV_CMD_NAV_FENCE_RETURN_POINT = 5000
+enums["MAV_CMD"][5000] = EnumEntry("MAV_CMD_NAV_FENCE_RETURN_POINT", """""")
+enums["MAV_CMD"][5000].has_location = True
+MAV_CMD_NAV_FENCE_POLYGON_VERTEX_INCLUSION = 5001
+enums["MAV_CMD"][5001] = EnumEntry("MAV_CMD_NAV_FENCE_POLYGON_VERTEX_INCLUSION", """""")
+enums["MAV_CMD"][5001].has_location = True
+MAV_CMD_NAV_FENCE_POLYGON_VERTEX_EXCLUSION = 5002
+enums["MAV_CMD"][5002] = EnumEntry("MAV_CMD_NAV_FENCE_POLYGON_VERTEX_EXCLUSION", """""")
+enums["MAV_CMD"][5002].has_location = True
+MAV_CMD_NAV_FENCE_CIRCLE_INCLUSION = 5003
+enums["MAV_CMD"][5003] = EnumEntry("MAV_CMD_NAV_FENCE_CIRCLE_INCLUSION", """""")
+enums["MAV_CMD"][5003].has_location = True
+MAV_CMD_NAV_FENCE_CIRCLE_EXCLUSION = 5004
+enums["MAV_CMD"][5004] = EnumEntry("MAV_CMD_NAV_FENCE_CIRCLE_EXCLUSION", """""")
+enums["MAV_CMD"][5004].has_location = True
+MAV_CMD_NAV_FENCE_HOME_CIRCLE_INCLUSION = 5005
+enums["MAV_CMD"][5005] = EnumEntry("MAV_CMD_NAV_FENCE_HOME_CIRCLE_INCLUSION", """""")
+MAV_CMD_NAV_RALLY_POINT = 5100
+enums["MAV_CMD"][5100] = EnumEntry("MAV_CMD_NAV_RALLY_POINT", """""")
+enums["MAV_CMD"][5100].has_location = True
+MAV_CMD_UAVCAN_GET_NODE_INFO = 5200
+enums["MAV_CMD"][5200] = EnumEntry("MAV_CMD_UAVCAN_GET_NODE_INFO", """""")
+MAV_CMD_DO_SET_SAFETY_SWITCH_STATE = 5300
+enums["MAV_CMD"][5300] = EnumEntry("MAV_CMD_DO_SET_SAFETY_SWITCH_STATE", """""")
+MAV_CMD_DO_ADSB_OUT_IDENT = 10001
+enums["MAV_CMD"][10001] = EnumEntry("MAV_CMD_DO_ADSB_OUT_IDENT", """""")
+MAV_CMD_LOWEHEISER_SET_STATE = 10151
+enums["MAV_CMD"][10151] = EnumEntry("MAV_CMD_LOWEHEISER_SET_STATE", """""")
+MAV_CMD_PAYLOAD_PREPARE_DEPLOY = 30001
+enums["MAV_CMD"][30001] = EnumEntry("MAV_CMD_PAYLOAD_PREPARE_DEPLOY", """""")
+enums["MAV_CMD"][30001].has_location = True
+MAV_CMD_PAYLOAD_CONTROL_DEPLOY = 30002
+enums["MAV_CMD"][30002] = EnumEntry("MAV_CMD_PAYLOAD_CONTROL_DEPLOY", """""")
+MAV_CMD_WAYPOINT_USER_1 = 31000
+enums["MAV_CMD"][31000] = EnumEntry("MAV_CMD_WAYPOINT_USER_1", """""")
+enums["MAV_CMD"][31000].has_location = True
+MAV_CMD_WAYPOINT_USER_2 = 31001
+enums["MAV_CMD"][31001] = EnumEntry("MAV_CMD_WAYPOINT_USER_2", """""")
+enums["MAV_CMD"][31001].has_location = True
+MAV_CMD_WAYPOINT_USER_3 = 31002
+enums["MAV_CMD"][31002] = EnumEntry("MAV_CMD_WAYPOINT_USER_3", """""")
+enums["MAV_CMD"][31002].has_location = True
+MAV_CMD_WAYPOINT_USER_4 = 31003
+enums["MAV_CMD"][31003] = EnumEntry("MAV_CMD_WAYPOINT_USER_4", """""")
+enums["MAV_CMD"][31003].has_location = True
+MAV_CMD_WAYPOINT_USER_5 = 31004
+enums["MAV_CMD"][31004] = EnumEntry("MAV_CMD_WAYPOINT_USER_5", """""")
+enums["MAV_CMD"][31004].has_location = True
+MAV_CMD_SPATIAL_USER_1 = 31005
+enums["MAV_CMD"][31005] = EnumEntry("MAV_CMD_SPATIAL_USER_1", """""")
+enums["MAV_CMD"][31005].has_location = True
+MAV_CMD_SPATIAL_USER_2 = 31006
+enums["MAV_CMD"][31006] = EnumEntry("MAV_CMD_SPATIAL_USER_2", """""")
+enums["MAV_CMD"][31006].has_location = True
+MAV_CMD_SPATIAL_USER_3 = 31007
+enums["MAV_CMD"][31007] = EnumEntry("MAV_CMD_SPATIAL_USER_3", """""")
+enums["MAV_CMD"][31007].has_location = True
+MAV_CMD_SPATIAL_USER_4 = 31008
+enums["MAV_CMD"][31008] = EnumEntry("MAV_CMD_SPATIAL_USER_4", """""")
+enums["MAV_CMD"][31008].has_location = True
+MAV_CMD_SPATIAL_USER_5 = 31009
+enums["MAV_CMD"][31009] = EnumEntry("MAV_CMD_SPATIAL_USER_5", """""")
+enums["MAV_CMD"][31009].has_location = True
+MAV_CMD_USER_1 = 31010
+enums["MAV_CMD"][31010] = EnumEntry("MAV_CMD_USER_1", """""")
+MAV_CMD_USER_2 = 31011
+enums["MAV_CMD"][31011] = EnumEntry("MAV_CMD_USER_2", """""")
+MAV_CMD_USER_3 = 31012
+enums["MAV_CMD"][31012] = EnumEntry("MAV_CMD_USER_3", """""")
+MAV_CMD_USER_4 = 31013
+enums["MAV_CMD"][31013] = EnumEntry("MAV_CMD_USER_4", """""")
+MAV_CMD_USER_5 = 31014
+enums["MAV_CMD"][31014] = EnumEntry("MAV_CMD_USER_5", """""")
+MAV_CMD_CAN_FORWARD = 32000
+enums["MAV_CMD"][32000] = EnumEntry("MAV_CMD_CAN_FORWARD", """""")
+MAV_CMD_RESET_MPPT = 40001
+enums["MAV_CMD"][40001] = EnumEntry("MAV_CMD_RESET_MPPT", """""")
+MAV_CMD_PAYLOAD_CONTROL = 40002
+enums["MAV_CMD"][40002] = EnumEntry("MAV_CMD_PAYLOAD_CONTROL", """""")
+MAV_CMD_POWER_OFF_INITIATED = 42000
+enums["MAV_CMD"][42000] = EnumEntry("MAV_CMD_POWER_OFF_INITIATED", """""")
+MAV_CMD_SOLO_BTN_FLY_CLICK = 42001
+enums["MAV_CMD"][42001] = EnumEntry("MAV_CMD_SOLO_BTN_FLY_CLICK", """""")
+MAV_CMD_SOLO_BTN_FLY_HOLD = 42002
+enums["MAV_CMD"][42002] = EnumEntry("MAV_CMD_SOLO_BTN_FLY_HOLD", """""")
+MAV_CMD_SOLO_BTN_PAUSE_CLICK = 42003
+enums["MAV_CMD"][42003] = EnumEntry("MAV_CMD_SOLO_BTN_PAUSE_CLICK", """""")
+MAV_CMD_FIXED_MAG_CAL = 42004
+enums["MAV_CMD"][42004] = EnumEntry("MAV_CMD_FIXED_MAG_CAL", """""")
+MAV_CMD_FIXED_MAG_CAL_FIELD = 42005
+enums["MAV_CMD"][42005] = EnumEntry("MAV_CMD_FIXED_MAG_CAL_FIELD", """""")
+MAV_CMD_FIXED_MAG_CAL_YAW = 42006
+enums["MAV_CMD"][42006] = EnumEntry("MAV_CMD_FIXED_MAG_CAL_YAW", """""")
+MAV_CMD_SET_EKF_SOURCE_SET = 42007
+enums["MAV_CMD"][42007] = EnumEntry("MAV_CMD_SET_EKF_SOURCE_SET", """""")
+MAV_CMD_DO_START_MAG_CAL = 42424
+enums["MAV_CMD"][42424] = EnumEntry("MAV_CMD_DO_START_MAG_CAL", """""")
+MAV_CMD_DO_ACCEPT_MAG_CAL = 42425
+enums["MAV_CMD"][42425] = EnumEntry("MAV_CMD_DO_ACCEPT_MAG_CAL", """""")
+MAV_CMD_DO_CANCEL_MAG_CAL = 42426
+enums["MAV_CMD"][42426] = EnumEntry("MAV_CMD_DO_CANCEL_MAG_CAL", """""")
+MAV_CMD_SET_FACTORY_TEST_MODE = 42427
+enums["MAV_CMD"][42427] = EnumEntry("MAV_CMD_SET_FACTORY_TEST_MODE", """""")
+MAV_CMD_DO_SEND_BANNER = 42428
+enums["MAV_CMD"][42428] = EnumEntry("MAV_CMD_DO_SEND_BANNER", """""")
+MAV_CMD_ACCELCAL_VEHICLE_POS = 42429
+enums["MAV_CMD"][42429] = EnumEntry("MAV_CMD_ACCELCAL_VEHICLE_POS", """""")
+MAV_CMD_GIMBAL_RESET = 42501
+enums["MAV_CMD"][42501] = EnumEntry("MAV_CMD_GIMBAL_RESET", """""")
+MAV_CMD_GIMBAL_AXIS_CALIBRATION_STATUS = 42502
+enums["MAV_CMD"][42502] = EnumEntry("MAV_CMD_GIMBAL_AXIS_CALIBRATION_STATUS", """""")
+MAV_CMD_GIMBAL_REQUEST_AXIS_CALIBRATION = 42503
+enums["MAV_CMD"][42503] = EnumEntry("MAV_CMD_GIMBAL_REQUEST_AXIS_CALIBRATION", """""")
+MAV_CMD_GIMBAL_FULL_RESET = 42505
+enums["MAV_CMD"][42505] = EnumEntry("MAV_CMD_GIMBAL_FULL_RESET", """""")
+MAV_CMD_DO_WINCH = 42600
+enums["MAV_CMD"][42600] = EnumEntry("MAV_CMD_DO_WINCH", """""")
+MAV_CMD_FLASH_BOOTLOADER = 42650
+enums["MAV_CMD"][42650] = EnumEntry("MAV_CMD_FLASH_BOOTLOADER", """""")
+MAV_CMD_BATTERY_RESET = 42651
+enums["MAV_CMD"][42651] = EnumEntry("MAV_CMD_BATTERY_RESET", """""")
+MAV_CMD_DEBUG_TRAP = 42700
+enums["MAV_CMD"][42700] = EnumEntry("MAV_CMD_DEBUG_TRAP", """""")
+MAV_CMD_SCRIPTING = 42701
+enums["MAV_CMD"][42701] = EnumEntry("MAV_CMD_SCRIPTING", """""")
+MAV_CMD_NAV_SCRIPT_TIME = 42702
+enums["MAV_CMD"][42702] = EnumEntry("MAV_CMD_NAV_SCRIPT_TIME", """""")
+MAV_CMD_NAV_ATTITUDE_TIME = 42703
+enums["MAV_CMD"][42703] = EnumEntry("MAV_CMD_NAV_ATTITUDE_TIME", """""")
+MAV_CMD_GUIDED_CHANGE_SPEED = 43000
+enums["MAV_CMD"][43000] = EnumEntry("MAV_CMD_GUIDED_CHANGE_SPEED", """""")
+MAV_CMD_GUIDED_CHANGE_ALTITUDE = 43001
+enums["MAV_CMD"][43001] = EnumEntry("MAV_CMD_GUIDED_CHANGE_ALTITUDE", """""")
+MAV_CMD_GUIDED_CHANGE_HEADING = 43002
+enums["MAV_CMD"][43002] = EnumEntry("MAV_CMD_GUIDED_CHANGE_HEADING", """""")
+MAV_CMD_EXTERNAL_POSITION_ESTIMATE = 43003
+enums["MAV_CMD"][43003] = EnumEntry("MAV_CMD_EXTERNAL_POSITION_ESTIMATE", """""")
+enums["MAV_CMD"][43003].has_location = True
+MAV_CMD_EXTERNAL_WIND_ESTIMATE = 43004
+enums["MAV_CMD"][43004] = EnumEntry("MAV_CMD_EXTERNAL_WIND_ESTIMATE", """""")
+MAV_CMD_SET_HAGL = 43005
+enums["MAV_CMD"][43005] = EnumEntry("MAV_CMD_SET_HAGL", """""")
+MAV_CMD_STORM32_DO_GIMBAL_MANAGER_CONTROL_PITCHYAW = 60002
+enums["MAV_CMD"][60002] = EnumEntry("MAV_CMD_STORM32_DO_GIMBAL_MANAGER_CONTROL_PITCHYAW", """""")
+MAV_CMD_STORM32_DO_GIMBAL_MANAGER_SETUP = 60010
+enums["MAV_CMD"][60010] = EnumEntry("MAV_CMD_STORM32_DO_GIMBAL_MANAGER_SETUP", """""")
+MAV_CMD_QSHOT_DO_CONFIGURE = 60020
+enums["MAV_CMD"][60020] = EnumEntry("MAV_CMD_QSHOT_DO_CONFIGURE", """""")
+MAV_CMD_PRS_SET_ARM = 60050
+enums["MAV_CMD"][60050] = EnumEntry("MAV_CMD_PRS_SET_ARM", """""")
+MAV_CMD_PRS_GET_ARM = 60051
+enums["MAV_CMD"][60051] = EnumEntry("MAV_CMD_PRS_GET_ARM", """""")
+MAV_CMD_PRS_GET_BATTERY = 60052
+enums["MAV_CMD"][60052] = EnumEntry("MAV_CMD_PRS_GET_BATTERY", """""")
+MAV_CMD_PRS_GET_ERR = 60053
+enums["MAV_CMD"][60053] = EnumEntry("MAV_CMD_PRS_GET_ERR", """""")
+MAV_CMD_PRS_SET_ARM_ALTI = 60070
+enums["MAV_CMD"][60070] = EnumEntry("MAV_CMD_PRS_SET_ARM_ALTI", """""")
+MAV_CMD_PRS_GET_ARM_ALTI = 60071
+enums["MAV_CMD"][60071] = EnumEntry("MAV_CMD_PRS_GET_ARM_ALTI", """""")
+MAV_CMD_PRS_SHUTDOWN = 60072
+enums["MAV_CMD"][60072] = EnumEntry("MAV_CMD_PRS_SHUTDOWN", """""")
+MAV_CMD_ENUM_END = 60073
+enums["MAV_CMD"][60073] = EnumEntry("MAV_CMD_ENUM_END", """""")
+
+# SCRIPTING_CMD
+SCRIPTING_CMD_REPL_START = 0
+SCRIPTING_CMD_REPL_STOP = 1
+SCRIPTING_CMD_STOP = 2
+SCRIPTING_CMD_STOP_AND_RESTART = 3
+SCRIPTING_CMD_ENUM_END = 4
+
+# SECURE_COMMAND_OP
+SECURE_COMMAND_GET_SESSION_KEY = 0
+SECURE_COMMAND_GET_REMOTEID_SESSION_KEY = 1
+SECURE_COMMAND_REMOVE_PUBLIC_KEYS = 2
+SECURE_COMMAND_GET_PUBLIC_KEYS = 3
+SECURE_COMMAND_SET_PUBLIC_KEYS = 4
+SECURE_COMMAND_GET_REMOTEID_CONFIG = 5
+SECURE_COMMAND_SET_REMOTEID_CONFIG = 6
+SECURE_COMMAND_FLASH_BOOTLOADER = 7
+SECURE_COMMAND_OP_ENUM_END = 8
+
+# LIMITS_STATE
+LIMITS_INIT = 0
+LIMITS_DISABLED = 1
+LIMITS_ENABLED = 2
+LIMITS_TRIGGERED = 3
+LIMITS_RECOVERING = 4
+LIMITS_RECOVERED = 5
+LIMITS_STATE_ENUM_END = 6
+
+# LIMIT_MODULE
+LIMIT_GPSLOCK = 1
+LIMIT_GEOFENCE = 2
+LIMIT_ALTITUDE = 4
+LIMIT_MODULE_ENUM_END = 5
+
+# RALLY_FLAGS
+FAVORABLE_WIND = 1
+LAND_IMMEDIATELY = 2
+ALT_FRAME_VALID = 4
+ALT_FRAME = 24
+RALLY_FLAGS_ENUM_END = 25
+
+# CAMERA_STATUS_TYPES
+CAMERA_STATUS_TYPE_HEARTBEAT = 0
+CAMERA_STATUS_TYPE_TRIGGER = 1
+CAMERA_STATUS_TYPE_DISCONNECT = 2
+CAMERA_STATUS_TYPE_ERROR = 3
+CAMERA_STATUS_TYPE_LOWBATT = 4
+CAMERA_STATUS_TYPE_LOWSTORE = 5
+CAMERA_STATUS_TYPE_LOWSTOREV = 6
+CAMERA_STATUS_TYPES_ENUM_END = 7
+
+# CAMERA_FEEDBACK_FLAGS
+CAMERA_FEEDBACK_PHOTO = 0
+CAMERA_FEEDBACK_VIDEO = 1
+CAMERA_FEEDBACK_BADEXPOSURE = 2
+CAMERA_FEEDBACK_CLOSEDLOOP = 3
+CAMERA_FEEDBACK_OPENLOOP = 4
+CAMERA_FEEDBACK_FLAGS_ENUM_END = 5
+
+# MAV_MODE_GIMBAL
+MAV_MODE_GIMBAL_UNINITIALIZED = 0
+MAV_MODE_GIMBAL_CALIBRATING_PITCH = 1
+MAV_MODE_GIMBAL_CALIBRATING_ROLL = 2
+MAV_MODE_GIMBAL_CALIBRATING_YAW = 3
+MAV_MODE_GIMBAL_INITIALIZED = 4
+MAV_MODE_GIMBAL_ACTIVE = 5
+MAV_MODE_GIMBAL_RATE_CMD_TIMEOUT = 6
+MAV_MODE_GIMBAL_ENUM_END = 7
+
+# GIMBAL_AXIS
+GIMBAL_AXIS_YAW = 0
+GIMBAL_AXIS_PITCH = 1
+GIMBAL_AXIS_ROLL = 2
+GIMBAL_AXIS_ENUM_END = 3
+
+# GIMBAL_AXIS_CALIBRATION_STATUS
+GIMBAL_AXIS_CALIBRATION_STATUS_IN_PROGRESS = 0
+GIMBAL_AXIS_CALIBRATION_STATUS_SUCCEEDED = 1
+GIMBAL_AXIS_CALIBRATION_STATUS_FAILED = 2
+GIMBAL_AXIS_CALIBRATION_STATUS_ENUM_END = 3
+
+# GIMBAL_AXIS_CALIBRATION_REQUIRED
+GIMBAL_AXIS_CALIBRATION_REQUIRED_UNKNOWN = 0
+GIMBAL_AXIS_CALIBRATION_REQUIRED_TRUE = 1
+GIMBAL_AXIS_CALIBRATION_REQUIRED_FALSE = 2
+GIMBAL_AXIS_CALIBRATION_REQUIRED_ENUM_END = 3
+
+# GOPRO_HEARTBEAT_STATUS
+GOPRO_HEARTBEAT_STATUS_DISCONNECTED = 0
+GOPRO_HEARTBEAT_STATUS_INCOMPATIBLE = 1
+GOPRO_HEARTBEAT_STATUS_CONNECTED = 2
+GOPRO_HEARTBEAT_STATUS_ERROR = 3
+GOPRO_HEARTBEAT_STATUS_ENUM_END = 4
+
+# GOPRO_HEARTBEAT_FLAGS
+GOPRO_FLAG_RECORDING = 1
+GOPRO_HEARTBEAT_FLAGS_ENUM_END = 2
+
+# GOPRO_REQUEST_STATUS
+GOPRO_REQUEST_SUCCESS = 0
+GOPRO_REQUEST_FAILED = 1
+GOPRO_REQUEST_STATUS_ENUM_END = 2
+
+# GOPRO_COMMAND
+GOPRO_COMMAND_POWER = 0
+GOPRO_COMMAND_CAPTURE_MODE = 1
+GOPRO_COMMAND_SHUTTER = 2
+GOPRO_COMMAND_BATTERY = 3
+GOPRO_COMMAND_MODEL = 4
+GOPRO_COMMAND_VIDEO_SETTINGS = 5
+GOPRO_COMMAND_LOW_LIGHT = 6
+GOPRO_COMMAND_PHOTO_RESOLUTION = 7
+GOPRO_COMMAND_PHOTO_BURST_RATE = 8
+GOPRO_COMMAND_PROTUNE = 9
+GOPRO_COMMAND_PROTUNE_WHITE_BALANCE = 10
+GOPRO_COMMAND_PROTUNE_COLOUR = 11
+GOPRO_COMMAND_PROTUNE_GAIN = 12
+GOPRO_COMMAND_PROTUNE_SHARPNESS = 13
+GOPRO_COMMAND_PROTUNE_EXPOSURE = 14
+GOPRO_COMMAND_TIME = 15
+GOPRO_COMMAND_CHARGING = 16
+GOPRO_COMMAND_ENUM_END = 17
+
+# GOPRO_CAPTURE_MODE
+GOPRO_CAPTURE_MODE_VIDEO = 0
+GOPRO_CAPTURE_MODE_PHOTO = 1
+GOPRO_CAPTURE_MODE_BURST = 2
+GOPRO_CAPTURE_MODE_TIME_LAPSE = 3
+GOPRO_CAPTURE_MODE_MULTI_SHOT = 4
+GOPRO_CAPTURE_MODE_PLAYBACK = 5
+GOPRO_CAPTURE_MODE_SETUP = 6
+GOPRO_CAPTURE_MODE_UNKNOWN = 255
+GOPRO_CAPTURE_MODE_ENUM_END = 256
+
+# GOPRO_RESOLUTION
+GOPRO_RESOLUTION_480p = 0
+GOPRO_RESOLUTION_720p = 1
+GOPRO_RESOLUTION_960p = 2
+GOPRO_RESOLUTION_1080p = 3
+GOPRO_RESOLUTION_1440p = 4
+GOPRO_RESOLUTION_2_7k_17_9 = 5
+GOPRO_RESOLUTION_2_7k_16_9 = 6
+GOPRO_RESOLUTION_2_7k_4_3 = 7
+GOPRO_RESOLUTION_4k_16_9 = 8
+GOPRO_RESOLUTION_4k_17_9 = 9
+GOPRO_RESOLUTION_720p_SUPERVIEW = 10
+GOPRO_RESOLUTION_1080p_SUPERVIEW = 11
+GOPRO_RESOLUTION_2_7k_SUPERVIEW = 12
+GOPRO_RESOLUTION_4k_SUPERVIEW = 13
+GOPRO_RESOLUTION_ENUM_END = 14
+
+# GOPRO_FRAME_RATE
+GOPRO_FRAME_RATE_12 = 0
+GOPRO_FRAME_RATE_15 = 1
+GOPRO_FRAME_RATE_24 = 2
+GOPRO_FRAME_RATE_25 = 3
+GOPRO_FRAME_RATE_30 = 4
+GOPRO_FRAME_RATE_48 = 5
+GOPRO_FRAME_RATE_50 = 6
+GOPRO_FRAME_RATE_60 = 7
+GOPRO_FRAME_RATE_80 = 8
+GOPRO_FRAME_RATE_90 = 9
+GOPRO_FRAME_RATE_100 = 10
+GOPRO_FRAME_RATE_120 = 11
+GOPRO_FRAME_RATE_240 = 12
+GOPRO_FRAME_RATE_12_5 = 13
+GOPRO_FRAME_RATE_ENUM_END = 14
+
+# GOPRO_FIELD_OF_VIEW
+GOPRO_FIELD_OF_VIEW_WIDE = 0
+GOPRO_FIELD_OF_VIEW_MEDIUM = 1
+GOPRO_FIELD_OF_VIEW_NARROW = 2
+GOPRO_FIELD_OF_VIEW_ENUM_END = 3
+
+# GOPRO_VIDEO_SETTINGS_FLAGS
+GOPRO_VIDEO_SETTINGS_TV_MODE = 1
+GOPRO_VIDEO_SETTINGS_FLAGS_ENUM_END = 2
+
+# GOPRO_PHOTO_RESOLUTION
+GOPRO_PHOTO_RESOLUTION_5MP_MEDIUM = 0
+GOPRO_PHOTO_RESOLUTION_7MP_MEDIUM = 1
+GOPRO_PHOTO_RESOLUTION_7MP_WIDE = 2
+GOPRO_PHOTO_RESOLUTION_10MP_WIDE = 3
+GOPRO_PHOTO_RESOLUTION_12MP_WIDE = 4
+GOPRO_PHOTO_RESOLUTION_ENUM_END = 5
+
+# GOPRO_PROTUNE_WHITE_BALANCE
+GOPRO_PROTUNE_WHITE_BALANCE_AUTO = 0
+GOPRO_PROTUNE_WHITE_BALANCE_3000K = 1
+GOPRO_PROTUNE_WHITE_BALANCE_5500K = 2
+GOPRO_PROTUNE_WHITE_BALANCE_6500K = 3
+GOPRO_PROTUNE_WHITE_BALANCE_RAW = 4
+GOPRO_PROTUNE_WHITE_BALANCE_ENUM_END = 5
+
+# GOPRO_PROTUNE_COLOUR
+GOPRO_PROTUNE_COLOUR_STANDARD = 0
+GOPRO_PROTUNE_COLOUR_NEUTRAL = 1
+GOPRO_PROTUNE_COLOUR_ENUM_END = 2
+
+# GOPRO_PROTUNE_GAIN
+GOPRO_PROTUNE_GAIN_400 = 0
+GOPRO_PROTUNE_GAIN_800 = 1
+GOPRO_PROTUNE_GAIN_1600 = 2
+GOPRO_PROTUNE_GAIN_3200 = 3
+GOPRO_PROTUNE_GAIN_6400 = 4
+GOPRO_PROTUNE_GAIN_ENUM_END = 5
+
+# GOPRO_PROTUNE_SHARPNESS
+GOPRO_PROTUNE_SHARPNESS_LOW = 0
+GOPRO_PROTUNE_SHARPNESS_MEDIUM = 1
+GOPRO_PROTUNE_SHARPNESS_HIGH = 2
+GOPRO_PROTUNE_SHARPNESS_ENUM_END = 3
+
+# GOPRO_PROTUNE_EXPOSURE
+GOPRO_PROTUNE_EXPOSURE_NEG_5_0 = 0
+GOPRO_PROTUNE_EXPOSURE_NEG_4_5 = 1
+GOPRO_PROTUNE_EXPOSURE_NEG_4_0 = 2
+GOPRO_PROTUNE_EXPOSURE_NEG_3_5 = 3
+GOPRO_PROTUNE_EXPOSURE_NEG_3_0 = 4
+GOPRO_PROTUNE_EXPOSURE_NEG_2_5 = 5
+GOPRO_PROTUNE_EXPOSURE_NEG_2_0 = 6
+GOPRO_PROTUNE_EXPOSURE_NEG_1_5 = 7
+GOPRO_PROTUNE_EXPOSURE_NEG_1_0 = 8
+GOPRO_PROTUNE_EXPOSURE_NEG_0_5 = 9
+GOPRO_PROTUNE_EXPOSURE_ZERO = 10
+GOPRO_PROTUNE_EXPOSURE_POS_0_5 = 11
+GOPRO_PROTUNE_EXPOSURE_POS_1_0 = 12
+GOPRO_PROTUNE_EXPOSURE_POS_1_5 = 13
+GOPRO_PROTUNE_EXPOSURE_POS_2_0 = 14
+GOPRO_PROTUNE_EXPOSURE_POS_2_5 = 15
+GOPRO_PROTUNE_EXPOSURE_POS_3_0 = 16
+GOPRO_PROTUNE_EXPOSURE_POS_3_5 = 17
+GOPRO_PROTUNE_EXPOSURE_POS_4_0 = 18
+GOPRO_PROTUNE_EXPOSURE_POS_4_5 = 19
+GOPRO_PROTUNE_EXPOSURE_POS_5_0 = 20
+GOPRO_PROTUNE_EXPOSURE_ENUM_END = 21
+
+# GOPRO_CHARGING
+GOPRO_CHARGING_DISABLED = 0
+GOPRO_CHARGING_ENABLED = 1
+GOPRO_CHARGING_ENUM_END = 2
+
+# GOPRO_MODEL
+GOPRO_MODEL_UNKNOWN = 0
+GOPRO_MODEL_HERO_3_PLUS_SILVER = 1
+GOPRO_MODEL_HERO_3_PLUS_BLACK = 2
+GOPRO_MODEL_HERO_4_SILVER = 3
+GOPRO_MODEL_HERO_4_BLACK = 4
+GOPRO_MODEL_ENUM_END = 5
+
+# GOPRO_BURST_RATE
+GOPRO_BURST_RATE_3_IN_1_SECOND = 0
+GOPRO_BURST_RATE_5_IN_1_SECOND = 1
+GOPRO_BURST_RATE_10_IN_1_SECOND = 2
+GOPRO_BURST_RATE_10_IN_2_SECOND = 3
+GOPRO_BURST_RATE_10_IN_3_SECOND = 4
+GOPRO_BURST_RATE_30_IN_1_SECOND = 5
+GOPRO_BURST_RATE_30_IN_2_SECOND = 6
+GOPRO_BURST_RATE_30_IN_3_SECOND = 7
+GOPRO_BURST_RATE_30_IN_6_SECOND = 8
+GOPRO_BURST_RATE_ENUM_END = 9
+
+# MAV_CMD_DO_AUX_FUNCTION_SWITCH_LEVEL
+MAV_CMD_DO_AUX_FUNCTION_SWITCH_LEVEL_LOW = 0
+MAV_CMD_DO_AUX_FUNCTION_SWITCH_LEVEL_MIDDLE = 1
+MAV_CMD_DO_AUX_FUNCTION_SWITCH_LEVEL_HIGH = 2
+MAV_CMD_DO_AUX_FUNCTION_SWITCH_LEVEL_ENUM_END = 3
+
+# LED_CONTROL_PATTERN
+LED_CONTROL_PATTERN_OFF = 0
+LED_CONTROL_PATTERN_FIRMWAREUPDATE = 1
+LED_CONTROL_PATTERN_CUSTOM = 255
+LED_CONTROL_PATTERN_ENUM_END = 256
+
+# EKF_STATUS_FLAGS
+enums["EKF_STATUS_FLAGS"] = Enum()
+enums["EKF_STATUS_FLAGS"].bitmask = True
+EKF_ATTITUDE = 1
+enums["EKF_STATUS_FLAGS"][1] = EnumEntry("EKF_ATTITUDE", """""")
+EKF_VELOCITY_HORIZ = 2
+enums["EKF_STATUS_FLAGS"][2] = EnumEntry("EKF_VELOCITY_HORIZ", """""")
+EKF_VELOCITY_VERT = 4
+enums["EKF_STATUS_FLAGS"][4] = EnumEntry("EKF_VELOCITY_VERT", """""")
+EKF_POS_HORIZ_REL = 8
+enums["EKF_STATUS_FLAGS"][8] = EnumEntry("EKF_POS_HORIZ_REL", """""")
+EKF_POS_HORIZ_ABS = 16
+enums["EKF_STATUS_FLAGS"][16] = EnumEntry("EKF_POS_HORIZ_ABS", """""")
+EKF_POS_VERT_ABS = 32
+enums["EKF_STATUS_FLAGS"][32] = EnumEntry("EKF_POS_VERT_ABS", """""")
+EKF_POS_VERT_AGL = 64
+enums["EKF_STATUS_FLAGS"][64] = EnumEntry("EKF_POS_VERT_AGL", """""")
+EKF_CONST_POS_MODE = 128
+enums["EKF_STATUS_FLAGS"][128] = EnumEntry("EKF_CONST_POS_MODE", """""")
+EKF_PRED_POS_HORIZ_REL = 256
+enums["EKF_STATUS_FLAGS"][256] = EnumEntry("EKF_PRED_POS_HORIZ_REL", """""")
+EKF_PRED_POS_HORIZ_ABS = 512
+enums["EKF_STATUS_FLAGS"][512] = EnumEntry("EKF_PRED_POS_HORIZ_ABS", """""")
+EKF_UNINITIALIZED = 1024
+enums["EKF_STATUS_FLAGS"][1024] = EnumEntry("EKF_UNINITIALIZED", """""")
+EKF_GPS_GLITCHING = 32768
+enums["EKF_STATUS_FLAGS"][32768] = EnumEntry("EKF_GPS_GLITCHING", """""")
+EKF_STATUS_FLAGS_ENUM_END = 32769
+enums["EKF_STATUS_FLAGS"][32769] = EnumEntry("EKF_STATUS_FLAGS_ENUM_END", """""")
+
+# PID_TUNING_AXIS
+PID_TUNING_ROLL = 1
+PID_TUNING_PITCH = 2
+PID_TUNING_YAW = 3
+PID_TUNING_ACCZ = 4
+PID_TUNING_STEER = 5
+PID_TUNING_LANDING = 6
+PID_TUNING_WHEEL_LEFT = 7
+PID_TUNING_WHEEL_RIGHT = 8
+PID_TUNING_SAIL_HEEL = 9
+PID_TUNING_VEL_NORTH = 10
+PID_TUNING_VEL_EAST = 11
+PID_TUNING_VEL_DOWN = 12
+PID_TUNING_POS_NORTH = 13
+PID_TUNING_POS_EAST = 14
+PID_TUNING_POS_DOWN = 15
+PID_TUNING_YAW_ANGLE = 16
+PID_TUNING_AXIS_ENUM_END = 17
+
+# MAV_REMOTE_LOG_DATA_BLOCK_COMMANDS
+MAV_REMOTE_LOG_DATA_BLOCK_STOP = 2147483645
+MAV_REMOTE_LOG_DATA_BLOCK_START = 2147483646
+MAV_REMOTE_LOG_DATA_BLOCK_COMMANDS_ENUM_END = 2147483647
+
+# MAV_REMOTE_LOG_DATA_BLOCK_STATUSES
+MAV_REMOTE_LOG_DATA_BLOCK_NACK = 0
+MAV_REMOTE_LOG_DATA_BLOCK_ACK = 1
+MAV_REMOTE_LOG_DATA_BLOCK_STATUSES_ENUM_END = 2
+
+# DEVICE_OP_BUSTYPE
+DEVICE_OP_BUSTYPE_I2C = 0
+DEVICE_OP_BUSTYPE_SPI = 1
+DEVICE_OP_BUSTYPE_ENUM_END = 2
+
+# DEEPSTALL_STAGE
+DEEPSTALL_STAGE_FLY_TO_LANDING = 0
+DEEPSTALL_STAGE_ESTIMATE_WIND = 1
+DEEPSTALL_STAGE_WAIT_FOR_BREAKOUT = 2
+DEEPSTALL_STAGE_FLY_TO_ARC = 3
+DEEPSTALL_STAGE_ARC = 4
+DEEPSTALL_STAGE_APPROACH = 5
+DEEPSTALL_STAGE_LAND = 6
+DEEPSTALL_STAGE_ENUM_END = 7
+
+# PLANE_MODE
+PLANE_MODE_MANUAL = 0
+PLANE_MODE_CIRCLE = 1
+PLANE_MODE_STABILIZE = 2
+PLANE_MODE_TRAINING = 3
+PLANE_MODE_ACRO = 4
+PLANE_MODE_FLY_BY_WIRE_A = 5
+PLANE_MODE_FLY_BY_WIRE_B = 6
+PLANE_MODE_CRUISE = 7
+PLANE_MODE_AUTOTUNE = 8
+PLANE_MODE_AUTO = 10
+PLANE_MODE_RTL = 11
+PLANE_MODE_LOITER = 12
+PLANE_MODE_TAKEOFF = 13
+PLANE_MODE_AVOID_ADSB = 14
+PLANE_MODE_GUIDED = 15
+PLANE_MODE_INITIALIZING = 16
+PLANE_MODE_QSTABILIZE = 17
+PLANE_MODE_QHOVER = 18
+PLANE_MODE_QLOITER = 19
+PLANE_MODE_QLAND = 20
+PLANE_MODE_QRTL = 21
+PLANE_MODE_QAUTOTUNE = 22
+PLANE_MODE_QACRO = 23
+PLANE_MODE_THERMAL = 24
+PLANE_MODE_LOITER_ALT_QLAND = 25
+PLANE_MODE_AUTOLAND = 26
+PLANE_MODE_ENUM_END = 27
+
+# COPTER_MODE
+COPTER_MODE_STABILIZE = 0
+COPTER_MODE_ACRO = 1
+COPTER_MODE_ALT_HOLD = 2
+COPTER_MODE_AUTO = 3
+COPTER_MODE_GUIDED = 4
+COPTER_MODE_LOITER = 5
+COPTER_MODE_RTL = 6
+COPTER_MODE_CIRCLE = 7
+COPTER_MODE_LAND = 9
+COPTER_MODE_DRIFT = 11
+COPTER_MODE_SPORT = 13
+COPTER_MODE_FLIP = 14
+COPTER_MODE_AUTOTUNE = 15
+COPTER_MODE_POSHOLD = 16
+COPTER_MODE_BRAKE = 17
+COPTER_MODE_THROW = 18
+COPTER_MODE_AVOID_ADSB = 19
+COPTER_MODE_GUIDED_NOGPS = 20
+COPTER_MODE_SMART_RTL = 21
+COPTER_MODE_FLOWHOLD = 22
+COPTER_MODE_FOLLOW = 23
+COPTER_MODE_ZIGZAG = 24
+COPTER_MODE_SYSTEMID = 25
+COPTER_MODE_AUTOROTATE = 26
+COPTER_MODE_AUTO_RTL = 27
+COPTER_MODE_TURTLE = 28
+COPTER_MODE_ENUM_END = 29
+
+# SUB_MODE
+SUB_MODE_STABILIZE = 0
+SUB_MODE_ACRO = 1
+SUB_MODE_ALT_HOLD = 2
+SUB_MODE_AUTO = 3
+SUB_MODE_GUIDED = 4
+SUB_MODE_CIRCLE = 7
+SUB_MODE_SURFACE = 9
+SUB_MODE_POSHOLD = 16
+SUB_MODE_MANUAL = 19
+SUB_MODE_MOTORDETECT = 20
+SUB_MODE_SURFTRAK = 21
+SUB_MODE_ENUM_END = 22
+
+# ROVER_MODE
+ROVER_MODE_MANUAL = 0
+ROVER_MODE_ACRO = 1
+ROVER_MODE_STEERING = 3
+ROVER_MODE_HOLD = 4
+ROVER_MODE_LOITER = 5
+ROVER_MODE_FOLLOW = 6
+ROVER_MODE_SIMPLE = 7
+ROVER_MODE_DOCK = 8
+ROVER_MODE_CIRCLE = 9
+ROVER_MODE_AUTO = 10
+ROVER_MODE_RTL = 11
+ROVER_MODE_SMART_RTL = 12
+ROVER_MODE_GUIDED = 15
+ROVER_MODE_INITIALIZING = 16
+ROVER_MODE_ENUM_END = 17
+
+# TRACKER_MODE
+TRACKER_MODE_MANUAL = 0
+TRACKER_MODE_STOP = 1
+TRACKER_MODE_SCAN = 2
+TRACKER_MODE_SERVO_TEST = 3
+TRACKER_MODE_GUIDED = 4
+TRACKER_MODE_AUTO = 10
+TRACKER_MODE_INITIALIZING = 16
+TRACKER_MODE_ENUM_END = 17
+
+# OSD_PARAM_CONFIG_TYPE
+OSD_PARAM_NONE = 0
+OSD_PARAM_SERIAL_PROTOCOL = 1
+OSD_PARAM_SERVO_FUNCTION = 2
+OSD_PARAM_AUX_FUNCTION = 3
+OSD_PARAM_FLIGHT_MODE = 4
+OSD_PARAM_FAILSAFE_ACTION = 5
+OSD_PARAM_FAILSAFE_ACTION_1 = 6
+OSD_PARAM_FAILSAFE_ACTION_2 = 7
+OSD_PARAM_NUM_TYPES = 8
+OSD_PARAM_CONFIG_TYPE_ENUM_END = 9
+
+# OSD_PARAM_CONFIG_ERROR
+OSD_PARAM_SUCCESS = 0
+OSD_PARAM_INVALID_SCREEN = 1
+OSD_PARAM_INVALID_PARAMETER_INDEX = 2
+OSD_PARAM_INVALID_PARAMETER = 3
+OSD_PARAM_CONFIG_ERROR_ENUM_END = 4
+
+# GSM_LINK_TYPE
+GSM_LINK_TYPE_NONE = 0
+GSM_LINK_TYPE_UNKNOWN = 1
+GSM_LINK_TYPE_2G = 2
+GSM_LINK_TYPE_3G = 3
+GSM_LINK_TYPE_4G = 4
+GSM_LINK_TYPE_ENUM_END = 5
+
+# GSM_MODEM_TYPE
+GSM_MODEM_TYPE_UNKNOWN = 0
+GSM_MODEM_TYPE_HUAWEI_E3372 = 1
+GSM_MODEM_TYPE_ENUM_END = 2
+
+# HL_FAILURE_FLAG
+HL_FAILURE_FLAG_GPS = 1
+HL_FAILURE_FLAG_DIFFERENTIAL_PRESSURE = 2
+HL_FAILURE_FLAG_ABSOLUTE_PRESSURE = 4
+HL_FAILURE_FLAG_3D_ACCEL = 8
+HL_FAILURE_FLAG_3D_GYRO = 16
+HL_FAILURE_FLAG_3D_MAG = 32
+HL_FAILURE_FLAG_TERRAIN = 64
+HL_FAILURE_FLAG_BATTERY = 128
+HL_FAILURE_FLAG_RC_RECEIVER = 256
+HL_FAILURE_FLAG_OFFBOARD_LINK = 512
+HL_FAILURE_FLAG_ENGINE = 1024
+HL_FAILURE_FLAG_GEOFENCE = 2048
+HL_FAILURE_FLAG_ESTIMATOR = 4096
+HL_FAILURE_FLAG_MISSION = 8192
+HL_FAILURE_FLAG_ENUM_END = 8193
+
+# MAV_GOTO
+MAV_GOTO_DO_HOLD = 0
+MAV_GOTO_DO_CONTINUE = 1
+MAV_GOTO_HOLD_AT_CURRENT_POSITION = 2
+MAV_GOTO_HOLD_AT_SPECIFIED_POSITION = 3
+MAV_GOTO_ENUM_END = 4
+
+# MAV_MODE
+enums["MAV_MODE"] = Enum()
+enums["MAV_MODE"].bitmask = False
+MAV_MODE_PREFLIGHT = 0
+enums["MAV_MODE"][0] = EnumEntry("MAV_MODE_PREFLIGHT", """""")
+MAV_MODE_MANUAL_DISARMED = 64
+enums["MAV_MODE"][64] = EnumEntry("MAV_MODE_MANUAL_DISARMED", """""")
+MAV_MODE_TEST_DISARMED = 66
+enums["MAV_MODE"][66] = EnumEntry("MAV_MODE_TEST_DISARMED", """""")
+MAV_MODE_STABILIZE_DISARMED = 80
+enums["MAV_MODE"][80] = EnumEntry("MAV_MODE_STABILIZE_DISARMED", """""")
+MAV_MODE_GUIDED_DISARMED = 88
+enums["MAV_MODE"][88] = EnumEntry("MAV_MODE_GUIDED_DISARMED", """""")
+MAV_MODE_AUTO_DISARMED = 92
+enums["MAV_MODE"][92] = EnumEntry("MAV_MODE_AUTO_DISARMED", """""")
+MAV_MODE_MANUAL_ARMED = 192
+enums["MAV_MODE"][192] = EnumEntry("MAV_MODE_MANUAL_ARMED", """""")
+MAV_MODE_TEST_ARMED = 194
+enums["MAV_MODE"][194] = EnumEntry("MAV_MODE_TEST_ARMED", """""")
+MAV_MODE_STABILIZE_ARMED = 208
+enums["MAV_MODE"][208] = EnumEntry("MAV_MODE_STABILIZE_ARMED", """""")
+MAV_MODE_GUIDED_ARMED = 216
+enums["MAV_MODE"][216] = EnumEntry("MAV_MODE_GUIDED_ARMED", """""")
+MAV_MODE_AUTO_ARMED = 220
+enums["MAV_MODE"][220] = EnumEntry("MAV_MODE_AUTO_ARMED", """""")
+MAV_MODE_ENUM_END = 221
+enums["MAV_MODE"][221] = EnumEntry("MAV_MODE_ENUM_END", """""")
+
+# MAV_SYS_STATUS_SENSOR
+enums["MAV_SYS_STATUS_SENSOR"] = Enum()
+enums["MAV_SYS_STATUS_SENSOR"].bitmask = True
+MAV_SYS_STATUS_SENSOR_3D_GYRO = 1
+enums["MAV_SYS_STATUS_SENSOR"][1] = EnumEntry("MAV_SYS_STATUS_SENSOR_3D_GYRO", """""")
+MAV_SYS_STATUS_SENSOR_3D_ACCEL = 2
+enums["MAV_SYS_STATUS_SENSOR"][2] = EnumEntry("MAV_SYS_STATUS_SENSOR_3D_ACCEL", """""")
+MAV_SYS_STATUS_SENSOR_3D_MAG = 4
+enums["MAV_SYS_STATUS_SENSOR"][4] = EnumEntry("MAV_SYS_STATUS_SENSOR_3D_MAG", """""")
+MAV_SYS_STATUS_SENSOR_ABSOLUTE_PRESSURE = 8
+enums["MAV_SYS_STATUS_SENSOR"][8] = EnumEntry("MAV_SYS_STATUS_SENSOR_ABSOLUTE_PRESSURE", """""")
+MAV_SYS_STATUS_SENSOR_DIFFERENTIAL_PRESSURE = 16
+enums["MAV_SYS_STATUS_SENSOR"][16] = EnumEntry("MAV_SYS_STATUS_SENSOR_DIFFERENTIAL_PRESSURE", """""")
+MAV_SYS_STATUS_SENSOR_GPS = 32
+enums["MAV_SYS_STATUS_SENSOR"][32] = EnumEntry("MAV_SYS_STATUS_SENSOR_GPS", """""")
+MAV_SYS_STATUS_SENSOR_OPTICAL_FLOW = 64
+enums["MAV_SYS_STATUS_SENSOR"][64] = EnumEntry("MAV_SYS_STATUS_SENSOR_OPTICAL_FLOW", """""")
+MAV_SYS_STATUS_SENSOR_VISION_POSITION = 128
+enums["MAV_SYS_STATUS_SENSOR"][128] = EnumEntry("MAV_SYS_STATUS_SENSOR_VISION_POSITION", """""")
+MAV_SYS_STATUS_SENSOR_LASER_POSITION = 256
+enums["MAV_SYS_STATUS_SENSOR"][256] = EnumEntry("MAV_SYS_STATUS_SENSOR_LASER_POSITION", """""")
+MAV_SYS_STATUS_SENSOR_EXTERNAL_GROUND_TRUTH = 512
+enums["MAV_SYS_STATUS_SENSOR"][512] = EnumEntry("MAV_SYS_STATUS_SENSOR_EXTERNAL_GROUND_TRUTH", """""")
+MAV_SYS_STATUS_SENSOR_ANGULAR_RATE_CONTROL = 1024
+enums["MAV_SYS_STATUS_SENSOR"][1024] = EnumEntry("MAV_SYS_STATUS_SENSOR_ANGULAR_RATE_CONTROL", """""")
+MAV_SYS_STATUS_SENSOR_ATTITUDE_STABILIZATION = 2048
+enums["MAV_SYS_STATUS_SENSOR"][2048] = EnumEntry("MAV_SYS_STATUS_SENSOR_ATTITUDE_STABILIZATION", """""")
+MAV_SYS_STATUS_SENSOR_YAW_POSITION = 4096
+enums["MAV_SYS_STATUS_SENSOR"][4096] = EnumEntry("MAV_SYS_STATUS_SENSOR_YAW_POSITION", """""")
+MAV_SYS_STATUS_SENSOR_Z_ALTITUDE_CONTROL = 8192
+enums["MAV_SYS_STATUS_SENSOR"][8192] = EnumEntry("MAV_SYS_STATUS_SENSOR_Z_ALTITUDE_CONTROL", """""")
+MAV_SYS_STATUS_SENSOR_XY_POSITION_CONTROL = 16384
+enums["MAV_SYS_STATUS_SENSOR"][16384] = EnumEntry("MAV_SYS_STATUS_SENSOR_XY_POSITION_CONTROL", """""")
+MAV_SYS_STATUS_SENSOR_MOTOR_OUTPUTS = 32768
+enums["MAV_SYS_STATUS_SENSOR"][32768] = EnumEntry("MAV_SYS_STATUS_SENSOR_MOTOR_OUTPUTS", """""")
+MAV_SYS_STATUS_SENSOR_RC_RECEIVER = 65536
+enums["MAV_SYS_STATUS_SENSOR"][65536] = EnumEntry("MAV_SYS_STATUS_SENSOR_RC_RECEIVER", """""")
+MAV_SYS_STATUS_SENSOR_3D_GYRO2 = 131072
+enums["MAV_SYS_STATUS_SENSOR"][131072] = EnumEntry("MAV_SYS_STATUS_SENSOR_3D_GYRO2", """""")
+MAV_SYS_STATUS_SENSOR_3D_ACCEL2 = 262144
+enums["MAV_SYS_STATUS_SENSOR"][262144] = EnumEntry("MAV_SYS_STATUS_SENSOR_3D_ACCEL2", """""")
+MAV_SYS_STATUS_SENSOR_3D_MAG2 = 524288
+enums["MAV_SYS_STATUS_SENSOR"][524288] = EnumEntry("MAV_SYS_STATUS_SENSOR_3D_MAG2", """""")
+MAV_SYS_STATUS_GEOFENCE = 1048576
+enums["MAV_SYS_STATUS_SENSOR"][1048576] = EnumEntry("MAV_SYS_STATUS_GEOFENCE", """""")
+MAV_SYS_STATUS_AHRS = 2097152
+enums["MAV_SYS_STATUS_SENSOR"][2097152] = EnumEntry("MAV_SYS_STATUS_AHRS", """""")
+MAV_SYS_STATUS_TERRAIN = 4194304
+enums["MAV_SYS_STATUS_SENSOR"][4194304] = EnumEntry("MAV_SYS_STATUS_TERRAIN", """""")
+MAV_SYS_STATUS_REVERSE_MOTOR = 8388608
+enums["MAV_SYS_STATUS_SENSOR"][8388608] = EnumEntry("MAV_SYS_STATUS_REVERSE_MOTOR", """""")
+MAV_SYS_STATUS_LOGGING = 16777216
+enums["MAV_SYS_STATUS_SENSOR"][16777216] = EnumEntry("MAV_SYS_STATUS_LOGGING", """""")
+MAV_SYS_STATUS_SENSOR_BATTERY = 33554432
+enums["MAV_SYS_STATUS_SENSOR"][33554432] = EnumEntry("MAV_SYS_STATUS_SENSOR_BATTERY", """""")
+MAV_SYS_STATUS_SENSOR_PROXIMITY = 67108864
+enums["MAV_SYS_STATUS_SENSOR"][67108864] = EnumEntry("MAV_SYS_STATUS_SENSOR_PROXIMITY", """""")
+MAV_SYS_STATUS_SENSOR_SATCOM = 134217728
+enums["MAV_SYS_STATUS_SENSOR"][134217728] = EnumEntry("MAV_SYS_STATUS_SENSOR_SATCOM", """""")
+MAV_SYS_STATUS_PREARM_CHECK = 268435456
+enums["MAV_SYS_STATUS_SENSOR"][268435456] = EnumEntry("MAV_SYS_STATUS_PREARM_CHECK", """""")
+MAV_SYS_STATUS_OBSTACLE_AVOIDANCE = 536870912
+enums["MAV_SYS_STATUS_SENSOR"][536870912] = EnumEntry("MAV_SYS_STATUS_OBSTACLE_AVOIDANCE", """""")
+MAV_SYS_STATUS_SENSOR_PROPULSION = 1073741824
+enums["MAV_SYS_STATUS_SENSOR"][1073741824] = EnumEntry("MAV_SYS_STATUS_SENSOR_PROPULSION", """""")
+MAV_SYS_STATUS_EXTENSION_USED = 2147483648
+enums["MAV_SYS_STATUS_SENSOR"][2147483648] = EnumEntry("MAV_SYS_STATUS_EXTENSION_USED", """""")
+MAV_SYS_STATUS_SENSOR_ENUM_END = 2147483649
+enums["MAV_SYS_STATUS_SENSOR"][2147483649] = EnumEntry("MAV_SYS_STATUS_SENSOR_ENUM_END", """""")
+
+# MAV_SYS_STATUS_SENSOR_EXTENDED
+MAV_SYS_STATUS_RECOVERY_SYSTEM = 1
+MAV_SYS_STATUS_SENSOR_LEAK = 2
+MAV_SYS_STATUS_SENSOR_EXTENDED_ENUM_END = 3
+
+# MAV_FRAME
+enums["MAV_FRAME"] = Enum()
+enums["MAV_FRAME"].bitmask = False
+MAV_FRAME_GLOBAL = 0
+enums["MAV_FRAME"][0] = EnumEntry("MAV_FRAME_GLOBAL", """""")
+MAV_FRAME_LOCAL_NED = 1
+enums["MAV_FRAME"][1] = EnumEntry("MAV_FRAME_LOCAL_NED", """""")
+MAV_FRAME_MISSION = 2
+enums["MAV_FRAME"][2] = EnumEntry("MAV_FRAME_MISSION", """""")
+MAV_FRAME_GLOBAL_RELATIVE_ALT = 3
+enums["MAV_FRAME"][3] = EnumEntry("MAV_FRAME_GLOBAL_RELATIVE_ALT", """""")
+MAV_FRAME_LOCAL_ENU = 4
+enums["MAV_FRAME"][4] = EnumEntry("MAV_FRAME_LOCAL_ENU", """""")
+MAV_FRAME_GLOBAL_INT = 5
+enums["MAV_FRAME"][5] = EnumEntry("MAV_FRAME_GLOBAL_INT", """""")
+MAV_FRAME_GLOBAL_RELATIVE_ALT_INT = 6
+enums["MAV_FRAME"][6] = EnumEntry("MAV_FRAME_GLOBAL_RELATIVE_ALT_INT", """""")
+MAV_FRAME_LOCAL_OFFSET_NED = 7
+enums["MAV_FRAME"][7] = EnumEntry("MAV_FRAME_LOCAL_OFFSET_NED", """""")
+MAV_FRAME_BODY_NED = 8
+enums["MAV_FRAME"][8] = EnumEntry("MAV_FRAME_BODY_NED", """""")
+MAV_FRAME_BODY_OFFSET_NED = 9
+enums["MAV_FRAME"][9] = EnumEntry("MAV_FRAME_BODY_OFFSET_NED", """""")
+MAV_FRAME_GLOBAL_TERRAIN_ALT = 10
+enums["MAV_FRAME"][10] = EnumEntry("MAV_FRAME_GLOBAL_TERRAIN_ALT", """""")
+MAV_FRAME_GLOBAL_TERRAIN_ALT_INT = 11
+enums["MAV_FRAME"][11] = EnumEntry("MAV_FRAME_GLOBAL_TERRAIN_ALT_INT", """""")
+MAV_FRAME_BODY_FRD = 12
+enums["MAV_FRAME"][12] = EnumEntry("MAV_FRAME_BODY_FRD", """""")
+MAV_FRAME_RESERVED_13 = 13
+enums["MAV_FRAME"][13] = EnumEntry("MAV_FRAME_RESERVED_13", """""")
+MAV_FRAME_RESERVED_14 = 14
+enums["MAV_FRAME"][14] = EnumEntry("MAV_FRAME_RESERVED_14", """""")
+MAV_FRAME_RESERVED_15 = 15
+enums["MAV_FRAME"][15] = EnumEntry("MAV_FRAME_RESERVED_15", """""")
+MAV_FRAME_RESERVED_16 = 16
+enums["MAV_FRAME"][16] = EnumEntry("MAV_FRAME_RESERVED_16", """""")
+MAV_FRAME_RESERVED_17 = 17
+enums["MAV_FRAME"][17] = EnumEntry("MAV_FRAME_RESERVED_17", """""")
+MAV_FRAME_RESERVED_18 = 18
+enums["MAV_FRAME"][18] = EnumEntry("MAV_FRAME_RESERVED_18", """""")
+MAV_FRAME_RESERVED_19 = 19
+enums["MAV_FRAME"][19] = EnumEntry("MAV_FRAME_RESERVED_19", """""")
+MAV_FRAME_LOCAL_FRD = 20
+enums["MAV_FRAME"][20] = EnumEntry("MAV_FRAME_LOCAL_FRD", """""")
+MAV_FRAME_LOCAL_FLU = 21
+enums["MAV_FRAME"][21] = EnumEntry("MAV_FRAME_LOCAL_FLU", """""")
+MAV_FRAME_ENUM_END = 22
+enums["MAV_FRAME"][22] = EnumEntry("MAV_FRAME_ENUM_END", """""")
+
+# MAVLINK_DATA_STREAM_TYPE
+MAVLINK_DATA_STREAM_IMG_JPEG = 0
+MAVLINK_DATA_STREAM_IMG_BMP = 1
+MAVLINK_DATA_STREAM_IMG_RAW8U = 2
+MAVLINK_DATA_STREAM_IMG_RAW32U = 3
+MAVLINK_DATA_STREAM_IMG_PGM = 4
+MAVLINK_DATA_STREAM_IMG_PNG = 5
+MAVLINK_DATA_STREAM_TYPE_ENUM_END = 6
+
+# FENCE_BREACH
+FENCE_BREACH_NONE = 0
+FENCE_BREACH_MINALT = 1
+FENCE_BREACH_MAXALT = 2
+FENCE_BREACH_BOUNDARY = 3
+FENCE_BREACH_ENUM_END = 4
+
+# FENCE_MITIGATE
+FENCE_MITIGATE_UNKNOWN = 0
+FENCE_MITIGATE_NONE = 1
+FENCE_MITIGATE_VEL_LIMIT = 2
+FENCE_MITIGATE_ENUM_END = 3
+
+# FENCE_TYPE
+FENCE_TYPE_ALT_MAX = 1
+FENCE_TYPE_CIRCLE = 2
+FENCE_TYPE_POLYGON = 4
+FENCE_TYPE_ALT_MIN = 8
+FENCE_TYPE_ENUM_END = 9
+
+# MAV_MOUNT_MODE
+MAV_MOUNT_MODE_RETRACT = 0
+MAV_MOUNT_MODE_NEUTRAL = 1
+MAV_MOUNT_MODE_MAVLINK_TARGETING = 2
+MAV_MOUNT_MODE_RC_TARGETING = 3
+MAV_MOUNT_MODE_GPS_POINT = 4
+MAV_MOUNT_MODE_SYSID_TARGET = 5
+MAV_MOUNT_MODE_HOME_LOCATION = 6
+MAV_MOUNT_MODE_WPNEXT_OFFSET = 7
+MAV_MOUNT_MODE_ENUM_END = 8
+
+# GIMBAL_DEVICE_CAP_FLAGS
+GIMBAL_DEVICE_CAP_FLAGS_HAS_RETRACT = 1
+GIMBAL_DEVICE_CAP_FLAGS_HAS_NEUTRAL = 2
+GIMBAL_DEVICE_CAP_FLAGS_HAS_ROLL_AXIS = 4
+GIMBAL_DEVICE_CAP_FLAGS_HAS_ROLL_FOLLOW = 8
+GIMBAL_DEVICE_CAP_FLAGS_HAS_ROLL_LOCK = 16
+GIMBAL_DEVICE_CAP_FLAGS_HAS_PITCH_AXIS = 32
+GIMBAL_DEVICE_CAP_FLAGS_HAS_PITCH_FOLLOW = 64
+GIMBAL_DEVICE_CAP_FLAGS_HAS_PITCH_LOCK = 128
+GIMBAL_DEVICE_CAP_FLAGS_HAS_YAW_AXIS = 256
+GIMBAL_DEVICE_CAP_FLAGS_HAS_YAW_FOLLOW = 512
+GIMBAL_DEVICE_CAP_FLAGS_HAS_YAW_LOCK = 1024
+GIMBAL_DEVICE_CAP_FLAGS_SUPPORTS_INFINITE_YAW = 2048
+GIMBAL_DEVICE_CAP_FLAGS_SUPPORTS_YAW_IN_EARTH_FRAME = 4096
+GIMBAL_DEVICE_CAP_FLAGS_HAS_RC_INPUTS = 8192
+GIMBAL_DEVICE_CAP_FLAGS_CAN_POINT_LOCATION_LOCAL = 65536
+GIMBAL_DEVICE_CAP_FLAGS_CAN_POINT_LOCATION_GLOBAL = 131072
+GIMBAL_DEVICE_CAP_FLAGS_ENUM_END = 131073
+
+# GIMBAL_MANAGER_CAP_FLAGS
+GIMBAL_MANAGER_CAP_FLAGS_HAS_RETRACT = 1
+GIMBAL_MANAGER_CAP_FLAGS_HAS_NEUTRAL = 2
+GIMBAL_MANAGER_CAP_FLAGS_HAS_ROLL_AXIS = 4
+GIMBAL_MANAGER_CAP_FLAGS_HAS_ROLL_FOLLOW = 8
+GIMBAL_MANAGER_CAP_FLAGS_HAS_ROLL_LOCK = 16
+GIMBAL_MANAGER_CAP_FLAGS_HAS_PITCH_AXIS = 32
+GIMBAL_MANAGER_CAP_FLAGS_HAS_PITCH_FOLLOW = 64
+GIMBAL_MANAGER_CAP_FLAGS_HAS_PITCH_LOCK = 128
+GIMBAL_MANAGER_CAP_FLAGS_HAS_YAW_AXIS = 256
+GIMBAL_MANAGER_CAP_FLAGS_HAS_YAW_FOLLOW = 512
+GIMBAL_MANAGER_CAP_FLAGS_HAS_YAW_LOCK = 1024
+GIMBAL_MANAGER_CAP_FLAGS_SUPPORTS_INFINITE_YAW = 2048
+GIMBAL_MANAGER_CAP_FLAGS_SUPPORTS_YAW_IN_EARTH_FRAME = 4096
+GIMBAL_MANAGER_CAP_FLAGS_HAS_RC_INPUTS = 8192
+GIMBAL_MANAGER_CAP_FLAGS_CAN_POINT_LOCATION_LOCAL = 65536
+GIMBAL_MANAGER_CAP_FLAGS_CAN_POINT_LOCATION_GLOBAL = 131072
+GIMBAL_MANAGER_CAP_FLAGS_ENUM_END = 131073
+
+# GIMBAL_DEVICE_FLAGS
+GIMBAL_DEVICE_FLAGS_RETRACT = 1
+GIMBAL_DEVICE_FLAGS_NEUTRAL = 2
+GIMBAL_DEVICE_FLAGS_ROLL_LOCK = 4
+GIMBAL_DEVICE_FLAGS_PITCH_LOCK = 8
+GIMBAL_DEVICE_FLAGS_YAW_LOCK = 16
+GIMBAL_DEVICE_FLAGS_YAW_IN_VEHICLE_FRAME = 32
+GIMBAL_DEVICE_FLAGS_YAW_IN_EARTH_FRAME = 64
+GIMBAL_DEVICE_FLAGS_ACCEPTS_YAW_IN_EARTH_FRAME = 128
+GIMBAL_DEVICE_FLAGS_RC_EXCLUSIVE = 256
+GIMBAL_DEVICE_FLAGS_RC_MIXED = 512
+GIMBAL_DEVICE_FLAGS_ENUM_END = 513
+
+# GIMBAL_MANAGER_FLAGS
+GIMBAL_MANAGER_FLAGS_RETRACT = 1
+GIMBAL_MANAGER_FLAGS_NEUTRAL = 2
+GIMBAL_MANAGER_FLAGS_ROLL_LOCK = 4
+GIMBAL_MANAGER_FLAGS_PITCH_LOCK = 8
+GIMBAL_MANAGER_FLAGS_YAW_LOCK = 16
+GIMBAL_MANAGER_FLAGS_YAW_IN_VEHICLE_FRAME = 32
+GIMBAL_MANAGER_FLAGS_YAW_IN_EARTH_FRAME = 64
+GIMBAL_MANAGER_FLAGS_ACCEPTS_YAW_IN_EARTH_FRAME = 128
+GIMBAL_MANAGER_FLAGS_RC_EXCLUSIVE = 256
+GIMBAL_MANAGER_FLAGS_RC_MIXED = 512
+GIMBAL_MANAGER_FLAGS_ENUM_END = 513
+
+# GIMBAL_DEVICE_ERROR_FLAGS
+GIMBAL_DEVICE_ERROR_FLAGS_AT_ROLL_LIMIT = 1
+GIMBAL_DEVICE_ERROR_FLAGS_AT_PITCH_LIMIT = 2
+GIMBAL_DEVICE_ERROR_FLAGS_AT_YAW_LIMIT = 4
+GIMBAL_DEVICE_ERROR_FLAGS_ENCODER_ERROR = 8
+GIMBAL_DEVICE_ERROR_FLAGS_POWER_ERROR = 16
+GIMBAL_DEVICE_ERROR_FLAGS_MOTOR_ERROR = 32
+GIMBAL_DEVICE_ERROR_FLAGS_SOFTWARE_ERROR = 64
+GIMBAL_DEVICE_ERROR_FLAGS_COMMS_ERROR = 128
+GIMBAL_DEVICE_ERROR_FLAGS_CALIBRATION_RUNNING = 256
+GIMBAL_DEVICE_ERROR_FLAGS_NO_MANAGER = 512
+GIMBAL_DEVICE_ERROR_FLAGS_ENUM_END = 513
+
+# GRIPPER_ACTIONS
+GRIPPER_ACTION_RELEASE = 0
+GRIPPER_ACTION_GRAB = 1
+GRIPPER_ACTION_HOLD = 2
+GRIPPER_ACTIONS_ENUM_END = 3
+
+# WINCH_ACTIONS
+WINCH_RELAXED = 0
+WINCH_RELATIVE_LENGTH_CONTROL = 1
+WINCH_RATE_CONTROL = 2
+WINCH_LOCK = 3
+WINCH_DELIVER = 4
+WINCH_HOLD = 5
+WINCH_RETRACT = 6
+WINCH_LOAD_LINE = 7
+WINCH_ABANDON_LINE = 8
+WINCH_LOAD_PAYLOAD = 9
+WINCH_ACTIONS_ENUM_END = 10
+
+# UAVCAN_NODE_HEALTH
+UAVCAN_NODE_HEALTH_OK = 0
+UAVCAN_NODE_HEALTH_WARNING = 1
+UAVCAN_NODE_HEALTH_ERROR = 2
+UAVCAN_NODE_HEALTH_CRITICAL = 3
+UAVCAN_NODE_HEALTH_ENUM_END = 4
+
+# UAVCAN_NODE_MODE
+UAVCAN_NODE_MODE_OPERATIONAL = 0
+UAVCAN_NODE_MODE_INITIALIZATION = 1
+UAVCAN_NODE_MODE_MAINTENANCE = 2
+UAVCAN_NODE_MODE_SOFTWARE_UPDATE = 3
+UAVCAN_NODE_MODE_OFFLINE = 7
+UAVCAN_NODE_MODE_ENUM_END = 8
+
+# STORAGE_STATUS
+STORAGE_STATUS_EMPTY = 0
+STORAGE_STATUS_UNFORMATTED = 1
+STORAGE_STATUS_READY = 2
+STORAGE_STATUS_NOT_SUPPORTED = 3
+STORAGE_STATUS_ENUM_END = 4
+
+# STORAGE_TYPE
+STORAGE_TYPE_UNKNOWN = 0
+STORAGE_TYPE_USB_STICK = 1
+STORAGE_TYPE_SD = 2
+STORAGE_TYPE_MICROSD = 3
+STORAGE_TYPE_CF = 4
+STORAGE_TYPE_CFE = 5
+STORAGE_TYPE_XQD = 6
+STORAGE_TYPE_HD = 7
+STORAGE_TYPE_OTHER = 254
+STORAGE_TYPE_ENUM_END = 255
+
+# STORAGE_USAGE_FLAG
+STORAGE_USAGE_FLAG_SET = 1
+STORAGE_USAGE_FLAG_PHOTO = 2
+STORAGE_USAGE_FLAG_VIDEO = 4
+STORAGE_USAGE_FLAG_LOGS = 8
+STORAGE_USAGE_FLAG_ENUM_END = 9
+
+# ORBIT_YAW_BEHAVIOUR
+ORBIT_YAW_BEHAVIOUR_HOLD_FRONT_TO_CIRCLE_CENTER = 0
+ORBIT_YAW_BEHAVIOUR_HOLD_INITIAL_HEADING = 1
+ORBIT_YAW_BEHAVIOUR_UNCONTROLLED = 2
+ORBIT_YAW_BEHAVIOUR_HOLD_FRONT_TANGENT_TO_CIRCLE = 3
+ORBIT_YAW_BEHAVIOUR_RC_CONTROLLED = 4
+ORBIT_YAW_BEHAVIOUR_UNCHANGED = 5
+ORBIT_YAW_BEHAVIOUR_ENUM_END = 6
+
+# ACTUATOR_CONFIGURATION
+ACTUATOR_CONFIGURATION_NONE = 0
+ACTUATOR_CONFIGURATION_BEEP = 1
+ACTUATOR_CONFIGURATION_3D_MODE_ON = 2
+ACTUATOR_CONFIGURATION_3D_MODE_OFF = 3
+ACTUATOR_CONFIGURATION_SPIN_DIRECTION1 = 4
+ACTUATOR_CONFIGURATION_SPIN_DIRECTION2 = 5
+ACTUATOR_CONFIGURATION_ENUM_END = 6
+
+# ACTUATOR_OUTPUT_FUNCTION
+ACTUATOR_OUTPUT_FUNCTION_NONE = 0
+ACTUATOR_OUTPUT_FUNCTION_MOTOR1 = 1
+ACTUATOR_OUTPUT_FUNCTION_MOTOR2 = 2
+ACTUATOR_OUTPUT_FUNCTION_MOTOR3 = 3
+ACTUATOR_OUTPUT_FUNCTION_MOTOR4 = 4
+ACTUATOR_OUTPUT_FUNCTION_MOTOR5 = 5
+ACTUATOR_OUTPUT_FUNCTION_MOTOR6 = 6
+ACTUATOR_OUTPUT_FUNCTION_MOTOR7 = 7
+ACTUATOR_OUTPUT_FUNCTION_MOTOR8 = 8
+ACTUATOR_OUTPUT_FUNCTION_MOTOR9 = 9
+ACTUATOR_OUTPUT_FUNCTION_MOTOR10 = 10
+ACTUATOR_OUTPUT_FUNCTION_MOTOR11 = 11
+ACTUATOR_OUTPUT_FUNCTION_MOTOR12 = 12
+ACTUATOR_OUTPUT_FUNCTION_MOTOR13 = 13
+ACTUATOR_OUTPUT_FUNCTION_MOTOR14 = 14
+ACTUATOR_OUTPUT_FUNCTION_MOTOR15 = 15
+ACTUATOR_OUTPUT_FUNCTION_MOTOR16 = 16
+ACTUATOR_OUTPUT_FUNCTION_SERVO1 = 33
+ACTUATOR_OUTPUT_FUNCTION_SERVO2 = 34
+ACTUATOR_OUTPUT_FUNCTION_SERVO3 = 35
+ACTUATOR_OUTPUT_FUNCTION_SERVO4 = 36
+ACTUATOR_OUTPUT_FUNCTION_SERVO5 = 37
+ACTUATOR_OUTPUT_FUNCTION_SERVO6 = 38
+ACTUATOR_OUTPUT_FUNCTION_SERVO7 = 39
+ACTUATOR_OUTPUT_FUNCTION_SERVO8 = 40
+ACTUATOR_OUTPUT_FUNCTION_SERVO9 = 41
+ACTUATOR_OUTPUT_FUNCTION_SERVO10 = 42
+ACTUATOR_OUTPUT_FUNCTION_SERVO11 = 43
+ACTUATOR_OUTPUT_FUNCTION_SERVO12 = 44
+ACTUATOR_OUTPUT_FUNCTION_SERVO13 = 45
+ACTUATOR_OUTPUT_FUNCTION_SERVO14 = 46
+ACTUATOR_OUTPUT_FUNCTION_SERVO15 = 47
+ACTUATOR_OUTPUT_FUNCTION_SERVO16 = 48
+ACTUATOR_OUTPUT_FUNCTION_ENUM_END = 49
+
+# AUTOTUNE_AXIS
+AUTOTUNE_AXIS_ROLL = 1
+AUTOTUNE_AXIS_PITCH = 2
+AUTOTUNE_AXIS_YAW = 4
+AUTOTUNE_AXIS_ENUM_END = 5
+
+# PREFLIGHT_STORAGE_PARAMETER_ACTION
+PARAM_READ_PERSISTENT = 0
+PARAM_WRITE_PERSISTENT = 1
+PARAM_RESET_FACTORY_DEFAULT = 2
+PARAM_RESET_SENSOR_DEFAULT = 3
+PARAM_RESET_ALL_DEFAULT = 4
+PREFLIGHT_STORAGE_PARAMETER_ACTION_ENUM_END = 5
+
+# PREFLIGHT_STORAGE_MISSION_ACTION
+MISSION_READ_PERSISTENT = 0
+MISSION_WRITE_PERSISTENT = 1
+MISSION_RESET_DEFAULT = 2
+PREFLIGHT_STORAGE_MISSION_ACTION_ENUM_END = 3
+
+# REBOOT_SHUTDOWN_ACTION
+REBOOT_SHUTDOWN_ACTION_NONE = 0
+REBOOT_SHUTDOWN_ACTION_REBOOT = 1
+REBOOT_SHUTDOWN_ACTION_SHUTDOWN = 2
+REBOOT_SHUTDOWN_ACTION_REBOOT_TO_BOOTLOADER = 3
+REBOOT_SHUTDOWN_ACTION_POWER_ON = 4
+REBOOT_SHUTDOWN_ACTION_REBOOT_TO_MASS_STORAGE = 5
+REBOOT_SHUTDOWN_ACTION_ENUM_END = 6
+
+# REBOOT_SHUTDOWN_CONDITIONS
+REBOOT_SHUTDOWN_CONDITIONS_SAFETY_INTERLOCKED = 0
+REBOOT_SHUTDOWN_CONDITIONS_FORCE = 20190226
+REBOOT_SHUTDOWN_CONDITIONS_ENUM_END = 20190227
+
+# PREFLIGHT_CALIBRATION_MAGNETOMETER
+PREFLIGHT_CALIBRATION_MAGNETOMETER_NONE = 0
+PREFLIGHT_CALIBRATION_MAGNETOMETER_START = 1
+PREFLIGHT_CALIBRATION_MAGNETOMETER_FORCE_SAVE = 76
+PREFLIGHT_CALIBRATION_MAGNETOMETER_ENUM_END = 77
+
+# PREFLIGHT_CALIBRATION_ACCELEROMETER
+PREFLIGHT_CALIBRATION_ACCELEROMETER_NONE = 0
+PREFLIGHT_CALIBRATION_ACCELEROMETER_FULL = 1
+PREFLIGHT_CALIBRATION_ACCELEROMETER_TRIM = 2
+PREFLIGHT_CALIBRATION_ACCELEROMETER_TEMPERATURE = 3
+PREFLIGHT_CALIBRATION_ACCELEROMETER_SIMPLE = 4
+PREFLIGHT_CALIBRATION_ACCELEROMETER_FORCE_SAVE = 76
+PREFLIGHT_CALIBRATION_ACCELEROMETER_ENUM_END = 77
+
+# NAV_TAKEOFF_FLAGS
+NAV_TAKEOFF_FLAGS_HORIZONTAL_POSITION_NOT_REQUIRED = 1
+NAV_TAKEOFF_FLAGS_ENUM_END = 2
+
+# MAV_DATA_STREAM
+enums["MAV_DATA_STREAM"] = Enum()
+enums["MAV_DATA_STREAM"].bitmask = False
+MAV_DATA_STREAM_ALL = 0
+enums["MAV_DATA_STREAM"][0] = EnumEntry("MAV_DATA_STREAM_ALL", """""")
+MAV_DATA_STREAM_RAW_SENSORS = 1
+enums["MAV_DATA_STREAM"][1] = EnumEntry("MAV_DATA_STREAM_RAW_SENSORS", """""")
+MAV_DATA_STREAM_EXTENDED_STATUS = 2
+enums["MAV_DATA_STREAM"][2] = EnumEntry("MAV_DATA_STREAM_EXTENDED_STATUS", """""")
+MAV_DATA_STREAM_RC_CHANNELS = 3
+enums["MAV_DATA_STREAM"][3] = EnumEntry("MAV_DATA_STREAM_RC_CHANNELS", """""")
+MAV_DATA_STREAM_RAW_CONTROLLER = 4
+enums["MAV_DATA_STREAM"][4] = EnumEntry("MAV_DATA_STREAM_RAW_CONTROLLER", """""")
+MAV_DATA_STREAM_POSITION = 6
+enums["MAV_DATA_STREAM"][6] = EnumEntry("MAV_DATA_STREAM_POSITION", """""")
+MAV_DATA_STREAM_EXTRA1 = 10
+enums["MAV_DATA_STREAM"][10] = EnumEntry("MAV_DATA_STREAM_EXTRA1", """""")
+MAV_DATA_STREAM_EXTRA2 = 11
+enums["MAV_DATA_STREAM"][11] = EnumEntry("MAV_DATA_STREAM_EXTRA2", """""")
+MAV_DATA_STREAM_EXTRA3 = 12
+enums["MAV_DATA_STREAM"][12] = EnumEntry("MAV_DATA_STREAM_EXTRA3", """""")
+MAV_DATA_STREAM_ENUM_END = 13
+enums["MAV_DATA_STREAM"][13] = EnumEntry("MAV_DATA_STREAM_ENUM_END", """""")
+
+# MAV_ROI
+MAV_ROI_NONE = 0
+MAV_ROI_WPNEXT = 1
+MAV_ROI_WPINDEX = 2
+MAV_ROI_LOCATION = 3
+MAV_ROI_TARGET = 4
+MAV_ROI_ENUM_END = 5
+
+# MAV_PARAM_TYPE
+enums["MAV_PARAM_TYPE"] = Enum()
+enums["MAV_PARAM_TYPE"].bitmask = False
+MAV_PARAM_TYPE_UINT8 = 1
+enums["MAV_PARAM_TYPE"][1] = EnumEntry("MAV_PARAM_TYPE_UINT8", """""")
+MAV_PARAM_TYPE_INT8 = 2
+enums["MAV_PARAM_TYPE"][2] = EnumEntry("MAV_PARAM_TYPE_INT8", """""")
+MAV_PARAM_TYPE_UINT16 = 3
+enums["MAV_PARAM_TYPE"][3] = EnumEntry("MAV_PARAM_TYPE_UINT16", """""")
+MAV_PARAM_TYPE_INT16 = 4
+enums["MAV_PARAM_TYPE"][4] = EnumEntry("MAV_PARAM_TYPE_INT16", """""")
+MAV_PARAM_TYPE_UINT32 = 5
+enums["MAV_PARAM_TYPE"][5] = EnumEntry("MAV_PARAM_TYPE_UINT32", """""")
+MAV_PARAM_TYPE_INT32 = 6
+enums["MAV_PARAM_TYPE"][6] = EnumEntry("MAV_PARAM_TYPE_INT32", """""")
+MAV_PARAM_TYPE_UINT64 = 7
+enums["MAV_PARAM_TYPE"][7] = EnumEntry("MAV_PARAM_TYPE_UINT64", """""")
+MAV_PARAM_TYPE_INT64 = 8
+enums["MAV_PARAM_TYPE"][8] = EnumEntry("MAV_PARAM_TYPE_INT64", """""")
+MAV_PARAM_TYPE_REAL32 = 9
+enums["MAV_PARAM_TYPE"][9] = EnumEntry("MAV_PARAM_TYPE_REAL32", """""")
+MAV_PARAM_TYPE_REAL64 = 10
+enums["MAV_PARAM_TYPE"][10] = EnumEntry("MAV_PARAM_TYPE_REAL64", """""")
+MAV_PARAM_TYPE_ENUM_END = 11
+enums["MAV_PARAM_TYPE"][11] = EnumEntry("MAV_PARAM_TYPE_ENUM_END", """""")
+
+# MAV_PARAM_ERROR
+MAV_PARAM_ERROR_NO_ERROR = 0
+MAV_PARAM_ERROR_DOES_NOT_EXIST = 1
+MAV_PARAM_ERROR_VALUE_OUT_OF_RANGE = 2
+MAV_PARAM_ERROR_PERMISSION_DENIED = 3
+MAV_PARAM_ERROR_COMPONENT_NOT_FOUND = 4
+MAV_PARAM_ERROR_READ_ONLY = 5
+MAV_PARAM_ERROR_ENUM_END = 6
+
+# MAV_PARAM_EXT_TYPE
+MAV_PARAM_EXT_TYPE_UINT8 = 1
+MAV_PARAM_EXT_TYPE_INT8 = 2
+MAV_PARAM_EXT_TYPE_UINT16 = 3
+MAV_PARAM_EXT_TYPE_INT16 = 4
+MAV_PARAM_EXT_TYPE_UINT32 = 5
+MAV_PARAM_EXT_TYPE_INT32 = 6
+MAV_PARAM_EXT_TYPE_UINT64 = 7
+MAV_PARAM_EXT_TYPE_INT64 = 8
+MAV_PARAM_EXT_TYPE_REAL32 = 9
+MAV_PARAM_EXT_TYPE_REAL64 = 10
+MAV_PARAM_EXT_TYPE_CUSTOM = 11
+MAV_PARAM_EXT_TYPE_ENUM_END = 12
+
+# MAV_RESULT
+enums["MAV_RESULT"] = Enum()
+enums["MAV_RESULT"].bitmask = False
+MAV_RESULT_ACCEPTED = 0
+enums["MAV_RESULT"][0] = EnumEntry("MAV_RESULT_ACCEPTED", """""")
+MAV_RESULT_TEMPORARILY_REJECTED = 1
+enums["MAV_RESULT"][1] = EnumEntry("MAV_RESULT_TEMPORARILY_REJECTED", """""")
+MAV_RESULT_DENIED = 2
+enums["MAV_RESULT"][2] = EnumEntry("MAV_RESULT_DENIED", """""")
+MAV_RESULT_UNSUPPORTED = 3
+enums["MAV_RESULT"][3] = EnumEntry("MAV_RESULT_UNSUPPORTED", """""")
+MAV_RESULT_FAILED = 4
+enums["MAV_RESULT"][4] = EnumEntry("MAV_RESULT_FAILED", """""")
+MAV_RESULT_IN_PROGRESS = 5
+enums["MAV_RESULT"][5] = EnumEntry("MAV_RESULT_IN_PROGRESS", """""")
+MAV_RESULT_COMMAND_LONG_ONLY = 7
+enums["MAV_RESULT"][7] = EnumEntry("MAV_RESULT_COMMAND_LONG_ONLY", """""")
+MAV_RESULT_COMMAND_INT_ONLY = 8
+enums["MAV_RESULT"][8] = EnumEntry("MAV_RESULT_COMMAND_INT_ONLY", """""")
+MAV_RESULT_ENUM_END = 9
+enums["MAV_RESULT"][9] = EnumEntry("MAV_RESULT_ENUM_END", """""")
+
+# MAV_MISSION_RESULT
+enums["MAV_MISSION_RESULT"] = Enum()
+enums["MAV_MISSION_RESULT"].bitmask = False
+MAV_MISSION_ACCEPTED = 0
+enums["MAV_MISSION_RESULT"][0] = EnumEntry("MAV_MISSION_ACCEPTED", """""")
+MAV_MISSION_ERROR = 1
+enums["MAV_MISSION_RESULT"][1] = EnumEntry("MAV_MISSION_ERROR", """""")
+MAV_MISSION_UNSUPPORTED_FRAME = 2
+enums["MAV_MISSION_RESULT"][2] = EnumEntry("MAV_MISSION_UNSUPPORTED_FRAME", """""")
+MAV_MISSION_UNSUPPORTED = 3
+enums["MAV_MISSION_RESULT"][3] = EnumEntry("MAV_MISSION_UNSUPPORTED", """""")
+MAV_MISSION_NO_SPACE = 4
+enums["MAV_MISSION_RESULT"][4] = EnumEntry("MAV_MISSION_NO_SPACE", """""")
+MAV_MISSION_INVALID = 5
+enums["MAV_MISSION_RESULT"][5] = EnumEntry("MAV_MISSION_INVALID", """""")
+MAV_MISSION_INVALID_PARAM1 = 6
+enums["MAV_MISSION_RESULT"][6] = EnumEntry("MAV_MISSION_INVALID_PARAM1", """""")
+MAV_MISSION_INVALID_PARAM2 = 7
+enums["MAV_MISSION_RESULT"][7] = EnumEntry("MAV_MISSION_INVALID_PARAM2", """""")
+MAV_MISSION_INVALID_PARAM3 = 8
+enums["MAV_MISSION_RESULT"][8] = EnumEntry("MAV_MISSION_INVALID_PARAM3", """""")
+MAV_MISSION_INVALID_PARAM4 = 9
+enums["MAV_MISSION_RESULT"][9] = EnumEntry("MAV_MISSION_INVALID_PARAM4", """""")
+MAV_MISSION_INVALID_PARAM5_X = 10
+enums["MAV_MISSION_RESULT"][10] = EnumEntry("MAV_MISSION_INVALID_PARAM5_X", """""")
+MAV_MISSION_INVALID_PARAM6_Y = 11
+enums["MAV_MISSION_RESULT"][11] = EnumEntry("MAV_MISSION_INVALID_PARAM6_Y", """""")
+MAV_MISSION_INVALID_PARAM7 = 12
+enums["MAV_MISSION_RESULT"][12] = EnumEntry("MAV_MISSION_INVALID_PARAM7", """""")
+MAV_MISSION_INVALID_SEQUENCE = 13
+enums["MAV_MISSION_RESULT"][13] = EnumEntry("MAV_MISSION_INVALID_SEQUENCE", """""")
+MAV_MISSION_DENIED = 14
+enums["MAV_MISSION_RESULT"][14] = EnumEntry("MAV_MISSION_DENIED", """""")
+MAV_MISSION_OPERATION_CANCELLED = 15
+enums["MAV_MISSION_RESULT"][15] = EnumEntry("MAV_MISSION_OPERATION_CANCELLED", """""")
+MAV_MISSION_RESULT_ENUM_END = 16
+enums["MAV_MISSION_RESULT"][16] = EnumEntry("MAV_MISSION_RESULT_ENUM_END", """""")
+
+# MAV_SEVERITY
+enums["MAV_SEVERITY"] = Enum()
+enums["MAV_SEVERITY"].bitmask = False
+MAV_SEVERITY_EMERGENCY = 0
+enums["MAV_SEVERITY"][0] = EnumEntry("MAV_SEVERITY_EMERGENCY", """""")
+MAV_SEVERITY_ALERT = 1
+enums["MAV_SEVERITY"][1] = EnumEntry("MAV_SEVERITY_ALERT", """""")
+MAV_SEVERITY_CRITICAL = 2
+enums["MAV_SEVERITY"][2] = EnumEntry("MAV_SEVERITY_CRITICAL", """""")
+MAV_SEVERITY_ERROR = 3
+enums["MAV_SEVERITY"][3] = EnumEntry("MAV_SEVERITY_ERROR", """""")
+MAV_SEVERITY_WARNING = 4
+enums["MAV_SEVERITY"][4] = EnumEntry("MAV_SEVERITY_WARNING", """""")
+MAV_SEVERITY_NOTICE = 5
+enums["MAV_SEVERITY"][5] = EnumEntry("MAV_SEVERITY_NOTICE", """""")
+MAV_SEVERITY_INFO = 6
+enums["MAV_SEVERITY"][6] = EnumEntry("MAV_SEVERITY_INFO", """""")
+MAV_SEVERITY_DEBUG = 7
+enums["MAV_SEVERITY"][7] = EnumEntry("MAV_SEVERITY_DEBUG", """""")
+MAV_SEVERITY_ENUM_END = 8
+enums["MAV_SEVERITY"][8] = EnumEntry("MAV_SEVERITY_ENUM_END", """""")
+
+# MAV_POWER_STATUS
+MAV_POWER_STATUS_BRICK_VALID = 1
+MAV_POWER_STATUS_SERVO_VALID = 2
+MAV_POWER_STATUS_USB_CONNECTED = 4
+MAV_POWER_STATUS_PERIPH_OVERCURRENT = 8
+MAV_POWER_STATUS_PERIPH_HIPOWER_OVERCURRENT = 16
+MAV_POWER_STATUS_CHANGED = 32
+MAV_POWER_STATUS_ENUM_END = 33
+
+# SERIAL_CONTROL_DEV
+SERIAL_CONTROL_DEV_TELEM1 = 0
+SERIAL_CONTROL_DEV_TELEM2 = 1
+SERIAL_CONTROL_DEV_GPS1 = 2
+SERIAL_CONTROL_DEV_GPS2 = 3
+SERIAL_CONTROL_DEV_SHELL = 10
+SERIAL_CONTROL_SERIAL0 = 100
+SERIAL_CONTROL_SERIAL1 = 101
+SERIAL_CONTROL_SERIAL2 = 102
+SERIAL_CONTROL_SERIAL3 = 103
+SERIAL_CONTROL_SERIAL4 = 104
+SERIAL_CONTROL_SERIAL5 = 105
+SERIAL_CONTROL_SERIAL6 = 106
+SERIAL_CONTROL_SERIAL7 = 107
+SERIAL_CONTROL_SERIAL8 = 108
+SERIAL_CONTROL_SERIAL9 = 109
+SERIAL_CONTROL_DEV_ENUM_END = 110
+
+# SERIAL_CONTROL_FLAG
+SERIAL_CONTROL_FLAG_REPLY = 1
+SERIAL_CONTROL_FLAG_RESPOND = 2
+SERIAL_CONTROL_FLAG_EXCLUSIVE = 4
+SERIAL_CONTROL_FLAG_BLOCKING = 8
+SERIAL_CONTROL_FLAG_MULTI = 16
+SERIAL_CONTROL_FLAG_ENUM_END = 17
+
+# MAV_DISTANCE_SENSOR
+MAV_DISTANCE_SENSOR_LASER = 0
+MAV_DISTANCE_SENSOR_ULTRASOUND = 1
+MAV_DISTANCE_SENSOR_INFRARED = 2
+MAV_DISTANCE_SENSOR_RADAR = 3
+MAV_DISTANCE_SENSOR_UNKNOWN = 4
+MAV_DISTANCE_SENSOR_ENUM_END = 5
+
+# MAV_SENSOR_ORIENTATION
+MAV_SENSOR_ROTATION_NONE = 0
+MAV_SENSOR_ROTATION_YAW_45 = 1
+MAV_SENSOR_ROTATION_YAW_90 = 2
+MAV_SENSOR_ROTATION_YAW_135 = 3
+MAV_SENSOR_ROTATION_YAW_180 = 4
+MAV_SENSOR_ROTATION_YAW_225 = 5
+MAV_SENSOR_ROTATION_YAW_270 = 6
+MAV_SENSOR_ROTATION_YAW_315 = 7
+MAV_SENSOR_ROTATION_ROLL_180 = 8
+MAV_SENSOR_ROTATION_ROLL_180_YAW_45 = 9
+MAV_SENSOR_ROTATION_ROLL_180_YAW_90 = 10
+MAV_SENSOR_ROTATION_ROLL_180_YAW_135 = 11
+MAV_SENSOR_ROTATION_PITCH_180 = 12
+MAV_SENSOR_ROTATION_ROLL_180_YAW_225 = 13
+MAV_SENSOR_ROTATION_ROLL_180_YAW_270 = 14
+MAV_SENSOR_ROTATION_ROLL_180_YAW_315 = 15
+MAV_SENSOR_ROTATION_ROLL_90 = 16
+MAV_SENSOR_ROTATION_ROLL_90_YAW_45 = 17
+MAV_SENSOR_ROTATION_ROLL_90_YAW_90 = 18
+MAV_SENSOR_ROTATION_ROLL_90_YAW_135 = 19
+MAV_SENSOR_ROTATION_ROLL_270 = 20
+MAV_SENSOR_ROTATION_ROLL_270_YAW_45 = 21
+MAV_SENSOR_ROTATION_ROLL_270_YAW_90 = 22
+MAV_SENSOR_ROTATION_ROLL_270_YAW_135 = 23
+MAV_SENSOR_ROTATION_PITCH_90 = 24
+MAV_SENSOR_ROTATION_PITCH_270 = 25
+MAV_SENSOR_ROTATION_PITCH_180_YAW_90 = 26
+MAV_SENSOR_ROTATION_PITCH_180_YAW_270 = 27
+MAV_SENSOR_ROTATION_ROLL_90_PITCH_90 = 28
+MAV_SENSOR_ROTATION_ROLL_180_PITCH_90 = 29
+MAV_SENSOR_ROTATION_ROLL_270_PITCH_90 = 30
+MAV_SENSOR_ROTATION_ROLL_90_PITCH_180 = 31
+MAV_SENSOR_ROTATION_ROLL_270_PITCH_180 = 32
+MAV_SENSOR_ROTATION_ROLL_90_PITCH_270 = 33
+MAV_SENSOR_ROTATION_ROLL_180_PITCH_270 = 34
+MAV_SENSOR_ROTATION_ROLL_270_PITCH_270 = 35
+MAV_SENSOR_ROTATION_ROLL_90_PITCH_180_YAW_90 = 36
+MAV_SENSOR_ROTATION_ROLL_90_YAW_270 = 37
+MAV_SENSOR_ROTATION_ROLL_90_PITCH_68_YAW_293 = 38
+MAV_SENSOR_ROTATION_PITCH_315 = 39
+MAV_SENSOR_ROTATION_ROLL_90_PITCH_315 = 40
+MAV_SENSOR_ROTATION_CUSTOM = 100
+MAV_SENSOR_ORIENTATION_ENUM_END = 101
+
+# MAV_MISSION_TYPE
+MAV_MISSION_TYPE_MISSION = 0
+MAV_MISSION_TYPE_FENCE = 1
+MAV_MISSION_TYPE_RALLY = 2
+MAV_MISSION_TYPE_ALL = 255
+MAV_MISSION_TYPE_ENUM_END = 256
+
+# MAV_ESTIMATOR_TYPE
+MAV_ESTIMATOR_TYPE_UNKNOWN = 0
+MAV_ESTIMATOR_TYPE_NAIVE = 1
+MAV_ESTIMATOR_TYPE_VISION = 2
+MAV_ESTIMATOR_TYPE_VIO = 3
+MAV_ESTIMATOR_TYPE_GPS = 4
+MAV_ESTIMATOR_TYPE_GPS_INS = 5
+MAV_ESTIMATOR_TYPE_MOCAP = 6
+MAV_ESTIMATOR_TYPE_LIDAR = 7
+MAV_ESTIMATOR_TYPE_AUTOPILOT = 8
+MAV_ESTIMATOR_TYPE_ENUM_END = 9
+
+# MAV_BATTERY_TYPE
+enums["MAV_BATTERY_TYPE"] = Enum()
+enums["MAV_BATTERY_TYPE"].bitmask = False
+MAV_BATTERY_TYPE_UNKNOWN = 0
+enums["MAV_BATTERY_TYPE"][0] = EnumEntry("MAV_BATTERY_TYPE_UNKNOWN", """""")
+MAV_BATTERY_TYPE_LIPO = 1
+enums["MAV_BATTERY_TYPE"][1] = EnumEntry("MAV_BATTERY_TYPE_LIPO", """""")
+MAV_BATTERY_TYPE_LIFE = 2
+enums["MAV_BATTERY_TYPE"][2] = EnumEntry("MAV_BATTERY_TYPE_LIFE", """""")
+MAV_BATTERY_TYPE_LION = 3
+enums["MAV_BATTERY_TYPE"][3] = EnumEntry("MAV_BATTERY_TYPE_LION", """""")
+MAV_BATTERY_TYPE_NIMH = 4
+enums["MAV_BATTERY_TYPE"][4] = EnumEntry("MAV_BATTERY_TYPE_NIMH", """""")
+MAV_BATTERY_TYPE_ENUM_END = 5
+enums["MAV_BATTERY_TYPE"][5] = EnumEntry("MAV_BATTERY_TYPE_ENUM_END", """""")
+
+# MAV_BATTERY_FUNCTION
+enums["MAV_BATTERY_FUNCTION"] = Enum()
+enums["MAV_BATTERY_FUNCTION"].bitmask = False
+MAV_BATTERY_FUNCTION_UNKNOWN = 0
+enums["MAV_BATTERY_FUNCTION"][0] = EnumEntry("MAV_BATTERY_FUNCTION_UNKNOWN", """""")
+MAV_BATTERY_FUNCTION_ALL = 1
+enums["MAV_BATTERY_FUNCTION"][1] = EnumEntry("MAV_BATTERY_FUNCTION_ALL", """""")
+MAV_BATTERY_FUNCTION_PROPULSION = 2
+enums["MAV_BATTERY_FUNCTION"][2] = EnumEntry("MAV_BATTERY_FUNCTION_PROPULSION", """""")
+MAV_BATTERY_FUNCTION_AVIONICS = 3
+enums["MAV_BATTERY_FUNCTION"][3] = EnumEntry("MAV_BATTERY_FUNCTION_AVIONICS", """""")
+MAV_BATTERY_FUNCTION_PAYLOAD = 4
+enums["MAV_BATTERY_FUNCTION"][4] = EnumEntry("MAV_BATTERY_FUNCTION_PAYLOAD", """""")
+MAV_BATTERY_FUNCTION_ENUM_END = 5
+enums["MAV_BATTERY_FUNCTION"][5] = EnumEntry("MAV_BATTERY_FUNCTION_ENUM_END", """""")
+
+# MAV_BATTERY_CHARGE_STATE
+MAV_BATTERY_CHARGE_STATE_UNDEFINED = 0
+MAV_BATTERY_CHARGE_STATE_OK = 1
+MAV_BATTERY_CHARGE_STATE_LOW = 2
+MAV_BATTERY_CHARGE_STATE_CRITICAL = 3
+MAV_BATTERY_CHARGE_STATE_EMERGENCY = 4
+MAV_BATTERY_CHARGE_STATE_FAILED = 5
+MAV_BATTERY_CHARGE_STATE_UNHEALTHY = 6
+MAV_BATTERY_CHARGE_STATE_CHARGING = 7
+MAV_BATTERY_CHARGE_STATE_ENUM_END = 8
+
+# MAV_BATTERY_MODE
+MAV_BATTERY_MODE_UNKNOWN = 0
+MAV_BATTERY_MODE_AUTO_DISCHARGING = 1
+MAV_BATTERY_MODE_HOT_SWAP = 2
+MAV_BATTERY_MODE_ENUM_END = 3
+
+# MAV_BATTERY_FAULT
+MAV_BATTERY_FAULT_DEEP_DISCHARGE = 1
+MAV_BATTERY_FAULT_SPIKES = 2
+MAV_BATTERY_FAULT_CELL_FAIL = 4
+MAV_BATTERY_FAULT_OVER_CURRENT = 8
+MAV_BATTERY_FAULT_OVER_TEMPERATURE = 16
+MAV_BATTERY_FAULT_UNDER_TEMPERATURE = 32
+MAV_BATTERY_FAULT_INCOMPATIBLE_VOLTAGE = 64
+MAV_BATTERY_FAULT_INCOMPATIBLE_FIRMWARE = 128
+BATTERY_FAULT_INCOMPATIBLE_CELLS_CONFIGURATION = 256
+MAV_BATTERY_FAULT_ENUM_END = 257
+
+# MAV_GENERATOR_STATUS_FLAG
+MAV_GENERATOR_STATUS_FLAG_OFF = 1
+MAV_GENERATOR_STATUS_FLAG_READY = 2
+MAV_GENERATOR_STATUS_FLAG_GENERATING = 4
+MAV_GENERATOR_STATUS_FLAG_CHARGING = 8
+MAV_GENERATOR_STATUS_FLAG_REDUCED_POWER = 16
+MAV_GENERATOR_STATUS_FLAG_MAXPOWER = 32
+MAV_GENERATOR_STATUS_FLAG_OVERTEMP_WARNING = 64
+MAV_GENERATOR_STATUS_FLAG_OVERTEMP_FAULT = 128
+MAV_GENERATOR_STATUS_FLAG_ELECTRONICS_OVERTEMP_WARNING = 256
+MAV_GENERATOR_STATUS_FLAG_ELECTRONICS_OVERTEMP_FAULT = 512
+MAV_GENERATOR_STATUS_FLAG_ELECTRONICS_FAULT = 1024
+MAV_GENERATOR_STATUS_FLAG_POWERSOURCE_FAULT = 2048
+MAV_GENERATOR_STATUS_FLAG_COMMUNICATION_WARNING = 4096
+MAV_GENERATOR_STATUS_FLAG_COOLING_WARNING = 8192
+MAV_GENERATOR_STATUS_FLAG_POWER_RAIL_FAULT = 16384
+MAV_GENERATOR_STATUS_FLAG_OVERCURRENT_FAULT = 32768
+MAV_GENERATOR_STATUS_FLAG_BATTERY_OVERCHARGE_CURRENT_FAULT = 65536
+MAV_GENERATOR_STATUS_FLAG_OVERVOLTAGE_FAULT = 131072
+MAV_GENERATOR_STATUS_FLAG_BATTERY_UNDERVOLT_FAULT = 262144
+MAV_GENERATOR_STATUS_FLAG_START_INHIBITED = 524288
+MAV_GENERATOR_STATUS_FLAG_MAINTENANCE_REQUIRED = 1048576
+MAV_GENERATOR_STATUS_FLAG_WARMING_UP = 2097152
+MAV_GENERATOR_STATUS_FLAG_IDLE = 4194304
+MAV_GENERATOR_STATUS_FLAG_ENUM_END = 4194305
+
+# MAV_VTOL_STATE
+MAV_VTOL_STATE_UNDEFINED = 0
+MAV_VTOL_STATE_TRANSITION_TO_FW = 1
+MAV_VTOL_STATE_TRANSITION_TO_MC = 2
+MAV_VTOL_STATE_MC = 3
+MAV_VTOL_STATE_FW = 4
+MAV_VTOL_STATE_ENUM_END = 5
+
+# MAV_LANDED_STATE
+MAV_LANDED_STATE_UNDEFINED = 0
+MAV_LANDED_STATE_ON_GROUND = 1
+MAV_LANDED_STATE_IN_AIR = 2
+MAV_LANDED_STATE_TAKEOFF = 3
+MAV_LANDED_STATE_LANDING = 4
+MAV_LANDED_STATE_ENUM_END = 5
+
+# ADSB_ALTITUDE_TYPE
+ADSB_ALTITUDE_TYPE_PRESSURE_QNH = 0
+ADSB_ALTITUDE_TYPE_GEOMETRIC = 1
+ADSB_ALTITUDE_TYPE_ENUM_END = 2
+
+# ADSB_EMITTER_TYPE
+ADSB_EMITTER_TYPE_NO_INFO = 0
+ADSB_EMITTER_TYPE_LIGHT = 1
+ADSB_EMITTER_TYPE_SMALL = 2
+ADSB_EMITTER_TYPE_LARGE = 3
+ADSB_EMITTER_TYPE_HIGH_VORTEX_LARGE = 4
+ADSB_EMITTER_TYPE_HEAVY = 5
+ADSB_EMITTER_TYPE_HIGHLY_MANUV = 6
+ADSB_EMITTER_TYPE_ROTOCRAFT = 7
+ADSB_EMITTER_TYPE_UNASSIGNED = 8
+ADSB_EMITTER_TYPE_GLIDER = 9
+ADSB_EMITTER_TYPE_LIGHTER_AIR = 10
+ADSB_EMITTER_TYPE_PARACHUTE = 11
+ADSB_EMITTER_TYPE_ULTRA_LIGHT = 12
+ADSB_EMITTER_TYPE_UNASSIGNED2 = 13
+ADSB_EMITTER_TYPE_UAV = 14
+ADSB_EMITTER_TYPE_SPACE = 15
+ADSB_EMITTER_TYPE_UNASSGINED3 = 16
+ADSB_EMITTER_TYPE_EMERGENCY_SURFACE = 17
+ADSB_EMITTER_TYPE_SERVICE_SURFACE = 18
+ADSB_EMITTER_TYPE_POINT_OBSTACLE = 19
+ADSB_EMITTER_TYPE_ENUM_END = 20
+
+# ADSB_FLAGS
+ADSB_FLAGS_VALID_COORDS = 1
+ADSB_FLAGS_VALID_ALTITUDE = 2
+ADSB_FLAGS_VALID_HEADING = 4
+ADSB_FLAGS_VALID_VELOCITY = 8
+ADSB_FLAGS_VALID_CALLSIGN = 16
+ADSB_FLAGS_VALID_SQUAWK = 32
+ADSB_FLAGS_SIMULATED = 64
+ADSB_FLAGS_VERTICAL_VELOCITY_VALID = 128
+ADSB_FLAGS_BARO_VALID = 256
+ADSB_FLAGS_SOURCE_UAT = 32768
+ADSB_FLAGS_ENUM_END = 32769
+
+# MAV_DO_REPOSITION_FLAGS
+MAV_DO_REPOSITION_FLAGS_CHANGE_MODE = 1
+MAV_DO_REPOSITION_FLAGS_RELATIVE_YAW = 2
+MAV_DO_REPOSITION_FLAGS_ENUM_END = 3
+
+# SPEED_TYPE
+SPEED_TYPE_AIRSPEED = 0
+SPEED_TYPE_GROUNDSPEED = 1
+SPEED_TYPE_CLIMB_SPEED = 2
+SPEED_TYPE_DESCENT_SPEED = 3
+SPEED_TYPE_ENUM_END = 4
+
+# HEADING_TYPE
+HEADING_TYPE_COURSE_OVER_GROUND = 0
+HEADING_TYPE_HEADING = 1
+HEADING_TYPE_DEFAULT = 2
+HEADING_TYPE_ENUM_END = 3
+
+# ESTIMATOR_STATUS_FLAGS
+ESTIMATOR_ATTITUDE = 1
+ESTIMATOR_VELOCITY_HORIZ = 2
+ESTIMATOR_VELOCITY_VERT = 4
+ESTIMATOR_POS_HORIZ_REL = 8
+ESTIMATOR_POS_HORIZ_ABS = 16
+ESTIMATOR_POS_VERT_ABS = 32
+ESTIMATOR_POS_VERT_AGL = 64
+ESTIMATOR_CONST_POS_MODE = 128
+ESTIMATOR_PRED_POS_HORIZ_REL = 256
+ESTIMATOR_PRED_POS_HORIZ_ABS = 512
+ESTIMATOR_GPS_GLITCH = 1024
+ESTIMATOR_ACCEL_ERROR = 2048
+ESTIMATOR_STATUS_FLAGS_ENUM_END = 2049
+
+# MOTOR_TEST_ORDER
+MOTOR_TEST_ORDER_DEFAULT = 0
+MOTOR_TEST_ORDER_SEQUENCE = 1
+MOTOR_TEST_ORDER_BOARD = 2
+MOTOR_TEST_ORDER_ENUM_END = 3
+
+# MOTOR_TEST_THROTTLE_TYPE
+MOTOR_TEST_THROTTLE_PERCENT = 0
+MOTOR_TEST_THROTTLE_PWM = 1
+MOTOR_TEST_THROTTLE_PILOT = 2
+MOTOR_TEST_COMPASS_CAL = 3
+MOTOR_TEST_THROTTLE_TYPE_ENUM_END = 4
+
+# GPS_INPUT_IGNORE_FLAGS
+GPS_INPUT_IGNORE_FLAG_ALT = 1
+GPS_INPUT_IGNORE_FLAG_HDOP = 2
+GPS_INPUT_IGNORE_FLAG_VDOP = 4
+GPS_INPUT_IGNORE_FLAG_VEL_HORIZ = 8
+GPS_INPUT_IGNORE_FLAG_VEL_VERT = 16
+GPS_INPUT_IGNORE_FLAG_SPEED_ACCURACY = 32
+GPS_INPUT_IGNORE_FLAG_HORIZONTAL_ACCURACY = 64
+GPS_INPUT_IGNORE_FLAG_VERTICAL_ACCURACY = 128
+GPS_INPUT_IGNORE_FLAGS_ENUM_END = 129
+
+# MAV_COLLISION_ACTION
+MAV_COLLISION_ACTION_NONE = 0
+MAV_COLLISION_ACTION_REPORT = 1
+MAV_COLLISION_ACTION_ASCEND_OR_DESCEND = 2
+MAV_COLLISION_ACTION_MOVE_HORIZONTALLY = 3
+MAV_COLLISION_ACTION_MOVE_PERPENDICULAR = 4
+MAV_COLLISION_ACTION_RTL = 5
+MAV_COLLISION_ACTION_HOVER = 6
+MAV_COLLISION_ACTION_ENUM_END = 7
+
+# MAV_COLLISION_THREAT_LEVEL
+MAV_COLLISION_THREAT_LEVEL_NONE = 0
+MAV_COLLISION_THREAT_LEVEL_LOW = 1
+MAV_COLLISION_THREAT_LEVEL_HIGH = 2
+MAV_COLLISION_THREAT_LEVEL_ENUM_END = 3
+
+# MAV_COLLISION_SRC
+MAV_COLLISION_SRC_ADSB = 0
+MAV_COLLISION_SRC_MAVLINK_GPS_GLOBAL_INT = 1
+MAV_COLLISION_SRC_ENUM_END = 2
+
+# GPS_FIX_TYPE
+enums["GPS_FIX_TYPE"] = Enum()
+enums["GPS_FIX_TYPE"].bitmask = False
+GPS_FIX_TYPE_NO_GPS = 0
+enums["GPS_FIX_TYPE"][0] = EnumEntry("GPS_FIX_TYPE_NO_GPS", """""")
+GPS_FIX_TYPE_NO_FIX = 1
+enums["GPS_FIX_TYPE"][1] = EnumEntry("GPS_FIX_TYPE_NO_FIX", """""")
+GPS_FIX_TYPE_2D_FIX = 2
+enums["GPS_FIX_TYPE"][2] = EnumEntry("GPS_FIX_TYPE_2D_FIX", """""")
+GPS_FIX_TYPE_3D_FIX = 3
+enums["GPS_FIX_TYPE"][3] = EnumEntry("GPS_FIX_TYPE_3D_FIX", """""")
+GPS_FIX_TYPE_DGPS = 4
+enums["GPS_FIX_TYPE"][4] = EnumEntry("GPS_FIX_TYPE_DGPS", """""")
+GPS_FIX_TYPE_RTK_FLOAT = 5
+enums["GPS_FIX_TYPE"][5] = EnumEntry("GPS_FIX_TYPE_RTK_FLOAT", """""")
+GPS_FIX_TYPE_RTK_FIXED = 6
+enums["GPS_FIX_TYPE"][6] = EnumEntry("GPS_FIX_TYPE_RTK_FIXED", """""")
+GPS_FIX_TYPE_STATIC = 7
+enums["GPS_FIX_TYPE"][7] = EnumEntry("GPS_FIX_TYPE_STATIC", """""")
+GPS_FIX_TYPE_PPP = 8
+enums["GPS_FIX_TYPE"][8] = EnumEntry("GPS_FIX_TYPE_PPP", """""")
+GPS_FIX_TYPE_ENUM_END = 9
+enums["GPS_FIX_TYPE"][9] = EnumEntry("GPS_FIX_TYPE_ENUM_END", """""")
+
+# RTK_BASELINE_COORDINATE_SYSTEM
+RTK_BASELINE_COORDINATE_SYSTEM_ECEF = 0
+RTK_BASELINE_COORDINATE_SYSTEM_NED = 1
+RTK_BASELINE_COORDINATE_SYSTEM_ENUM_END = 2
+
+# LANDING_TARGET_TYPE
+LANDING_TARGET_TYPE_LIGHT_BEACON = 0
+LANDING_TARGET_TYPE_RADIO_BEACON = 1
+LANDING_TARGET_TYPE_VISION_FIDUCIAL = 2
+LANDING_TARGET_TYPE_VISION_OTHER = 3
+LANDING_TARGET_TYPE_ENUM_END = 4
+
+# VTOL_TRANSITION_HEADING
+VTOL_TRANSITION_HEADING_VEHICLE_DEFAULT = 0
+VTOL_TRANSITION_HEADING_NEXT_WAYPOINT = 1
+VTOL_TRANSITION_HEADING_TAKEOFF = 2
+VTOL_TRANSITION_HEADING_SPECIFIED = 3
+VTOL_TRANSITION_HEADING_ANY = 4
+VTOL_TRANSITION_HEADING_ENUM_END = 5
+
+# CAMERA_CAP_FLAGS
+CAMERA_CAP_FLAGS_CAPTURE_VIDEO = 1
+CAMERA_CAP_FLAGS_CAPTURE_IMAGE = 2
+CAMERA_CAP_FLAGS_HAS_MODES = 4
+CAMERA_CAP_FLAGS_CAN_CAPTURE_IMAGE_IN_VIDEO_MODE = 8
+CAMERA_CAP_FLAGS_CAN_CAPTURE_VIDEO_IN_IMAGE_MODE = 16
+CAMERA_CAP_FLAGS_HAS_IMAGE_SURVEY_MODE = 32
+CAMERA_CAP_FLAGS_HAS_BASIC_ZOOM = 64
+CAMERA_CAP_FLAGS_HAS_BASIC_FOCUS = 128
+CAMERA_CAP_FLAGS_HAS_VIDEO_STREAM = 256
+CAMERA_CAP_FLAGS_HAS_TRACKING_POINT = 512
+CAMERA_CAP_FLAGS_HAS_TRACKING_RECTANGLE = 1024
+CAMERA_CAP_FLAGS_HAS_TRACKING_GEO_STATUS = 2048
+CAMERA_CAP_FLAGS_HAS_THERMAL_RANGE = 4096
+CAMERA_CAP_FLAGS_HAS_MTI = 8192
+CAMERA_CAP_FLAGS_ENUM_END = 8193
+
+# VIDEO_STREAM_STATUS_FLAGS
+VIDEO_STREAM_STATUS_FLAGS_RUNNING = 1
+VIDEO_STREAM_STATUS_FLAGS_THERMAL = 2
+VIDEO_STREAM_STATUS_FLAGS_THERMAL_RANGE_ENABLED = 4
+VIDEO_STREAM_STATUS_FLAGS_ENUM_END = 5
+
+# VIDEO_STREAM_TYPE
+VIDEO_STREAM_TYPE_RTSP = 0
+VIDEO_STREAM_TYPE_RTPUDP = 1
+VIDEO_STREAM_TYPE_TCP_MPEG = 2
+VIDEO_STREAM_TYPE_MPEG_TS = 3
+VIDEO_STREAM_TYPE_WHEP = 4
+VIDEO_STREAM_TYPE_ENUM_END = 5
+
+# VIDEO_STREAM_ENCODING
+VIDEO_STREAM_ENCODING_UNKNOWN = 0
+VIDEO_STREAM_ENCODING_H264 = 1
+VIDEO_STREAM_ENCODING_H265 = 2
+VIDEO_STREAM_ENCODING_ENUM_END = 3
+
+# CAMERA_TRACKING_STATUS_FLAGS
+CAMERA_TRACKING_STATUS_FLAGS_IDLE = 0
+CAMERA_TRACKING_STATUS_FLAGS_ACTIVE = 1
+CAMERA_TRACKING_STATUS_FLAGS_ERROR = 2
+CAMERA_TRACKING_STATUS_FLAGS_MTI = 4
+CAMERA_TRACKING_STATUS_FLAGS_COASTING = 8
+CAMERA_TRACKING_STATUS_FLAGS_ENUM_END = 9
+
+# CAMERA_TRACKING_MODE
+CAMERA_TRACKING_MODE_NONE = 0
+CAMERA_TRACKING_MODE_POINT = 1
+CAMERA_TRACKING_MODE_RECTANGLE = 2
+CAMERA_TRACKING_MODE_ENUM_END = 3
+
+# CAMERA_TRACKING_TARGET_DATA
+CAMERA_TRACKING_TARGET_DATA_EMBEDDED = 1
+CAMERA_TRACKING_TARGET_DATA_RENDERED = 2
+CAMERA_TRACKING_TARGET_DATA_IN_STATUS = 4
+CAMERA_TRACKING_TARGET_DATA_ENUM_END = 5
+
+# CAMERA_ZOOM_TYPE
+ZOOM_TYPE_STEP = 0
+ZOOM_TYPE_CONTINUOUS = 1
+ZOOM_TYPE_RANGE = 2
+ZOOM_TYPE_FOCAL_LENGTH = 3
+ZOOM_TYPE_HORIZONTAL_FOV = 4
+CAMERA_ZOOM_TYPE_ENUM_END = 5
+
+# SET_FOCUS_TYPE
+FOCUS_TYPE_STEP = 0
+FOCUS_TYPE_CONTINUOUS = 1
+FOCUS_TYPE_RANGE = 2
+FOCUS_TYPE_METERS = 3
+FOCUS_TYPE_AUTO = 4
+FOCUS_TYPE_AUTO_SINGLE = 5
+FOCUS_TYPE_AUTO_CONTINUOUS = 6
+SET_FOCUS_TYPE_ENUM_END = 7
+
+# CAMERA_SOURCE
+CAMERA_SOURCE_DEFAULT = 0
+CAMERA_SOURCE_RGB = 1
+CAMERA_SOURCE_IR = 2
+CAMERA_SOURCE_NDVI = 3
+CAMERA_SOURCE_ENUM_END = 4
+
+# PARAM_ACK
+PARAM_ACK_ACCEPTED = 0
+PARAM_ACK_VALUE_UNSUPPORTED = 1
+PARAM_ACK_FAILED = 2
+PARAM_ACK_IN_PROGRESS = 3
+PARAM_ACK_ENUM_END = 4
+
+# CAMERA_MODE
+CAMERA_MODE_IMAGE = 0
+CAMERA_MODE_VIDEO = 1
+CAMERA_MODE_IMAGE_SURVEY = 2
+CAMERA_MODE_ENUM_END = 3
+
+# MAV_ARM_AUTH_DENIED_REASON
+MAV_ARM_AUTH_DENIED_REASON_GENERIC = 0
+MAV_ARM_AUTH_DENIED_REASON_NONE = 1
+MAV_ARM_AUTH_DENIED_REASON_INVALID_WAYPOINT = 2
+MAV_ARM_AUTH_DENIED_REASON_TIMEOUT = 3
+MAV_ARM_AUTH_DENIED_REASON_AIRSPACE_IN_USE = 4
+MAV_ARM_AUTH_DENIED_REASON_BAD_WEATHER = 5
+MAV_ARM_AUTH_DENIED_REASON_ENUM_END = 6
+
+# RC_TYPE
+RC_TYPE_SPEKTRUM = 0
+RC_TYPE_CRSF = 1
+RC_TYPE_ENUM_END = 2
+
+# RC_SUB_TYPE
+RC_SUB_TYPE_SPEKTRUM_DSM2 = 0
+RC_SUB_TYPE_SPEKTRUM_DSMX = 1
+RC_SUB_TYPE_SPEKTRUM_DSMX8 = 2
+RC_SUB_TYPE_ENUM_END = 3
+
+# ENGINE_CONTROL_OPTIONS
+ENGINE_CONTROL_OPTIONS_ALLOW_START_WHILE_DISARMED = 1
+ENGINE_CONTROL_OPTIONS_ENUM_END = 2
+
+# POSITION_TARGET_TYPEMASK
+POSITION_TARGET_TYPEMASK_X_IGNORE = 1
+POSITION_TARGET_TYPEMASK_Y_IGNORE = 2
+POSITION_TARGET_TYPEMASK_Z_IGNORE = 4
+POSITION_TARGET_TYPEMASK_VX_IGNORE = 8
+POSITION_TARGET_TYPEMASK_VY_IGNORE = 16
+POSITION_TARGET_TYPEMASK_VZ_IGNORE = 32
+POSITION_TARGET_TYPEMASK_AX_IGNORE = 64
+POSITION_TARGET_TYPEMASK_AY_IGNORE = 128
+POSITION_TARGET_TYPEMASK_AZ_IGNORE = 256
+POSITION_TARGET_TYPEMASK_FORCE_SET = 512
+POSITION_TARGET_TYPEMASK_YAW_IGNORE = 1024
+POSITION_TARGET_TYPEMASK_YAW_RATE_IGNORE = 2048
+POSITION_TARGET_TYPEMASK_ENUM_END = 2049
+
+# ATTITUDE_TARGET_TYPEMASK
+ATTITUDE_TARGET_TYPEMASK_BODY_ROLL_RATE_IGNORE = 1
+ATTITUDE_TARGET_TYPEMASK_BODY_PITCH_RATE_IGNORE = 2
+ATTITUDE_TARGET_TYPEMASK_BODY_YAW_RATE_IGNORE = 4
+ATTITUDE_TARGET_TYPEMASK_THROTTLE_IGNORE = 64
+ATTITUDE_TARGET_TYPEMASK_ATTITUDE_IGNORE = 128
+ATTITUDE_TARGET_TYPEMASK_ENUM_END = 129
+
+# UTM_FLIGHT_STATE
+UTM_FLIGHT_STATE_UNKNOWN = 1
+UTM_FLIGHT_STATE_GROUND = 2
+UTM_FLIGHT_STATE_AIRBORNE = 3
+UTM_FLIGHT_STATE_EMERGENCY = 16
+UTM_FLIGHT_STATE_NOCTRL = 32
+UTM_FLIGHT_STATE_ENUM_END = 33
+
+# UTM_DATA_AVAIL_FLAGS
+UTM_DATA_AVAIL_FLAGS_TIME_VALID = 1
+UTM_DATA_AVAIL_FLAGS_UAS_ID_AVAILABLE = 2
+UTM_DATA_AVAIL_FLAGS_POSITION_AVAILABLE = 4
+UTM_DATA_AVAIL_FLAGS_ALTITUDE_AVAILABLE = 8
+UTM_DATA_AVAIL_FLAGS_RELATIVE_ALTITUDE_AVAILABLE = 16
+UTM_DATA_AVAIL_FLAGS_HORIZONTAL_VELO_AVAILABLE = 32
+UTM_DATA_AVAIL_FLAGS_VERTICAL_VELO_AVAILABLE = 64
+UTM_DATA_AVAIL_FLAGS_NEXT_WAYPOINT_AVAILABLE = 128
+UTM_DATA_AVAIL_FLAGS_ENUM_END = 129
+
+# PRECISION_LAND_MODE
+PRECISION_LAND_MODE_DISABLED = 0
+PRECISION_LAND_MODE_OPPORTUNISTIC = 1
+PRECISION_LAND_MODE_REQUIRED = 2
+PRECISION_LAND_MODE_ENUM_END = 3
+
+# PARACHUTE_ACTION
+PARACHUTE_DISABLE = 0
+PARACHUTE_ENABLE = 1
+PARACHUTE_RELEASE = 2
+PARACHUTE_ACTION_ENUM_END = 3
+
+# MAV_TUNNEL_PAYLOAD_TYPE
+MAV_TUNNEL_PAYLOAD_TYPE_UNKNOWN = 0
+MAV_TUNNEL_PAYLOAD_TYPE_STORM32_RESERVED0 = 200
+MAV_TUNNEL_PAYLOAD_TYPE_STORM32_RESERVED1 = 201
+MAV_TUNNEL_PAYLOAD_TYPE_STORM32_RESERVED2 = 202
+MAV_TUNNEL_PAYLOAD_TYPE_STORM32_RESERVED3 = 203
+MAV_TUNNEL_PAYLOAD_TYPE_STORM32_RESERVED4 = 204
+MAV_TUNNEL_PAYLOAD_TYPE_STORM32_RESERVED5 = 205
+MAV_TUNNEL_PAYLOAD_TYPE_STORM32_RESERVED6 = 206
+MAV_TUNNEL_PAYLOAD_TYPE_STORM32_RESERVED7 = 207
+MAV_TUNNEL_PAYLOAD_TYPE_STORM32_RESERVED8 = 208
+MAV_TUNNEL_PAYLOAD_TYPE_STORM32_RESERVED9 = 209
+MAV_TUNNEL_PAYLOAD_TYPE_MODALAI_REMOTE_OSD = 210
+MAV_TUNNEL_PAYLOAD_TYPE_MODALAI_ESC_UART_PASSTHRU = 211
+MAV_TUNNEL_PAYLOAD_TYPE_MODALAI_IO_UART_PASSTHRU = 212
+MAV_TUNNEL_PAYLOAD_TYPE_ENUM_END = 213
+
+# MAV_ODID_ID_TYPE
+MAV_ODID_ID_TYPE_NONE = 0
+MAV_ODID_ID_TYPE_SERIAL_NUMBER = 1
+MAV_ODID_ID_TYPE_CAA_REGISTRATION_ID = 2
+MAV_ODID_ID_TYPE_UTM_ASSIGNED_UUID = 3
+MAV_ODID_ID_TYPE_SPECIFIC_SESSION_ID = 4
+MAV_ODID_ID_TYPE_ENUM_END = 5
+
+# MAV_ODID_UA_TYPE
+MAV_ODID_UA_TYPE_NONE = 0
+MAV_ODID_UA_TYPE_AEROPLANE = 1
+MAV_ODID_UA_TYPE_HELICOPTER_OR_MULTIROTOR = 2
+MAV_ODID_UA_TYPE_GYROPLANE = 3
+MAV_ODID_UA_TYPE_HYBRID_LIFT = 4
+MAV_ODID_UA_TYPE_ORNITHOPTER = 5
+MAV_ODID_UA_TYPE_GLIDER = 6
+MAV_ODID_UA_TYPE_KITE = 7
+MAV_ODID_UA_TYPE_FREE_BALLOON = 8
+MAV_ODID_UA_TYPE_CAPTIVE_BALLOON = 9
+MAV_ODID_UA_TYPE_AIRSHIP = 10
+MAV_ODID_UA_TYPE_FREE_FALL_PARACHUTE = 11
+MAV_ODID_UA_TYPE_ROCKET = 12
+MAV_ODID_UA_TYPE_TETHERED_POWERED_AIRCRAFT = 13
+MAV_ODID_UA_TYPE_GROUND_OBSTACLE = 14
+MAV_ODID_UA_TYPE_OTHER = 15
+MAV_ODID_UA_TYPE_ENUM_END = 16
+
+# MAV_ODID_STATUS
+MAV_ODID_STATUS_UNDECLARED = 0
+MAV_ODID_STATUS_GROUND = 1
+MAV_ODID_STATUS_AIRBORNE = 2
+MAV_ODID_STATUS_EMERGENCY = 3
+MAV_ODID_STATUS_REMOTE_ID_SYSTEM_FAILURE = 4
+MAV_ODID_STATUS_ENUM_END = 5
+
+# MAV_ODID_HEIGHT_REF
+MAV_ODID_HEIGHT_REF_OVER_TAKEOFF = 0
+MAV_ODID_HEIGHT_REF_OVER_GROUND = 1
+MAV_ODID_HEIGHT_REF_ENUM_END = 2
+
+# MAV_ODID_HOR_ACC
+MAV_ODID_HOR_ACC_UNKNOWN = 0
+MAV_ODID_HOR_ACC_10NM = 1
+MAV_ODID_HOR_ACC_4NM = 2
+MAV_ODID_HOR_ACC_2NM = 3
+MAV_ODID_HOR_ACC_1NM = 4
+MAV_ODID_HOR_ACC_0_5NM = 5
+MAV_ODID_HOR_ACC_0_3NM = 6
+MAV_ODID_HOR_ACC_0_1NM = 7
+MAV_ODID_HOR_ACC_0_05NM = 8
+MAV_ODID_HOR_ACC_30_METER = 9
+MAV_ODID_HOR_ACC_10_METER = 10
+MAV_ODID_HOR_ACC_3_METER = 11
+MAV_ODID_HOR_ACC_1_METER = 12
+MAV_ODID_HOR_ACC_ENUM_END = 13
+
+# MAV_ODID_VER_ACC
+MAV_ODID_VER_ACC_UNKNOWN = 0
+MAV_ODID_VER_ACC_150_METER = 1
+MAV_ODID_VER_ACC_45_METER = 2
+MAV_ODID_VER_ACC_25_METER = 3
+MAV_ODID_VER_ACC_10_METER = 4
+MAV_ODID_VER_ACC_3_METER = 5
+MAV_ODID_VER_ACC_1_METER = 6
+MAV_ODID_VER_ACC_ENUM_END = 7
+
+# MAV_ODID_SPEED_ACC
+MAV_ODID_SPEED_ACC_UNKNOWN = 0
+MAV_ODID_SPEED_ACC_10_METERS_PER_SECOND = 1
+MAV_ODID_SPEED_ACC_3_METERS_PER_SECOND = 2
+MAV_ODID_SPEED_ACC_1_METERS_PER_SECOND = 3
+MAV_ODID_SPEED_ACC_0_3_METERS_PER_SECOND = 4
+MAV_ODID_SPEED_ACC_ENUM_END = 5
+
+# MAV_ODID_TIME_ACC
+MAV_ODID_TIME_ACC_UNKNOWN = 0
+MAV_ODID_TIME_ACC_0_1_SECOND = 1
+MAV_ODID_TIME_ACC_0_2_SECOND = 2
+MAV_ODID_TIME_ACC_0_3_SECOND = 3
+MAV_ODID_TIME_ACC_0_4_SECOND = 4
+MAV_ODID_TIME_ACC_0_5_SECOND = 5
+MAV_ODID_TIME_ACC_0_6_SECOND = 6
+MAV_ODID_TIME_ACC_0_7_SECOND = 7
+MAV_ODID_TIME_ACC_0_8_SECOND = 8
+MAV_ODID_TIME_ACC_0_9_SECOND = 9
+MAV_ODID_TIME_ACC_1_0_SECOND = 10
+MAV_ODID_TIME_ACC_1_1_SECOND = 11
+MAV_ODID_TIME_ACC_1_2_SECOND = 12
+MAV_ODID_TIME_ACC_1_3_SECOND = 13
+MAV_ODID_TIME_ACC_1_4_SECOND = 14
+MAV_ODID_TIME_ACC_1_5_SECOND = 15
+MAV_ODID_TIME_ACC_ENUM_END = 16
+
+# MAV_ODID_AUTH_TYPE
+MAV_ODID_AUTH_TYPE_NONE = 0
+MAV_ODID_AUTH_TYPE_UAS_ID_SIGNATURE = 1
+MAV_ODID_AUTH_TYPE_OPERATOR_ID_SIGNATURE = 2
+MAV_ODID_AUTH_TYPE_MESSAGE_SET_SIGNATURE = 3
+MAV_ODID_AUTH_TYPE_NETWORK_REMOTE_ID = 4
+MAV_ODID_AUTH_TYPE_SPECIFIC_AUTHENTICATION = 5
+MAV_ODID_AUTH_TYPE_ENUM_END = 6
+
+# MAV_ODID_DESC_TYPE
+MAV_ODID_DESC_TYPE_TEXT = 0
+MAV_ODID_DESC_TYPE_EMERGENCY = 1
+MAV_ODID_DESC_TYPE_EXTENDED_STATUS = 2
+MAV_ODID_DESC_TYPE_ENUM_END = 3
+
+# MAV_ODID_OPERATOR_LOCATION_TYPE
+MAV_ODID_OPERATOR_LOCATION_TYPE_TAKEOFF = 0
+MAV_ODID_OPERATOR_LOCATION_TYPE_LIVE_GNSS = 1
+MAV_ODID_OPERATOR_LOCATION_TYPE_FIXED = 2
+MAV_ODID_OPERATOR_LOCATION_TYPE_ENUM_END = 3
+
+# MAV_ODID_CLASSIFICATION_TYPE
+MAV_ODID_CLASSIFICATION_TYPE_UNDECLARED = 0
+MAV_ODID_CLASSIFICATION_TYPE_EU = 1
+MAV_ODID_CLASSIFICATION_TYPE_ENUM_END = 2
+
+# MAV_ODID_CATEGORY_EU
+MAV_ODID_CATEGORY_EU_UNDECLARED = 0
+MAV_ODID_CATEGORY_EU_OPEN = 1
+MAV_ODID_CATEGORY_EU_SPECIFIC = 2
+MAV_ODID_CATEGORY_EU_CERTIFIED = 3
+MAV_ODID_CATEGORY_EU_ENUM_END = 4
+
+# MAV_ODID_CLASS_EU
+MAV_ODID_CLASS_EU_UNDECLARED = 0
+MAV_ODID_CLASS_EU_CLASS_0 = 1
+MAV_ODID_CLASS_EU_CLASS_1 = 2
+MAV_ODID_CLASS_EU_CLASS_2 = 3
+MAV_ODID_CLASS_EU_CLASS_3 = 4
+MAV_ODID_CLASS_EU_CLASS_4 = 5
+MAV_ODID_CLASS_EU_CLASS_5 = 6
+MAV_ODID_CLASS_EU_CLASS_6 = 7
+MAV_ODID_CLASS_EU_ENUM_END = 8
+
+# MAV_ODID_OPERATOR_ID_TYPE
+MAV_ODID_OPERATOR_ID_TYPE_CAA = 0
+MAV_ODID_OPERATOR_ID_TYPE_ENUM_END = 1
+
+# MAV_ODID_ARM_STATUS
+MAV_ODID_ARM_STATUS_GOOD_TO_ARM = 0
+MAV_ODID_ARM_STATUS_PRE_ARM_FAIL_GENERIC = 1
+MAV_ODID_ARM_STATUS_ENUM_END = 2
+
+# AIS_TYPE
+AIS_TYPE_UNKNOWN = 0
+AIS_TYPE_RESERVED_1 = 1
+AIS_TYPE_RESERVED_2 = 2
+AIS_TYPE_RESERVED_3 = 3
+AIS_TYPE_RESERVED_4 = 4
+AIS_TYPE_RESERVED_5 = 5
+AIS_TYPE_RESERVED_6 = 6
+AIS_TYPE_RESERVED_7 = 7
+AIS_TYPE_RESERVED_8 = 8
+AIS_TYPE_RESERVED_9 = 9
+AIS_TYPE_RESERVED_10 = 10
+AIS_TYPE_RESERVED_11 = 11
+AIS_TYPE_RESERVED_12 = 12
+AIS_TYPE_RESERVED_13 = 13
+AIS_TYPE_RESERVED_14 = 14
+AIS_TYPE_RESERVED_15 = 15
+AIS_TYPE_RESERVED_16 = 16
+AIS_TYPE_RESERVED_17 = 17
+AIS_TYPE_RESERVED_18 = 18
+AIS_TYPE_RESERVED_19 = 19
+AIS_TYPE_WIG = 20
+AIS_TYPE_WIG_HAZARDOUS_A = 21
+AIS_TYPE_WIG_HAZARDOUS_B = 22
+AIS_TYPE_WIG_HAZARDOUS_C = 23
+AIS_TYPE_WIG_HAZARDOUS_D = 24
+AIS_TYPE_WIG_RESERVED_1 = 25
+AIS_TYPE_WIG_RESERVED_2 = 26
+AIS_TYPE_WIG_RESERVED_3 = 27
+AIS_TYPE_WIG_RESERVED_4 = 28
+AIS_TYPE_WIG_RESERVED_5 = 29
+AIS_TYPE_FISHING = 30
+AIS_TYPE_TOWING = 31
+AIS_TYPE_TOWING_LARGE = 32
+AIS_TYPE_DREDGING = 33
+AIS_TYPE_DIVING = 34
+AIS_TYPE_MILITARY = 35
+AIS_TYPE_SAILING = 36
+AIS_TYPE_PLEASURE = 37
+AIS_TYPE_RESERVED_20 = 38
+AIS_TYPE_RESERVED_21 = 39
+AIS_TYPE_HSC = 40
+AIS_TYPE_HSC_HAZARDOUS_A = 41
+AIS_TYPE_HSC_HAZARDOUS_B = 42
+AIS_TYPE_HSC_HAZARDOUS_C = 43
+AIS_TYPE_HSC_HAZARDOUS_D = 44
+AIS_TYPE_HSC_RESERVED_1 = 45
+AIS_TYPE_HSC_RESERVED_2 = 46
+AIS_TYPE_HSC_RESERVED_3 = 47
+AIS_TYPE_HSC_RESERVED_4 = 48
+AIS_TYPE_HSC_UNKNOWN = 49
+AIS_TYPE_PILOT = 50
+AIS_TYPE_SAR = 51
+AIS_TYPE_TUG = 52
+AIS_TYPE_PORT_TENDER = 53
+AIS_TYPE_ANTI_POLLUTION = 54
+AIS_TYPE_LAW_ENFORCEMENT = 55
+AIS_TYPE_SPARE_LOCAL_1 = 56
+AIS_TYPE_SPARE_LOCAL_2 = 57
+AIS_TYPE_MEDICAL_TRANSPORT = 58
+AIS_TYPE_NONECOMBATANT = 59
+AIS_TYPE_PASSENGER = 60
+AIS_TYPE_PASSENGER_HAZARDOUS_A = 61
+AIS_TYPE_PASSENGER_HAZARDOUS_B = 62
+AIS_TYPE_PASSENGER_HAZARDOUS_C = 63
+AIS_TYPE_PASSENGER_HAZARDOUS_D = 64
+AIS_TYPE_PASSENGER_RESERVED_1 = 65
+AIS_TYPE_PASSENGER_RESERVED_2 = 66
+AIS_TYPE_PASSENGER_RESERVED_3 = 67
+AIS_TYPE_PASSENGER_RESERVED_4 = 68
+AIS_TYPE_PASSENGER_UNKNOWN = 69
+AIS_TYPE_CARGO = 70
+AIS_TYPE_CARGO_HAZARDOUS_A = 71
+AIS_TYPE_CARGO_HAZARDOUS_B = 72
+AIS_TYPE_CARGO_HAZARDOUS_C = 73
+AIS_TYPE_CARGO_HAZARDOUS_D = 74
+AIS_TYPE_CARGO_RESERVED_1 = 75
+AIS_TYPE_CARGO_RESERVED_2 = 76
+AIS_TYPE_CARGO_RESERVED_3 = 77
+AIS_TYPE_CARGO_RESERVED_4 = 78
+AIS_TYPE_CARGO_UNKNOWN = 79
+AIS_TYPE_TANKER = 80
+AIS_TYPE_TANKER_HAZARDOUS_A = 81
+AIS_TYPE_TANKER_HAZARDOUS_B = 82
+AIS_TYPE_TANKER_HAZARDOUS_C = 83
+AIS_TYPE_TANKER_HAZARDOUS_D = 84
+AIS_TYPE_TANKER_RESERVED_1 = 85
+AIS_TYPE_TANKER_RESERVED_2 = 86
+AIS_TYPE_TANKER_RESERVED_3 = 87
+AIS_TYPE_TANKER_RESERVED_4 = 88
+AIS_TYPE_TANKER_UNKNOWN = 89
+AIS_TYPE_OTHER = 90
+AIS_TYPE_OTHER_HAZARDOUS_A = 91
+AIS_TYPE_OTHER_HAZARDOUS_B = 92
+AIS_TYPE_OTHER_HAZARDOUS_C = 93
+AIS_TYPE_OTHER_HAZARDOUS_D = 94
+AIS_TYPE_OTHER_RESERVED_1 = 95
+AIS_TYPE_OTHER_RESERVED_2 = 96
+AIS_TYPE_OTHER_RESERVED_3 = 97
+AIS_TYPE_OTHER_RESERVED_4 = 98
+AIS_TYPE_OTHER_UNKNOWN = 99
+AIS_TYPE_ENUM_END = 100
+
+# AIS_NAV_STATUS
+AIS_NAV_STATUS_UNDER_WAY = 0
+AIS_NAV_STATUS_ANCHORED = 1
+AIS_NAV_STATUS_UN_COMMANDED = 2
+AIS_NAV_STATUS_RESTRICTED_MANOEUVERABILITY = 3
+AIS_NAV_STATUS_DRAUGHT_CONSTRAINED = 4
+AIS_NAV_STATUS_MOORED = 5
+AIS_NAV_STATUS_AGROUND = 6
+AIS_NAV_STATUS_FISHING = 7
+AIS_NAV_STATUS_SAILING = 8
+AIS_NAV_STATUS_RESERVED_HSC = 9
+AIS_NAV_STATUS_RESERVED_WIG = 10
+AIS_NAV_STATUS_RESERVED_1 = 11
+AIS_NAV_STATUS_RESERVED_2 = 12
+AIS_NAV_STATUS_RESERVED_3 = 13
+AIS_NAV_STATUS_AIS_SART = 14
+AIS_NAV_STATUS_UNKNOWN = 15
+AIS_NAV_STATUS_ENUM_END = 16
+
+# AIS_FLAGS
+AIS_FLAGS_POSITION_ACCURACY = 1
+AIS_FLAGS_VALID_COG = 2
+AIS_FLAGS_VALID_VELOCITY = 4
+AIS_FLAGS_HIGH_VELOCITY = 8
+AIS_FLAGS_VALID_TURN_RATE = 16
+AIS_FLAGS_TURN_RATE_SIGN_ONLY = 32
+AIS_FLAGS_VALID_DIMENSIONS = 64
+AIS_FLAGS_LARGE_BOW_DIMENSION = 128
+AIS_FLAGS_LARGE_STERN_DIMENSION = 256
+AIS_FLAGS_LARGE_PORT_DIMENSION = 512
+AIS_FLAGS_LARGE_STARBOARD_DIMENSION = 1024
+AIS_FLAGS_VALID_CALLSIGN = 2048
+AIS_FLAGS_VALID_NAME = 4096
+AIS_FLAGS_ENUM_END = 4097
+
+# FAILURE_UNIT
+FAILURE_UNIT_SENSOR_GYRO = 0
+FAILURE_UNIT_SENSOR_ACCEL = 1
+FAILURE_UNIT_SENSOR_MAG = 2
+FAILURE_UNIT_SENSOR_BARO = 3
+FAILURE_UNIT_SENSOR_GPS = 4
+FAILURE_UNIT_SENSOR_OPTICAL_FLOW = 5
+FAILURE_UNIT_SENSOR_VIO = 6
+FAILURE_UNIT_SENSOR_DISTANCE_SENSOR = 7
+FAILURE_UNIT_SENSOR_AIRSPEED = 8
+FAILURE_UNIT_SYSTEM_BATTERY = 100
+FAILURE_UNIT_SYSTEM_MOTOR = 101
+FAILURE_UNIT_SYSTEM_SERVO = 102
+FAILURE_UNIT_SYSTEM_AVOIDANCE = 103
+FAILURE_UNIT_SYSTEM_RC_SIGNAL = 104
+FAILURE_UNIT_SYSTEM_MAVLINK_SIGNAL = 105
+FAILURE_UNIT_ENUM_END = 106
+
+# FAILURE_TYPE
+FAILURE_TYPE_OK = 0
+FAILURE_TYPE_OFF = 1
+FAILURE_TYPE_STUCK = 2
+FAILURE_TYPE_GARBAGE = 3
+FAILURE_TYPE_WRONG = 4
+FAILURE_TYPE_SLOW = 5
+FAILURE_TYPE_DELAYED = 6
+FAILURE_TYPE_INTERMITTENT = 7
+FAILURE_TYPE_ENUM_END = 8
+
+# NAV_VTOL_LAND_OPTIONS
+NAV_VTOL_LAND_OPTIONS_DEFAULT = 0
+NAV_VTOL_LAND_OPTIONS_FW_SPIRAL_APPROACH = 1
+NAV_VTOL_LAND_OPTIONS_FW_APPROACH = 2
+NAV_VTOL_LAND_OPTIONS_ENUM_END = 3
+
+# MAV_WINCH_STATUS_FLAG
+MAV_WINCH_STATUS_HEALTHY = 1
+MAV_WINCH_STATUS_FULLY_RETRACTED = 2
+MAV_WINCH_STATUS_MOVING = 4
+MAV_WINCH_STATUS_CLUTCH_ENGAGED = 8
+MAV_WINCH_STATUS_FLAG_ENUM_END = 9
+
+# MAG_CAL_STATUS
+MAG_CAL_NOT_STARTED = 0
+MAG_CAL_WAITING_TO_START = 1
+MAG_CAL_RUNNING_STEP_ONE = 2
+MAG_CAL_RUNNING_STEP_TWO = 3
+MAG_CAL_SUCCESS = 4
+MAG_CAL_FAILED = 5
+MAG_CAL_FAILED_ORIENTATION = 6
+MAG_CAL_FAILED_RADIUS = 7
+MAG_CAL_FAILED_OFFSETS = 8
+MAG_CAL_FAILED_DIAG_SCALING = 9
+MAG_CAL_FAILED_RESIDUALS_HIGH = 10
+MAG_CAL_STATUS_ENUM_END = 11
+
+# HIL_SENSOR_UPDATED_FLAGS
+HIL_SENSOR_UPDATED_XACC = 1
+HIL_SENSOR_UPDATED_YACC = 2
+HIL_SENSOR_UPDATED_ZACC = 4
+HIL_SENSOR_UPDATED_XGYRO = 8
+HIL_SENSOR_UPDATED_YGYRO = 16
+HIL_SENSOR_UPDATED_ZGYRO = 32
+HIL_SENSOR_UPDATED_XMAG = 64
+HIL_SENSOR_UPDATED_YMAG = 128
+HIL_SENSOR_UPDATED_ZMAG = 256
+HIL_SENSOR_UPDATED_ABS_PRESSURE = 512
+HIL_SENSOR_UPDATED_DIFF_PRESSURE = 1024
+HIL_SENSOR_UPDATED_PRESSURE_ALT = 2048
+HIL_SENSOR_UPDATED_TEMPERATURE = 4096
+HIL_SENSOR_UPDATED_RESET = 2147483648
+HIL_SENSOR_UPDATED_FLAGS_ENUM_END = 2147483649
+
+# HIGHRES_IMU_UPDATED_FLAGS
+HIGHRES_IMU_UPDATED_XACC = 1
+HIGHRES_IMU_UPDATED_YACC = 2
+HIGHRES_IMU_UPDATED_ZACC = 4
+HIGHRES_IMU_UPDATED_XGYRO = 8
+HIGHRES_IMU_UPDATED_YGYRO = 16
+HIGHRES_IMU_UPDATED_ZGYRO = 32
+HIGHRES_IMU_UPDATED_XMAG = 64
+HIGHRES_IMU_UPDATED_YMAG = 128
+HIGHRES_IMU_UPDATED_ZMAG = 256
+HIGHRES_IMU_UPDATED_ABS_PRESSURE = 512
+HIGHRES_IMU_UPDATED_DIFF_PRESSURE = 1024
+HIGHRES_IMU_UPDATED_PRESSURE_ALT = 2048
+HIGHRES_IMU_UPDATED_TEMPERATURE = 4096
+HIGHRES_IMU_UPDATED_FLAGS_ENUM_END = 4097
+
+# CAN_FILTER_OP
+CAN_FILTER_REPLACE = 0
+CAN_FILTER_ADD = 1
+CAN_FILTER_REMOVE = 2
+CAN_FILTER_OP_ENUM_END = 3
+
+# MAV_FTP_ERR
+MAV_FTP_ERR_NONE = 0
+MAV_FTP_ERR_FAIL = 1
+MAV_FTP_ERR_FAILERRNO = 2
+MAV_FTP_ERR_INVALIDDATASIZE = 3
+MAV_FTP_ERR_INVALIDSESSION = 4
+MAV_FTP_ERR_NOSESSIONSAVAILABLE = 5
+MAV_FTP_ERR_EOF = 6
+MAV_FTP_ERR_UNKNOWNCOMMAND = 7
+MAV_FTP_ERR_FILEEXISTS = 8
+MAV_FTP_ERR_FILEPROTECTED = 9
+MAV_FTP_ERR_FILENOTFOUND = 10
+MAV_FTP_ERR_ENUM_END = 11
+
+# MAV_FTP_OPCODE
+MAV_FTP_OPCODE_NONE = 0
+MAV_FTP_OPCODE_TERMINATESESSION = 1
+MAV_FTP_OPCODE_RESETSESSION = 2
+MAV_FTP_OPCODE_LISTDIRECTORY = 3
+MAV_FTP_OPCODE_OPENFILERO = 4
+MAV_FTP_OPCODE_READFILE = 5
+MAV_FTP_OPCODE_CREATEFILE = 6
+MAV_FTP_OPCODE_WRITEFILE = 7
+MAV_FTP_OPCODE_REMOVEFILE = 8
+MAV_FTP_OPCODE_CREATEDIRECTORY = 9
+MAV_FTP_OPCODE_REMOVEDIRECTORY = 10
+MAV_FTP_OPCODE_OPENFILEWO = 11
+MAV_FTP_OPCODE_TRUNCATEFILE = 12
+MAV_FTP_OPCODE_RENAME = 13
+MAV_FTP_OPCODE_CALCFILECRC = 14
+MAV_FTP_OPCODE_BURSTREADFILE = 15
+MAV_FTP_OPCODE_ACK = 128
+MAV_FTP_OPCODE_NAK = 129
+MAV_FTP_OPCODE_ENUM_END = 130
+
+# MISSION_STATE
+MISSION_STATE_UNKNOWN = 0
+MISSION_STATE_NO_MISSION = 1
+MISSION_STATE_NOT_STARTED = 2
+MISSION_STATE_ACTIVE = 3
+MISSION_STATE_PAUSED = 4
+MISSION_STATE_COMPLETE = 5
+MISSION_STATE_ENUM_END = 6
+
+# SAFETY_SWITCH_STATE
+SAFETY_SWITCH_STATE_SAFE = 0
+SAFETY_SWITCH_STATE_DANGEROUS = 1
+SAFETY_SWITCH_STATE_ENUM_END = 2
+
+# ILLUMINATOR_MODE
+ILLUMINATOR_MODE_UNKNOWN = 0
+ILLUMINATOR_MODE_INTERNAL_CONTROL = 1
+ILLUMINATOR_MODE_EXTERNAL_SYNC = 2
+ILLUMINATOR_MODE_ENUM_END = 3
+
+# ILLUMINATOR_ERROR_FLAGS
+ILLUMINATOR_ERROR_FLAGS_THERMAL_THROTTLING = 1
+ILLUMINATOR_ERROR_FLAGS_OVER_TEMPERATURE_SHUTDOWN = 2
+ILLUMINATOR_ERROR_FLAGS_THERMISTOR_FAILURE = 4
+ILLUMINATOR_ERROR_FLAGS_ENUM_END = 5
+
+# MAV_STANDARD_MODE
+MAV_STANDARD_MODE_NON_STANDARD = 0
+MAV_STANDARD_MODE_POSITION_HOLD = 1
+MAV_STANDARD_MODE_ORBIT = 2
+MAV_STANDARD_MODE_CRUISE = 3
+MAV_STANDARD_MODE_ALTITUDE_HOLD = 4
+MAV_STANDARD_MODE_SAFE_RECOVERY = 5
+MAV_STANDARD_MODE_MISSION = 6
+MAV_STANDARD_MODE_LAND = 7
+MAV_STANDARD_MODE_TAKEOFF = 8
+MAV_STANDARD_MODE_ENUM_END = 9
+
+# HIL_ACTUATOR_CONTROLS_FLAGS
+HIL_ACTUATOR_CONTROLS_FLAGS_LOCKSTEP = 1
+HIL_ACTUATOR_CONTROLS_FLAGS_ENUM_END = 2
+
+# COMPUTER_STATUS_FLAGS
+COMPUTER_STATUS_FLAGS_UNDER_VOLTAGE = 1
+COMPUTER_STATUS_FLAGS_CPU_THROTTLE = 2
+COMPUTER_STATUS_FLAGS_THERMAL_THROTTLE = 4
+COMPUTER_STATUS_FLAGS_DISK_FULL = 8
+COMPUTER_STATUS_FLAGS_ENUM_END = 9
+
+# AIRSPEED_SENSOR_FLAGS
+AIRSPEED_SENSOR_UNHEALTHY = 1
+AIRSPEED_SENSOR_USING = 2
+AIRSPEED_SENSOR_FLAGS_ENUM_END = 3
+
+# GLOBAL_POSITION_SRC
+GLOBAL_POSITION_SRC_UNKNOWN = 0
+GLOBAL_POSITION_SRC_GNSS = 1
+GLOBAL_POSITION_SRC_VISION = 2
+GLOBAL_POSITION_SRC_PSEUDOLITES = 3
+GLOBAL_POSITION_SRC_TERRAIN = 4
+GLOBAL_POSITION_SRC_MAGNETIC = 5
+GLOBAL_POSITION_SRC_ESTIMATOR = 6
+GLOBAL_POSITION_SRC_ENUM_END = 7
+
+# GLOBAL_POSITION_FLAGS
+GLOBAL_POSITION_UNHEALTHY = 1
+GLOBAL_POSITION_PRIMARY = 2
+GLOBAL_POSITION_FLAGS_ENUM_END = 3
+
+# RADIO_RC_CHANNELS_FLAGS
+RADIO_RC_CHANNELS_FLAGS_FAILSAFE = 1
+RADIO_RC_CHANNELS_FLAGS_OUTDATED = 2
+RADIO_RC_CHANNELS_FLAGS_ENUM_END = 3
+
+# MAV_MODE_PROPERTY
+MAV_MODE_PROPERTY_ADVANCED = 1
+MAV_MODE_PROPERTY_NOT_USER_SELECTABLE = 2
+MAV_MODE_PROPERTY_ENUM_END = 3
+
+# GPS_SYSTEM_ERROR_FLAGS
+GPS_SYSTEM_ERROR_INCOMING_CORRECTIONS = 1
+GPS_SYSTEM_ERROR_CONFIGURATION = 2
+GPS_SYSTEM_ERROR_SOFTWARE = 4
+GPS_SYSTEM_ERROR_ANTENNA = 8
+GPS_SYSTEM_ERROR_EVENT_CONGESTION = 16
+GPS_SYSTEM_ERROR_CPU_OVERLOAD = 32
+GPS_SYSTEM_ERROR_OUTPUT_CONGESTION = 64
+GPS_SYSTEM_ERROR_FLAGS_ENUM_END = 65
+
+# GPS_AUTHENTICATION_STATE
+GPS_AUTHENTICATION_STATE_UNKNOWN = 0
+GPS_AUTHENTICATION_STATE_INITIALIZING = 1
+GPS_AUTHENTICATION_STATE_ERROR = 2
+GPS_AUTHENTICATION_STATE_OK = 3
+GPS_AUTHENTICATION_STATE_DISABLED = 4
+GPS_AUTHENTICATION_STATE_ENUM_END = 5
+
+# GPS_JAMMING_STATE
+GPS_JAMMING_STATE_UNKNOWN = 0
+GPS_JAMMING_STATE_NOT_JAMMED = 1
+GPS_JAMMING_STATE_MITIGATED = 2
+GPS_JAMMING_STATE_DETECTED = 3
+GPS_JAMMING_STATE_ENUM_END = 4
+
+# GPS_SPOOFING_STATE
+GPS_SPOOFING_STATE_UNKNOWN = 0
+GPS_SPOOFING_STATE_NOT_SPOOFED = 1
+GPS_SPOOFING_STATE_MITIGATED = 2
+GPS_SPOOFING_STATE_DETECTED = 3
+GPS_SPOOFING_STATE_ENUM_END = 4
+
+# GPS_RAIM_STATE
+GPS_RAIM_STATE_UNKNOWN = 0
+GPS_RAIM_STATE_DISABLED = 1
+GPS_RAIM_STATE_OK = 2
+GPS_RAIM_STATE_FAILED = 3
+GPS_RAIM_STATE_ENUM_END = 4
+
+# RANGING_BEACON_ALT_TYPE
+RANGING_BEACON_ALT_TYPE_WGS84 = 0
+RANGING_BEACON_ALT_TYPE_MSL = 1
+RANGING_BEACON_ALT_TYPE_ENUM_END = 2
+
+# RANGING_BEACON_STATUS_FLAG
+RANGING_BEACON_STATUS_FLAG_STATION_SIGNAL_POOR = 1
+RANGING_BEACON_STATUS_FLAG_ENUM_END = 2
+
+# ICAROUS_TRACK_BAND_TYPES
+ICAROUS_TRACK_BAND_TYPE_NONE = 0
+ICAROUS_TRACK_BAND_TYPE_NEAR = 1
+ICAROUS_TRACK_BAND_TYPE_RECOVERY = 2
+ICAROUS_TRACK_BAND_TYPES_ENUM_END = 3
+
+# ICAROUS_FMS_STATE
+ICAROUS_FMS_STATE_IDLE = 0
+ICAROUS_FMS_STATE_TAKEOFF = 1
+ICAROUS_FMS_STATE_CLIMB = 2
+ICAROUS_FMS_STATE_CRUISE = 3
+ICAROUS_FMS_STATE_APPROACH = 4
+ICAROUS_FMS_STATE_LAND = 5
+ICAROUS_FMS_STATE_ENUM_END = 6
+
+# MAV_AUTOPILOT
+enums["MAV_AUTOPILOT"] = Enum()
+enums["MAV_AUTOPILOT"].bitmask = False
+MAV_AUTOPILOT_GENERIC = 0
+enums["MAV_AUTOPILOT"][0] = EnumEntry("MAV_AUTOPILOT_GENERIC", """""")
+MAV_AUTOPILOT_RESERVED = 1
+enums["MAV_AUTOPILOT"][1] = EnumEntry("MAV_AUTOPILOT_RESERVED", """""")
+MAV_AUTOPILOT_SLUGS = 2
+enums["MAV_AUTOPILOT"][2] = EnumEntry("MAV_AUTOPILOT_SLUGS", """""")
+MAV_AUTOPILOT_ARDUPILOTMEGA = 3
+enums["MAV_AUTOPILOT"][3] = EnumEntry("MAV_AUTOPILOT_ARDUPILOTMEGA", """""")
+MAV_AUTOPILOT_OPENPILOT = 4
+enums["MAV_AUTOPILOT"][4] = EnumEntry("MAV_AUTOPILOT_OPENPILOT", """""")
+MAV_AUTOPILOT_GENERIC_WAYPOINTS_ONLY = 5
+enums["MAV_AUTOPILOT"][5] = EnumEntry("MAV_AUTOPILOT_GENERIC_WAYPOINTS_ONLY", """""")
+MAV_AUTOPILOT_GENERIC_WAYPOINTS_AND_SIMPLE_NAVIGATION_ONLY = 6
+enums["MAV_AUTOPILOT"][6] = EnumEntry("MAV_AUTOPILOT_GENERIC_WAYPOINTS_AND_SIMPLE_NAVIGATION_ONLY", """""")
+MAV_AUTOPILOT_GENERIC_MISSION_FULL = 7
+enums["MAV_AUTOPILOT"][7] = EnumEntry("MAV_AUTOPILOT_GENERIC_MISSION_FULL", """""")
+MAV_AUTOPILOT_INVALID = 8
+enums["MAV_AUTOPILOT"][8] = EnumEntry("MAV_AUTOPILOT_INVALID", """""")
+MAV_AUTOPILOT_PPZ = 9
+enums["MAV_AUTOPILOT"][9] = EnumEntry("MAV_AUTOPILOT_PPZ", """""")
+MAV_AUTOPILOT_UDB = 10
+enums["MAV_AUTOPILOT"][10] = EnumEntry("MAV_AUTOPILOT_UDB", """""")
+MAV_AUTOPILOT_FP = 11
+enums["MAV_AUTOPILOT"][11] = EnumEntry("MAV_AUTOPILOT_FP", """""")
+MAV_AUTOPILOT_PX4 = 12
+enums["MAV_AUTOPILOT"][12] = EnumEntry("MAV_AUTOPILOT_PX4", """""")
+MAV_AUTOPILOT_SMACCMPILOT = 13
+enums["MAV_AUTOPILOT"][13] = EnumEntry("MAV_AUTOPILOT_SMACCMPILOT", """""")
+MAV_AUTOPILOT_AUTOQUAD = 14
+enums["MAV_AUTOPILOT"][14] = EnumEntry("MAV_AUTOPILOT_AUTOQUAD", """""")
+MAV_AUTOPILOT_ARMAZILA = 15
+enums["MAV_AUTOPILOT"][15] = EnumEntry("MAV_AUTOPILOT_ARMAZILA", """""")
+MAV_AUTOPILOT_AEROB = 16
+enums["MAV_AUTOPILOT"][16] = EnumEntry("MAV_AUTOPILOT_AEROB", """""")
+MAV_AUTOPILOT_ASLUAV = 17
+enums["MAV_AUTOPILOT"][17] = EnumEntry("MAV_AUTOPILOT_ASLUAV", """""")
+MAV_AUTOPILOT_SMARTAP = 18
+enums["MAV_AUTOPILOT"][18] = EnumEntry("MAV_AUTOPILOT_SMARTAP", """""")
+MAV_AUTOPILOT_AIRRAILS = 19
+enums["MAV_AUTOPILOT"][19] = EnumEntry("MAV_AUTOPILOT_AIRRAILS", """""")
+MAV_AUTOPILOT_REFLEX = 20
+enums["MAV_AUTOPILOT"][20] = EnumEntry("MAV_AUTOPILOT_REFLEX", """""")
+MAV_AUTOPILOT_ENUM_END = 21
+enums["MAV_AUTOPILOT"][21] = EnumEntry("MAV_AUTOPILOT_ENUM_END", """""")
+
+# MAV_TYPE
+enums["MAV_TYPE"] = Enum()
+enums["MAV_TYPE"].bitmask = False
+MAV_TYPE_GENERIC = 0
+enums["MAV_TYPE"][0] = EnumEntry("MAV_TYPE_GENERIC", """""")
+MAV_TYPE_FIXED_WING = 1
+enums["MAV_TYPE"][1] = EnumEntry("MAV_TYPE_FIXED_WING", """""")
+MAV_TYPE_QUADROTOR = 2
+enums["MAV_TYPE"][2] = EnumEntry("MAV_TYPE_QUADROTOR", """""")
+MAV_TYPE_COAXIAL = 3
+enums["MAV_TYPE"][3] = EnumEntry("MAV_TYPE_COAXIAL", """""")
+MAV_TYPE_HELICOPTER = 4
+enums["MAV_TYPE"][4] = EnumEntry("MAV_TYPE_HELICOPTER", """""")
+MAV_TYPE_ANTENNA_TRACKER = 5
+enums["MAV_TYPE"][5] = EnumEntry("MAV_TYPE_ANTENNA_TRACKER", """""")
+MAV_TYPE_GCS = 6
+enums["MAV_TYPE"][6] = EnumEntry("MAV_TYPE_GCS", """""")
+MAV_TYPE_AIRSHIP = 7
+enums["MAV_TYPE"][7] = EnumEntry("MAV_TYPE_AIRSHIP", """""")
+MAV_TYPE_FREE_BALLOON = 8
+enums["MAV_TYPE"][8] = EnumEntry("MAV_TYPE_FREE_BALLOON", """""")
+MAV_TYPE_ROCKET = 9
+enums["MAV_TYPE"][9] = EnumEntry("MAV_TYPE_ROCKET", """""")
+MAV_TYPE_GROUND_ROVER = 10
+enums["MAV_TYPE"][10] = EnumEntry("MAV_TYPE_GROUND_ROVER", """""")
+MAV_TYPE_SURFACE_BOAT = 11
+enums["MAV_TYPE"][11] = EnumEntry("MAV_TYPE_SURFACE_BOAT", """""")
+MAV_TYPE_SUBMARINE = 12
+enums["MAV_TYPE"][12] = EnumEntry("MAV_TYPE_SUBMARINE", """""")
+MAV_TYPE_HEXAROTOR = 13
+enums["MAV_TYPE"][13] = EnumEntry("MAV_TYPE_HEXAROTOR", """""")
+MAV_TYPE_OCTOROTOR = 14
+enums["MAV_TYPE"][14] = EnumEntry("MAV_TYPE_OCTOROTOR", """""")
+MAV_TYPE_TRICOPTER = 15
+enums["MAV_TYPE"][15] = EnumEntry("MAV_TYPE_TRICOPTER", """""")
+MAV_TYPE_FLAPPING_WING = 16
+enums["MAV_TYPE"][16] = EnumEntry("MAV_TYPE_FLAPPING_WING", """""")
+MAV_TYPE_KITE = 17
+enums["MAV_TYPE"][17] = EnumEntry("MAV_TYPE_KITE", """""")
+MAV_TYPE_ONBOARD_CONTROLLER = 18
+enums["MAV_TYPE"][18] = EnumEntry("MAV_TYPE_ONBOARD_CONTROLLER", """""")
+MAV_TYPE_VTOL_DUOROTOR = 19
+enums["MAV_TYPE"][19] = EnumEntry("MAV_TYPE_VTOL_DUOROTOR", """""")
+MAV_TYPE_VTOL_QUADROTOR = 20
+enums["MAV_TYPE"][20] = EnumEntry("MAV_TYPE_VTOL_QUADROTOR", """""")
+MAV_TYPE_VTOL_TILTROTOR = 21
+enums["MAV_TYPE"][21] = EnumEntry("MAV_TYPE_VTOL_TILTROTOR", """""")
+MAV_TYPE_VTOL_RESERVED2 = 22
+enums["MAV_TYPE"][22] = EnumEntry("MAV_TYPE_VTOL_RESERVED2", """""")
+MAV_TYPE_VTOL_RESERVED3 = 23
+enums["MAV_TYPE"][23] = EnumEntry("MAV_TYPE_VTOL_RESERVED3", """""")
+MAV_TYPE_VTOL_RESERVED4 = 24
+enums["MAV_TYPE"][24] = EnumEntry("MAV_TYPE_VTOL_RESERVED4", """""")
+MAV_TYPE_VTOL_RESERVED5 = 25
+enums["MAV_TYPE"][25] = EnumEntry("MAV_TYPE_VTOL_RESERVED5", """""")
+MAV_TYPE_GIMBAL = 26
+enums["MAV_TYPE"][26] = EnumEntry("MAV_TYPE_GIMBAL", """""")
+MAV_TYPE_ADSB = 27
+enums["MAV_TYPE"][27] = EnumEntry("MAV_TYPE_ADSB", """""")
+MAV_TYPE_PARAFOIL = 28
+enums["MAV_TYPE"][28] = EnumEntry("MAV_TYPE_PARAFOIL", """""")
+MAV_TYPE_DODECAROTOR = 29
+enums["MAV_TYPE"][29] = EnumEntry("MAV_TYPE_DODECAROTOR", """""")
+MAV_TYPE_CAMERA = 30
+enums["MAV_TYPE"][30] = EnumEntry("MAV_TYPE_CAMERA", """""")
+MAV_TYPE_CHARGING_STATION = 31
+enums["MAV_TYPE"][31] = EnumEntry("MAV_TYPE_CHARGING_STATION", """""")
+MAV_TYPE_FLARM = 32
+enums["MAV_TYPE"][32] = EnumEntry("MAV_TYPE_FLARM", """""")
+MAV_TYPE_SERVO = 33
+enums["MAV_TYPE"][33] = EnumEntry("MAV_TYPE_SERVO", """""")
+MAV_TYPE_ODID = 34
+enums["MAV_TYPE"][34] = EnumEntry("MAV_TYPE_ODID", """""")
+MAV_TYPE_DECAROTOR = 35
+enums["MAV_TYPE"][35] = EnumEntry("MAV_TYPE_DECAROTOR", """""")
+MAV_TYPE_BATTERY = 36
+enums["MAV_TYPE"][36] = EnumEntry("MAV_TYPE_BATTERY", """""")
+MAV_TYPE_PARACHUTE = 37
+enums["MAV_TYPE"][37] = EnumEntry("MAV_TYPE_PARACHUTE", """""")
+MAV_TYPE_LOG = 38
+enums["MAV_TYPE"][38] = EnumEntry("MAV_TYPE_LOG", """""")
+MAV_TYPE_OSD = 39
+enums["MAV_TYPE"][39] = EnumEntry("MAV_TYPE_OSD", """""")
+MAV_TYPE_IMU = 40
+enums["MAV_TYPE"][40] = EnumEntry("MAV_TYPE_IMU", """""")
+MAV_TYPE_GPS = 41
+enums["MAV_TYPE"][41] = EnumEntry("MAV_TYPE_GPS", """""")
+MAV_TYPE_WINCH = 42
+enums["MAV_TYPE"][42] = EnumEntry("MAV_TYPE_WINCH", """""")
+MAV_TYPE_GENERIC_MULTIROTOR = 43
+enums["MAV_TYPE"][43] = EnumEntry("MAV_TYPE_GENERIC_MULTIROTOR", """""")
+MAV_TYPE_ILLUMINATOR = 44
+enums["MAV_TYPE"][44] = EnumEntry("MAV_TYPE_ILLUMINATOR", """""")
+MAV_TYPE_SPACECRAFT_ORBITER = 45
+enums["MAV_TYPE"][45] = EnumEntry("MAV_TYPE_SPACECRAFT_ORBITER", """""")
+MAV_TYPE_GROUND_QUADRUPED = 46
+enums["MAV_TYPE"][46] = EnumEntry("MAV_TYPE_GROUND_QUADRUPED", """""")
+MAV_TYPE_VTOL_GYRODYNE = 47
+enums["MAV_TYPE"][47] = EnumEntry("MAV_TYPE_VTOL_GYRODYNE", """""")
+MAV_TYPE_GRIPPER = 48
+enums["MAV_TYPE"][48] = EnumEntry("MAV_TYPE_GRIPPER", """""")
+MAV_TYPE_ENUM_END = 49
+enums["MAV_TYPE"][49] = EnumEntry("MAV_TYPE_ENUM_END", """""")
+
+# MAV_MODE_FLAG
+enums["MAV_MODE_FLAG"] = Enum()
+enums["MAV_MODE_FLAG"].bitmask = True
+MAV_MODE_FLAG_CUSTOM_MODE_ENABLED = 1
+enums["MAV_MODE_FLAG"][1] = EnumEntry("MAV_MODE_FLAG_CUSTOM_MODE_ENABLED", """""")
+MAV_MODE_FLAG_TEST_ENABLED = 2
+enums["MAV_MODE_FLAG"][2] = EnumEntry("MAV_MODE_FLAG_TEST_ENABLED", """""")
+MAV_MODE_FLAG_AUTO_ENABLED = 4
+enums["MAV_MODE_FLAG"][4] = EnumEntry("MAV_MODE_FLAG_AUTO_ENABLED", """""")
+MAV_MODE_FLAG_GUIDED_ENABLED = 8
+enums["MAV_MODE_FLAG"][8] = EnumEntry("MAV_MODE_FLAG_GUIDED_ENABLED", """""")
+MAV_MODE_FLAG_STABILIZE_ENABLED = 16
+enums["MAV_MODE_FLAG"][16] = EnumEntry("MAV_MODE_FLAG_STABILIZE_ENABLED", """""")
+MAV_MODE_FLAG_HIL_ENABLED = 32
+enums["MAV_MODE_FLAG"][32] = EnumEntry("MAV_MODE_FLAG_HIL_ENABLED", """""")
+MAV_MODE_FLAG_MANUAL_INPUT_ENABLED = 64
+enums["MAV_MODE_FLAG"][64] = EnumEntry("MAV_MODE_FLAG_MANUAL_INPUT_ENABLED", """""")
+MAV_MODE_FLAG_SAFETY_ARMED = 128
+enums["MAV_MODE_FLAG"][128] = EnumEntry("MAV_MODE_FLAG_SAFETY_ARMED", """""")
+MAV_MODE_FLAG_ENUM_END = 129
+enums["MAV_MODE_FLAG"][129] = EnumEntry("MAV_MODE_FLAG_ENUM_END", """""")
+
+# MAV_MODE_FLAG_DECODE_POSITION
+MAV_MODE_FLAG_DECODE_POSITION_CUSTOM_MODE = 1
+MAV_MODE_FLAG_DECODE_POSITION_TEST = 2
+MAV_MODE_FLAG_DECODE_POSITION_AUTO = 4
+MAV_MODE_FLAG_DECODE_POSITION_GUIDED = 8
+MAV_MODE_FLAG_DECODE_POSITION_STABILIZE = 16
+MAV_MODE_FLAG_DECODE_POSITION_HIL = 32
+MAV_MODE_FLAG_DECODE_POSITION_MANUAL = 64
+MAV_MODE_FLAG_DECODE_POSITION_SAFETY = 128
+MAV_MODE_FLAG_DECODE_POSITION_ENUM_END = 129
+
+# MAV_STATE
+enums["MAV_STATE"] = Enum()
+enums["MAV_STATE"].bitmask = False
+MAV_STATE_UNINIT = 0
+enums["MAV_STATE"][0] = EnumEntry("MAV_STATE_UNINIT", """""")
+MAV_STATE_BOOT = 1
+enums["MAV_STATE"][1] = EnumEntry("MAV_STATE_BOOT", """""")
+MAV_STATE_CALIBRATING = 2
+enums["MAV_STATE"][2] = EnumEntry("MAV_STATE_CALIBRATING", """""")
+MAV_STATE_STANDBY = 3
+enums["MAV_STATE"][3] = EnumEntry("MAV_STATE_STANDBY", """""")
+MAV_STATE_ACTIVE = 4
+enums["MAV_STATE"][4] = EnumEntry("MAV_STATE_ACTIVE", """""")
+MAV_STATE_CRITICAL = 5
+enums["MAV_STATE"][5] = EnumEntry("MAV_STATE_CRITICAL", """""")
+MAV_STATE_EMERGENCY = 6
+enums["MAV_STATE"][6] = EnumEntry("MAV_STATE_EMERGENCY", """""")
+MAV_STATE_POWEROFF = 7
+enums["MAV_STATE"][7] = EnumEntry("MAV_STATE_POWEROFF", """""")
+MAV_STATE_FLIGHT_TERMINATION = 8
+enums["MAV_STATE"][8] = EnumEntry("MAV_STATE_FLIGHT_TERMINATION", """""")
+MAV_STATE_ENUM_END = 9
+enums["MAV_STATE"][9] = EnumEntry("MAV_STATE_ENUM_END", """""")
+
+# MAV_COMPONENT
+MAV_COMP_ID_ALL = 0
+MAV_COMP_ID_AUTOPILOT1 = 1
+MAV_COMP_ID_USER1 = 25
+MAV_COMP_ID_USER2 = 26
+MAV_COMP_ID_USER3 = 27
+MAV_COMP_ID_USER4 = 28
+MAV_COMP_ID_USER5 = 29
+MAV_COMP_ID_USER6 = 30
+MAV_COMP_ID_USER7 = 31
+MAV_COMP_ID_USER8 = 32
+MAV_COMP_ID_USER9 = 33
+MAV_COMP_ID_USER10 = 34
+MAV_COMP_ID_USER11 = 35
+MAV_COMP_ID_USER12 = 36
+MAV_COMP_ID_USER13 = 37
+MAV_COMP_ID_USER14 = 38
+MAV_COMP_ID_USER15 = 39
+MAV_COMP_ID_USER16 = 40
+MAV_COMP_ID_USER17 = 41
+MAV_COMP_ID_USER18 = 42
+MAV_COMP_ID_USER19 = 43
+MAV_COMP_ID_USER20 = 44
+MAV_COMP_ID_USER21 = 45
+MAV_COMP_ID_USER22 = 46
+MAV_COMP_ID_USER23 = 47
+MAV_COMP_ID_USER24 = 48
+MAV_COMP_ID_USER25 = 49
+MAV_COMP_ID_USER26 = 50
+MAV_COMP_ID_USER27 = 51
+MAV_COMP_ID_USER28 = 52
+MAV_COMP_ID_USER29 = 53
+MAV_COMP_ID_USER30 = 54
+MAV_COMP_ID_USER31 = 55
+MAV_COMP_ID_USER32 = 56
+MAV_COMP_ID_USER33 = 57
+MAV_COMP_ID_USER34 = 58
+MAV_COMP_ID_USER35 = 59
+MAV_COMP_ID_USER36 = 60
+MAV_COMP_ID_USER37 = 61
+MAV_COMP_ID_USER38 = 62
+MAV_COMP_ID_USER39 = 63
+MAV_COMP_ID_USER40 = 64
+MAV_COMP_ID_USER41 = 65
+MAV_COMP_ID_USER42 = 66
+MAV_COMP_ID_USER43 = 67
+MAV_COMP_ID_TELEMETRY_RADIO = 68
+MAV_COMP_ID_USER45 = 69
+MAV_COMP_ID_USER46 = 70
+MAV_COMP_ID_USER47 = 71
+MAV_COMP_ID_USER48 = 72
+MAV_COMP_ID_USER49 = 73
+MAV_COMP_ID_USER50 = 74
+MAV_COMP_ID_USER51 = 75
+MAV_COMP_ID_USER52 = 76
+MAV_COMP_ID_USER53 = 77
+MAV_COMP_ID_USER54 = 78
+MAV_COMP_ID_USER55 = 79
+MAV_COMP_ID_USER56 = 80
+MAV_COMP_ID_USER57 = 81
+MAV_COMP_ID_USER58 = 82
+MAV_COMP_ID_USER59 = 83
+MAV_COMP_ID_USER60 = 84
+MAV_COMP_ID_USER61 = 85
+MAV_COMP_ID_USER62 = 86
+MAV_COMP_ID_USER63 = 87
+MAV_COMP_ID_USER64 = 88
+MAV_COMP_ID_USER65 = 89
+MAV_COMP_ID_USER66 = 90
+MAV_COMP_ID_USER67 = 91
+MAV_COMP_ID_USER68 = 92
+MAV_COMP_ID_USER69 = 93
+MAV_COMP_ID_USER70 = 94
+MAV_COMP_ID_USER71 = 95
+MAV_COMP_ID_USER72 = 96
+MAV_COMP_ID_USER73 = 97
+MAV_COMP_ID_USER74 = 98
+MAV_COMP_ID_USER75 = 99
+MAV_COMP_ID_CAMERA = 100
+MAV_COMP_ID_CAMERA2 = 101
+MAV_COMP_ID_CAMERA3 = 102
+MAV_COMP_ID_CAMERA4 = 103
+MAV_COMP_ID_CAMERA5 = 104
+MAV_COMP_ID_CAMERA6 = 105
+MAV_COMP_ID_SERVO1 = 140
+MAV_COMP_ID_SERVO2 = 141
+MAV_COMP_ID_SERVO3 = 142
+MAV_COMP_ID_SERVO4 = 143
+MAV_COMP_ID_SERVO5 = 144
+MAV_COMP_ID_SERVO6 = 145
+MAV_COMP_ID_SERVO7 = 146
+MAV_COMP_ID_SERVO8 = 147
+MAV_COMP_ID_SERVO9 = 148
+MAV_COMP_ID_SERVO10 = 149
+MAV_COMP_ID_SERVO11 = 150
+MAV_COMP_ID_SERVO12 = 151
+MAV_COMP_ID_SERVO13 = 152
+MAV_COMP_ID_SERVO14 = 153
+MAV_COMP_ID_GIMBAL = 154
+MAV_COMP_ID_LOG = 155
+MAV_COMP_ID_ADSB = 156
+MAV_COMP_ID_OSD = 157
+MAV_COMP_ID_PERIPHERAL = 158
+MAV_COMP_ID_QX1_GIMBAL = 159
+MAV_COMP_ID_FLARM = 160
+MAV_COMP_ID_PARACHUTE = 161
+MAV_COMP_ID_WINCH = 169
+MAV_COMP_ID_GIMBAL2 = 171
+MAV_COMP_ID_GIMBAL3 = 172
+MAV_COMP_ID_GIMBAL4 = 173
+MAV_COMP_ID_GIMBAL5 = 174
+MAV_COMP_ID_GIMBAL6 = 175
+MAV_COMP_ID_BATTERY = 180
+MAV_COMP_ID_BATTERY2 = 181
+MAV_COMP_ID_MAVCAN = 189
+MAV_COMP_ID_MISSIONPLANNER = 190
+MAV_COMP_ID_ONBOARD_COMPUTER = 191
+MAV_COMP_ID_ONBOARD_COMPUTER2 = 192
+MAV_COMP_ID_ONBOARD_COMPUTER3 = 193
+MAV_COMP_ID_ONBOARD_COMPUTER4 = 194
+MAV_COMP_ID_PATHPLANNER = 195
+MAV_COMP_ID_OBSTACLE_AVOIDANCE = 196
+MAV_COMP_ID_VISUAL_INERTIAL_ODOMETRY = 197
+MAV_COMP_ID_PAIRING_MANAGER = 198
+MAV_COMP_ID_IMU = 200
+MAV_COMP_ID_IMU_2 = 201
+MAV_COMP_ID_IMU_3 = 202
+MAV_COMP_ID_GPS = 220
+MAV_COMP_ID_GPS2 = 221
+MAV_COMP_ID_ODID_TXRX_1 = 236
+MAV_COMP_ID_ODID_TXRX_2 = 237
+MAV_COMP_ID_ODID_TXRX_3 = 238
+MAV_COMP_ID_UDP_BRIDGE = 240
+MAV_COMP_ID_UART_BRIDGE = 241
+MAV_COMP_ID_TUNNEL_NODE = 242
+MAV_COMP_ID_ILLUMINATOR = 243
+MAV_COMP_ID_SYSTEM_CONTROL = 250
+MAV_COMPONENT_ENUM_END = 251
+
+# MAV_BOOL
+MAV_BOOL_FALSE = 0
+MAV_BOOL_TRUE = 1
+MAV_BOOL_ENUM_END = 2
+
+# MAV_PROTOCOL_CAPABILITY
+enums["MAV_PROTOCOL_CAPABILITY"] = Enum()
+enums["MAV_PROTOCOL_CAPABILITY"].bitmask = True
+MAV_PROTOCOL_CAPABILITY_MISSION_FLOAT = 1
+enums["MAV_PROTOCOL_CAPABILITY"][1] = EnumEntry("MAV_PROTOCOL_CAPABILITY_MISSION_FLOAT", """""")
+MAV_PROTOCOL_CAPABILITY_PARAM_FLOAT = 2
+enums["MAV_PROTOCOL_CAPABILITY"][2] = EnumEntry("MAV_PROTOCOL_CAPABILITY_PARAM_FLOAT", """""")
+MAV_PROTOCOL_CAPABILITY_MISSION_INT = 4
+enums["MAV_PROTOCOL_CAPABILITY"][4] = EnumEntry("MAV_PROTOCOL_CAPABILITY_MISSION_INT", """""")
+MAV_PROTOCOL_CAPABILITY_COMMAND_INT = 8
+enums["MAV_PROTOCOL_CAPABILITY"][8] = EnumEntry("MAV_PROTOCOL_CAPABILITY_COMMAND_INT", """""")
+MAV_PROTOCOL_CAPABILITY_PARAM_ENCODE_BYTEWISE = 16
+enums["MAV_PROTOCOL_CAPABILITY"][16] = EnumEntry("MAV_PROTOCOL_CAPABILITY_PARAM_ENCODE_BYTEWISE", """""")
+MAV_PROTOCOL_CAPABILITY_FTP = 32
+enums["MAV_PROTOCOL_CAPABILITY"][32] = EnumEntry("MAV_PROTOCOL_CAPABILITY_FTP", """""")
+MAV_PROTOCOL_CAPABILITY_SET_ATTITUDE_TARGET = 64
+enums["MAV_PROTOCOL_CAPABILITY"][64] = EnumEntry("MAV_PROTOCOL_CAPABILITY_SET_ATTITUDE_TARGET", """""")
+MAV_PROTOCOL_CAPABILITY_SET_POSITION_TARGET_LOCAL_NED = 128
+enums["MAV_PROTOCOL_CAPABILITY"][128] = EnumEntry("MAV_PROTOCOL_CAPABILITY_SET_POSITION_TARGET_LOCAL_NED", """""")
+MAV_PROTOCOL_CAPABILITY_SET_POSITION_TARGET_GLOBAL_INT = 256
+enums["MAV_PROTOCOL_CAPABILITY"][256] = EnumEntry("MAV_PROTOCOL_CAPABILITY_SET_POSITION_TARGET_GLOBAL_INT", """""")
+MAV_PROTOCOL_CAPABILITY_TERRAIN = 512
+enums["MAV_PROTOCOL_CAPABILITY"][512] = EnumEntry("MAV_PROTOCOL_CAPABILITY_TERRAIN", """""")
+MAV_PROTOCOL_CAPABILITY_RESERVED3 = 1024
+enums["MAV_PROTOCOL_CAPABILITY"][1024] = EnumEntry("MAV_PROTOCOL_CAPABILITY_RESERVED3", """""")
+MAV_PROTOCOL_CAPABILITY_FLIGHT_TERMINATION = 2048
+enums["MAV_PROTOCOL_CAPABILITY"][2048] = EnumEntry("MAV_PROTOCOL_CAPABILITY_FLIGHT_TERMINATION", """""")
+MAV_PROTOCOL_CAPABILITY_COMPASS_CALIBRATION = 4096
+enums["MAV_PROTOCOL_CAPABILITY"][4096] = EnumEntry("MAV_PROTOCOL_CAPABILITY_COMPASS_CALIBRATION", """""")
+MAV_PROTOCOL_CAPABILITY_MAVLINK2 = 8192
+enums["MAV_PROTOCOL_CAPABILITY"][8192] = EnumEntry("MAV_PROTOCOL_CAPABILITY_MAVLINK2", """""")
+MAV_PROTOCOL_CAPABILITY_MISSION_FENCE = 16384
+enums["MAV_PROTOCOL_CAPABILITY"][16384] = EnumEntry("MAV_PROTOCOL_CAPABILITY_MISSION_FENCE", """""")
+MAV_PROTOCOL_CAPABILITY_MISSION_RALLY = 32768
+enums["MAV_PROTOCOL_CAPABILITY"][32768] = EnumEntry("MAV_PROTOCOL_CAPABILITY_MISSION_RALLY", """""")
+MAV_PROTOCOL_CAPABILITY_RESERVED2 = 65536
+enums["MAV_PROTOCOL_CAPABILITY"][65536] = EnumEntry("MAV_PROTOCOL_CAPABILITY_RESERVED2", """""")
+MAV_PROTOCOL_CAPABILITY_PARAM_ENCODE_C_CAST = 131072
+enums["MAV_PROTOCOL_CAPABILITY"][131072] = EnumEntry("MAV_PROTOCOL_CAPABILITY_PARAM_ENCODE_C_CAST", """""")
+MAV_PROTOCOL_CAPABILITY_COMPONENT_IMPLEMENTS_GIMBAL_MANAGER = 262144
+enums["MAV_PROTOCOL_CAPABILITY"][262144] = EnumEntry("MAV_PROTOCOL_CAPABILITY_COMPONENT_IMPLEMENTS_GIMBAL_MANAGER", """""")
+MAV_PROTOCOL_CAPABILITY_COMPONENT_ACCEPTS_GCS_CONTROL = 524288
+enums["MAV_PROTOCOL_CAPABILITY"][524288] = EnumEntry("MAV_PROTOCOL_CAPABILITY_COMPONENT_ACCEPTS_GCS_CONTROL", """""")
+MAV_PROTOCOL_CAPABILITY_GRIPPER = 1048576
+enums["MAV_PROTOCOL_CAPABILITY"][1048576] = EnumEntry("MAV_PROTOCOL_CAPABILITY_GRIPPER", """""")
+MAV_PROTOCOL_CAPABILITY_ENUM_END = 1048577
+enums["MAV_PROTOCOL_CAPABILITY"][1048577] = EnumEntry("MAV_PROTOCOL_CAPABILITY_ENUM_END", """""")
+
+# FIRMWARE_VERSION_TYPE
+FIRMWARE_VERSION_TYPE_DEV = 0
+FIRMWARE_VERSION_TYPE_ALPHA = 64
+FIRMWARE_VERSION_TYPE_BETA = 128
+FIRMWARE_VERSION_TYPE_RC = 192
+FIRMWARE_VERSION_TYPE_OFFICIAL = 255
+FIRMWARE_VERSION_TYPE_ENUM_END = 256
+
+# UALBERTA_AUTOPILOT_MODE
+MODE_MANUAL_DIRECT = 1
+MODE_MANUAL_SCALED = 2
+MODE_AUTO_PID_ATT = 3
+MODE_AUTO_PID_VEL = 4
+MODE_AUTO_PID_POS = 5
+UALBERTA_AUTOPILOT_MODE_ENUM_END = 6
+
+# UALBERTA_NAV_MODE
+NAV_AHRS_INIT = 1
+NAV_AHRS = 2
+NAV_INS_GPS_INIT = 3
+NAV_INS_GPS = 4
+UALBERTA_NAV_MODE_ENUM_END = 5
+
+# UALBERTA_PILOT_MODE
+PILOT_MANUAL = 1
+PILOT_AUTO = 2
+PILOT_ROTO = 3
+UALBERTA_PILOT_MODE_ENUM_END = 4
+
+# UAVIONIX_ADSB_OUT_DYNAMIC_STATE
+UAVIONIX_ADSB_OUT_DYNAMIC_STATE_INTENT_CHANGE = 1
+UAVIONIX_ADSB_OUT_DYNAMIC_STATE_AUTOPILOT_ENABLED = 2
+UAVIONIX_ADSB_OUT_DYNAMIC_STATE_NICBARO_CROSSCHECKED = 4
+UAVIONIX_ADSB_OUT_DYNAMIC_STATE_ON_GROUND = 8
+UAVIONIX_ADSB_OUT_DYNAMIC_STATE_IDENT = 16
+UAVIONIX_ADSB_OUT_DYNAMIC_STATE_ENUM_END = 17
+
+# UAVIONIX_ADSB_OUT_RF_SELECT
+UAVIONIX_ADSB_OUT_RF_SELECT_RX_ENABLED = 1
+UAVIONIX_ADSB_OUT_RF_SELECT_TX_ENABLED = 2
+UAVIONIX_ADSB_OUT_RF_SELECT_ENUM_END = 3
+
+# UAVIONIX_ADSB_OUT_DYNAMIC_GPS_FIX
+UAVIONIX_ADSB_OUT_DYNAMIC_GPS_FIX_NONE_0 = 0
+UAVIONIX_ADSB_OUT_DYNAMIC_GPS_FIX_NONE_1 = 1
+UAVIONIX_ADSB_OUT_DYNAMIC_GPS_FIX_2D = 2
+UAVIONIX_ADSB_OUT_DYNAMIC_GPS_FIX_3D = 3
+UAVIONIX_ADSB_OUT_DYNAMIC_GPS_FIX_DGPS = 4
+UAVIONIX_ADSB_OUT_DYNAMIC_GPS_FIX_RTK = 5
+UAVIONIX_ADSB_OUT_DYNAMIC_GPS_FIX_ENUM_END = 6
+
+# UAVIONIX_ADSB_RF_HEALTH
+UAVIONIX_ADSB_RF_HEALTH_OK = 1
+UAVIONIX_ADSB_RF_HEALTH_FAIL_TX = 2
+UAVIONIX_ADSB_RF_HEALTH_FAIL_RX = 16
+UAVIONIX_ADSB_RF_HEALTH_ENUM_END = 17
+
+# UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_NO_DATA = 0
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_L15M_W23M = 1
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_L25M_W28P5M = 2
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_L25_34M = 3
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_L35_33M = 4
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_L35_38M = 5
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_L45_39P5M = 6
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_L45_45M = 7
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_L55_45M = 8
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_L55_52M = 9
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_L65_59P5M = 10
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_L65_67M = 11
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_L75_W72P5M = 12
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_L75_W80M = 13
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_L85_W80M = 14
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_L85_W90M = 15
+UAVIONIX_ADSB_OUT_CFG_AIRCRAFT_SIZE_ENUM_END = 16
+
+# UAVIONIX_ADSB_OUT_CFG_GPS_OFFSET_LAT
+UAVIONIX_ADSB_OUT_CFG_GPS_OFFSET_LAT_NO_DATA = 0
+UAVIONIX_ADSB_OUT_CFG_GPS_OFFSET_LAT_LEFT_2M = 1
+UAVIONIX_ADSB_OUT_CFG_GPS_OFFSET_LAT_LEFT_4M = 2
+UAVIONIX_ADSB_OUT_CFG_GPS_OFFSET_LAT_LEFT_6M = 3
+UAVIONIX_ADSB_OUT_CFG_GPS_OFFSET_LAT_RIGHT_0M = 4
+UAVIONIX_ADSB_OUT_CFG_GPS_OFFSET_LAT_RIGHT_2M = 5
+UAVIONIX_ADSB_OUT_CFG_GPS_OFFSET_LAT_RIGHT_4M = 6
+UAVIONIX_ADSB_OUT_CFG_GPS_OFFSET_LAT_RIGHT_6M = 7
+UAVIONIX_ADSB_OUT_CFG_GPS_OFFSET_LAT_ENUM_END = 8
+
+# UAVIONIX_ADSB_OUT_CFG_GPS_OFFSET_LON
+UAVIONIX_ADSB_OUT_CFG_GPS_OFFSET_LON_NO_DATA = 0
+UAVIONIX_ADSB_OUT_CFG_GPS_OFFSET_LON_APPLIED_BY_SENSOR = 1
+UAVIONIX_ADSB_OUT_CFG_GPS_OFFSET_LON_ENUM_END = 2
+
+# UAVIONIX_ADSB_EMERGENCY_STATUS
+UAVIONIX_ADSB_OUT_NO_EMERGENCY = 0
+UAVIONIX_ADSB_OUT_GENERAL_EMERGENCY = 1
+UAVIONIX_ADSB_OUT_LIFEGUARD_EMERGENCY = 2
+UAVIONIX_ADSB_OUT_MINIMUM_FUEL_EMERGENCY = 3
+UAVIONIX_ADSB_OUT_NO_COMM_EMERGENCY = 4
+UAVIONIX_ADSB_OUT_UNLAWFUL_INTERFERANCE_EMERGENCY = 5
+UAVIONIX_ADSB_OUT_DOWNED_AIRCRAFT_EMERGENCY = 6
+UAVIONIX_ADSB_OUT_RESERVED = 7
+UAVIONIX_ADSB_EMERGENCY_STATUS_ENUM_END = 8
+
+# UAVIONIX_ADSB_OUT_CONTROL_STATE
+UAVIONIX_ADSB_OUT_CONTROL_STATE_EXTERNAL_BARO_CROSSCHECKED = 1
+UAVIONIX_ADSB_OUT_CONTROL_STATE_ON_GROUND = 4
+UAVIONIX_ADSB_OUT_CONTROL_STATE_IDENT_BUTTON_ACTIVE = 8
+UAVIONIX_ADSB_OUT_CONTROL_STATE_MODE_A_ENABLED = 16
+UAVIONIX_ADSB_OUT_CONTROL_STATE_MODE_C_ENABLED = 32
+UAVIONIX_ADSB_OUT_CONTROL_STATE_MODE_S_ENABLED = 64
+UAVIONIX_ADSB_OUT_CONTROL_STATE_1090ES_TX_ENABLED = 128
+UAVIONIX_ADSB_OUT_CONTROL_STATE_ENUM_END = 129
+
+# UAVIONIX_ADSB_XBIT
+UAVIONIX_ADSB_XBIT_ENABLED = 128
+UAVIONIX_ADSB_XBIT_ENUM_END = 129
+
+# UAVIONIX_ADSB_OUT_STATUS_STATE
+UAVIONIX_ADSB_OUT_STATUS_STATE_ON_GROUND = 1
+UAVIONIX_ADSB_OUT_STATUS_STATE_INTERROGATED_SINCE_LAST = 2
+UAVIONIX_ADSB_OUT_STATUS_STATE_XBIT_ENABLED = 4
+UAVIONIX_ADSB_OUT_STATUS_STATE_IDENT_ACTIVE = 8
+UAVIONIX_ADSB_OUT_STATUS_STATE_MODE_A_ENABLED = 16
+UAVIONIX_ADSB_OUT_STATUS_STATE_MODE_C_ENABLED = 32
+UAVIONIX_ADSB_OUT_STATUS_STATE_MODE_S_ENABLED = 64
+UAVIONIX_ADSB_OUT_STATUS_STATE_1090ES_TX_ENABLED = 128
+UAVIONIX_ADSB_OUT_STATUS_STATE_ENUM_END = 129
+
+# UAVIONIX_ADSB_OUT_STATUS_NIC_NACP
+UAVIONIX_ADSB_NIC_CR_20_NM = 1
+UAVIONIX_ADSB_NIC_CR_8_NM = 2
+UAVIONIX_ADSB_NIC_CR_4_NM = 3
+UAVIONIX_ADSB_NIC_CR_2_NM = 4
+UAVIONIX_ADSB_NIC_CR_1_NM = 5
+UAVIONIX_ADSB_NIC_CR_0_3_NM = 6
+UAVIONIX_ADSB_NIC_CR_0_2_NM = 7
+UAVIONIX_ADSB_NIC_CR_0_1_NM = 8
+UAVIONIX_ADSB_NIC_CR_75_M = 9
+UAVIONIX_ADSB_NIC_CR_25_M = 10
+UAVIONIX_ADSB_NIC_CR_7_5_M = 11
+UAVIONIX_ADSB_NACP_EPU_10_NM = 16
+UAVIONIX_ADSB_NACP_EPU_4_NM = 32
+UAVIONIX_ADSB_NACP_EPU_2_NM = 48
+UAVIONIX_ADSB_NACP_EPU_1_NM = 64
+UAVIONIX_ADSB_NACP_EPU_0_5_NM = 80
+UAVIONIX_ADSB_NACP_EPU_0_3_NM = 96
+UAVIONIX_ADSB_NACP_EPU_0_1_NM = 112
+UAVIONIX_ADSB_NACP_EPU_0_05_NM = 128
+UAVIONIX_ADSB_NACP_EPU_30_M = 144
+UAVIONIX_ADSB_NACP_EPU_10_M = 160
+UAVIONIX_ADSB_NACP_EPU_3_M = 176
+UAVIONIX_ADSB_OUT_STATUS_NIC_NACP_ENUM_END = 177
+
+# UAVIONIX_ADSB_OUT_STATUS_FAULT
+UAVIONIX_ADSB_OUT_STATUS_FAULT_STATUS_MESSAGE_UNAVAIL = 8
+UAVIONIX_ADSB_OUT_STATUS_FAULT_GPS_NO_POS = 16
+UAVIONIX_ADSB_OUT_STATUS_FAULT_GPS_UNAVAIL = 32
+UAVIONIX_ADSB_OUT_STATUS_FAULT_TX_SYSTEM_FAIL = 64
+UAVIONIX_ADSB_OUT_STATUS_FAULT_MAINT_REQ = 128
+UAVIONIX_ADSB_OUT_STATUS_FAULT_ENUM_END = 129
+
+# MAV_STORM32_TUNNEL_PAYLOAD_TYPE
+MAV_STORM32_TUNNEL_PAYLOAD_TYPE_STORM32_CH1_IN = 200
+MAV_STORM32_TUNNEL_PAYLOAD_TYPE_STORM32_CH1_OUT = 201
+MAV_STORM32_TUNNEL_PAYLOAD_TYPE_STORM32_CH2_IN = 202
+MAV_STORM32_TUNNEL_PAYLOAD_TYPE_STORM32_CH2_OUT = 203
+MAV_STORM32_TUNNEL_PAYLOAD_TYPE_STORM32_CH3_IN = 204
+MAV_STORM32_TUNNEL_PAYLOAD_TYPE_STORM32_CH3_OUT = 205
+MAV_STORM32_TUNNEL_PAYLOAD_TYPE_ENUM_END = 206
+
+# MAV_STORM32_GIMBAL_MANAGER_CAP_FLAGS
+MAV_STORM32_GIMBAL_MANAGER_CAP_FLAGS_HAS_PROFILES = 1
+MAV_STORM32_GIMBAL_MANAGER_CAP_FLAGS_ENUM_END = 2
+
+# MAV_STORM32_GIMBAL_MANAGER_FLAGS
+MAV_STORM32_GIMBAL_MANAGER_FLAGS_RC_ACTIVE = 1
+MAV_STORM32_GIMBAL_MANAGER_FLAGS_CLIENT_ONBOARD_ACTIVE = 2
+MAV_STORM32_GIMBAL_MANAGER_FLAGS_CLIENT_AUTOPILOT_ACTIVE = 4
+MAV_STORM32_GIMBAL_MANAGER_FLAGS_CLIENT_GCS_ACTIVE = 8
+MAV_STORM32_GIMBAL_MANAGER_FLAGS_CLIENT_CAMERA_ACTIVE = 16
+MAV_STORM32_GIMBAL_MANAGER_FLAGS_CLIENT_GCS2_ACTIVE = 32
+MAV_STORM32_GIMBAL_MANAGER_FLAGS_CLIENT_CAMERA2_ACTIVE = 64
+MAV_STORM32_GIMBAL_MANAGER_FLAGS_CLIENT_CUSTOM_ACTIVE = 128
+MAV_STORM32_GIMBAL_MANAGER_FLAGS_CLIENT_CUSTOM2_ACTIVE = 256
+MAV_STORM32_GIMBAL_MANAGER_FLAGS_SET_SUPERVISON = 512
+MAV_STORM32_GIMBAL_MANAGER_FLAGS_SET_RELEASE = 1024
+MAV_STORM32_GIMBAL_MANAGER_FLAGS_ENUM_END = 1025
+
+# MAV_STORM32_GIMBAL_MANAGER_CLIENT
+MAV_STORM32_GIMBAL_MANAGER_CLIENT_NONE = 0
+MAV_STORM32_GIMBAL_MANAGER_CLIENT_ONBOARD = 1
+MAV_STORM32_GIMBAL_MANAGER_CLIENT_AUTOPILOT = 2
+MAV_STORM32_GIMBAL_MANAGER_CLIENT_GCS = 3
+MAV_STORM32_GIMBAL_MANAGER_CLIENT_CAMERA = 4
+MAV_STORM32_GIMBAL_MANAGER_CLIENT_GCS2 = 5
+MAV_STORM32_GIMBAL_MANAGER_CLIENT_CAMERA2 = 6
+MAV_STORM32_GIMBAL_MANAGER_CLIENT_CUSTOM = 7
+MAV_STORM32_GIMBAL_MANAGER_CLIENT_CUSTOM2 = 8
+MAV_STORM32_GIMBAL_MANAGER_CLIENT_ENUM_END = 9
+
+# MAV_STORM32_GIMBAL_MANAGER_PROFILE
+MAV_STORM32_GIMBAL_MANAGER_PROFILE_DEFAULT = 0
+MAV_STORM32_GIMBAL_MANAGER_PROFILE_CUSTOM = 1
+MAV_STORM32_GIMBAL_MANAGER_PROFILE_COOPERATIVE = 2
+MAV_STORM32_GIMBAL_MANAGER_PROFILE_EXCLUSIVE = 3
+MAV_STORM32_GIMBAL_MANAGER_PROFILE_PRIORITY_COOPERATIVE = 4
+MAV_STORM32_GIMBAL_MANAGER_PROFILE_PRIORITY_EXCLUSIVE = 5
+MAV_STORM32_GIMBAL_MANAGER_PROFILE_ENUM_END = 6
+
+# MAV_QSHOT_MODE
+MAV_QSHOT_MODE_UNDEFINED = 0
+MAV_QSHOT_MODE_DEFAULT = 1
+MAV_QSHOT_MODE_GIMBAL_RETRACT = 2
+MAV_QSHOT_MODE_GIMBAL_NEUTRAL = 3
+MAV_QSHOT_MODE_GIMBAL_MISSION = 4
+MAV_QSHOT_MODE_GIMBAL_RC_CONTROL = 5
+MAV_QSHOT_MODE_POI_TARGETING = 6
+MAV_QSHOT_MODE_SYSID_TARGETING = 7
+MAV_QSHOT_MODE_CABLECAM_2POINT = 8
+MAV_QSHOT_MODE_HOME_TARGETING = 9
+MAV_QSHOT_MODE_ENUM_END = 10
+
+# MLRS_RADIO_LINK_STATS_FLAGS
+MLRS_RADIO_LINK_STATS_FLAGS_RSSI_DBM = 1
+MLRS_RADIO_LINK_STATS_FLAGS_RX_RECEIVE_ANTENNA2 = 2
+MLRS_RADIO_LINK_STATS_FLAGS_RX_TRANSMIT_ANTENNA1 = 4
+MLRS_RADIO_LINK_STATS_FLAGS_RX_TRANSMIT_ANTENNA2 = 8
+MLRS_RADIO_LINK_STATS_FLAGS_TX_RECEIVE_ANTENNA2 = 16
+MLRS_RADIO_LINK_STATS_FLAGS_TX_TRANSMIT_ANTENNA1 = 32
+MLRS_RADIO_LINK_STATS_FLAGS_TX_TRANSMIT_ANTENNA2 = 64
+MLRS_RADIO_LINK_STATS_FLAGS_ENUM_END = 65
+
+# MLRS_RADIO_LINK_TYPE
+MLRS_RADIO_LINK_TYPE_GENERIC = 0
+MLRS_RADIO_LINK_TYPE_HERELINK = 1
+MLRS_RADIO_LINK_TYPE_DRAGONLINK = 2
+MLRS_RADIO_LINK_TYPE_RFD900 = 3
+MLRS_RADIO_LINK_TYPE_CROSSFIRE = 4
+MLRS_RADIO_LINK_TYPE_EXPRESSLRS = 5
+MLRS_RADIO_LINK_TYPE_MLRS = 6
+MLRS_RADIO_LINK_TYPE_ENUM_END = 7
+
+# MAV_AVSS_COMMAND_FAILURE_REASON
+PRS_NOT_STEADY = 1
+PRS_DTM_NOT_ARMED = 2
+PRS_OTM_NOT_ARMED = 3
+MAV_AVSS_COMMAND_FAILURE_REASON_ENUM_END = 4
+
+# AVSS_M300_OPERATION_MODE
+MODE_M300_MANUAL_CTRL = 0
+MODE_M300_ATTITUDE = 1
+MODE_M300_P_GPS = 6
+MODE_M300_HOTPOINT_MODE = 9
+MODE_M300_ASSISTED_TAKEOFF = 10
+MODE_M300_AUTO_TAKEOFF = 11
+MODE_M300_AUTO_LANDING = 12
+MODE_M300_NAVI_GO_HOME = 15
+MODE_M300_NAVI_SDK_CTRL = 17
+MODE_M300_S_SPORT = 31
+MODE_M300_FORCE_AUTO_LANDING = 33
+MODE_M300_T_TRIPOD = 38
+MODE_M300_SEARCH_MODE = 40
+MODE_M300_ENGINE_START = 41
+AVSS_M300_OPERATION_MODE_ENUM_END = 42
+
+# AVSS_HORSEFLY_OPERATION_MODE
+MODE_HORSEFLY_MANUAL_CTRL = 0
+MODE_HORSEFLY_AUTO_TAKEOFF = 1
+MODE_HORSEFLY_AUTO_LANDING = 2
+MODE_HORSEFLY_NAVI_GO_HOME = 3
+MODE_HORSEFLY_DROP = 4
+AVSS_HORSEFLY_OPERATION_MODE_ENUM_END = 5
+
+# AIRLINK_AUTH_RESPONSE_TYPE
+AIRLINK_ERROR_LOGIN_OR_PASS = 0
+AIRLINK_AUTH_OK = 1
+AIRLINK_AUTH_RESPONSE_TYPE_ENUM_END = 2
+
+# message IDs
+MAVLINK_MSG_ID_BAD_DATA = -1
+MAVLINK_MSG_ID_UNKNOWN = -2
+MAVLINK_MSG_ID_EKF_STATUS_REPORT = 193
+MAVLINK_MSG_ID_SYS_STATUS = 1
+MAVLINK_MSG_ID_SET_MODE = 11
+MAVLINK_MSG_ID_PARAM_REQUEST_READ = 20
+MAVLINK_MSG_ID_PARAM_REQUEST_LIST = 21
+MAVLINK_MSG_ID_PARAM_VALUE = 22
+MAVLINK_MSG_ID_GPS_RAW_INT = 24
+MAVLINK_MSG_ID_ATTITUDE = 30
+MAVLINK_MSG_ID_MISSION_ITEM = 39
+MAVLINK_MSG_ID_MISSION_REQUEST = 40
+MAVLINK_MSG_ID_MISSION_REQUEST_LIST = 43
+MAVLINK_MSG_ID_MISSION_COUNT = 44
+MAVLINK_MSG_ID_MISSION_CLEAR_ALL = 45
+MAVLINK_MSG_ID_MISSION_ACK = 47
+MAVLINK_MSG_ID_MISSION_REQUEST_INT = 51
+MAVLINK_MSG_ID_REQUEST_DATA_STREAM = 66
+MAVLINK_MSG_ID_MISSION_ITEM_INT = 73
+MAVLINK_MSG_ID_VFR_HUD = 74
+MAVLINK_MSG_ID_COMMAND_LONG = 76
+MAVLINK_MSG_ID_COMMAND_ACK = 77
+MAVLINK_MSG_ID_BATTERY_STATUS = 147
+MAVLINK_MSG_ID_STATUSTEXT = 253
+MAVLINK_MSG_ID_HEARTBEAT = 0
+MAVLINK_MSG_ID_GLOBAL_POSITION_INT = 33
+MAVLINK_MSG_ID_AUTOPILOT_VERSION = 148
+
+
+class MAVLink_ekf_status_report_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_EKF_STATUS_REPORT
+    msgname = "EKF_STATUS_REPORT"
+    fieldnames = ["flags", "velocity_variance", "pos_horiz_variance", "pos_vert_variance", "compass_variance", "terrain_alt_variance"]
+    ordered_fieldnames = ["velocity_variance", "pos_horiz_variance", "pos_vert_variance", "compass_variance", "terrain_alt_variance", "flags"]
+    fieldtypes = ["uint16_t", "float", "float", "float", "float", "float"]
+    fielddisplays_by_name: Dict[str, str] = {"flags": "bitmask"}
+    fieldenums_by_name: Dict[str, str] = {"flags": "EKF_STATUS_FLAGS"}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<fffffH")
+    orders = [5, 0, 1, 2, 3, 4]
+    lengths = [1, 1, 1, 1, 1, 1]
+    array_lengths = [0, 0, 0, 0, 0, 0]
+    crc_extra = 71
+    unpacker = struct.Struct("<fffffH")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, flags: int, velocity_variance: float, pos_horiz_variance: float, pos_vert_variance: float, compass_variance: float, terrain_alt_variance: float):
+        MAVLink_message.__init__(self, MAVLink_ekf_status_report_message.id, MAVLink_ekf_status_report_message.msgname)
+        self._fieldnames = MAVLink_ekf_status_report_message.fieldnames
+        self._instance_field = MAVLink_ekf_status_report_message.instance_field
+        self._instance_offset = MAVLink_ekf_status_report_message.instance_offset
+        self.flags = flags
+        self.velocity_variance = velocity_variance
+        self.pos_horiz_variance = pos_horiz_variance
+        self.pos_vert_variance = pos_vert_variance
+        self.compass_variance = compass_variance
+        self.terrain_alt_variance = terrain_alt_variance
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.velocity_variance, self.pos_horiz_variance, self.pos_vert_variance, self.compass_variance, self.terrain_alt_variance, self.flags), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_ekf_status_report_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_sys_status_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_SYS_STATUS
+    msgname = "SYS_STATUS"
+    fieldnames = ["onboard_control_sensors_present", "onboard_control_sensors_enabled", "onboard_control_sensors_health", "load", "voltage_battery", "current_battery", "battery_remaining", "drop_rate_comm", "errors_comm", "errors_count1", "errors_count2", "errors_count3", "errors_count4"]
+    ordered_fieldnames = ["onboard_control_sensors_present", "onboard_control_sensors_enabled", "onboard_control_sensors_health", "load", "voltage_battery", "current_battery", "drop_rate_comm", "errors_comm", "errors_count1", "errors_count2", "errors_count3", "errors_count4", "battery_remaining"]
+    fieldtypes = ["uint32_t", "uint32_t", "uint32_t", "uint16_t", "uint16_t", "int16_t", "int8_t", "uint16_t", "uint16_t", "uint16_t", "uint16_t", "uint16_t", "uint16_t"]
+    fielddisplays_by_name: Dict[str, str] = {"onboard_control_sensors_present": "bitmask", "onboard_control_sensors_enabled": "bitmask", "onboard_control_sensors_health": "bitmask"}
+    fieldenums_by_name: Dict[str, str] = {"onboard_control_sensors_present": "MAV_SYS_STATUS_SENSOR", "onboard_control_sensors_enabled": "MAV_SYS_STATUS_SENSOR", "onboard_control_sensors_health": "MAV_SYS_STATUS_SENSOR"}
+    fieldunits_by_name: Dict[str, str] = {"load": "d%", "voltage_battery": "mV", "current_battery": "cA", "battery_remaining": "%", "drop_rate_comm": "c%"}
+    native_format = bytearray(b"<IIIHHhHHHHHHb")
+    orders = [0, 1, 2, 3, 4, 5, 12, 6, 7, 8, 9, 10, 11]
+    lengths = [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+    array_lengths = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+    crc_extra = 124
+    unpacker = struct.Struct("<IIIHHhHHHHHHb")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, onboard_control_sensors_present: int, onboard_control_sensors_enabled: int, onboard_control_sensors_health: int, load: int, voltage_battery: int, current_battery: int, battery_remaining: int, drop_rate_comm: int, errors_comm: int, errors_count1: int, errors_count2: int, errors_count3: int, errors_count4: int):
+        MAVLink_message.__init__(self, MAVLink_sys_status_message.id, MAVLink_sys_status_message.msgname)
+        self._fieldnames = MAVLink_sys_status_message.fieldnames
+        self._instance_field = MAVLink_sys_status_message.instance_field
+        self._instance_offset = MAVLink_sys_status_message.instance_offset
+        self.onboard_control_sensors_present = onboard_control_sensors_present
+        self.onboard_control_sensors_enabled = onboard_control_sensors_enabled
+        self.onboard_control_sensors_health = onboard_control_sensors_health
+        self.load = load
+        self.voltage_battery = voltage_battery
+        self.current_battery = current_battery
+        self.battery_remaining = battery_remaining
+        self.drop_rate_comm = drop_rate_comm
+        self.errors_comm = errors_comm
+        self.errors_count1 = errors_count1
+        self.errors_count2 = errors_count2
+        self.errors_count3 = errors_count3
+        self.errors_count4 = errors_count4
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.onboard_control_sensors_present, self.onboard_control_sensors_enabled, self.onboard_control_sensors_health, self.load, self.voltage_battery, self.current_battery, self.drop_rate_comm, self.errors_comm, self.errors_count1, self.errors_count2, self.errors_count3, self.errors_count4, self.battery_remaining), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_sys_status_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_set_mode_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_SET_MODE
+    msgname = "SET_MODE"
+    fieldnames = ["target_system", "base_mode", "custom_mode"]
+    ordered_fieldnames = ["custom_mode", "target_system", "base_mode"]
+    fieldtypes = ["uint8_t", "uint8_t", "uint32_t"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {"base_mode": "MAV_MODE"}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<IBB")
+    orders = [1, 2, 0]
+    lengths = [1, 1, 1]
+    array_lengths = [0, 0, 0]
+    crc_extra = 89
+    unpacker = struct.Struct("<IBB")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, target_system: int, base_mode: int, custom_mode: int):
+        MAVLink_message.__init__(self, MAVLink_set_mode_message.id, MAVLink_set_mode_message.msgname)
+        self._fieldnames = MAVLink_set_mode_message.fieldnames
+        self._instance_field = MAVLink_set_mode_message.instance_field
+        self._instance_offset = MAVLink_set_mode_message.instance_offset
+        self.target_system = target_system
+        self.base_mode = base_mode
+        self.custom_mode = custom_mode
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.custom_mode, self.target_system, self.base_mode), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_set_mode_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_param_request_read_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_PARAM_REQUEST_READ
+    msgname = "PARAM_REQUEST_READ"
+    fieldnames = ["target_system", "target_component", "param_id", "param_index"]
+    ordered_fieldnames = ["param_index", "target_system", "target_component", "param_id"]
+    fieldtypes = ["uint8_t", "uint8_t", "char", "int16_t"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<hBBc")
+    orders = [1, 2, 3, 0]
+    lengths = [1, 1, 1, 1]
+    array_lengths = [0, 0, 0, 16]
+    crc_extra = 214
+    unpacker = struct.Struct("<hBB16s")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, target_system: int, target_component: int, param_id: bytes, param_index: int):
+        MAVLink_message.__init__(self, MAVLink_param_request_read_message.id, MAVLink_param_request_read_message.msgname)
+        self._fieldnames = MAVLink_param_request_read_message.fieldnames
+        self._instance_field = MAVLink_param_request_read_message.instance_field
+        self._instance_offset = MAVLink_param_request_read_message.instance_offset
+        self.target_system = target_system
+        self.target_component = target_component
+        self._param_id_raw = param_id
+        self.param_id = param_id.split(b"\x00", 1)[0].decode("ascii", errors="replace")
+        self.param_index = param_index
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.param_index, self.target_system, self.target_component, self._param_id_raw), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_param_request_read_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_param_request_list_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_PARAM_REQUEST_LIST
+    msgname = "PARAM_REQUEST_LIST"
+    fieldnames = ["target_system", "target_component"]
+    ordered_fieldnames = ["target_system", "target_component"]
+    fieldtypes = ["uint8_t", "uint8_t"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<BB")
+    orders = [0, 1]
+    lengths = [1, 1]
+    array_lengths = [0, 0]
+    crc_extra = 159
+    unpacker = struct.Struct("<BB")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, target_system: int, target_component: int):
+        MAVLink_message.__init__(self, MAVLink_param_request_list_message.id, MAVLink_param_request_list_message.msgname)
+        self._fieldnames = MAVLink_param_request_list_message.fieldnames
+        self._instance_field = MAVLink_param_request_list_message.instance_field
+        self._instance_offset = MAVLink_param_request_list_message.instance_offset
+        self.target_system = target_system
+        self.target_component = target_component
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.target_system, self.target_component), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_param_request_list_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_param_value_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_PARAM_VALUE
+    msgname = "PARAM_VALUE"
+    fieldnames = ["param_id", "param_value", "param_type", "param_count", "param_index"]
+    ordered_fieldnames = ["param_value", "param_count", "param_index", "param_id", "param_type"]
+    fieldtypes = ["char", "float", "uint8_t", "uint16_t", "uint16_t"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {"param_type": "MAV_PARAM_TYPE"}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<fHHcB")
+    orders = [3, 0, 4, 1, 2]
+    lengths = [1, 1, 1, 1, 1]
+    array_lengths = [0, 0, 0, 16, 0]
+    crc_extra = 220
+    unpacker = struct.Struct("<fHH16sB")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, param_id: bytes, param_value: float, param_type: int, param_count: int, param_index: int):
+        MAVLink_message.__init__(self, MAVLink_param_value_message.id, MAVLink_param_value_message.msgname)
+        self._fieldnames = MAVLink_param_value_message.fieldnames
+        self._instance_field = MAVLink_param_value_message.instance_field
+        self._instance_offset = MAVLink_param_value_message.instance_offset
+        self._param_id_raw = param_id
+        self.param_id = param_id.split(b"\x00", 1)[0].decode("ascii", errors="replace")
+        self.param_value = param_value
+        self.param_type = param_type
+        self.param_count = param_count
+        self.param_index = param_index
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.param_value, self.param_count, self.param_index, self._param_id_raw, self.param_type), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_param_value_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_gps_raw_int_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_GPS_RAW_INT
+    msgname = "GPS_RAW_INT"
+    fieldnames = ["time_usec", "fix_type", "lat", "lon", "alt", "eph", "epv", "vel", "cog", "satellites_visible"]
+    ordered_fieldnames = ["time_usec", "lat", "lon", "alt", "eph", "epv", "vel", "cog", "fix_type", "satellites_visible"]
+    fieldtypes = ["uint64_t", "uint8_t", "int32_t", "int32_t", "int32_t", "uint16_t", "uint16_t", "uint16_t", "uint16_t", "uint8_t"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {"fix_type": "GPS_FIX_TYPE"}
+    fieldunits_by_name: Dict[str, str] = {"time_usec": "us", "lat": "degE7", "lon": "degE7", "alt": "mm", "vel": "cm/s", "cog": "cdeg"}
+    native_format = bytearray(b"<QiiiHHHHBB")
+    orders = [0, 8, 1, 2, 3, 4, 5, 6, 7, 9]
+    lengths = [1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+    array_lengths = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+    crc_extra = 24
+    unpacker = struct.Struct("<QiiiHHHHBB")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, time_usec: int, fix_type: int, lat: int, lon: int, alt: int, eph: int, epv: int, vel: int, cog: int, satellites_visible: int):
+        MAVLink_message.__init__(self, MAVLink_gps_raw_int_message.id, MAVLink_gps_raw_int_message.msgname)
+        self._fieldnames = MAVLink_gps_raw_int_message.fieldnames
+        self._instance_field = MAVLink_gps_raw_int_message.instance_field
+        self._instance_offset = MAVLink_gps_raw_int_message.instance_offset
+        self.time_usec = time_usec
+        self.fix_type = fix_type
+        self.lat = lat
+        self.lon = lon
+        self.alt = alt
+        self.eph = eph
+        self.epv = epv
+        self.vel = vel
+        self.cog = cog
+        self.satellites_visible = satellites_visible
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.time_usec, self.lat, self.lon, self.alt, self.eph, self.epv, self.vel, self.cog, self.fix_type, self.satellites_visible), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_gps_raw_int_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_attitude_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_ATTITUDE
+    msgname = "ATTITUDE"
+    fieldnames = ["time_boot_ms", "roll", "pitch", "yaw", "rollspeed", "pitchspeed", "yawspeed"]
+    ordered_fieldnames = ["time_boot_ms", "roll", "pitch", "yaw", "rollspeed", "pitchspeed", "yawspeed"]
+    fieldtypes = ["uint32_t", "float", "float", "float", "float", "float", "float"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {}
+    fieldunits_by_name: Dict[str, str] = {"time_boot_ms": "ms", "roll": "rad", "pitch": "rad", "yaw": "rad", "rollspeed": "rad/s", "pitchspeed": "rad/s", "yawspeed": "rad/s"}
+    native_format = bytearray(b"<Iffffff")
+    orders = [0, 1, 2, 3, 4, 5, 6]
+    lengths = [1, 1, 1, 1, 1, 1, 1]
+    array_lengths = [0, 0, 0, 0, 0, 0, 0]
+    crc_extra = 39
+    unpacker = struct.Struct("<Iffffff")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, time_boot_ms: int, roll: float, pitch: float, yaw: float, rollspeed: float, pitchspeed: float, yawspeed: float):
+        MAVLink_message.__init__(self, MAVLink_attitude_message.id, MAVLink_attitude_message.msgname)
+        self._fieldnames = MAVLink_attitude_message.fieldnames
+        self._instance_field = MAVLink_attitude_message.instance_field
+        self._instance_offset = MAVLink_attitude_message.instance_offset
+        self.time_boot_ms = time_boot_ms
+        self.roll = roll
+        self.pitch = pitch
+        self.yaw = yaw
+        self.rollspeed = rollspeed
+        self.pitchspeed = pitchspeed
+        self.yawspeed = yawspeed
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.time_boot_ms, self.roll, self.pitch, self.yaw, self.rollspeed, self.pitchspeed, self.yawspeed), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_attitude_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_mission_item_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_MISSION_ITEM
+    msgname = "MISSION_ITEM"
+    fieldnames = ["target_system", "target_component", "seq", "frame", "command", "current", "autocontinue", "param1", "param2", "param3", "param4", "x", "y", "z"]
+    ordered_fieldnames = ["param1", "param2", "param3", "param4", "x", "y", "z", "seq", "command", "target_system", "target_component", "frame", "current", "autocontinue"]
+    fieldtypes = ["uint8_t", "uint8_t", "uint16_t", "uint8_t", "uint16_t", "uint8_t", "uint8_t", "float", "float", "float", "float", "float", "float", "float"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {"frame": "MAV_FRAME", "command": "MAV_CMD"}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<fffffffHHBBBBB")
+    orders = [9, 10, 7, 11, 8, 12, 13, 0, 1, 2, 3, 4, 5, 6]
+    lengths = [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+    array_lengths = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+    crc_extra = 254
+    unpacker = struct.Struct("<fffffffHHBBBBB")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, target_system: int, target_component: int, seq: int, frame: int, command: int, current: int, autocontinue: int, param1: float, param2: float, param3: float, param4: float, x: float, y: float, z: float):
+        MAVLink_message.__init__(self, MAVLink_mission_item_message.id, MAVLink_mission_item_message.msgname)
+        self._fieldnames = MAVLink_mission_item_message.fieldnames
+        self._instance_field = MAVLink_mission_item_message.instance_field
+        self._instance_offset = MAVLink_mission_item_message.instance_offset
+        self.target_system = target_system
+        self.target_component = target_component
+        self.seq = seq
+        self.frame = frame
+        self.command = command
+        self.current = current
+        self.autocontinue = autocontinue
+        self.param1 = param1
+        self.param2 = param2
+        self.param3 = param3
+        self.param4 = param4
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.param1, self.param2, self.param3, self.param4, self.x, self.y, self.z, self.seq, self.command, self.target_system, self.target_component, self.frame, self.current, self.autocontinue), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_mission_item_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_mission_request_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_MISSION_REQUEST
+    msgname = "MISSION_REQUEST"
+    fieldnames = ["target_system", "target_component", "seq"]
+    ordered_fieldnames = ["seq", "target_system", "target_component"]
+    fieldtypes = ["uint8_t", "uint8_t", "uint16_t"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<HBB")
+    orders = [1, 2, 0]
+    lengths = [1, 1, 1]
+    array_lengths = [0, 0, 0]
+    crc_extra = 230
+    unpacker = struct.Struct("<HBB")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, target_system: int, target_component: int, seq: int):
+        MAVLink_message.__init__(self, MAVLink_mission_request_message.id, MAVLink_mission_request_message.msgname)
+        self._fieldnames = MAVLink_mission_request_message.fieldnames
+        self._instance_field = MAVLink_mission_request_message.instance_field
+        self._instance_offset = MAVLink_mission_request_message.instance_offset
+        self.target_system = target_system
+        self.target_component = target_component
+        self.seq = seq
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.seq, self.target_system, self.target_component), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_mission_request_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_mission_request_list_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_MISSION_REQUEST_LIST
+    msgname = "MISSION_REQUEST_LIST"
+    fieldnames = ["target_system", "target_component"]
+    ordered_fieldnames = ["target_system", "target_component"]
+    fieldtypes = ["uint8_t", "uint8_t"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<BB")
+    orders = [0, 1]
+    lengths = [1, 1]
+    array_lengths = [0, 0]
+    crc_extra = 132
+    unpacker = struct.Struct("<BB")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, target_system: int, target_component: int):
+        MAVLink_message.__init__(self, MAVLink_mission_request_list_message.id, MAVLink_mission_request_list_message.msgname)
+        self._fieldnames = MAVLink_mission_request_list_message.fieldnames
+        self._instance_field = MAVLink_mission_request_list_message.instance_field
+        self._instance_offset = MAVLink_mission_request_list_message.instance_offset
+        self.target_system = target_system
+        self.target_component = target_component
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.target_system, self.target_component), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_mission_request_list_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_mission_count_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_MISSION_COUNT
+    msgname = "MISSION_COUNT"
+    fieldnames = ["target_system", "target_component", "count"]
+    ordered_fieldnames = ["count", "target_system", "target_component"]
+    fieldtypes = ["uint8_t", "uint8_t", "uint16_t"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<HBB")
+    orders = [1, 2, 0]
+    lengths = [1, 1, 1]
+    array_lengths = [0, 0, 0]
+    crc_extra = 221
+    unpacker = struct.Struct("<HBB")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, target_system: int, target_component: int, count: int):
+        MAVLink_message.__init__(self, MAVLink_mission_count_message.id, MAVLink_mission_count_message.msgname)
+        self._fieldnames = MAVLink_mission_count_message.fieldnames
+        self._instance_field = MAVLink_mission_count_message.instance_field
+        self._instance_offset = MAVLink_mission_count_message.instance_offset
+        self.target_system = target_system
+        self.target_component = target_component
+        self.count = count
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.count, self.target_system, self.target_component), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_mission_count_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_mission_clear_all_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_MISSION_CLEAR_ALL
+    msgname = "MISSION_CLEAR_ALL"
+    fieldnames = ["target_system", "target_component"]
+    ordered_fieldnames = ["target_system", "target_component"]
+    fieldtypes = ["uint8_t", "uint8_t"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<BB")
+    orders = [0, 1]
+    lengths = [1, 1]
+    array_lengths = [0, 0]
+    crc_extra = 232
+    unpacker = struct.Struct("<BB")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, target_system: int, target_component: int):
+        MAVLink_message.__init__(self, MAVLink_mission_clear_all_message.id, MAVLink_mission_clear_all_message.msgname)
+        self._fieldnames = MAVLink_mission_clear_all_message.fieldnames
+        self._instance_field = MAVLink_mission_clear_all_message.instance_field
+        self._instance_offset = MAVLink_mission_clear_all_message.instance_offset
+        self.target_system = target_system
+        self.target_component = target_component
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.target_system, self.target_component), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_mission_clear_all_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_mission_ack_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_MISSION_ACK
+    msgname = "MISSION_ACK"
+    fieldnames = ["target_system", "target_component", "type"]
+    ordered_fieldnames = ["target_system", "target_component", "type"]
+    fieldtypes = ["uint8_t", "uint8_t", "uint8_t"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {"type": "MAV_MISSION_RESULT"}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<BBB")
+    orders = [0, 1, 2]
+    lengths = [1, 1, 1]
+    array_lengths = [0, 0, 0]
+    crc_extra = 153
+    unpacker = struct.Struct("<BBB")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, target_system: int, target_component: int, type: int):
+        MAVLink_message.__init__(self, MAVLink_mission_ack_message.id, MAVLink_mission_ack_message.msgname)
+        self._fieldnames = MAVLink_mission_ack_message.fieldnames
+        self._instance_field = MAVLink_mission_ack_message.instance_field
+        self._instance_offset = MAVLink_mission_ack_message.instance_offset
+        self.target_system = target_system
+        self.target_component = target_component
+        self.type = type
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.target_system, self.target_component, self.type), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_mission_ack_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_mission_request_int_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_MISSION_REQUEST_INT
+    msgname = "MISSION_REQUEST_INT"
+    fieldnames = ["target_system", "target_component", "seq"]
+    ordered_fieldnames = ["seq", "target_system", "target_component"]
+    fieldtypes = ["uint8_t", "uint8_t", "uint16_t"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<HBB")
+    orders = [1, 2, 0]
+    lengths = [1, 1, 1]
+    array_lengths = [0, 0, 0]
+    crc_extra = 196
+    unpacker = struct.Struct("<HBB")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, target_system: int, target_component: int, seq: int):
+        MAVLink_message.__init__(self, MAVLink_mission_request_int_message.id, MAVLink_mission_request_int_message.msgname)
+        self._fieldnames = MAVLink_mission_request_int_message.fieldnames
+        self._instance_field = MAVLink_mission_request_int_message.instance_field
+        self._instance_offset = MAVLink_mission_request_int_message.instance_offset
+        self.target_system = target_system
+        self.target_component = target_component
+        self.seq = seq
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.seq, self.target_system, self.target_component), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_mission_request_int_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_request_data_stream_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_REQUEST_DATA_STREAM
+    msgname = "REQUEST_DATA_STREAM"
+    fieldnames = ["target_system", "target_component", "req_stream_id", "req_message_rate", "start_stop"]
+    ordered_fieldnames = ["req_message_rate", "target_system", "target_component", "req_stream_id", "start_stop"]
+    fieldtypes = ["uint8_t", "uint8_t", "uint8_t", "uint16_t", "uint8_t"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {"req_stream_id": "MAV_DATA_STREAM"}
+    fieldunits_by_name: Dict[str, str] = {"req_message_rate": "Hz"}
+    native_format = bytearray(b"<HBBBB")
+    orders = [1, 2, 3, 0, 4]
+    lengths = [1, 1, 1, 1, 1]
+    array_lengths = [0, 0, 0, 0, 0]
+    crc_extra = 148
+    unpacker = struct.Struct("<HBBBB")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, target_system: int, target_component: int, req_stream_id: int, req_message_rate: int, start_stop: int):
+        MAVLink_message.__init__(self, MAVLink_request_data_stream_message.id, MAVLink_request_data_stream_message.msgname)
+        self._fieldnames = MAVLink_request_data_stream_message.fieldnames
+        self._instance_field = MAVLink_request_data_stream_message.instance_field
+        self._instance_offset = MAVLink_request_data_stream_message.instance_offset
+        self.target_system = target_system
+        self.target_component = target_component
+        self.req_stream_id = req_stream_id
+        self.req_message_rate = req_message_rate
+        self.start_stop = start_stop
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.req_message_rate, self.target_system, self.target_component, self.req_stream_id, self.start_stop), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_request_data_stream_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_mission_item_int_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_MISSION_ITEM_INT
+    msgname = "MISSION_ITEM_INT"
+    fieldnames = ["target_system", "target_component", "seq", "frame", "command", "current", "autocontinue", "param1", "param2", "param3", "param4", "x", "y", "z"]
+    ordered_fieldnames = ["param1", "param2", "param3", "param4", "x", "y", "z", "seq", "command", "target_system", "target_component", "frame", "current", "autocontinue"]
+    fieldtypes = ["uint8_t", "uint8_t", "uint16_t", "uint8_t", "uint16_t", "uint8_t", "uint8_t", "float", "float", "float", "float", "int32_t", "int32_t", "float"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {"frame": "MAV_FRAME", "command": "MAV_CMD"}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<ffffiifHHBBBBB")
+    orders = [9, 10, 7, 11, 8, 12, 13, 0, 1, 2, 3, 4, 5, 6]
+    lengths = [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+    array_lengths = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+    crc_extra = 38
+    unpacker = struct.Struct("<ffffiifHHBBBBB")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, target_system: int, target_component: int, seq: int, frame: int, command: int, current: int, autocontinue: int, param1: float, param2: float, param3: float, param4: float, x: int, y: int, z: float):
+        MAVLink_message.__init__(self, MAVLink_mission_item_int_message.id, MAVLink_mission_item_int_message.msgname)
+        self._fieldnames = MAVLink_mission_item_int_message.fieldnames
+        self._instance_field = MAVLink_mission_item_int_message.instance_field
+        self._instance_offset = MAVLink_mission_item_int_message.instance_offset
+        self.target_system = target_system
+        self.target_component = target_component
+        self.seq = seq
+        self.frame = frame
+        self.command = command
+        self.current = current
+        self.autocontinue = autocontinue
+        self.param1 = param1
+        self.param2 = param2
+        self.param3 = param3
+        self.param4 = param4
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.param1, self.param2, self.param3, self.param4, self.x, self.y, self.z, self.seq, self.command, self.target_system, self.target_component, self.frame, self.current, self.autocontinue), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_mission_item_int_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_vfr_hud_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_VFR_HUD
+    msgname = "VFR_HUD"
+    fieldnames = ["airspeed", "groundspeed", "heading", "throttle", "alt", "climb"]
+    ordered_fieldnames = ["airspeed", "groundspeed", "alt", "climb", "heading", "throttle"]
+    fieldtypes = ["float", "float", "int16_t", "uint16_t", "float", "float"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {}
+    fieldunits_by_name: Dict[str, str] = {"airspeed": "m/s", "groundspeed": "m/s", "heading": "deg", "throttle": "%", "alt": "m", "climb": "m/s"}
+    native_format = bytearray(b"<ffffhH")
+    orders = [0, 1, 4, 5, 2, 3]
+    lengths = [1, 1, 1, 1, 1, 1]
+    array_lengths = [0, 0, 0, 0, 0, 0]
+    crc_extra = 20
+    unpacker = struct.Struct("<ffffhH")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, airspeed: float, groundspeed: float, heading: int, throttle: int, alt: float, climb: float):
+        MAVLink_message.__init__(self, MAVLink_vfr_hud_message.id, MAVLink_vfr_hud_message.msgname)
+        self._fieldnames = MAVLink_vfr_hud_message.fieldnames
+        self._instance_field = MAVLink_vfr_hud_message.instance_field
+        self._instance_offset = MAVLink_vfr_hud_message.instance_offset
+        self.airspeed = airspeed
+        self.groundspeed = groundspeed
+        self.heading = heading
+        self.throttle = throttle
+        self.alt = alt
+        self.climb = climb
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.airspeed, self.groundspeed, self.alt, self.climb, self.heading, self.throttle), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_vfr_hud_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_command_long_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_COMMAND_LONG
+    msgname = "COMMAND_LONG"
+    fieldnames = ["target_system", "target_component", "command", "confirmation", "param1", "param2", "param3", "param4", "param5", "param6", "param7"]
+    ordered_fieldnames = ["param1", "param2", "param3", "param4", "param5", "param6", "param7", "command", "target_system", "target_component", "confirmation"]
+    fieldtypes = ["uint8_t", "uint8_t", "uint16_t", "uint8_t", "float", "float", "float", "float", "float", "float", "float"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {"command": "MAV_CMD"}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<fffffffHBBB")
+    orders = [8, 9, 7, 10, 0, 1, 2, 3, 4, 5, 6]
+    lengths = [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+    array_lengths = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+    crc_extra = 152
+    unpacker = struct.Struct("<fffffffHBBB")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, target_system: int, target_component: int, command: int, confirmation: int, param1: float, param2: float, param3: float, param4: float, param5: float, param6: float, param7: float):
+        MAVLink_message.__init__(self, MAVLink_command_long_message.id, MAVLink_command_long_message.msgname)
+        self._fieldnames = MAVLink_command_long_message.fieldnames
+        self._instance_field = MAVLink_command_long_message.instance_field
+        self._instance_offset = MAVLink_command_long_message.instance_offset
+        self.target_system = target_system
+        self.target_component = target_component
+        self.command = command
+        self.confirmation = confirmation
+        self.param1 = param1
+        self.param2 = param2
+        self.param3 = param3
+        self.param4 = param4
+        self.param5 = param5
+        self.param6 = param6
+        self.param7 = param7
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.param1, self.param2, self.param3, self.param4, self.param5, self.param6, self.param7, self.command, self.target_system, self.target_component, self.confirmation), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_command_long_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_command_ack_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_COMMAND_ACK
+    msgname = "COMMAND_ACK"
+    fieldnames = ["command", "result"]
+    ordered_fieldnames = ["command", "result"]
+    fieldtypes = ["uint16_t", "uint8_t"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {"command": "MAV_CMD", "result": "MAV_RESULT"}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<HB")
+    orders = [0, 1]
+    lengths = [1, 1]
+    array_lengths = [0, 0]
+    crc_extra = 143
+    unpacker = struct.Struct("<HB")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, command: int, result: int):
+        MAVLink_message.__init__(self, MAVLink_command_ack_message.id, MAVLink_command_ack_message.msgname)
+        self._fieldnames = MAVLink_command_ack_message.fieldnames
+        self._instance_field = MAVLink_command_ack_message.instance_field
+        self._instance_offset = MAVLink_command_ack_message.instance_offset
+        self.command = command
+        self.result = result
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.command, self.result), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_command_ack_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_battery_status_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_BATTERY_STATUS
+    msgname = "BATTERY_STATUS"
+    fieldnames = ["id", "battery_function", "type", "temperature", "voltages", "current_battery", "current_consumed", "energy_consumed", "battery_remaining"]
+    ordered_fieldnames = ["current_consumed", "energy_consumed", "temperature", "voltages", "current_battery", "id", "battery_function", "type", "battery_remaining"]
+    fieldtypes = ["uint8_t", "uint8_t", "uint8_t", "int16_t", "uint16_t", "int16_t", "int32_t", "int32_t", "int8_t"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {"battery_function": "MAV_BATTERY_FUNCTION", "type": "MAV_BATTERY_TYPE"}
+    fieldunits_by_name: Dict[str, str] = {"temperature": "cdegC", "voltages": "mV", "current_battery": "cA", "current_consumed": "mAh", "energy_consumed": "hJ", "battery_remaining": "%"}
+    native_format = bytearray(b"<iihHhBBBb")
+    orders = [5, 6, 7, 2, 3, 4, 0, 1, 8]
+    lengths = [1, 1, 1, 10, 1, 1, 1, 1, 1]
+    array_lengths = [0, 0, 0, 10, 0, 0, 0, 0, 0]
+    crc_extra = 154
+    unpacker = struct.Struct("<iih10HhBBBb")
+    instance_field = "id"
+    instance_offset = 32
+
+    def __init__(self, id: int, battery_function: int, type: int, temperature: int, voltages: Sequence[int], current_battery: int, current_consumed: int, energy_consumed: int, battery_remaining: int):
+        MAVLink_message.__init__(self, MAVLink_battery_status_message.id, MAVLink_battery_status_message.msgname)
+        self._fieldnames = MAVLink_battery_status_message.fieldnames
+        self._instance_field = MAVLink_battery_status_message.instance_field
+        self._instance_offset = MAVLink_battery_status_message.instance_offset
+        self.id = id
+        self.battery_function = battery_function
+        self.type = type
+        self.temperature = temperature
+        self.voltages = voltages
+        self.current_battery = current_battery
+        self.current_consumed = current_consumed
+        self.energy_consumed = energy_consumed
+        self.battery_remaining = battery_remaining
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.current_consumed, self.energy_consumed, self.temperature, self.voltages[0], self.voltages[1], self.voltages[2], self.voltages[3], self.voltages[4], self.voltages[5], self.voltages[6], self.voltages[7], self.voltages[8], self.voltages[9], self.current_battery, self.id, self.battery_function, self.type, self.battery_remaining), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_battery_status_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_statustext_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_STATUSTEXT
+    msgname = "STATUSTEXT"
+    fieldnames = ["severity", "text"]
+    ordered_fieldnames = ["severity", "text"]
+    fieldtypes = ["uint8_t", "char"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {"severity": "MAV_SEVERITY"}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<Bc")
+    orders = [0, 1]
+    lengths = [1, 1]
+    array_lengths = [0, 50]
+    crc_extra = 83
+    unpacker = struct.Struct("<B50s")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, severity: int, text: bytes):
+        MAVLink_message.__init__(self, MAVLink_statustext_message.id, MAVLink_statustext_message.msgname)
+        self._fieldnames = MAVLink_statustext_message.fieldnames
+        self._instance_field = MAVLink_statustext_message.instance_field
+        self._instance_offset = MAVLink_statustext_message.instance_offset
+        self.severity = severity
+        self._text_raw = text
+        self.text = text.split(b"\x00", 1)[0].decode("ascii", errors="replace")
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.severity, self._text_raw), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_statustext_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_heartbeat_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_HEARTBEAT
+    msgname = "HEARTBEAT"
+    fieldnames = ["type", "autopilot", "base_mode", "custom_mode", "system_status", "mavlink_version"]
+    ordered_fieldnames = ["custom_mode", "type", "autopilot", "base_mode", "system_status", "mavlink_version"]
+    fieldtypes = ["uint8_t", "uint8_t", "uint8_t", "uint32_t", "uint8_t", "uint8_t"]
+    fielddisplays_by_name: Dict[str, str] = {"base_mode": "bitmask"}
+    fieldenums_by_name: Dict[str, str] = {"type": "MAV_TYPE", "autopilot": "MAV_AUTOPILOT", "base_mode": "MAV_MODE_FLAG", "system_status": "MAV_STATE"}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<IBBBBB")
+    orders = [1, 2, 3, 0, 4, 5]
+    lengths = [1, 1, 1, 1, 1, 1]
+    array_lengths = [0, 0, 0, 0, 0, 0]
+    crc_extra = 50
+    unpacker = struct.Struct("<IBBBBB")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, type: int, autopilot: int, base_mode: int, custom_mode: int, system_status: int, mavlink_version: int):
+        MAVLink_message.__init__(self, MAVLink_heartbeat_message.id, MAVLink_heartbeat_message.msgname)
+        self._fieldnames = MAVLink_heartbeat_message.fieldnames
+        self._instance_field = MAVLink_heartbeat_message.instance_field
+        self._instance_offset = MAVLink_heartbeat_message.instance_offset
+        self.type = type
+        self.autopilot = autopilot
+        self.base_mode = base_mode
+        self.custom_mode = custom_mode
+        self.system_status = system_status
+        self.mavlink_version = mavlink_version
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.custom_mode, self.type, self.autopilot, self.base_mode, self.system_status, self.mavlink_version), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_heartbeat_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_global_position_int_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_GLOBAL_POSITION_INT
+    msgname = "GLOBAL_POSITION_INT"
+    fieldnames = ["time_boot_ms", "lat", "lon", "alt", "relative_alt", "vx", "vy", "vz", "hdg"]
+    ordered_fieldnames = ["time_boot_ms", "lat", "lon", "alt", "relative_alt", "vx", "vy", "vz", "hdg"]
+    fieldtypes = ["uint32_t", "int32_t", "int32_t", "int32_t", "int32_t", "int16_t", "int16_t", "int16_t", "uint16_t"]
+    fielddisplays_by_name: Dict[str, str] = {}
+    fieldenums_by_name: Dict[str, str] = {}
+    fieldunits_by_name: Dict[str, str] = {"time_boot_ms": "ms", "lat": "degE7", "lon": "degE7", "alt": "mm", "relative_alt": "mm", "vx": "cm/s", "vy": "cm/s", "vz": "cm/s", "hdg": "cdeg"}
+    native_format = bytearray(b"<IiiiihhhH")
+    orders = [0, 1, 2, 3, 4, 5, 6, 7, 8]
+    lengths = [1, 1, 1, 1, 1, 1, 1, 1, 1]
+    array_lengths = [0, 0, 0, 0, 0, 0, 0, 0, 0]
+    crc_extra = 104
+    unpacker = struct.Struct("<IiiiihhhH")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, time_boot_ms: int, lat: int, lon: int, alt: int, relative_alt: int, vx: int, vy: int, vz: int, hdg: int):
+        MAVLink_message.__init__(self, MAVLink_global_position_int_message.id, MAVLink_global_position_int_message.msgname)
+        self._fieldnames = MAVLink_global_position_int_message.fieldnames
+        self._instance_field = MAVLink_global_position_int_message.instance_field
+        self._instance_offset = MAVLink_global_position_int_message.instance_offset
+        self.time_boot_ms = time_boot_ms
+        self.lat = lat
+        self.lon = lon
+        self.alt = alt
+        self.relative_alt = relative_alt
+        self.vx = vx
+        self.vy = vy
+        self.vz = vz
+        self.hdg = hdg
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.time_boot_ms, self.lat, self.lon, self.alt, self.relative_alt, self.vx, self.vy, self.vz, self.hdg), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_global_position_int_message, "name", mavlink_msg_deprecated_name_property())
+
+
+class MAVLink_autopilot_version_message(MAVLink_message):
+    """
+
+    """
+
+    id = MAVLINK_MSG_ID_AUTOPILOT_VERSION
+    msgname = "AUTOPILOT_VERSION"
+    fieldnames = ["capabilities", "flight_sw_version", "middleware_sw_version", "os_sw_version", "board_version", "flight_custom_version", "middleware_custom_version", "os_custom_version", "vendor_id", "product_id", "uid"]
+    ordered_fieldnames = ["capabilities", "uid", "flight_sw_version", "middleware_sw_version", "os_sw_version", "board_version", "vendor_id", "product_id", "flight_custom_version", "middleware_custom_version", "os_custom_version"]
+    fieldtypes = ["uint64_t", "uint32_t", "uint32_t", "uint32_t", "uint32_t", "uint8_t", "uint8_t", "uint8_t", "uint16_t", "uint16_t", "uint64_t"]
+    fielddisplays_by_name: Dict[str, str] = {"capabilities": "bitmask"}
+    fieldenums_by_name: Dict[str, str] = {"capabilities": "MAV_PROTOCOL_CAPABILITY"}
+    fieldunits_by_name: Dict[str, str] = {}
+    native_format = bytearray(b"<QQIIIIHHBBB")
+    orders = [0, 2, 3, 4, 5, 8, 9, 10, 6, 7, 1]
+    lengths = [1, 1, 1, 1, 1, 1, 1, 1, 8, 8, 8]
+    array_lengths = [0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 8]
+    crc_extra = 178
+    unpacker = struct.Struct("<QQIIIIHH8B8B8B")
+    instance_field = None
+    instance_offset = -1
+
+    def __init__(self, capabilities: int, flight_sw_version: int, middleware_sw_version: int, os_sw_version: int, board_version: int, flight_custom_version: Sequence[int], middleware_custom_version: Sequence[int], os_custom_version: Sequence[int], vendor_id: int, product_id: int, uid: int):
+        MAVLink_message.__init__(self, MAVLink_autopilot_version_message.id, MAVLink_autopilot_version_message.msgname)
+        self._fieldnames = MAVLink_autopilot_version_message.fieldnames
+        self._instance_field = MAVLink_autopilot_version_message.instance_field
+        self._instance_offset = MAVLink_autopilot_version_message.instance_offset
+        self.capabilities = capabilities
+        self.flight_sw_version = flight_sw_version
+        self.middleware_sw_version = middleware_sw_version
+        self.os_sw_version = os_sw_version
+        self.board_version = board_version
+        self.flight_custom_version = flight_custom_version
+        self.middleware_custom_version = middleware_custom_version
+        self.os_custom_version = os_custom_version
+        self.vendor_id = vendor_id
+        self.product_id = product_id
+        self.uid = uid
+
+    def pack(self, mav: "MAVLink", force_mavlink1: bool = False) -> bytes:
+        return self._pack(mav, self.crc_extra, self.unpacker.pack(self.capabilities, self.uid, self.flight_sw_version, self.middleware_sw_version, self.os_sw_version, self.board_version, self.vendor_id, self.product_id, self.flight_custom_version[0], self.flight_custom_version[1], self.flight_custom_version[2], self.flight_custom_version[3], self.flight_custom_version[4], self.flight_custom_version[5], self.flight_custom_version[6], self.flight_custom_version[7], self.middleware_custom_version[0], self.middleware_custom_version[1], self.middleware_custom_version[2], self.middleware_custom_version[3], self.middleware_custom_version[4], self.middleware_custom_version[5], self.middleware_custom_version[6], self.middleware_custom_version[7], self.os_custom_version[0], self.os_custom_version[1], self.os_custom_version[2], self.os_custom_version[3], self.os_custom_version[4], self.os_custom_version[5], self.os_custom_version[6], self.os_custom_version[7]), force_mavlink1=force_mavlink1)
+
+
+# Define name on the class for backwards compatibility (it is now msgname).
+# Done with setattr to hide the class variable from mypy.
+setattr(MAVLink_autopilot_version_message, "name", mavlink_msg_deprecated_name_property())
+
+
+mavlink_map: Dict[int, Type[MAVLink_message]] = {
+    MAVLINK_MSG_ID_EKF_STATUS_REPORT: MAVLink_ekf_status_report_message,
+    MAVLINK_MSG_ID_SYS_STATUS: MAVLink_sys_status_message,
+    MAVLINK_MSG_ID_SET_MODE: MAVLink_set_mode_message,
+    MAVLINK_MSG_ID_PARAM_REQUEST_READ: MAVLink_param_request_read_message,
+    MAVLINK_MSG_ID_PARAM_REQUEST_LIST: MAVLink_param_request_list_message,
+    MAVLINK_MSG_ID_PARAM_VALUE: MAVLink_param_value_message,
+    MAVLINK_MSG_ID_GPS_RAW_INT: MAVLink_gps_raw_int_message,
+    MAVLINK_MSG_ID_ATTITUDE: MAVLink_attitude_message,
+    MAVLINK_MSG_ID_MISSION_ITEM: MAVLink_mission_item_message,
+    MAVLINK_MSG_ID_MISSION_REQUEST: MAVLink_mission_request_message,
+    MAVLINK_MSG_ID_MISSION_REQUEST_LIST: MAVLink_mission_request_list_message,
+    MAVLINK_MSG_ID_MISSION_COUNT: MAVLink_mission_count_message,
+    MAVLINK_MSG_ID_MISSION_CLEAR_ALL: MAVLink_mission_clear_all_message,
+    MAVLINK_MSG_ID_MISSION_ACK: MAVLink_mission_ack_message,
+    MAVLINK_MSG_ID_MISSION_REQUEST_INT: MAVLink_mission_request_int_message,
+    MAVLINK_MSG_ID_REQUEST_DATA_STREAM: MAVLink_request_data_stream_message,
+    MAVLINK_MSG_ID_MISSION_ITEM_INT: MAVLink_mission_item_int_message,
+    MAVLINK_MSG_ID_VFR_HUD: MAVLink_vfr_hud_message,
+    MAVLINK_MSG_ID_COMMAND_LONG: MAVLink_command_long_message,
+    MAVLINK_MSG_ID_COMMAND_ACK: MAVLink_command_ack_message,
+    MAVLINK_MSG_ID_BATTERY_STATUS: MAVLink_battery_status_message,
+    MAVLINK_MSG_ID_STATUSTEXT: MAVLink_statustext_message,
+    MAVLINK_MSG_ID_HEARTBEAT: MAVLink_heartbeat_message,
+    MAVLINK_MSG_ID_GLOBAL_POSITION_INT: MAVLink_global_position_int_message,
+    MAVLINK_MSG_ID_AUTOPILOT_VERSION: MAVLink_autopilot_version_message,
+}
+
+
+class MAVError(Exception):
+    """MAVLink error class"""
+
+    def __init__(self, msg: str) -> None:
+        Exception.__init__(self, msg)
+        self.message = msg
+
+
+class MAVLink_bad_data(MAVLink_message):
+    """
+    a piece of bad data in a mavlink stream
+    """
+
+    def __init__(self, data: Union[bytes, bytearray], reason: str) -> None:
+        MAVLink_message.__init__(self, MAVLINK_MSG_ID_BAD_DATA, "BAD_DATA")
+        self._fieldnames = ["data", "reason"]
+        self.data = data
+        self.reason = reason
+        self._msgbuf = bytearray(data)
+        self._instance_field = None
+
+    def __str__(self) -> str:
+        """Override the __str__ function from MAVLink_messages because non-printable characters are common in to be the reason for this message to exist."""
+        hexstr = ["{:x}".format(i) for i in self.data]
+        return "%s {%s, data:%s}" % (self._type, self.reason, hexstr)
+
+
+class MAVLink_unknown(MAVLink_message):
+    """
+    a message that we don't have in the XML used when built
+    """
+
+    def __init__(self, msgid: int, data: Union[bytes, bytearray]) -> None:
+        MAVLink_message.__init__(self, MAVLINK_MSG_ID_UNKNOWN, "UNKNOWN_%u" % msgid)
+        self._fieldnames = ["data"]
+        self.data = data
+        self._msgbuf = bytearray(data)
+        self._instance_field = None
+
+    def __str__(self) -> str:
+        """Override the __str__ function from MAVLink_messages because non-printable characters are common."""
+        hexstr = ["{:x}".format(i) for i in self.data]
+        return "%s {data:%s}" % (self._type, hexstr)
+
+
+class MAVLinkSigning(object):
+    """MAVLink signing state class"""
+
+    def __init__(self) -> None:
+        self.secret_key: Optional[bytes] = None
+        self.timestamp = 0
+        self.link_id = 0
+        self.sign_outgoing = False
+        self.allow_unsigned_callback: Optional[Callable[["MAVLink", int], bool]] = None
+        self.stream_timestamps: Dict[Tuple[int, int, int], int] = {}
+        self.sig_count = 0
+        self.badsig_count = 0
+        self.goodsig_count = 0
+        self.unsigned_count = 0
+        self.reject_count = 0
+
+
+MAVLinkV1Header = Tuple[bytes, int, int, int, int, int]
+MAVLinkV2Header = Tuple[bytes, int, int, int, int, int, int, int, int]
+
+class MAVLink(object):
+    """MAVLink protocol handling class"""
+
+    def __init__(self, file: Any, srcSystem: int = 0, srcComponent: int = 0, use_native: bool = False) -> None:
+        self.seq = 0
+        self.file = file
+        self.srcSystem = srcSystem
+        self.srcComponent = srcComponent
+        self.callback: Optional[Callable[..., None]] = None
+        self.callback_args: Optional[Iterable[Any]] = None
+        self.callback_kwargs: Optional[Mapping[str, Any]] = None
+        self.send_callback: Optional[Callable[..., None]] = None
+        self.send_callback_args: Optional[Iterable[Any]] = None
+        self.send_callback_kwargs: Optional[Mapping[str, Any]] = None
+        self.buf = bytearray()
+        self.buf_index = 0
+        self.expected_length = HEADER_LEN_V1 + 2
+        self.have_prefix_error = False
+        self.robust_parsing = False
+        self.protocol_marker = 254
+        self.little_endian = True
+        self.crc_extra = True
+        self.sort_fields = True
+        self.total_packets_sent = 0
+        self.total_bytes_sent = 0
+        self.total_packets_received = 0
+        self.total_bytes_received = 0
+        self.total_receive_errors = 0
+        self.startup_time = time.time()
+        self.signing = MAVLinkSigning()
+        self.mav20_unpacker = struct.Struct("<cBBBBBBHB")
+        self.mav10_unpacker = struct.Struct("<cBBBBB")
+        self.mav20_h3_unpacker = struct.Struct("BBB")
+        self.mav_csum_unpacker = struct.Struct("<H")
+        self.mav_sign_unpacker = struct.Struct("<IH")
+
+    def set_callback(self, callback: Callable[..., None], *args: Any, **kwargs: Any) -> None:
+        self.callback = callback
+        self.callback_args = args
+        self.callback_kwargs = kwargs
+
+    def set_send_callback(self, callback: Callable[..., None], *args: Any, **kwargs: Any) -> None:
+        self.send_callback = callback
+        self.send_callback_args = args
+        self.send_callback_kwargs = kwargs
+
+    def send(self, mavmsg: MAVLink_message, force_mavlink1: bool = False) -> None:
+        """send a MAVLink message"""
+        buf = mavmsg.pack(self, force_mavlink1=force_mavlink1)
+        self.file.write(buf)
+        self.seq = (self.seq + 1) % 256
+        self.total_packets_sent += 1
+        self.total_bytes_sent += len(buf)
+        if self.send_callback is not None and self.send_callback_args is not None and self.send_callback_kwargs is not None:
+            self.send_callback(mavmsg, *self.send_callback_args, **self.send_callback_kwargs)
+
+    def buf_len(self) -> int:
+        return len(self.buf) - self.buf_index
+
+    def bytes_needed(self) -> int:
+        """return number of bytes needed for next parsing stage"""
+        ret = self.expected_length - self.buf_len()
+
+        if ret <= 0:
+            return 1
+        return ret
+
+    def __callbacks(self, msg: MAVLink_message) -> None:
+        """this method exists only to make profiling results easier to read"""
+        if self.callback is not None and self.callback_args is not None and self.callback_kwargs is not None:
+            self.callback(msg, *self.callback_args, **self.callback_kwargs)
+
+    def parse_char(self, c: Sequence[int]) -> Optional[MAVLink_message]:
+        """input some data bytes, possibly returning a new message"""
+        self.buf.extend(c)
+
+        self.total_bytes_received += len(c)
+
+        m = self.__parse_char_legacy()
+
+        if m is not None:
+            self.total_packets_received += 1
+            self.__callbacks(m)
+
+        # See if there's nothing left in the buffer, reset it to 0
+        # which frees the memory
+        if self.buf_index != 0 and self.buf_len() == 0:
+            self.buf = bytearray()
+            self.buf_index = 0
+
+        return m
+
+    def __parse_char_legacy(self) -> Optional[MAVLink_message]:
+        """input some data bytes, possibly returning a new message"""
+        header_len = HEADER_LEN_V1
+        if self.buf_len() >= 1 and self.buf[self.buf_index] == PROTOCOL_MARKER_V2:
+            header_len = HEADER_LEN_V2
+
+        m: Optional[MAVLink_message] = None
+        if self.buf_len() >= 1 and self.buf[self.buf_index] != PROTOCOL_MARKER_V1 and self.buf[self.buf_index] != PROTOCOL_MARKER_V2:
+            magic = self.buf[self.buf_index]
+            self.buf_index += 1
+            if self.robust_parsing:
+                invalid_prefix_start = self.buf_index - 1
+                while self.buf_len() >= 1 and self.buf[self.buf_index] != PROTOCOL_MARKER_V1 and self.buf[self.buf_index] != PROTOCOL_MARKER_V2:
+                    self.buf_index += 1
+                m = MAVLink_bad_data(self.buf[invalid_prefix_start : self.buf_index], "Bad prefix")
+                self.expected_length = header_len + 2
+                self.total_receive_errors += 1
+                return m
+            if self.have_prefix_error:
+                return None
+            self.have_prefix_error = True
+            self.total_receive_errors += 1
+            raise MAVError("invalid MAVLink prefix '%s'" % magic)
+        self.have_prefix_error = False
+        if self.buf_len() >= 3:
+            sbuf = self.buf[self.buf_index : 3 + self.buf_index]
+            unpacked_h3: Tuple[int, int, int] = self.mav20_h3_unpacker.unpack(sbuf)
+            magic, self.expected_length, incompat_flags = unpacked_h3
+            if magic == PROTOCOL_MARKER_V2 and (incompat_flags & MAVLINK_IFLAG_SIGNED):
+                self.expected_length += MAVLINK_SIGNATURE_BLOCK_LEN
+            self.expected_length += header_len + 2
+        if self.expected_length >= (header_len + 2) and self.buf_len() >= self.expected_length:
+            mbuf = self.buf[self.buf_index : self.buf_index + self.expected_length]
+            self.buf_index += self.expected_length
+            self.expected_length = header_len + 2
+            if self.robust_parsing:
+                try:
+                    if magic == PROTOCOL_MARKER_V2 and (incompat_flags & ~MAVLINK_IFLAG_SIGNED) != 0:
+                        raise MAVError("invalid incompat_flags 0x%x 0x%x %u" % (incompat_flags, magic, self.expected_length))
+                    m = self.decode(mbuf)
+                except MAVError as reason:
+                    m = MAVLink_bad_data(mbuf, reason.message)
+                    self.total_receive_errors += 1
+            else:
+                if magic == PROTOCOL_MARKER_V2 and (incompat_flags & ~MAVLINK_IFLAG_SIGNED) != 0:
+                    raise MAVError("invalid incompat_flags 0x%x 0x%x %u" % (incompat_flags, magic, self.expected_length))
+                m = self.decode(mbuf)
+            return m
+        return None
+
+    def parse_buffer(self, s: Sequence[int]) -> Optional[List[MAVLink_message]]:
+        """input some data bytes, possibly returning a list of new messages"""
+        m = self.parse_char(s)
+        if m is None:
+            return None
+        ret = [m]
+        while True:
+            m = self.parse_char(b"")
+            if m is None:
+                return ret
+            ret.append(m)
+
+    def check_signature(self, msgbuf: bytearray, srcSystem: int, srcComponent: int) -> bool:
+        """check signature on incoming message"""
+        assert self.signing.secret_key is not None
+
+        timestamp_buf = msgbuf[-12:-6]
+        link_id = msgbuf[-13]
+        tbytes: Tuple[int, int] = self.mav_sign_unpacker.unpack(timestamp_buf)
+        tlow, thigh = tbytes
+        timestamp = tlow + (thigh << 32)
+
+        # see if the timestamp is acceptable
+        stream_key = (link_id, srcSystem, srcComponent)
+        if stream_key in self.signing.stream_timestamps:
+            if timestamp <= self.signing.stream_timestamps[stream_key]:
+                # reject old timestamp
+                logger.info("old timestamp")
+                return False
+        else:
+            # a new stream has appeared. Accept the timestamp if it is at most
+            # one minute behind our current timestamp
+            if timestamp + 6000 * 1000 < self.signing.timestamp:
+                logger.info("bad new stream %s %s", timestamp / (100.0 * 1000 * 60 * 60 * 24 * 365), self.signing.timestamp / (100.0 * 1000 * 60 * 60 * 24 * 365))
+                return False
+            logger.info("new stream")
+
+        # set the streams timestamp so we reject timestamps that go backwards
+        self.signing.stream_timestamps[stream_key] = timestamp
+
+        h = hashlib.new("sha256")
+        h.update(self.signing.secret_key)
+        h.update(msgbuf[:-6])
+        sig1 = h.digest()[:6]
+        sig2 = msgbuf[-6:]
+        if sig1 != sig2:
+            logger.info("sig mismatch")
+            return False
+
+        # the timestamp we next send with is the max of the received timestamp and
+        # our current timestamp
+        self.signing.timestamp = max(self.signing.timestamp, timestamp)
+        return True
+
+    def decode(self, msgbuf: bytearray) -> MAVLink_message:
+        """decode a buffer as a MAVLink message"""
+        # decode the header
+        if msgbuf[0] != PROTOCOL_MARKER_V1:
+            headerlen = 10
+            try:
+                header_v2: MAVLinkV2Header = self.mav20_unpacker.unpack(msgbuf[:headerlen])
+            except struct.error as emsg:
+                raise MAVError("Unable to unpack MAVLink header: %s" % emsg)
+            magic, mlen, incompat_flags, compat_flags, seq, srcSystem, srcComponent, msgIdlow, msgIdhigh = header_v2
+            msgId = msgIdlow | (msgIdhigh << 16)
+        else:
+            headerlen = 6
+            try:
+                header_v1: MAVLinkV1Header = self.mav10_unpacker.unpack(msgbuf[:headerlen])
+            except struct.error as emsg:
+                raise MAVError("Unable to unpack MAVLink header: %s" % emsg)
+            magic, mlen, seq, srcSystem, srcComponent, msgId = header_v1
+            incompat_flags = 0
+            compat_flags = 0
+        mapkey = msgId
+        if (incompat_flags & MAVLINK_IFLAG_SIGNED) != 0:
+            signature_len = MAVLINK_SIGNATURE_BLOCK_LEN
+        else:
+            signature_len = 0
+
+        if ord(magic) != PROTOCOL_MARKER_V1 and ord(magic) != PROTOCOL_MARKER_V2:
+            raise MAVError("invalid MAVLink prefix '{}'".format(hex(ord(magic))))
+        if mlen != len(msgbuf) - (headerlen + 2 + signature_len):
+            raise MAVError("invalid MAVLink message length. Got %u expected %u, msgId=%u headerlen=%u" % (len(msgbuf) - (headerlen + 2 + signature_len), mlen, msgId, headerlen))
+
+        if mapkey not in mavlink_map:
+            return _decode_skipped(msgbuf, msgId, mlen, incompat_flags, compat_flags, seq, srcSystem, srcComponent,
+                                   signature_len, self.mav_csum_unpacker)
+
+        # decode the payload
+        msgtype = mavlink_map[mapkey]
+        order_map = msgtype.orders
+        len_map = msgtype.lengths
+        crc_extra = msgtype.crc_extra
+
+        # decode the checksum
+        try:
+            crc: int = self.mav_csum_unpacker.unpack(msgbuf[-(2 + signature_len) :][:2])[0]
+        except struct.error as emsg:
+            raise MAVError("Unable to unpack MAVLink CRC: %s" % emsg)
+        crcbuf = msgbuf[1 : -(2 + signature_len)]
+        # using CRC extra
+        crcbuf.append(crc_extra)
+        crc2 = x25crc(crcbuf)
+        if crc != crc2.crc and not MAVLINK_IGNORE_CRC:
+            raise MAVError("invalid MAVLink CRC in msgID %u 0x%04x should be 0x%04x" % (msgId, crc, crc2.crc))
+
+        sig_ok = False
+        if signature_len == MAVLINK_SIGNATURE_BLOCK_LEN:
+            self.signing.sig_count += 1
+        if self.signing.secret_key is not None:
+            accept_signature = False
+            if signature_len == MAVLINK_SIGNATURE_BLOCK_LEN:
+                sig_ok = self.check_signature(msgbuf, srcSystem, srcComponent)
+                accept_signature = sig_ok
+                if sig_ok:
+                    self.signing.goodsig_count += 1
+                else:
+                    self.signing.badsig_count += 1
+                if not accept_signature and self.signing.allow_unsigned_callback is not None:
+                    accept_signature = self.signing.allow_unsigned_callback(self, msgId)
+                    if accept_signature:
+                        self.signing.unsigned_count += 1
+                    else:
+                        self.signing.reject_count += 1
+            elif self.signing.allow_unsigned_callback is not None:
+                accept_signature = self.signing.allow_unsigned_callback(self, msgId)
+                if accept_signature:
+                    self.signing.unsigned_count += 1
+                else:
+                    self.signing.reject_count += 1
+            if not accept_signature:
+                raise MAVError("Invalid signature")
+
+        csize = msgtype.unpacker.size
+        mbuf = msgbuf[headerlen : -(2 + signature_len)]
+        if len(mbuf) < csize:
+            # zero pad to give right size
+            mbuf.extend([0] * (csize - len(mbuf)))
+        if len(mbuf) < csize:
+            raise MAVError("Bad message of type %s length %u needs %s" % (msgtype, len(mbuf), csize))
+        mbuf = mbuf[:csize]
+        try:
+            t: Tuple[Union[bytes, int, float], ...] = msgtype.unpacker.unpack(mbuf)
+        except struct.error as emsg:
+            raise MAVError("Unable to unpack MAVLink payload type=%s payloadLength=%u: %s" % (msgtype, len(mbuf), emsg))
+
+        tlist: List[Union[bytes, float, int, Sequence[Union[bytes, float, int]]]] = list(t)
+        # handle sorted fields
+        if sum(len_map) == len(len_map):
+            # message has no arrays in it
+            for i in range(0, len(tlist)):
+                tlist[i] = t[order_map[i]]
+        else:
+            # message has some arrays
+            tlist = []
+            for i in range(0, len(order_map)):
+                order = order_map[i]
+                L = len_map[order]
+                tip = sum(len_map[:order])
+                field = t[tip]
+                if L == 1 or isinstance(field, bytes):
+                    tlist.append(field)
+                else:
+                    tlist.append(list(t[tip : (tip + L)]))
+
+        # terminate any strings
+        for i, elem in enumerate(tlist):
+            if isinstance(elem, bytes):
+                tlist[i] = elem.rstrip(b"\x00")
+
+        # construct the message object
+        try:
+            # Note that initializers don't follow the Liskov Substitution Principle
+            # therefore it can't be typechecked
+            m = msgtype(*tlist)  # type: ignore
+        except Exception as emsg:
+            raise MAVError("Unable to instantiate MAVLink message of type %s : %s" % (msgtype, emsg))
+        m._signed = sig_ok
+        if m._signed:
+            m._link_id = msgbuf[-13]
+        m._msgbuf = msgbuf
+        m._payload = msgbuf[6 : -(2 + signature_len)]
+        m._crc = crc
+        m._header = MAVLink_header(msgId, incompat_flags, compat_flags, mlen, seq, srcSystem, srcComponent)
+        return m
+
+    def ekf_status_report_encode(self, flags: int, velocity_variance: float, pos_horiz_variance: float, pos_vert_variance: float, compass_variance: float, terrain_alt_variance: float) -> MAVLink_ekf_status_report_message:
+        """
+        
+
+        flags                     :  (type:uint16_t, values:EKF_STATUS_FLAGS)
+        velocity_variance         :  (type:float)
+        pos_horiz_variance        :  (type:float)
+        pos_vert_variance         :  (type:float)
+        compass_variance          :  (type:float)
+        terrain_alt_variance        :  (type:float)
+
+        """
+        return MAVLink_ekf_status_report_message(flags, velocity_variance, pos_horiz_variance, pos_vert_variance, compass_variance, terrain_alt_variance)
+
+    def ekf_status_report_send(self, flags: int, velocity_variance: float, pos_horiz_variance: float, pos_vert_variance: float, compass_variance: float, terrain_alt_variance: float, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        flags                     :  (type:uint16_t, values:EKF_STATUS_FLAGS)
+        velocity_variance         :  (type:float)
+        pos_horiz_variance        :  (type:float)
+        pos_vert_variance         :  (type:float)
+        compass_variance          :  (type:float)
+        terrain_alt_variance        :  (type:float)
+
+        """
+        self.send(self.ekf_status_report_encode(flags, velocity_variance, pos_horiz_variance, pos_vert_variance, compass_variance, terrain_alt_variance), force_mavlink1=force_mavlink1)
+
+    def sys_status_encode(self, onboard_control_sensors_present: int, onboard_control_sensors_enabled: int, onboard_control_sensors_health: int, load: int, voltage_battery: int, current_battery: int, battery_remaining: int, drop_rate_comm: int, errors_comm: int, errors_count1: int, errors_count2: int, errors_count3: int, errors_count4: int) -> MAVLink_sys_status_message:
+        """
+        
+
+        onboard_control_sensors_present        :  (type:uint32_t, values:MAV_SYS_STATUS_SENSOR)
+        onboard_control_sensors_enabled        :  (type:uint32_t, values:MAV_SYS_STATUS_SENSOR)
+        onboard_control_sensors_health        :  (type:uint32_t, values:MAV_SYS_STATUS_SENSOR)
+        load                      :  [d%] (type:uint16_t)
+        voltage_battery           :  [mV] (type:uint16_t)
+        current_battery           :  [cA] (type:int16_t)
+        battery_remaining         :  [%] (type:int8_t)
+        drop_rate_comm            :  [c%] (type:uint16_t)
+        errors_comm               :  (type:uint16_t)
+        errors_count1             :  (type:uint16_t)
+        errors_count2             :  (type:uint16_t)
+        errors_count3             :  (type:uint16_t)
+        errors_count4             :  (type:uint16_t)
+
+        """
+        return MAVLink_sys_status_message(onboard_control_sensors_present, onboard_control_sensors_enabled, onboard_control_sensors_health, load, voltage_battery, current_battery, battery_remaining, drop_rate_comm, errors_comm, errors_count1, errors_count2, errors_count3, errors_count4)
+
+    def sys_status_send(self, onboard_control_sensors_present: int, onboard_control_sensors_enabled: int, onboard_control_sensors_health: int, load: int, voltage_battery: int, current_battery: int, battery_remaining: int, drop_rate_comm: int, errors_comm: int, errors_count1: int, errors_count2: int, errors_count3: int, errors_count4: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        onboard_control_sensors_present        :  (type:uint32_t, values:MAV_SYS_STATUS_SENSOR)
+        onboard_control_sensors_enabled        :  (type:uint32_t, values:MAV_SYS_STATUS_SENSOR)
+        onboard_control_sensors_health        :  (type:uint32_t, values:MAV_SYS_STATUS_SENSOR)
+        load                      :  [d%] (type:uint16_t)
+        voltage_battery           :  [mV] (type:uint16_t)
+        current_battery           :  [cA] (type:int16_t)
+        battery_remaining         :  [%] (type:int8_t)
+        drop_rate_comm            :  [c%] (type:uint16_t)
+        errors_comm               :  (type:uint16_t)
+        errors_count1             :  (type:uint16_t)
+        errors_count2             :  (type:uint16_t)
+        errors_count3             :  (type:uint16_t)
+        errors_count4             :  (type:uint16_t)
+
+        """
+        self.send(self.sys_status_encode(onboard_control_sensors_present, onboard_control_sensors_enabled, onboard_control_sensors_health, load, voltage_battery, current_battery, battery_remaining, drop_rate_comm, errors_comm, errors_count1, errors_count2, errors_count3, errors_count4), force_mavlink1=force_mavlink1)
+
+    def set_mode_encode(self, target_system: int, base_mode: int, custom_mode: int) -> MAVLink_set_mode_message:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        base_mode                 :  (type:uint8_t, values:MAV_MODE)
+        custom_mode               :  (type:uint32_t)
+
+        """
+        return MAVLink_set_mode_message(target_system, base_mode, custom_mode)
+
+    def set_mode_send(self, target_system: int, base_mode: int, custom_mode: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        base_mode                 :  (type:uint8_t, values:MAV_MODE)
+        custom_mode               :  (type:uint32_t)
+
+        """
+        self.send(self.set_mode_encode(target_system, base_mode, custom_mode), force_mavlink1=force_mavlink1)
+
+    def param_request_read_encode(self, target_system: int, target_component: int, param_id: bytes, param_index: int) -> MAVLink_param_request_read_message:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        param_id                  :  (type:char)
+        param_index               :  (type:int16_t)
+
+        """
+        return MAVLink_param_request_read_message(target_system, target_component, param_id, param_index)
+
+    def param_request_read_send(self, target_system: int, target_component: int, param_id: bytes, param_index: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        param_id                  :  (type:char)
+        param_index               :  (type:int16_t)
+
+        """
+        self.send(self.param_request_read_encode(target_system, target_component, param_id, param_index), force_mavlink1=force_mavlink1)
+
+    def param_request_list_encode(self, target_system: int, target_component: int) -> MAVLink_param_request_list_message:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+
+        """
+        return MAVLink_param_request_list_message(target_system, target_component)
+
+    def param_request_list_send(self, target_system: int, target_component: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+
+        """
+        self.send(self.param_request_list_encode(target_system, target_component), force_mavlink1=force_mavlink1)
+
+    def param_value_encode(self, param_id: bytes, param_value: float, param_type: int, param_count: int, param_index: int) -> MAVLink_param_value_message:
+        """
+        
+
+        param_id                  :  (type:char)
+        param_value               :  (type:float)
+        param_type                :  (type:uint8_t, values:MAV_PARAM_TYPE)
+        param_count               :  (type:uint16_t)
+        param_index               :  (type:uint16_t)
+
+        """
+        return MAVLink_param_value_message(param_id, param_value, param_type, param_count, param_index)
+
+    def param_value_send(self, param_id: bytes, param_value: float, param_type: int, param_count: int, param_index: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        param_id                  :  (type:char)
+        param_value               :  (type:float)
+        param_type                :  (type:uint8_t, values:MAV_PARAM_TYPE)
+        param_count               :  (type:uint16_t)
+        param_index               :  (type:uint16_t)
+
+        """
+        self.send(self.param_value_encode(param_id, param_value, param_type, param_count, param_index), force_mavlink1=force_mavlink1)
+
+    def gps_raw_int_encode(self, time_usec: int, fix_type: int, lat: int, lon: int, alt: int, eph: int, epv: int, vel: int, cog: int, satellites_visible: int) -> MAVLink_gps_raw_int_message:
+        """
+        
+
+        time_usec                 :  [us] (type:uint64_t)
+        fix_type                  :  (type:uint8_t, values:GPS_FIX_TYPE)
+        lat                       :  [degE7] (type:int32_t)
+        lon                       :  [degE7] (type:int32_t)
+        alt                       :  [mm] (type:int32_t)
+        eph                       :  (type:uint16_t)
+        epv                       :  (type:uint16_t)
+        vel                       :  [cm/s] (type:uint16_t)
+        cog                       :  [cdeg] (type:uint16_t)
+        satellites_visible        :  (type:uint8_t)
+
+        """
+        return MAVLink_gps_raw_int_message(time_usec, fix_type, lat, lon, alt, eph, epv, vel, cog, satellites_visible)
+
+    def gps_raw_int_send(self, time_usec: int, fix_type: int, lat: int, lon: int, alt: int, eph: int, epv: int, vel: int, cog: int, satellites_visible: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        time_usec                 :  [us] (type:uint64_t)
+        fix_type                  :  (type:uint8_t, values:GPS_FIX_TYPE)
+        lat                       :  [degE7] (type:int32_t)
+        lon                       :  [degE7] (type:int32_t)
+        alt                       :  [mm] (type:int32_t)
+        eph                       :  (type:uint16_t)
+        epv                       :  (type:uint16_t)
+        vel                       :  [cm/s] (type:uint16_t)
+        cog                       :  [cdeg] (type:uint16_t)
+        satellites_visible        :  (type:uint8_t)
+
+        """
+        self.send(self.gps_raw_int_encode(time_usec, fix_type, lat, lon, alt, eph, epv, vel, cog, satellites_visible), force_mavlink1=force_mavlink1)
+
+    def attitude_encode(self, time_boot_ms: int, roll: float, pitch: float, yaw: float, rollspeed: float, pitchspeed: float, yawspeed: float) -> MAVLink_attitude_message:
+        """
+        
+
+        time_boot_ms              :  [ms] (type:uint32_t)
+        roll                      :  [rad] (type:float)
+        pitch                     :  [rad] (type:float)
+        yaw                       :  [rad] (type:float)
+        rollspeed                 :  [rad/s] (type:float)
+        pitchspeed                :  [rad/s] (type:float)
+        yawspeed                  :  [rad/s] (type:float)
+
+        """
+        return MAVLink_attitude_message(time_boot_ms, roll, pitch, yaw, rollspeed, pitchspeed, yawspeed)
+
+    def attitude_send(self, time_boot_ms: int, roll: float, pitch: float, yaw: float, rollspeed: float, pitchspeed: float, yawspeed: float, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        time_boot_ms              :  [ms] (type:uint32_t)
+        roll                      :  [rad] (type:float)
+        pitch                     :  [rad] (type:float)
+        yaw                       :  [rad] (type:float)
+        rollspeed                 :  [rad/s] (type:float)
+        pitchspeed                :  [rad/s] (type:float)
+        yawspeed                  :  [rad/s] (type:float)
+
+        """
+        self.send(self.attitude_encode(time_boot_ms, roll, pitch, yaw, rollspeed, pitchspeed, yawspeed), force_mavlink1=force_mavlink1)
+
+    def mission_item_encode(self, target_system: int, target_component: int, seq: int, frame: int, command: int, current: int, autocontinue: int, param1: float, param2: float, param3: float, param4: float, x: float, y: float, z: float) -> MAVLink_mission_item_message:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        seq                       :  (type:uint16_t)
+        frame                     :  (type:uint8_t, values:MAV_FRAME)
+        command                   :  (type:uint16_t, values:MAV_CMD)
+        current                   :  (type:uint8_t)
+        autocontinue              :  (type:uint8_t)
+        param1                    :  (type:float)
+        param2                    :  (type:float)
+        param3                    :  (type:float)
+        param4                    :  (type:float)
+        x                         :  (type:float)
+        y                         :  (type:float)
+        z                         :  (type:float)
+
+        """
+        return MAVLink_mission_item_message(target_system, target_component, seq, frame, command, current, autocontinue, param1, param2, param3, param4, x, y, z)
+
+    def mission_item_send(self, target_system: int, target_component: int, seq: int, frame: int, command: int, current: int, autocontinue: int, param1: float, param2: float, param3: float, param4: float, x: float, y: float, z: float, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        seq                       :  (type:uint16_t)
+        frame                     :  (type:uint8_t, values:MAV_FRAME)
+        command                   :  (type:uint16_t, values:MAV_CMD)
+        current                   :  (type:uint8_t)
+        autocontinue              :  (type:uint8_t)
+        param1                    :  (type:float)
+        param2                    :  (type:float)
+        param3                    :  (type:float)
+        param4                    :  (type:float)
+        x                         :  (type:float)
+        y                         :  (type:float)
+        z                         :  (type:float)
+
+        """
+        self.send(self.mission_item_encode(target_system, target_component, seq, frame, command, current, autocontinue, param1, param2, param3, param4, x, y, z), force_mavlink1=force_mavlink1)
+
+    def mission_request_encode(self, target_system: int, target_component: int, seq: int) -> MAVLink_mission_request_message:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        seq                       :  (type:uint16_t)
+
+        """
+        return MAVLink_mission_request_message(target_system, target_component, seq)
+
+    def mission_request_send(self, target_system: int, target_component: int, seq: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        seq                       :  (type:uint16_t)
+
+        """
+        self.send(self.mission_request_encode(target_system, target_component, seq), force_mavlink1=force_mavlink1)
+
+    def mission_request_list_encode(self, target_system: int, target_component: int) -> MAVLink_mission_request_list_message:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+
+        """
+        return MAVLink_mission_request_list_message(target_system, target_component)
+
+    def mission_request_list_send(self, target_system: int, target_component: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+
+        """
+        self.send(self.mission_request_list_encode(target_system, target_component), force_mavlink1=force_mavlink1)
+
+    def mission_count_encode(self, target_system: int, target_component: int, count: int) -> MAVLink_mission_count_message:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        count                     :  (type:uint16_t)
+
+        """
+        return MAVLink_mission_count_message(target_system, target_component, count)
+
+    def mission_count_send(self, target_system: int, target_component: int, count: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        count                     :  (type:uint16_t)
+
+        """
+        self.send(self.mission_count_encode(target_system, target_component, count), force_mavlink1=force_mavlink1)
+
+    def mission_clear_all_encode(self, target_system: int, target_component: int) -> MAVLink_mission_clear_all_message:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+
+        """
+        return MAVLink_mission_clear_all_message(target_system, target_component)
+
+    def mission_clear_all_send(self, target_system: int, target_component: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+
+        """
+        self.send(self.mission_clear_all_encode(target_system, target_component), force_mavlink1=force_mavlink1)
+
+    def mission_ack_encode(self, target_system: int, target_component: int, type: int) -> MAVLink_mission_ack_message:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        type                      :  (type:uint8_t, values:MAV_MISSION_RESULT)
+
+        """
+        return MAVLink_mission_ack_message(target_system, target_component, type)
+
+    def mission_ack_send(self, target_system: int, target_component: int, type: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        type                      :  (type:uint8_t, values:MAV_MISSION_RESULT)
+
+        """
+        self.send(self.mission_ack_encode(target_system, target_component, type), force_mavlink1=force_mavlink1)
+
+    def mission_request_int_encode(self, target_system: int, target_component: int, seq: int) -> MAVLink_mission_request_int_message:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        seq                       :  (type:uint16_t)
+
+        """
+        return MAVLink_mission_request_int_message(target_system, target_component, seq)
+
+    def mission_request_int_send(self, target_system: int, target_component: int, seq: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        seq                       :  (type:uint16_t)
+
+        """
+        self.send(self.mission_request_int_encode(target_system, target_component, seq), force_mavlink1=force_mavlink1)
+
+    def request_data_stream_encode(self, target_system: int, target_component: int, req_stream_id: int, req_message_rate: int, start_stop: int) -> MAVLink_request_data_stream_message:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        req_stream_id             :  (type:uint8_t, values:MAV_DATA_STREAM)
+        req_message_rate          :  [Hz] (type:uint16_t)
+        start_stop                :  (type:uint8_t)
+
+        """
+        return MAVLink_request_data_stream_message(target_system, target_component, req_stream_id, req_message_rate, start_stop)
+
+    def request_data_stream_send(self, target_system: int, target_component: int, req_stream_id: int, req_message_rate: int, start_stop: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        req_stream_id             :  (type:uint8_t, values:MAV_DATA_STREAM)
+        req_message_rate          :  [Hz] (type:uint16_t)
+        start_stop                :  (type:uint8_t)
+
+        """
+        self.send(self.request_data_stream_encode(target_system, target_component, req_stream_id, req_message_rate, start_stop), force_mavlink1=force_mavlink1)
+
+    def mission_item_int_encode(self, target_system: int, target_component: int, seq: int, frame: int, command: int, current: int, autocontinue: int, param1: float, param2: float, param3: float, param4: float, x: int, y: int, z: float) -> MAVLink_mission_item_int_message:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        seq                       :  (type:uint16_t)
+        frame                     :  (type:uint8_t, values:MAV_FRAME)
+        command                   :  (type:uint16_t, values:MAV_CMD)
+        current                   :  (type:uint8_t)
+        autocontinue              :  (type:uint8_t)
+        param1                    :  (type:float)
+        param2                    :  (type:float)
+        param3                    :  (type:float)
+        param4                    :  (type:float)
+        x                         :  (type:int32_t)
+        y                         :  (type:int32_t)
+        z                         :  (type:float)
+
+        """
+        return MAVLink_mission_item_int_message(target_system, target_component, seq, frame, command, current, autocontinue, param1, param2, param3, param4, x, y, z)
+
+    def mission_item_int_send(self, target_system: int, target_component: int, seq: int, frame: int, command: int, current: int, autocontinue: int, param1: float, param2: float, param3: float, param4: float, x: int, y: int, z: float, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        seq                       :  (type:uint16_t)
+        frame                     :  (type:uint8_t, values:MAV_FRAME)
+        command                   :  (type:uint16_t, values:MAV_CMD)
+        current                   :  (type:uint8_t)
+        autocontinue              :  (type:uint8_t)
+        param1                    :  (type:float)
+        param2                    :  (type:float)
+        param3                    :  (type:float)
+        param4                    :  (type:float)
+        x                         :  (type:int32_t)
+        y                         :  (type:int32_t)
+        z                         :  (type:float)
+
+        """
+        self.send(self.mission_item_int_encode(target_system, target_component, seq, frame, command, current, autocontinue, param1, param2, param3, param4, x, y, z), force_mavlink1=force_mavlink1)
+
+    def vfr_hud_encode(self, airspeed: float, groundspeed: float, heading: int, throttle: int, alt: float, climb: float) -> MAVLink_vfr_hud_message:
+        """
+        
+
+        airspeed                  :  [m/s] (type:float)
+        groundspeed               :  [m/s] (type:float)
+        heading                   :  [deg] (type:int16_t)
+        throttle                  :  [%] (type:uint16_t)
+        alt                       :  [m] (type:float)
+        climb                     :  [m/s] (type:float)
+
+        """
+        return MAVLink_vfr_hud_message(airspeed, groundspeed, heading, throttle, alt, climb)
+
+    def vfr_hud_send(self, airspeed: float, groundspeed: float, heading: int, throttle: int, alt: float, climb: float, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        airspeed                  :  [m/s] (type:float)
+        groundspeed               :  [m/s] (type:float)
+        heading                   :  [deg] (type:int16_t)
+        throttle                  :  [%] (type:uint16_t)
+        alt                       :  [m] (type:float)
+        climb                     :  [m/s] (type:float)
+
+        """
+        self.send(self.vfr_hud_encode(airspeed, groundspeed, heading, throttle, alt, climb), force_mavlink1=force_mavlink1)
+
+    def command_long_encode(self, target_system: int, target_component: int, command: int, confirmation: int, param1: float, param2: float, param3: float, param4: float, param5: float, param6: float, param7: float) -> MAVLink_command_long_message:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        command                   :  (type:uint16_t, values:MAV_CMD)
+        confirmation              :  (type:uint8_t)
+        param1                    :  (type:float)
+        param2                    :  (type:float)
+        param3                    :  (type:float)
+        param4                    :  (type:float)
+        param5                    :  (type:float)
+        param6                    :  (type:float)
+        param7                    :  (type:float)
+
+        """
+        return MAVLink_command_long_message(target_system, target_component, command, confirmation, param1, param2, param3, param4, param5, param6, param7)
+
+    def command_long_send(self, target_system: int, target_component: int, command: int, confirmation: int, param1: float, param2: float, param3: float, param4: float, param5: float, param6: float, param7: float, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        target_system             :  (type:uint8_t)
+        target_component          :  (type:uint8_t)
+        command                   :  (type:uint16_t, values:MAV_CMD)
+        confirmation              :  (type:uint8_t)
+        param1                    :  (type:float)
+        param2                    :  (type:float)
+        param3                    :  (type:float)
+        param4                    :  (type:float)
+        param5                    :  (type:float)
+        param6                    :  (type:float)
+        param7                    :  (type:float)
+
+        """
+        self.send(self.command_long_encode(target_system, target_component, command, confirmation, param1, param2, param3, param4, param5, param6, param7), force_mavlink1=force_mavlink1)
+
+    def command_ack_encode(self, command: int, result: int) -> MAVLink_command_ack_message:
+        """
+        
+
+        command                   :  (type:uint16_t, values:MAV_CMD)
+        result                    :  (type:uint8_t, values:MAV_RESULT)
+
+        """
+        return MAVLink_command_ack_message(command, result)
+
+    def command_ack_send(self, command: int, result: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        command                   :  (type:uint16_t, values:MAV_CMD)
+        result                    :  (type:uint8_t, values:MAV_RESULT)
+
+        """
+        self.send(self.command_ack_encode(command, result), force_mavlink1=force_mavlink1)
+
+    def battery_status_encode(self, id: int, battery_function: int, type: int, temperature: int, voltages: Sequence[int], current_battery: int, current_consumed: int, energy_consumed: int, battery_remaining: int) -> MAVLink_battery_status_message:
+        """
+        
+
+        id                        :  (type:uint8_t)
+        battery_function          :  (type:uint8_t, values:MAV_BATTERY_FUNCTION)
+        type                      :  (type:uint8_t, values:MAV_BATTERY_TYPE)
+        temperature               :  [cdegC] (type:int16_t)
+        voltages                  :  [mV] (type:uint16_t)
+        current_battery           :  [cA] (type:int16_t)
+        current_consumed          :  [mAh] (type:int32_t)
+        energy_consumed           :  [hJ] (type:int32_t)
+        battery_remaining         :  [%] (type:int8_t)
+
+        """
+        return MAVLink_battery_status_message(id, battery_function, type, temperature, voltages, current_battery, current_consumed, energy_consumed, battery_remaining)
+
+    def battery_status_send(self, id: int, battery_function: int, type: int, temperature: int, voltages: Sequence[int], current_battery: int, current_consumed: int, energy_consumed: int, battery_remaining: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        id                        :  (type:uint8_t)
+        battery_function          :  (type:uint8_t, values:MAV_BATTERY_FUNCTION)
+        type                      :  (type:uint8_t, values:MAV_BATTERY_TYPE)
+        temperature               :  [cdegC] (type:int16_t)
+        voltages                  :  [mV] (type:uint16_t)
+        current_battery           :  [cA] (type:int16_t)
+        current_consumed          :  [mAh] (type:int32_t)
+        energy_consumed           :  [hJ] (type:int32_t)
+        battery_remaining         :  [%] (type:int8_t)
+
+        """
+        self.send(self.battery_status_encode(id, battery_function, type, temperature, voltages, current_battery, current_consumed, energy_consumed, battery_remaining), force_mavlink1=force_mavlink1)
+
+    def statustext_encode(self, severity: int, text: bytes) -> MAVLink_statustext_message:
+        """
+        
+
+        severity                  :  (type:uint8_t, values:MAV_SEVERITY)
+        text                      :  (type:char)
+
+        """
+        return MAVLink_statustext_message(severity, text)
+
+    def statustext_send(self, severity: int, text: bytes, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        severity                  :  (type:uint8_t, values:MAV_SEVERITY)
+        text                      :  (type:char)
+
+        """
+        self.send(self.statustext_encode(severity, text), force_mavlink1=force_mavlink1)
+
+    def heartbeat_encode(self, type: int, autopilot: int, base_mode: int, custom_mode: int, system_status: int, mavlink_version: int = 3) -> MAVLink_heartbeat_message:
+        """
+        
+
+        type                      :  (type:uint8_t, values:MAV_TYPE)
+        autopilot                 :  (type:uint8_t, values:MAV_AUTOPILOT)
+        base_mode                 :  (type:uint8_t, values:MAV_MODE_FLAG)
+        custom_mode               :  (type:uint32_t)
+        system_status             :  (type:uint8_t, values:MAV_STATE)
+        mavlink_version           :  (type:uint8_t)
+
+        """
+        return MAVLink_heartbeat_message(type, autopilot, base_mode, custom_mode, system_status, mavlink_version)
+
+    def heartbeat_send(self, type: int, autopilot: int, base_mode: int, custom_mode: int, system_status: int, mavlink_version: int = 3, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        type                      :  (type:uint8_t, values:MAV_TYPE)
+        autopilot                 :  (type:uint8_t, values:MAV_AUTOPILOT)
+        base_mode                 :  (type:uint8_t, values:MAV_MODE_FLAG)
+        custom_mode               :  (type:uint32_t)
+        system_status             :  (type:uint8_t, values:MAV_STATE)
+        mavlink_version           :  (type:uint8_t)
+
+        """
+        self.send(self.heartbeat_encode(type, autopilot, base_mode, custom_mode, system_status, mavlink_version), force_mavlink1=force_mavlink1)
+
+    def global_position_int_encode(self, time_boot_ms: int, lat: int, lon: int, alt: int, relative_alt: int, vx: int, vy: int, vz: int, hdg: int) -> MAVLink_global_position_int_message:
+        """
+        
+
+        time_boot_ms              :  [ms] (type:uint32_t)
+        lat                       :  [degE7] (type:int32_t)
+        lon                       :  [degE7] (type:int32_t)
+        alt                       :  [mm] (type:int32_t)
+        relative_alt              :  [mm] (type:int32_t)
+        vx                        :  [cm/s] (type:int16_t)
+        vy                        :  [cm/s] (type:int16_t)
+        vz                        :  [cm/s] (type:int16_t)
+        hdg                       :  [cdeg] (type:uint16_t)
+
+        """
+        return MAVLink_global_position_int_message(time_boot_ms, lat, lon, alt, relative_alt, vx, vy, vz, hdg)
+
+    def global_position_int_send(self, time_boot_ms: int, lat: int, lon: int, alt: int, relative_alt: int, vx: int, vy: int, vz: int, hdg: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        time_boot_ms              :  [ms] (type:uint32_t)
+        lat                       :  [degE7] (type:int32_t)
+        lon                       :  [degE7] (type:int32_t)
+        alt                       :  [mm] (type:int32_t)
+        relative_alt              :  [mm] (type:int32_t)
+        vx                        :  [cm/s] (type:int16_t)
+        vy                        :  [cm/s] (type:int16_t)
+        vz                        :  [cm/s] (type:int16_t)
+        hdg                       :  [cdeg] (type:uint16_t)
+
+        """
+        self.send(self.global_position_int_encode(time_boot_ms, lat, lon, alt, relative_alt, vx, vy, vz, hdg), force_mavlink1=force_mavlink1)
+
+    def autopilot_version_encode(self, capabilities: int, flight_sw_version: int, middleware_sw_version: int, os_sw_version: int, board_version: int, flight_custom_version: Sequence[int], middleware_custom_version: Sequence[int], os_custom_version: Sequence[int], vendor_id: int, product_id: int, uid: int) -> MAVLink_autopilot_version_message:
+        """
+        
+
+        capabilities              :  (type:uint64_t, values:MAV_PROTOCOL_CAPABILITY)
+        flight_sw_version         :  (type:uint32_t)
+        middleware_sw_version        :  (type:uint32_t)
+        os_sw_version             :  (type:uint32_t)
+        board_version             :  (type:uint32_t)
+        flight_custom_version        :  (type:uint8_t)
+        middleware_custom_version        :  (type:uint8_t)
+        os_custom_version         :  (type:uint8_t)
+        vendor_id                 :  (type:uint16_t)
+        product_id                :  (type:uint16_t)
+        uid                       :  (type:uint64_t)
+
+        """
+        return MAVLink_autopilot_version_message(capabilities, flight_sw_version, middleware_sw_version, os_sw_version, board_version, flight_custom_version, middleware_custom_version, os_custom_version, vendor_id, product_id, uid)
+
+    def autopilot_version_send(self, capabilities: int, flight_sw_version: int, middleware_sw_version: int, os_sw_version: int, board_version: int, flight_custom_version: Sequence[int], middleware_custom_version: Sequence[int], os_custom_version: Sequence[int], vendor_id: int, product_id: int, uid: int, force_mavlink1: bool = False) -> None:
+        """
+        
+
+        capabilities              :  (type:uint64_t, values:MAV_PROTOCOL_CAPABILITY)
+        flight_sw_version         :  (type:uint32_t)
+        middleware_sw_version        :  (type:uint32_t)
+        os_sw_version             :  (type:uint32_t)
+        board_version             :  (type:uint32_t)
+        flight_custom_version        :  (type:uint8_t)
+        middleware_custom_version        :  (type:uint8_t)
+        os_custom_version         :  (type:uint8_t)
+        vendor_id                 :  (type:uint16_t)
+        product_id                :  (type:uint16_t)
+        uid                       :  (type:uint64_t)
+
+        """
+        self.send(self.autopilot_version_encode(capabilities, flight_sw_version, middleware_sw_version, os_sw_version, board_version, flight_custom_version, middleware_custom_version, os_custom_version, vendor_id, product_id, uid), force_mavlink1=force_mavlink1)
+
+
+# DroneControl: облегченный диалект (mavlink_dialect.py)
+PYMAVLINK_VERSION = "2.4.50"
+APP_MESSAGES = ('ATTITUDE', 'AUTOPILOT_VERSION', 'BATTERY_STATUS', 'COMMAND_ACK', 'COMMAND_LONG', 'EKF_STATUS_REPORT', 'GLOBAL_POSITION_INT', 'GPS_RAW_INT', 'HEARTBEAT', 'MISSION_ACK', 'MISSION_CLEAR_ALL', 'MISSION_COUNT', 'MISSION_ITEM', 'MISSION_ITEM_INT', 'MISSION_REQUEST', 'MISSION_REQUEST_INT', 'MISSION_REQUEST_LIST', 'PARAM_REQUEST_LIST', 'PARAM_REQUEST_READ', 'PARAM_VALUE', 'REQUEST_DATA_STREAM', 'SET_MODE', 'STATUSTEXT', 'SYS_STATUS', 'VFR_HUD')
+# crc_extra всех сообщений полного диалекта: CRC пропущенных сообщений проверяется так же
+SKIPPED_CRC_EXTRA = {2: 137, 4: 237, 5: 217, 6: 104, 7: 119, 23: 168, 25: 23, 26: 170, 27: 144, 28: 67, 29: 115, 31: 246, 32: 185, 34: 237, 35: 244, 36: 222, 37: 212, 38: 9, 41: 28, 42: 28, 46: 11, 48: 41, 49: 39, 50: 78, 53: 3, 54: 15, 55: 3, 61: 167, 62: 183, 63: 119, 64: 191, 65: 118, 67: 21, 69: 243, 70: 124, 75: 158, 81: 106, 82: 49, 83: 22, 84: 143, 85: 140, 86: 5, 87: 150, 89: 231, 90: 183, 91: 63, 92: 54, 93: 47, 100: 175, 101: 102, 102: 158, 103: 208, 104: 56, 105: 93, 106: 138, 107: 108, 108: 32, 109: 185, 110: 84, 111: 34, 112: 174, 113: 124, 114: 237, 115: 4, 116: 76, 117: 128, 118: 56, 119: 116, 120: 134, 121: 237, 122: 203, 123: 250, 124: 87, 125: 203, 126: 220, 127: 25, 128: 226, 129: 46, 130: 29, 131: 223, 132: 85, 133: 6, 134: 229, 135: 203, 136: 1, 137: 195, 138: 109, 139: 168, 140: 181, 141: 47, 142: 72, 143: 131, 144: 127, 146: 103, 149: 200, 150: 134, 151: 219, 152: 208, 153: 188, 154: 84, 155: 22, 156: 19, 157: 21, 158: 134, 160: 78, 161: 68, 162: 189, 163: 127, 164: 154, 165: 21, 166: 21, 167: 144, 168: 1, 169: 234, 170: 73, 171: 181, 172: 22, 173: 83, 174: 167, 175: 138, 176: 234, 177: 240, 178: 47, 179: 189, 180: 52, 181: 174, 182: 229, 183: 85, 184: 159, 185: 186, 186: 72, 191: 92, 192: 36, 194: 98, 195: 120, 200: 134, 201: 205, 214: 69, 215: 101, 216: 50, 217: 202, 218: 17, 219: 162, 220: 34, 221: 71, 222: 15, 223: 119, 224: 102, 225: 208, 226: 207, 230: 163, 231: 105, 232: 151, 233: 35, 234: 150, 235: 179, 241: 90, 242: 104, 243: 85, 244: 95, 245: 130, 246: 184, 247: 81, 248: 8, 249: 204, 250: 49, 251: 170, 252: 44, 254: 46}
+
+
+def _decode_skipped(msgbuf, msgId, mlen, incompat_flags, compat_flags, seq, srcSystem, srcComponent,
+                    signature_len, csum_unpacker):
+    crc_extra = SKIPPED_CRC_EXTRA.get(msgId)
+    if crc_extra is not None and not MAVLINK_IGNORE_CRC:
+        crc = csum_unpacker.unpack(msgbuf[-(2 + signature_len):][:2])[0]
+        crcbuf = msgbuf[1:-(2 + signature_len)]
+        crcbuf.append(crc_extra)
+        if crc != x25crc(crcbuf).crc:
+            raise MAVError("invalid MAVLink CRC in msgID %u" % msgId)
+    m = MAVLink_unknown(msgId, msgbuf)
+    m._header = MAVLink_header(msgId, incompat_flags, compat_flags, mlen, seq, srcSystem, srcComponent)
+    return m
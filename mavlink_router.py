@@ -0,0 +1,343 @@
+import errno
+import socket
+import threading
+import time
+
+
+MAVLINK1_STX = 0xFE
+MAVLINK2_STX = 0xFD
+_SIGNED = 0x01  # флаг подписи MAVLink 2 (incompat_flags): +13 байт в конце кадра
+UDP_DATAGRAM_MAX = 8192  # байт кадров в одной датаграмме клиенту
+
+
+def frame_length(data, start):
+    """Длина кадра по его заголовку (None - заголовок еще не принят)"""
+    if start + 3 > len(data):
+        return None
+    if data[start] == MAVLINK2_STX:
+        length = data[start + 1] + 12
+        if data[start + 2] & _SIGNED:
+            length += 13
+        return length
+    return data[start + 1] + 8
+
+
+def split_frames(data):
+    """Целые кадры блока и недописанный хвост: (bytes кадров, bytes хвоста)
+
+    Кадры режутся только по заголовку - поля и CRC не разбираются (кадр с
+    ошибкой отбросит парсер получателя), байты между кадрами выбрасываются.
+    Блок из одних целых кадров возвращается как есть, без копирования.
+    """
+    size = len(data)
+    runs = []
+    start = i = 0
+    while i < size:
+        stx = data[i]
+        if stx != MAVLINK2_STX and stx != MAVLINK1_STX:
+            if i > start:
+                runs.append(data[start:i])
+            i += 1
+            while i < size and data[i] != MAVLINK2_STX and data[i] != MAVLINK1_STX:
+                i += 1
+            start = i
+            continue
+        length = frame_length(data, i)
+        if length is None or i + length > size:
+            break
+        i += length
+    if i > start:
+        runs.append(data[start:i])
+    frames = runs[0] if len(runs) == 1 else b"".join(runs)
+    return frames, data[i:]
+
+
+def split_datagrams(frames, limit=UDP_DATAGRAM_MAX):
+    """Целые кадры, разложенные по датаграммам не длиннее limit"""
+    if len(frames) <= limit:
+        return [frames]
+    datagrams = []
+    start = i = 0
+    while i < len(frames):
+        length = frame_length(frames, i)
+        if i + length - start > limit and i > start:
+            datagrams.append(frames[start:i])
+            start = i
+        i += length
+    datagrams.append(frames[start:])
+    return datagrams
+
+
+class FrameSplitter:
+    """split_frames для потока: хвост блока дописывается следующим блоком"""
+
+    def __init__(self):
+        self._tail = b""
+
+    def feed(self, data):
+        if self._tail:
+            data = self._tail + data
+        frames, self._tail = split_frames(data)
+        return frames
+
+
+class MAVLinkRouter:
+    """Раздача сырых кадров линков локальным клиентам (вторая станция, скрипты анализа)
+
+    Входящие блоки линков уходят всем клиентам байтами, как пришли с
+    транспорта, - до разбора и без повторной упаковки; из потока вырезаются
+    только целые кадры (split_frames). Кадры клиентов пишутся во все
+    подключенные линки целыми, поэтому не перемешиваются с командами самой
+    программы. Клиенты:
+      - TCP: подключения на tcp_port;
+      - UDP: все, кто прислал датаграмму на udp_port (забываются после
+        UDP_CLIENT_TIMEOUT без датаграмм), и постоянные адресаты udp_targets.
+    Сокеты обслуживает пул ввода-вывода линков.
+    """
+    UDP_CLIENT_TIMEOUT = 15.0  # с
+    MAX_BACKLOG = 1 << 20  # байт, которые TCP-клиент может не успеть принять
+
+    def __init__(self, io_pool, tcp_port=None, udp_port=None, udp_targets=(), host="127.0.0.1", log=None):
+        self.io_pool = io_pool
+        self.host = host
+        self.tcp_port = tcp_port
+        self.udp_port = udp_port
+        self.udp_targets = [tuple(target) for target in udp_targets]
+        self.log = log or (lambda message: None)
+        self.links = set()
+        self.clients = set()  # TCP-клиенты
+        self._splitters = {}  # линк -> FrameSplitter
+        self._endpoints = []
+        self._udp = None
+        self._lock = threading.Lock()
+        self.bytes_out = 0  # к клиентам
+        self.bytes_in = 0  # от клиентов к линкам
+
+    def start(self):
+        """Открытие портов (OSError - порт занят)"""
+        endpoints = []
+        try:
+            if self.tcp_port is not None:
+                endpoints.append(_TCPListener(self, self.host, self.tcp_port))
+            if self.udp_port is not None or self.udp_targets:
+                endpoints.append(_UDPEndpoint(self, self.host, self.udp_port or 0))
+        except OSError:
+            for endpoint in endpoints:
+                endpoint.sock.close()
+            raise
+        self._endpoints = endpoints
+        for endpoint in endpoints:
+            if isinstance(endpoint, _UDPEndpoint):
+                self._udp = endpoint
+            self.io_pool.register(endpoint)
+        self.log(f"🔀 Маршрутизатор MAVLink: {self.describe()}")
+
+    def describe(self):
+        parts = []
+        if self.tcp_port is not None:
+            parts.append(f"TCP {self.host}:{self.tcp_port}")
+        if self.udp_port is not None:
+            parts.append(f"UDP {self.host}:{self.udp_port}")
+        parts.extend(f"UDP → {host}:{port}" for host, port in self.udp_targets)
+        return ", ".join(parts)
+
+    def attach(self, link):
+        """Линк отдает маршрутизатору сырые блоки и принимает кадры клиентов"""
+        with self._lock:
+            self.links.add(link)
+            self._splitters[link] = FrameSplitter()
+        link.router = self
+
+    def detach(self, link):
+        link.router = None
+        with self._lock:
+            self.links.discard(link)
+            self._splitters.pop(link, None)
+
+    def from_link(self, link, data):
+        """Блок, принятый линком (поток ввода-вывода линка)"""
+        with self._lock:
+            splitter = self._splitters.get(link)
+            if splitter is None:
+                return
+            frames = splitter.feed(data)
+            if not frames:
+                return
+            self.bytes_out += len(frames)
+            lagging = [client for client in self.clients if not client.send(frames)]
+            if self._udp is not None:
+                self._udp.send(frames)
+        for client in lagging:
+            self.drop(client, f"⚠️ Клієнт {client.name} не приймає дані - відключено")
+
+    def to_links(self, frames):
+        """Целые кадры клиента - во все линки"""
+        self.bytes_in += len(frames)
+        for link in list(self.links):
+            link.write_raw(frames)
+
+    def add_client(self, client):
+        with self._lock:
+            self.clients.add(client)
+        self.io_pool.register(client)
+        self.log(f"🔀 Клієнт {client.name} підключився")
+
+    def drop(self, client, message=None):
+        with self._lock:
+            if client not in self.clients:
+                return
+            self.clients.discard(client)
+        self.io_pool.unregister(client, then=client.sock.close)
+        self.log(message or f"🔀 Клієнт {client.name} відключився")
+
+    def stop(self):
+        for link in list(self.links):
+            self.detach(link)
+        for client in list(self.clients):
+            self.drop(client)
+        for endpoint in self._endpoints:
+            self.io_pool.unregister(endpoint, then=endpoint.sock.close)
+        self._endpoints = []
+        self._udp = None
+
+
+class _TCPListener:
+    """Прием TCP-клиентов маршрутизатора (объект пула ввода-вывода)"""
+
+    def __init__(self, router, host, port):
+        self.router = router
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            self.sock.bind((host, port))
+            self.sock.listen(8)
+        except OSError:
+            self.sock.close()
+            raise
+        self.sock.setblocking(False)
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def _on_readable(self):
+        while True:
+            try:
+                sock, address = self.sock.accept()
+            except BlockingIOError:
+                return
+            self.router.add_client(_TCPClient(self.router, sock, address))
+
+    def _on_tick(self, now):
+        pass
+
+    def _on_io_error(self, error):
+        self.router.log(f"⚠️ Маршрутизатор: TCP {self.router.host}:{self.router.tcp_port}: {str(error)}")
+
+
+class _TCPClient:
+    """TCP-клиент маршрутизатора: кадры к нему и от него"""
+
+    def __init__(self, router, sock, address):
+        self.router = router
+        self.sock = sock
+        self.sock.setblocking(False)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.name = f"TCP {address[0]}:{address[1]}"
+        self.splitter = FrameSplitter()
+        self.backlog = b""
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def send(self, data):
+        """Неблокирующая отправка (под блокировкой маршрутизатора); False - клиент не успевает
+
+        То, что сокет не принял, досылается следующей отправкой или тактом пула,
+        так что клиент всегда получает кадры целыми.
+        """
+        if self.backlog:
+            data = self.backlog + data
+        try:
+            sent = self.sock.send(data)
+        except BlockingIOError:
+            sent = 0
+        except OSError:
+            return False
+        self.backlog = data[sent:]
+        return len(self.backlog) <= self.router.MAX_BACKLOG
+
+    def _on_readable(self):
+        data = self.sock.recv(65536)
+        if not data:
+            raise ConnectionError("з'єднання закрито")
+        frames = self.splitter.feed(data)
+        if frames:
+            self.router.to_links(frames)
+
+    def _on_tick(self, now):
+        if self.backlog:
+            with self.router._lock:
+                ok = self.send(b"")
+            if not ok:
+                self.router.drop(self, f"⚠️ Клієнт {self.name} не приймає дані - відключено")
+
+    def _on_io_error(self, error):
+        self.router.drop(self)
+
+
+class _UDPEndpoint:
+    """UDP-сокет маршрутизатора: клиенты по адресу отправителя и постоянные адресаты"""
+    MAX_DATAGRAMS = 256
+
+    def __init__(self, router, host, port):
+        self.router = router
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            self.sock.bind((host, port))
+        except OSError:
+            self.sock.close()
+            raise
+        self.sock.setblocking(False)
+        self.clients = {}  # адрес -> время последней датаграммы
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def send(self, frames):
+        addresses = list(self.clients) + self.router.udp_targets
+        if not addresses:
+            return
+        for datagram in split_datagrams(frames):
+            for address in addresses:
+                try:
+                    self.sock.sendto(datagram, address)
+                except OSError:
+                    # Переполненный буфер или недоступный адресат: UDP-клиент просто теряет кадры
+                    pass
+
+    def _on_readable(self):
+        for _ in range(self.MAX_DATAGRAMS):
+            try:
+                data, address = self.sock.recvfrom(65535)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                # Windows сообщает о закрытом порту клиента ошибкой приема (ICMP port unreachable)
+                if e.errno in (errno.ECONNRESET, errno.ECONNREFUSED) or getattr(e, 'winerror', None) == 10054:
+                    continue
+                raise
+            if address not in self.clients and address not in self.router.udp_targets:
+                self.router.log(f"🔀 Клієнт UDP {address[0]}:{address[1]} підключився")
+            self.clients[address] = time.monotonic()
+            frames, _ = split_frames(data)
+            if frames:
+                self.router.to_links(frames)
+
+    def _on_tick(self, now):
+        for address, seen in list(self.clients.items()):
+            if now - seen > self.router.UDP_CLIENT_TIMEOUT:
+                del self.clients[address]
+                self.router.log(f"🔀 Клієнт UDP {address[0]}:{address[1]} відключився (немає даних)")
+
+    def _on_io_error(self, error):
+        self.router.log(f"⚠️ Маршрутизатор: UDP: {str(error)}")
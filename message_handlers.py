@@ -0,0 +1,154 @@
+import math
+import threading
+import mavlink_dialect
+from mavlink_dialect import mavutil
+
+
+def message_id(message):
+    """Id сообщения MAVLink по имени ('ATTITUDE') или по самому id
+
+    Сообщение вне облегченного диалекта переключает программу на полный.
+    """
+    if isinstance(message, int):
+        return message
+    return mavlink_dialect.message_id(message)
+
+
+class MessageHandlerRegistry:
+    """Реестр декодеров и подписчиков, ключ - id сообщения MAVLink
+
+    Обработчик вызывается в потоке ввода-вывода как handler(msg) и может
+    вернуть словарь значений телеметрии аппарата (или None). Для каждого id
+    хранится неизменяемый кортеж обработчиков, поэтому поиск при приеме -
+    один доступ к словарю без блокировок. Сообщения, на которые никто не
+    подписан, отбрасываются сразу.
+    """
+
+    def __init__(self):
+        self._handlers = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def with_defaults(cls):
+        registry = cls()
+        for message, decoder in DEFAULT_DECODERS.items():
+            registry.register(message, decoder)
+        return registry
+
+    def register(self, message, handler):
+        """Подписка обработчика на сообщение (имя или id)"""
+        msgid = message_id(message)
+        with self._lock:
+            self._handlers[msgid] = self._handlers.get(msgid, ()) + (handler,)
+
+    def unregister(self, message, handler):
+        msgid = message_id(message)
+        with self._lock:
+            handlers = tuple(h for h in self._handlers.get(msgid, ()) if h != handler)
+            if handlers:
+                self._handlers[msgid] = handlers
+            else:
+                self._handlers.pop(msgid, None)
+
+    def get(self, msgid):
+        """Обработчики сообщения или None, если на него никто не подписан"""
+        return self._handlers.get(msgid)
+
+    def message_ids(self):
+        return set(self._handlers)
+
+    def __contains__(self, msgid):
+        return msgid in self._handlers
+
+
+# --- Стандартные декодеры телеметрии ---
+
+def decode_heartbeat(msg):
+    # Обновляем режим и статус вооружения
+    return {
+        'mode': mavutil.mode_string_v10(msg),
+        'armed': bool(msg.base_mode & mavutil.mavlink.MAV_MODE_FLAG_SAFETY_ARMED)
+    }
+
+
+def decode_global_position_int(msg):
+    return {
+        'lat': msg.lat / 1e7,
+        'lon': msg.lon / 1e7,
+        'alt': msg.alt / 1000.0,
+        'relative_alt': msg.relative_alt / 1000.0,
+        'heading': msg.hdg / 100.0
+    }
+
+
+def decode_vfr_hud(msg):
+    return {
+        'groundspeed': msg.groundspeed,
+        'airspeed': msg.airspeed,
+        'heading': msg.heading
+    }
+
+
+def decode_sys_status(msg):
+    return {
+        'battery_voltage': msg.voltage_battery / 1000.0,
+        'battery_current': msg.current_battery / 100.0,
+        'battery_remaining': msg.battery_remaining
+    }
+
+
+def decode_gps_raw_int(msg):
+    return {
+        'gps_fix': msg.fix_type,
+        'satellites': msg.satellites_visible
+    }
+
+
+def decode_attitude(msg):
+    return {
+        'roll': math.degrees(msg.roll),
+        'pitch': math.degrees(msg.pitch),
+        'yaw': math.degrees(msg.yaw)
+    }
+
+
+def decode_battery_status(msg):
+    # Ячейки, которых нет, передаются как UINT16_MAX
+    cells = [v for v in msg.voltages if v != 0xFFFF]
+    values = {'battery_remaining': msg.battery_remaining}
+    if cells:
+        values['battery_voltage'] = sum(cells) / 1000.0
+    if msg.current_battery != -1:
+        values['battery_current'] = msg.current_battery / 100.0
+    return values
+
+
+def decode_ekf_status_report(msg):
+    # EKF в порядке, если есть оценка положения и нет флага неинициализированного GPS
+    ok_flags = mavutil.mavlink.EKF_ATTITUDE | mavutil.mavlink.EKF_POS_HORIZ_ABS
+    return {
+        'ekf_flags': msg.flags,
+        'ekf_ok': (msg.flags & ok_flags) == ok_flags and not (msg.flags & mavutil.mavlink.EKF_UNINITIALIZED),
+        'ekf_velocity_variance': msg.velocity_variance,
+        'ekf_pos_variance': msg.pos_horiz_variance
+    }
+
+
+def statustext_text(msg):
+    # STATUSTEXT - поток событий, а не поле телеметрии: линк отдает каждое сообщение сигналом
+    text = msg.text
+    if isinstance(text, bytes):
+        text = text.decode('utf-8', errors='replace')
+    return text.rstrip('\x00')
+
+
+DEFAULT_DECODERS = {
+    'HEARTBEAT': decode_heartbeat,
+    'GLOBAL_POSITION_INT': decode_global_position_int,
+    'VFR_HUD': decode_vfr_hud,
+    'SYS_STATUS': decode_sys_status,
+    'GPS_RAW_INT': decode_gps_raw_int,
+    'ATTITUDE': decode_attitude,
+    'BATTERY_STATUS': decode_battery_status,
+    'EKF_STATUS_REPORT': decode_ekf_status_report,
+}
@@ -0,0 +1,338 @@
+import math
+import threading
+import time
+from collections import deque
+from mavlink_dialect import mavutil
+
+
+mavlink = mavutil.mavlink
+
+# Сообщения протокола миссий, которые линк передает MissionClient
+MISSION_MESSAGE_IDS = frozenset((
+    mavlink.MAVLINK_MSG_ID_MISSION_REQUEST_INT,
+    mavlink.MAVLINK_MSG_ID_MISSION_REQUEST,
+    mavlink.MAVLINK_MSG_ID_MISSION_ITEM_INT,
+    mavlink.MAVLINK_MSG_ID_MISSION_COUNT,
+    mavlink.MAVLINK_MSG_ID_MISSION_ACK,
+))
+
+UPLOAD = "upload"
+DOWNLOAD = "download"
+
+EARTH_RADIUS = 6378137.0
+
+
+def mission_result_name(result):
+    entry = mavlink.enums['MAV_MISSION_RESULT'].get(result)
+    return entry.name if entry is not None else str(result)
+
+
+class MissionItem:
+    """Пункт миссии: команда MAV_CMD, координаты в градусах, высота в метрах"""
+
+    def __init__(self, command, lat=0.0, lon=0.0, alt=0.0, params=(0, 0, 0, 0),
+                 frame=mavlink.MAV_FRAME_GLOBAL_RELATIVE_ALT_INT, autocontinue=True):
+        self.command = command
+        self.lat = lat
+        self.lon = lon
+        self.alt = alt
+        self.params = tuple(params)
+        self.frame = frame
+        self.autocontinue = autocontinue
+
+    @classmethod
+    def waypoint(cls, lat, lon, alt, hold=0):
+        return cls(mavlink.MAV_CMD_NAV_WAYPOINT, lat, lon, alt, (hold, 0, 0, 0))
+
+    @classmethod
+    def from_message(cls, msg):
+        return cls(msg.command, msg.x / 1e7, msg.y / 1e7, msg.z, (msg.param1, msg.param2, msg.param3, msg.param4),
+                   msg.frame, bool(msg.autocontinue))
+
+    def encode(self, mav, target, seq):
+        """MISSION_ITEM_INT для отправки аппарату target"""
+        return mav.mission_item_int_encode(
+            target[0], target[1], seq, self.frame, self.command, 0, 1 if self.autocontinue else 0, *self.params,
+            int(round(self.lat * 1e7)), int(round(self.lon * 1e7)), self.alt)
+
+    def __repr__(self):
+        return f"MissionItem({self.command}, {self.lat:.7f}, {self.lon:.7f}, {self.alt:g})"
+
+
+def survey_mission(lat, lon, width, height, spacing, altitude):
+    """Облет прямоугольника змейкой с шагом spacing м (центр - lat/lon, размеры в метрах)
+
+    Пункт 0 - домашняя точка (ArduPilot перезаписывает его сам), затем
+    взлет, галсы по два пункта и возврат домой.
+    """
+    items = [MissionItem(mavlink.MAV_CMD_NAV_WAYPOINT, lat, lon, 0, frame=mavlink.MAV_FRAME_GLOBAL_INT),
+             MissionItem(mavlink.MAV_CMD_NAV_TAKEOFF, lat, lon, altitude)]
+    meters_lat = math.degrees(1.0 / EARTH_RADIUS)
+    meters_lon = meters_lat / math.cos(math.radians(lat))
+    lanes = max(1, int(width // spacing) + 1)
+    for lane in range(lanes):
+        east = -width / 2 + lane * spacing
+        north_start, north_end = (-height / 2, height / 2) if lane % 2 == 0 else (height / 2, -height / 2)
+        for north in (north_start, north_end):
+            items.append(MissionItem.waypoint(lat + north * meters_lat, lon + east * meters_lon, altitude))
+    items.append(MissionItem(mavlink.MAV_CMD_NAV_RETURN_TO_LAUNCH, frame=mavlink.MAV_FRAME_MISSION))
+    return items
+
+
+class _Transfer:
+    """Передача миссии одного аппарата в одну сторону"""
+
+    def __init__(self, key, direction, messages=None):
+        self.key = key
+        self.direction = direction
+        self.active = True
+        # Загрузка: заранее собранные MISSION_ITEM_INT; count известен сразу
+        self.messages = messages
+        self.count = len(messages) if messages is not None else None
+        self.requested = -1  # последний запрошенный аппаратом пункт
+        # Скачивание: принятые пункты, еще не запрошенные, запросы в полете (seq -> срок) и попытки по пунктам
+        self.items = {}
+        self.queue = deque()
+        self.in_flight = {}
+        self.attempts = {}
+        self.retries = 0
+        self.started = time.monotonic()
+        self.last_activity = self.started
+        self.last_progress = 0.0
+
+
+class MissionClient:
+    """Загрузка и скачивание миссий аппаратов линка (MISSION_COUNT/REQUEST_INT/ITEM_INT)
+
+    Весь обмен идет в потоке ввода-вывода линка: на MISSION_REQUEST_INT
+    сразу отвечает заранее собранный MISSION_ITEM_INT, поэтому загрузка
+    идет со скоростью линка, а не GUI. Скачивание держит в полете
+    REQUEST_WINDOW запросов пунктов. Таймауты и повторы отрабатывает tick();
+    передачи разных аппаратов идут одновременно. Результат - сигналы
+    mission_progress/mission_finished линка.
+    """
+    COUNT_TIMEOUT = 1.5  # с на первый ответ аппарата
+    ITEM_TIMEOUT = 1.0
+    RETRIES = 5
+    REQUEST_WINDOW = 8
+    PROGRESS_INTERVAL = 0.25
+
+    def __init__(self, link, source_system=255):
+        self.link = link
+        self.source_system = source_system
+        self.transfers = {}  # (sysid, compid) -> _Transfer
+        self.missions = {}  # (sysid, compid) -> [MissionItem], последняя переданная миссия
+        self._lock = threading.RLock()
+
+    def mission(self, key):
+        return self.missions.get(key)
+
+    def is_active(self, key):
+        transfer = self.transfers.get(key)
+        return transfer is not None and transfer.active
+
+    def upload(self, key, items):
+        """Загрузка миссии в аппарат; False - с аппаратом уже идет обмен"""
+        connection = self.link.connection
+        if connection is None:
+            return False
+        # Пункты кодируются до начала обмена, а не в ответ на каждый запрос
+        messages = [item.encode(connection.mav, key, seq) for seq, item in enumerate(items)]
+        with self._lock:
+            if self.is_active(key):
+                return False
+            transfer = _Transfer(key, UPLOAD, messages)
+            transfer.items = list(items)
+            self.transfers[key] = transfer
+        self._send(lambda mav: mav.mission_count_send(key[0], key[1], transfer.count))
+        return True
+
+    def download(self, key):
+        """Скачивание миссии из аппарата; False - с аппаратом уже идет обмен"""
+        if self.link.connection is None:
+            return False
+        with self._lock:
+            if self.is_active(key):
+                return False
+            self.transfers[key] = _Transfer(key, DOWNLOAD)
+        self._send(lambda mav: mav.mission_request_list_send(key[0], key[1]))
+        return True
+
+    def cancel(self, key):
+        with self._lock:
+            transfer = self.transfers.get(key)
+            if transfer is None or not transfer.active:
+                return
+            self._finish(transfer, False, "скасовано")
+        self._send(lambda mav: mav.mission_ack_send(key[0], key[1], mavlink.MAV_MISSION_OPERATION_CANCELLED))
+
+    def reset(self):
+        """Линк закрыт: передачи в полете прерываются"""
+        with self._lock:
+            for transfer in self.transfers.values():
+                if transfer.active:
+                    self._finish(transfer, False, "з'єднання закрито")
+
+    # --- Прием (поток ввода-вывода) ---
+
+    def handle_message(self, key, msg):
+        transfer = self.transfers.get(key)
+        if transfer is None or not transfer.active:
+            return
+        if getattr(msg, 'target_system', 0) not in (0, self.source_system):
+            # Обмен аппарата с другой наземной станцией
+            return
+        msgid = msg.get_msgId()
+        now = time.monotonic()
+        with self._lock:
+            if not transfer.active:
+                return
+            if transfer.direction == UPLOAD:
+                reply = self._on_upload_message(transfer, msgid, msg, now)
+            else:
+                reply = self._on_download_message(transfer, msgid, msg, now)
+        if reply:
+            self._send(reply)
+
+    def _on_upload_message(self, transfer, msgid, msg, now):
+        key = transfer.key
+        if msgid in (mavlink.MAVLINK_MSG_ID_MISSION_REQUEST_INT, mavlink.MAVLINK_MSG_ID_MISSION_REQUEST):
+            seq = msg.seq
+            if seq >= transfer.count:
+                return None
+            transfer.requested = max(transfer.requested, seq)
+            transfer.last_activity = now
+            transfer.retries = 0
+            self._progress(transfer, seq, now)
+            message = transfer.messages[seq]
+            return lambda mav: mav.send(message)
+        if msgid == mavlink.MAVLINK_MSG_ID_MISSION_ACK:
+            if msg.type == mavlink.MAV_MISSION_ACCEPTED:
+                if transfer.requested < transfer.count - 1:
+                    # Запоздалое подтверждение прошлой передачи
+                    return None
+                self.missions[key] = transfer.items
+                self._finish(transfer, True, f"завантажено {transfer.count} пунктів")
+            else:
+                self._finish(transfer, False, mission_result_name(msg.type))
+        return None
+
+    def _on_download_message(self, transfer, msgid, msg, now):
+        if msgid == mavlink.MAVLINK_MSG_ID_MISSION_COUNT:
+            if transfer.count is not None:
+                return None
+            transfer.count = msg.count
+            transfer.queue = deque(range(msg.count))
+            transfer.last_activity = now
+            transfer.retries = 0
+            if not msg.count:
+                return self._complete_download(transfer)
+            return self._request_items(transfer, now)
+        if msgid == mavlink.MAVLINK_MSG_ID_MISSION_ITEM_INT:
+            if transfer.count is None or msg.seq >= transfer.count:
+                return None
+            transfer.items[msg.seq] = MissionItem.from_message(msg)
+            transfer.in_flight.pop(msg.seq, None)
+            transfer.last_activity = now
+            if len(transfer.items) >= transfer.count:
+                return self._complete_download(transfer)
+            self._progress(transfer, len(transfer.items), now)
+            return self._request_items(transfer, now)
+        if msgid == mavlink.MAVLINK_MSG_ID_MISSION_ACK and msg.type != mavlink.MAV_MISSION_ACCEPTED:
+            self._finish(transfer, False, mission_result_name(msg.type))
+        return None
+
+    def _complete_download(self, transfer):
+        key = transfer.key
+        self.missions[key] = [transfer.items[seq] for seq in range(transfer.count)]
+        self._finish(transfer, True, f"отримано {transfer.count} пунктів")
+        return lambda mav: mav.mission_ack_send(key[0], key[1], mavlink.MAV_MISSION_ACCEPTED)
+
+    def _request_items(self, transfer, now):
+        """Дозаполнение окна запросов пунктов (под блокировкой)"""
+        free = self.REQUEST_WINDOW - len(transfer.in_flight)
+        seqs = []
+        while len(seqs) < free and transfer.queue:
+            seq = transfer.queue.popleft()
+            if seq in transfer.items or seq in transfer.in_flight:
+                continue
+            transfer.in_flight[seq] = now + self.ITEM_TIMEOUT
+            transfer.attempts[seq] = transfer.attempts.get(seq, 0) + 1
+            seqs.append(seq)
+        if not seqs:
+            return None
+        key = transfer.key
+
+        def send(mav):
+            for seq in seqs:
+                mav.mission_request_int_send(key[0], key[1], seq)
+        return send
+
+    # --- Такт: таймауты и повторы ---
+
+    def tick(self, now):
+        if not self.transfers:
+            return
+        replies = []
+        with self._lock:
+            for transfer in list(self.transfers.values()):
+                if transfer.active:
+                    reply = self._tick_transfer(transfer, now)
+                    if reply:
+                        replies.append(reply)
+        for reply in replies:
+            self._send(reply)
+
+    def _tick_transfer(self, transfer, now):
+        key = transfer.key
+        if transfer.direction == DOWNLOAD and transfer.count is not None:
+            for seq, deadline in list(transfer.in_flight.items()):
+                if now > deadline:
+                    del transfer.in_flight[seq]
+                    if transfer.attempts[seq] > self.RETRIES:
+                        self._finish(transfer, False, f"пункт {seq} не отримано")
+                        return None
+                    # Повтор - раньше еще не запрошенных пунктов
+                    transfer.queue.appendleft(seq)
+            return self._request_items(transfer, now)
+
+        timeout = self.COUNT_TIMEOUT if transfer.requested < 0 else self.ITEM_TIMEOUT
+        if now - transfer.last_activity <= timeout:
+            return None
+        transfer.retries += 1
+        transfer.last_activity = now
+        if transfer.retries > self.RETRIES:
+            self._finish(transfer, False, "апарат не відповідає")
+            return None
+        if transfer.direction == DOWNLOAD:
+            return lambda mav: mav.mission_request_list_send(key[0], key[1])
+        if transfer.requested < 0:
+            return lambda mav: mav.mission_count_send(key[0], key[1], transfer.count)
+        # Ответ на последний запрос мог потеряться - повторяем его
+        message = transfer.messages[transfer.requested]
+        return lambda mav: mav.send(message)
+
+    def _progress(self, transfer, done, now):
+        if now - transfer.last_progress >= self.PROGRESS_INTERVAL:
+            transfer.last_progress = now
+            self.link.mission_progress.emit(transfer.key[0], transfer.key[1], done, transfer.count)
+
+    def _finish(self, transfer, ok, description):
+        """Завершение передачи (под блокировкой)"""
+        transfer.active = False
+        key = transfer.key
+        elapsed = time.monotonic() - transfer.started
+        action = "Завантаження місії" if transfer.direction == UPLOAD else "Читання місії"
+        if ok:
+            self.link.message_received.emit(f"🗺 {action} system={key[0]}: {description} за {elapsed:.1f} с")
+            self.link.mission_progress.emit(key[0], key[1], transfer.count, transfer.count)
+        else:
+            self.link.message_received.emit(f"❌ {action} system={key[0]}: {description}")
+        self.link.mission_finished.emit(key[0], key[1], transfer.direction, ok, description)
+
+    def _send(self, write):
+        connection = self.link.connection
+        if connection is None:
+            return
+        with self.link._send_lock:
+            write(connection.mav)
@@ -0,0 +1,454 @@
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from mavlink_dialect import mavutil
+
+
+mavlink = mavutil.mavlink
+
+# Имя запроса хеша таблицы (PX4): ответ - PARAM_VALUE с хешем в поле param_value
+HASH_CHECK = "_HASH_CHECK"
+
+# Этапы загрузки таблицы одного аппарата
+PHASE_IDENTIFY = "identify"
+PHASE_VALIDATE_HASH = "validate_hash"
+PHASE_LIST = "list"
+PHASE_GAPS = "gaps"
+PHASE_DONE = "done"
+PHASE_FAILED = "failed"
+ACTIVE_PHASES = (PHASE_IDENTIFY, PHASE_VALIDATE_HASH, PHASE_LIST, PHASE_GAPS)
+
+
+def value_bytes(value):
+    """Значение параметра в том виде, как оно передается в PARAM_VALUE (float32)"""
+    return struct.pack('<f', value)
+
+
+def parameter_hash(values):
+    """CRC32 таблицы как в _HASH_CHECK PX4: имя и 4 байта значения, по порядку имен"""
+    crc = 0
+    for name in sorted(values):
+        crc = zlib.crc32(name.encode('ascii', 'replace'), crc)
+        crc = zlib.crc32(value_bytes(values[name][0]), crc)
+    return crc & 0xFFFFFFFF
+
+
+def hash_as_value(crc):
+    """Хеш в поле param_value: те же 4 байта, прочитанные как float"""
+    return struct.unpack('<f', struct.pack('<I', crc))[0]
+
+
+class ParameterTable:
+    """Таблица параметров аппарата: имя -> (значение, MAV_PARAM_TYPE) и порядок индексов"""
+
+    def __init__(self, count=0):
+        self.count = count
+        self.values = {}  # имя -> (значение, тип)
+        self.names = {}  # индекс -> имя
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.values
+
+    @property
+    def complete(self):
+        return self.count > 0 and len(self.names) >= self.count
+
+    def set(self, index, name, value, param_type):
+        self.names[index] = name
+        self.values[name] = (value, param_type)
+
+    def get(self, name, default=None):
+        entry = self.values.get(name)
+        return entry[0] if entry is not None else default
+
+    def hash(self):
+        return parameter_hash(self.values)
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "hash": self.hash(),
+            "params": [[index, name, *self.values[name]] for index, name in sorted(self.names.items())],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        table = cls(int(data["count"]))
+        for index, name, value, param_type in data["params"]:
+            table.set(int(index), name, float(value), int(param_type))
+        return table
+
+
+class ParameterCache:
+    """Таблицы параметров на диске: JSON-файл на аппарат (ключ - идентичность аппарата)"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    def path(self, identity):
+        safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in identity)
+        return os.path.join(self.directory, f"{safe}.json")
+
+    def load(self, identity):
+        """Сохраненная таблица или None (нет файла, файл поврежден или неполон)"""
+        try:
+            with open(self.path(identity), encoding="utf-8") as f:
+                table = ParameterTable.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return table if table.complete else None
+
+    def save(self, identity, table):
+        path = self.path(identity)
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            # Через временный файл: обрыв записи не оставит испорченный кеш
+            temp = path + ".tmp"
+            with open(temp, "w", encoding="utf-8") as f:
+                json.dump(dict(table.to_dict(), identity=identity, saved=time.time()), f)
+            os.replace(temp, path)
+
+
+class _Download:
+    """Загрузка таблицы параметров одного аппарата"""
+
+    def __init__(self, key, force):
+        self.key = key
+        self.force = force
+        self.phase = PHASE_IDENTIFY
+        self.identity = None
+        self.cached = None
+        self.table = ParameterTable()
+        self.deadline = 0.0
+        self.started = time.monotonic()
+        # PARAM_REQUEST_LIST: следующий ожидаемый индекс и пропуски перед ним
+        self.list_requests = 0
+        self.next_index = 0
+        self.missing = set()
+        self.last_value = 0.0
+        # PARAM_REQUEST_READ в полете: индекс -> срок ответа; число попыток по индексам
+        self.in_flight = {}
+        self.attempts = {}
+        self.rerequested = 0
+        self.last_progress = 0.0
+        # Таблицу изменили после загрузки: срок записи в кеш (None - кеш актуален)
+        self.save_at = None
+
+
+class ParameterClient:
+    """Загрузка таблиц параметров аппаратов линка
+
+    Полная таблица запрашивается PARAM_REQUEST_LIST. Пропуски видны по
+    индексам по мере прихода PARAM_VALUE и дозапрашиваются PARAM_REQUEST_READ
+    окном из READ_WINDOW запросов, не дожидаясь конца потока. Таблицы всех
+    аппаратов линка загружаются одновременно.
+
+    Готовая таблица сохраняется в ParameterCache под идентичностью аппарата
+    (uid из AUTOPILOT_VERSION, иначе автопилот/тип/sysid). При следующем
+    подключении кеш проверяется хешем всей таблицы (_HASH_CHECK); если хеш
+    не совпал или автопилот его не поддерживает (ArduPilot) - полная
+    загрузка. Значения, измененные после загрузки, дописываются в кеш через
+    SAVE_DELAY после последнего изменения.
+
+    handle_*() и tick() вызываются из потока ввода-вывода линка, fetch() - из любого.
+    """
+    IDENTIFY_TIMEOUT = 2.0  # с на AUTOPILOT_VERSION
+    HASH_TIMEOUT = 1.0
+    LIST_IDLE = 1.0  # с без PARAM_VALUE - поток PARAM_REQUEST_LIST закончился
+    LIST_RETRIES = 3
+    READ_TIMEOUT = 0.5
+    READ_RETRIES = 5
+    READ_WINDOW = 8
+    SAVE_DELAY = 1.0  # с без изменений таблицы перед записью кеша
+    PROGRESS_INTERVAL = 0.25  # с между сигналами хода загрузки
+
+    def __init__(self, link, cache=None):
+        self.link = link
+        self.cache = cache
+        self.downloads = {}  # (sysid, compid) -> _Download
+        self.tables = {}  # (sysid, compid) -> ParameterTable
+        self.uids = {}  # (sysid, compid) -> uid из AUTOPILOT_VERSION
+        self._lock = threading.RLock()
+
+    def table(self, key):
+        return self.tables.get(key)
+
+    def is_active(self, key):
+        download = self.downloads.get(key)
+        return download is not None and download.phase in ACTIVE_PHASES
+
+    def fetch(self, key, force=False):
+        """Загрузка (или проверка кеша) таблицы аппарата; force - без кеша"""
+        with self._lock:
+            if self.is_active(key):
+                return False
+            download = _Download(key, force)
+            download.deadline = time.monotonic() + self.IDENTIFY_TIMEOUT
+            self.downloads[key] = download
+        if key in self.uids:
+            self._identified(download, self.uids[key])
+            return True
+        self.link.commands.submit(
+            key, mavlink.MAV_CMD_REQUEST_MESSAGE, (mavlink.MAVLINK_MSG_ID_AUTOPILOT_VERSION, 0, 0, 0, 0, 0, 0),
+            callback=lambda pending: self._on_identify_result(download, pending)
+        )
+        return True
+
+    def resume(self, key):
+        """Аппарат снова на связи: незавершенная загрузка начинается заново"""
+        download = self.downloads.get(key)
+        if download is not None and download.phase != PHASE_DONE:
+            self.fetch(key, force=download.force)
+
+    def reset(self):
+        """Линк закрыт: загрузки в полете прерываются (resume() возобновит их), изменения пишутся в кеш"""
+        with self._lock:
+            unsaved = []
+            for download in self.downloads.values():
+                if download.phase in ACTIVE_PHASES:
+                    download.phase = PHASE_FAILED
+                if download.save_at is not None:
+                    download.save_at = None
+                    unsaved.append(download)
+        for download in unsaved:
+            self._save(download, self.tables.get(download.key))
+
+    # --- Опознание аппарата ---
+
+    def _on_identify_result(self, download, pending):
+        if pending.cancelled() or pending.exception() is not None or pending.result() != mavlink.MAV_RESULT_ACCEPTED:
+            # Автопилот не отдает AUTOPILOT_VERSION по запросу
+            self._identified(download, None)
+
+    def handle_autopilot_version(self, key, msg):
+        uid = msg.uid or None
+        self.uids[key] = uid
+        download = self.downloads.get(key)
+        if download is not None:
+            self._identified(download, uid)
+
+    def _identity(self, key, uid):
+        vehicle = self.link.vehicles.get(key)
+        autopilot = vehicle.autopilot if vehicle is not None else 0
+        if uid:
+            return f"ap{autopilot}-{uid:016x}"
+        mav_type = vehicle.mav_type if vehicle is not None else 0
+        return f"ap{autopilot}-type{mav_type}-sys{key[0]}-comp{key[1]}"
+
+    def _identified(self, download, uid):
+        identity = self._identity(download.key, uid)
+        cached = None
+        if self.cache is not None and not download.force:
+            cached = self.cache.load(identity)
+        now = time.monotonic()
+        with self._lock:
+            if download.phase != PHASE_IDENTIFY or self.downloads.get(download.key) is not download:
+                return
+            download.identity = identity
+            download.cached = cached
+            if cached is None:
+                self._start_list(download, now)
+                return
+            download.phase = PHASE_VALIDATE_HASH
+            download.deadline = now + self.HASH_TIMEOUT
+        self._send_read(download.key, HASH_CHECK, -1)
+
+    # --- Прием PARAM_VALUE ---
+
+    def handle_param_value(self, key, msg):
+        download = self.downloads.get(key)
+        if download is None:
+            return
+        name = msg.param_id
+        now = time.monotonic()
+        finish = None
+        with self._lock:
+            phase = download.phase
+            if name == HASH_CHECK:
+                if phase == PHASE_VALIDATE_HASH:
+                    if value_bytes(msg.param_value) == struct.pack('<I', download.cached.hash()):
+                        finish = True
+                    else:
+                        self._start_list(download, now)
+            elif phase in (PHASE_LIST, PHASE_GAPS):
+                finish = self._record(download, msg, now) or None
+                if finish is None and now - download.last_progress >= self.PROGRESS_INTERVAL:
+                    download.last_progress = now
+                    self.link.parameters_progress.emit(key[0], key[1], len(download.table), download.table.count)
+            elif phase == PHASE_DONE:
+                # Значение изменили (PARAM_SET с этой или другой станции): кеш переписывается
+                table = self.tables.get(key)
+                entry = table.values.get(name) if table is not None else None
+                if entry is not None:
+                    table.values[name] = (msg.param_value, msg.param_type)
+                    if value_bytes(entry[0]) != value_bytes(msg.param_value) or entry[1] != msg.param_type:
+                        download.save_at = now + self.SAVE_DELAY
+            if finish:
+                download.phase = PHASE_DONE
+        if finish:
+            self._finish(download, from_cache=phase != PHASE_LIST and phase != PHASE_GAPS)
+
+    def _record(self, download, msg, now):
+        """Новое значение загружаемой таблицы; True - таблица собрана"""
+        index, count = msg.param_index, msg.param_count
+        if not count or index >= count:
+            # Ответ на чтение по имени (индекс 65535) - таблицу не дополняет
+            return False
+        table = download.table
+        if table.count != count:
+            table.count = count
+        if index >= download.next_index:
+            # Все, что между прошлым и этим индексом, потеряно в пути
+            download.missing.update(range(download.next_index, index))
+            download.next_index = index + 1
+        download.missing.discard(index)
+        download.in_flight.pop(index, None)
+        download.last_value = now
+        table.set(index, msg.param_id, msg.param_value, msg.param_type)
+        return table.complete
+
+    # --- Такт: таймауты, дозапросы пропусков ---
+
+    def tick(self, now):
+        if not self.downloads or not self.link.connected:
+            return
+        with self._lock:
+            active = [d for d in self.downloads.values() if d.phase in ACTIVE_PHASES]
+            unsaved = [d for d in self.downloads.values() if d.save_at is not None and now >= d.save_at]
+            for download in unsaved:
+                download.save_at = None
+        for download in active:
+            self._tick_download(download, now)
+        for download in unsaved:
+            self._save(download, self.tables.get(download.key))
+
+    def _tick_download(self, download, now):
+        phase = download.phase
+        if phase == PHASE_IDENTIFY:
+            if now > download.deadline:
+                self._identified(download, None)
+            return
+        if phase == PHASE_VALIDATE_HASH:
+            if now > download.deadline:
+                # _HASH_CHECK не поддерживается: чтение части индексов пропустило бы
+                # измененный параметр, поэтому таблица загружается целиком
+                with self._lock:
+                    if download.phase == PHASE_VALIDATE_HASH:
+                        self._start_list(download, now)
+            return
+
+        with self._lock:
+            if download.phase == PHASE_LIST and now - download.last_value > self.LIST_IDLE:
+                if not download.table.count:
+                    # Ни одного PARAM_VALUE: запрос списка потерян
+                    if download.list_requests >= self.LIST_RETRIES:
+                        self._fail(download, "немає відповіді на PARAM_REQUEST_LIST")
+                        return
+                    download.last_value = now
+                    download.list_requests += 1
+                    requests = True
+                else:
+                    # Поток закончился: хвост таблицы тоже дозапрашивается
+                    download.missing.update(range(download.next_index, download.table.count))
+                    download.next_index = download.table.count
+                    download.phase = PHASE_GAPS
+                    requests = False
+            else:
+                requests = False
+            reads = self._gap_requests(download, now)
+            if reads is None:
+                return
+        if requests:
+            self._send_list(download.key)
+        for index in reads:
+            self._send_read(download.key, "", index)
+
+    def _gap_requests(self, download, now):
+        """Индексы для PARAM_REQUEST_READ (под блокировкой); None - загрузка не удалась"""
+        for index, deadline in list(download.in_flight.items()):
+            if now > deadline:
+                del download.in_flight[index]
+                if download.attempts.get(index, 0) >= self.READ_RETRIES:
+                    self._fail(download, f"параметр #{index} не отримано після {self.READ_RETRIES} спроб")
+                    return None
+        free = self.READ_WINDOW - len(download.in_flight)
+        if free <= 0 or not download.missing:
+            return []
+        reads = []
+        for index in sorted(download.missing):
+            if index in download.in_flight:
+                continue
+            download.in_flight[index] = now + self.READ_TIMEOUT
+            download.attempts[index] = download.attempts.get(index, 0) + 1
+            download.rerequested += 1
+            reads.append(index)
+            if len(reads) >= free:
+                break
+        return reads
+
+    def _start_list(self, download, now):
+        """Полная загрузка (под блокировкой)"""
+        download.phase = PHASE_LIST
+        download.table = ParameterTable()
+        download.next_index = 0
+        download.missing = set()
+        download.in_flight = {}
+        download.attempts = {}
+        download.last_value = now
+        download.list_requests = 1
+        self._send_list(download.key)
+
+    def _finish(self, download, from_cache):
+        key = download.key
+        table = download.cached if from_cache else download.table
+        self.tables[key] = table
+        elapsed = time.monotonic() - download.started
+        if not from_cache:
+            self._save(download, table)
+        if from_cache:
+            text = f"⚙️ Параметри system={key[0]}: {table.count} з кешу (перевірка {elapsed:.1f} с)"
+        else:
+            text = f"⚙️ Параметри system={key[0]}: завантажено {table.count} за {elapsed:.1f} с"
+            if download.rerequested:
+                text += f", дозапитано {download.rerequested}"
+        self.link.message_received.emit(text)
+        self.link.parameters_progress.emit(key[0], key[1], table.count, table.count)
+        self.link.parameters_ready.emit(key[0], key[1], table.count, from_cache)
+
+    def _save(self, download, table):
+        if self.cache is None or download.identity is None or table is None:
+            return
+        try:
+            self.cache.save(download.identity, table)
+        except OSError as e:
+            self.link.message_received.emit(f"⚠️ Кеш параметрів не збережено: {str(e)}")
+
+    def _fail(self, download, reason):
+        """Загрузка не удалась (под блокировкой)"""
+        download.phase = PHASE_FAILED
+        key = download.key
+        self.link.message_received.emit(f"❌ Параметри system={key[0]}: {reason}")
+        self.link.parameters_failed.emit(key[0], key[1], reason)
+
+    # --- Отправка ---
+
+    def _send_list(self, key):
+        connection = self.link.connection
+        if connection is None:
+            return
+        with self.link._send_lock:
+            connection.mav.param_request_list_send(key[0], key[1])
+
+    def _send_read(self, key, name, index):
+        connection = self.link.connection
+        if connection is None:
+            return
+        with self.link._send_lock:
+            connection.mav.param_request_read_send(key[0], key[1], name.encode('ascii'), index)
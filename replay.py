@@ -0,0 +1,275 @@
+import os
+import socket
+import threading
+import time
+from mavlink_dialect import mavutil
+from PyQt5.QtCore import pyqtSignal
+from mavlink_connection import MAVLinkConnection
+from tlog import REPLAY_MAX_SPEED, TlogReader
+
+
+class ReplaySource:
+    """Источник сообщений из tlog вместо сокета mavutil
+
+    recv_msg() отдает только те кадры, время которых уже наступило по часам
+    воспроизведения (реальное время, N× или без ожидания). Дескриптор fd -
+    socketpair, через который линк будит поток пула, когда очередной кадр готов.
+    """
+    MAX_SPEED = REPLAY_MAX_SPEED
+
+    def __init__(self, path, speed=1.0):
+        self.path = path
+        self.reader = TlogReader(path)
+        self.start_time = self.reader.start_time
+        self.end_time = self.reader.end_time
+        self.mav = mavutil.mavlink.MAVLink(None)
+        self.mav.robust_parsing = True
+        # Заполняются линком по первому heartbeat, как у mavutil соединения
+        self.target_system = 0
+        self.target_component = 0
+
+        self.speed = speed
+        self.paused = False
+        self.finished = False
+        self.position = self.start_time
+        self._lock = threading.Lock()
+        self._frames = None
+        self._next = None
+        self._anchor_log = self.start_time
+        self._anchor_wall = time.monotonic()
+
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self.fd = self._wake_r.fileno()
+        self.seek(self.start_time)
+
+    @property
+    def duration(self):
+        return max(0.0, self.end_time - self.start_time)
+
+    def _clock(self, now):
+        """Время записи, до которого кадры уже должны быть отданы"""
+        return self._anchor_log + (now - self._anchor_wall) * self.speed
+
+    def _reanchor(self):
+        self._anchor_log = self.position
+        self._anchor_wall = time.monotonic()
+
+    def recv_msg(self):
+        """Следующее наступившее сообщение или None"""
+        with self._lock:
+            while not self.paused and not self.finished:
+                frame = self._next
+                if frame is None:
+                    frame = next(self._frames, None)
+                    if frame is None:
+                        self.finished = True
+                        self.position = self.end_time
+                        return None
+                    self._next = frame
+                timestamp, data = frame
+                if self.speed != self.MAX_SPEED and timestamp > self._clock(time.monotonic()):
+                    return None
+                self._next = None
+                self.position = timestamp
+                msgs = self.mav.parse_buffer(bytes(data))
+                if msgs:
+                    msg = msgs[0]
+                    msg._timestamp = timestamp
+                    return msg
+            return None
+
+    def due(self, now):
+        """Есть ли кадр, время которого уже наступило"""
+        with self._lock:
+            if self.paused or self.finished:
+                return False
+            if self.speed == self.MAX_SPEED or self._next is None:
+                return True
+            return self._next[0] <= self._clock(now)
+
+    def seek(self, timestamp):
+        """Переход к моменту записи (по индексу tlog)"""
+        timestamp = min(max(timestamp, self.start_time), self.end_time)
+        with self._lock:
+            self._next = None
+            self._frames = self.reader.frames(start_time=timestamp)
+            self.finished = False
+            self.position = timestamp
+            self._reanchor()
+        self.wake()
+
+    def set_speed(self, speed):
+        with self._lock:
+            self.speed = speed
+            self._reanchor()
+        self.wake()
+
+    def set_paused(self, paused):
+        with self._lock:
+            self.paused = paused
+            self._reanchor()
+        self.wake()
+
+    def wake(self):
+        try:
+            self._wake_w.send(b'\0')
+        except OSError:
+            pass
+
+    def drain(self):
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def close(self):
+        with self._lock:
+            # Срезы mmap должны быть освобождены до закрытия файла
+            self._next = None
+            self._frames = None
+        self.reader.close()
+        self._wake_r.close()
+        self._wake_w.close()
+
+
+class ReplayConnection(MAVLinkConnection):
+    """Воспроизведение tlog через тот же конвейер, что и живой линк
+
+    Кадры идут через реестр декодеров, coalescer и историю телеметрии, поэтому
+    UI не отличает запись от реального аппарата. Команды не отправляются.
+    При скорости MAX_SPEED запись прокручивается с максимальной скоростью -
+    это и нагрузочный тест интерфейса.
+    """
+    # Текущая позиция и длительность записи, секунды от начала
+    replay_progress = pyqtSignal(float, float)
+    replay_finished = pyqtSignal()
+
+    REPLAY = True
+    MAX_SPEED = ReplaySource.MAX_SPEED
+    BATCH_SIZE = 500  # сообщений за одно обслуживание, чтобы не задерживать другие линки
+    PROGRESS_INTERVAL = 0.25  # секунд между сигналами replay_progress
+
+    def __init__(self, path, speed=1.0, io_pool=None, handlers=None):
+        super().__init__(io_pool=io_pool, handlers=handlers)
+        self.path = path
+        self.speed = speed
+        self.protocol = "TLOG"
+        self.host = os.path.basename(path)
+        self.port = 0
+        self.connection_string = path
+        self._last_progress = 0.0
+        # Пауза воспроизведения - не потеря связи, а у файла нечего переподключать
+        self.heartbeat_timeout = None
+        self.auto_reconnect = False
+        # После перехода по записи история аппаратов начинается заново (время отсчетов - из tlog)
+        self._history_reset = False
+
+    def _create_connection(self):
+        return ReplaySource(self.path, self.speed)
+
+    def _request_data_stream(self, vehicle):
+        """Запись уже содержит все потоки - запрашивать нечего"""
+        if len(self.vehicles) == 1:
+            self.message_received.emit(f"📼 Відтворення {self.host} ({self._speed_text()})")
+
+    def _speed_text(self):
+        return "макс. швидкість" if self.speed == self.MAX_SPEED else f"{self.speed:g}×"
+
+    def send_command(self, command, *args, **kwargs):
+        self.message_received.emit("❌ Відтворення запису: команди недоступні")
+        return False
+
+    def set_mode(self, mode_name, target=None):
+        return self.send_command(mavutil.mavlink.MAV_CMD_DO_SET_MODE)
+
+    # --- Управление воспроизведением (из любого потока) ---
+
+    @property
+    def duration(self):
+        source = self.connection
+        return source.duration if source else 0.0
+
+    @property
+    def position(self):
+        source = self.connection
+        return source.position - source.start_time if source else 0.0
+
+    def set_speed(self, speed):
+        """Скорость воспроизведения: 1.0 - реальное время, MAX_SPEED - без ожидания"""
+        self.speed = speed
+        source = self.connection
+        if source:
+            source.set_speed(speed)
+            self.message_received.emit(f"⏩ Швидкість відтворення: {self._speed_text()}")
+
+    def pause(self):
+        source = self.connection
+        if source:
+            source.set_paused(True)
+            self.message_received.emit("⏸ Відтворення призупинено")
+
+    def resume(self):
+        source = self.connection
+        if source:
+            source.set_paused(False)
+            self.message_received.emit("▶️ Відтворення продовжено")
+
+    def seek(self, seconds):
+        """Переход на seconds секунд от начала записи"""
+        source = self.connection
+        if source:
+            source.seek(source.start_time + seconds)
+            self._history_reset = True
+            self.replay_progress.emit(self.position, self.duration)
+
+    # --- Интерфейс для IOPool ---
+
+    def _on_readable(self):
+        source = self.connection
+        if source is None:
+            return
+        source.drain()
+        if self._history_reset:
+            self._history_reset = False
+            self._forget_history()
+        for _ in range(self.BATCH_SIZE):
+            if not self.running:
+                return
+            msg = source.recv_msg()
+            if msg is None:
+                break
+            self._handle_message(msg)
+        else:
+            # Кадры еще есть - вернемся к ним на следующем проходе select
+            source.wake()
+        self._report_progress(source)
+
+    def _forget_history(self):
+        """Сброс истории аппаратов, чтобы время отсчетов в ней не шло назад (поток ввода-вывода)"""
+        store = self.telemetry_store
+        if store is None:
+            return
+        for sysid, compid in list(self.vehicles):
+            store.forget((self.link_id, sysid, compid))
+
+    def _on_tick(self, now):
+        super()._on_tick(now)
+        source = self.connection
+        if source is not None and source.due(now):
+            source.wake()
+
+    def _report_progress(self, source):
+        now = time.monotonic()
+        if source.finished:
+            if self._last_progress is not None:
+                self._last_progress = None
+                self.replay_progress.emit(self.duration, self.duration)
+                self.message_received.emit(f"⏹ Відтворення {self.host} завершено")
+                self.replay_finished.emit()
+            return
+        if self._last_progress is None or now - self._last_progress >= self.PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.replay_progress.emit(self.position, self.duration)
@@ -2,6 +2,10 @@
 echo Установка зависимостей...
 pip install -r ./requirements.txt
 
+echo.
+echo Компиляция интерфейса...
+python ./compile_ui.py
+
 echo.
 echo Запуск приложения...
 python ./main.py
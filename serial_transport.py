@@ -0,0 +1,43 @@
+from mavlink_dialect import mavutil
+from buffered_transport import BufferedReader
+
+
+# Скорости телеметрийных радиомодемов и USB-подключений автопилотов
+BAUD_RATES = (57600, 115200, 230400, 460800, 921600)
+DEFAULT_BAUD = 57600
+
+
+def list_serial_ports():
+    """Доступные последовательные порты: [(устройство, описание)]"""
+    try:
+        from serial.tools import list_ports
+    except ImportError:
+        return []
+    return [(port.device, port.description) for port in sorted(list_ports.comports(), key=lambda p: p.device)]
+
+
+class BufferedSerial(BufferedReader, mavutil.mavserial):
+    """Последовательный порт (радиомодем, USB) с чтением крупными блоками
+
+    mavserial читает ровно столько байт, сколько парсеру не хватает до конца
+    кадра, - на 921600 бод это тысячи системных вызовов в секунду. Здесь за
+    один вызов забирается все, что накопил драйвер (до READ_SIZE), и блок
+    целиком разбирается parse_buffer (см. BufferedReader).
+    """
+
+    def __init__(self, device, baud=DEFAULT_BAUD, source_system=255, source_component=0):
+        super().__init__(device, baud=baud, source_system=source_system, source_component=source_component)
+        self._init_buffer()
+
+    @property
+    def bandwidth(self):
+        """Пропускная способность порта, байт/с (8N1: 10 бит на байт)"""
+        return int(self.baud) / 10
+
+    def _read_chunk(self):
+        # timeout=0: pyserial возвращает уже принятые байты одним os.read, не дожидаясь READ_SIZE
+        try:
+            return self.port.read(self.READ_SIZE)
+        except Exception as e:
+            # Например, USB-адаптер выдернули
+            raise ConnectionError(f"порт {self.device}: {e}") from e
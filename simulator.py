@@ -0,0 +1,652 @@
+import heapq
+import math
+import os
+import random
+import selectors
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from mavlink_dialect import mavutil
+from parameters import HASH_CHECK, hash_as_value, parameter_hash
+
+
+mavlink = mavutil.mavlink
+
+# Частоты сообщений по умолчанию, Гц
+DEFAULT_RATES = {
+    'HEARTBEAT': 1,
+    'GLOBAL_POSITION_INT': 10,
+    'VFR_HUD': 4,
+    'SYS_STATUS': 2,
+    'GPS_RAW_INT': 2,
+    'ATTITUDE': 4,
+}
+# Сообщения, которые умеет отправлять аппарат (частоту меняет SET_MESSAGE_INTERVAL)
+STREAMS = ('HEARTBEAT', 'GLOBAL_POSITION_INT', 'VFR_HUD', 'SYS_STATUS', 'GPS_RAW_INT', 'ATTITUDE',
+           'BATTERY_STATUS', 'EKF_STATUS_REPORT')
+
+# Таблица параметров в духе ArduCopter: группа_поле, 40 x 25 = 1000 параметров
+PARAM_GROUPS = ('ACRO', 'ADSB', 'AHRS', 'ARMING', 'ATC', 'AUTOTUNE', 'BATT', 'BRD', 'CAM', 'CAN', 'CIRCLE',
+                'COMPASS', 'EK3', 'FENCE', 'FLOW', 'FS', 'GPS', 'GND', 'INS', 'LAND', 'LOG', 'LOIT', 'MIS', 'MNT',
+                'MOT', 'NTF', 'PHLD', 'PILOT', 'PSC', 'RALLY', 'RC', 'RCMAP', 'RNGFND', 'RTL', 'SCHED', 'SERIAL',
+                'SERVO', 'SR0', 'TERRAIN', 'WPNAV')
+PARAM_FIELDS = ('ENABLE', 'TYPE', 'OPTIONS', 'RATE', 'P', 'I', 'D', 'FF', 'IMAX', 'FILT', 'MIN', 'MAX', 'TRIM',
+                'SPEED', 'ACCEL', 'ALT', 'TIMEOUT', 'ACTION', 'ORIENT', 'OFS_X', 'OFS_Y', 'OFS_Z', 'SCALE', 'DELAY',
+                'MASK')
+# Частота потока PARAM_VALUE в ответ на PARAM_REQUEST_LIST, Гц
+PARAM_STREAM_RATE = 500
+
+
+def default_parameters(rng):
+    """Параметры аппарата: имя -> (значение, MAV_PARAM_TYPE), в порядке индексов"""
+    params = {}
+    for group in PARAM_GROUPS:
+        for field in PARAM_FIELDS:
+            if field in ('ENABLE', 'TYPE', 'ACTION', 'ORIENT'):
+                params[f"{group}_{field}"] = (float(rng.randint(0, 3)), mavlink.MAV_PARAM_TYPE_INT8)
+            elif field in ('OPTIONS', 'MASK'):
+                params[f"{group}_{field}"] = (float(rng.randint(0, 0xFFFF)), mavlink.MAV_PARAM_TYPE_INT32)
+            else:
+                # Значения хранятся так же, как передаются - в float32
+                value = round(rng.uniform(0, 100), 3)
+                params[f"{group}_{field}"] = (struct.unpack('<f', struct.pack('<f', value))[0],
+                                              mavlink.MAV_PARAM_TYPE_REAL32)
+    return params
+
+
+# Режимы ArduCopter: имя -> custom_mode
+COPTER_MODES = {name: number for number, name in mavutil.mode_mapping_acm.items()}
+
+HOME = (50.4501, 30.5234)  # Київ
+EARTH_RADIUS = 6378137.0
+
+
+class SimulatedVehicle:
+    """Один симулированный коптер: простая кинематика и ответы на команды
+
+    Сообщения собирает общий pymavlink MAVLink с file=endpoint, поэтому
+    аппарат пишет кадры прямо в транспорт своего линка.
+    """
+    CLIMB_RATE = 2.0  # м/с
+    CRUISE_SPEED = 5.0  # м/с, облет по кругу в воздухе
+    FULL_VOLTAGE = 16.8
+    EMPTY_VOLTAGE = 13.2
+
+    def __init__(self, sysid, endpoint, home=HOME, rng=None, rates=None, on_rate_change=None, uid=0,
+                 param_loss=0.0, param_hash=True):
+        self.sysid = sysid
+        self.mav = mavlink.MAVLink(endpoint, srcSystem=sysid, srcComponent=mavlink.MAV_COMP_ID_AUTOPILOT1)
+        rng = rng or random.Random(sysid)
+        # Аппараты разнесены вокруг точки старта, чтобы не совпадали на карте
+        self.lat = home[0] + rng.uniform(-0.01, 0.01)
+        self.lon = home[1] + rng.uniform(-0.01, 0.01)
+        self.home_alt = 150.0
+        self.relative_alt = 0.0
+        self.target_alt = 0.0
+        self.heading = rng.uniform(0, 360)
+        self.groundspeed = 0.0
+        self.climb = 0.0
+        self.armed = False
+        self.mode = COPTER_MODES['STABILIZE']
+        self.battery = 100.0
+        self.satellites = rng.randint(10, 16)
+        self.boot_time = time.monotonic()
+        self.last_update = self.boot_time
+        # Текущие частоты сообщений, Гц; изменения сообщаются планировщику флота
+        self.default_rates = dict(DEFAULT_RATES if rates is None else rates)
+        self.rates = dict(self.default_rates)
+        self.on_rate_change = on_rate_change
+        # Параметры: uid для AUTOPILOT_VERSION, доля теряемых PARAM_VALUE, поддержка _HASH_CHECK
+        self.uid = uid
+        self.params = default_parameters(random.Random(0))
+        self.param_names = list(self.params)
+        self.param_loss = param_loss
+        self.param_hash = param_hash
+        self._param_queue = deque()
+        self._rng = rng
+        # Миссия: поля MISSION_ITEM_INT по пунктам; принимаемая миссия и номер ожидаемого пункта
+        self.mission = []
+        self._mission_upload = None
+        self._mission_count = 0
+
+    @property
+    def mode_name(self):
+        return mavutil.mode_mapping_acm.get(self.mode, str(self.mode))
+
+    @property
+    def landed(self):
+        return self.relative_alt < 0.1
+
+    def update(self, now):
+        """Интегрирование движения с прошлого вызова"""
+        dt = now - self.last_update
+        if dt <= 0:
+            return
+        self.last_update = now
+
+        if self.armed:
+            self.battery = max(0.0, self.battery - 0.05 * dt)
+        delta = self.target_alt - self.relative_alt
+        step = self.CLIMB_RATE * dt
+        self.climb = max(-self.CLIMB_RATE, min(self.CLIMB_RATE, delta / dt)) if abs(delta) > 1e-3 else 0.0
+        self.relative_alt += max(-step, min(step, delta))
+
+        if self.landed:
+            self.groundspeed = 0.0
+            if self.armed and self.mode == COPTER_MODES['LAND']:
+                # Как автопилот: после посадки в LAND мотор выключается сам
+                self.armed = False
+            return
+
+        self.groundspeed = self.CRUISE_SPEED
+        self.heading = (self.heading + 6.0 * dt) % 360
+        distance = self.groundspeed * dt
+        rad = math.radians(self.heading)
+        self.lat += math.degrees(distance * math.cos(rad) / EARTH_RADIUS)
+        self.lon += math.degrees(distance * math.sin(rad) / (EARTH_RADIUS * math.cos(math.radians(self.lat))))
+
+    def send(self, name, now):
+        """Отправка сообщения name (одно из STREAMS)"""
+        mav = self.mav
+        if name == 'HEARTBEAT':
+            base_mode = mavlink.MAV_MODE_FLAG_CUSTOM_MODE_ENABLED
+            if self.armed:
+                base_mode |= mavlink.MAV_MODE_FLAG_SAFETY_ARMED
+            mav.heartbeat_send(
+                mavlink.MAV_TYPE_QUADROTOR, mavlink.MAV_AUTOPILOT_ARDUPILOTMEGA, base_mode, self.mode,
+                mavlink.MAV_STATE_ACTIVE if self.armed else mavlink.MAV_STATE_STANDBY
+            )
+        elif name == 'GLOBAL_POSITION_INT':
+            rad = math.radians(self.heading)
+            mav.global_position_int_send(
+                self._boot_ms(now), int(self.lat * 1e7), int(self.lon * 1e7),
+                int((self.home_alt + self.relative_alt) * 1000), int(self.relative_alt * 1000),
+                int(self.groundspeed * math.cos(rad) * 100), int(self.groundspeed * math.sin(rad) * 100),
+                int(-self.climb * 100), int(self.heading * 100)
+            )
+        elif name == 'VFR_HUD':
+            mav.vfr_hud_send(
+                self.groundspeed, self.groundspeed, int(self.heading), 50 if self.armed else 0,
+                self.home_alt + self.relative_alt, self.climb
+            )
+        elif name == 'SYS_STATUS':
+            voltage = self.EMPTY_VOLTAGE + (self.FULL_VOLTAGE - self.EMPTY_VOLTAGE) * self.battery / 100.0
+            current = 1500 if self.armed else 50
+            mav.sys_status_send(0, 0, 0, 250, int(voltage * 1000), current, int(self.battery), 0, 0, 0, 0, 0, 0)
+        elif name == 'GPS_RAW_INT':
+            mav.gps_raw_int_send(
+                int((now - self.boot_time) * 1e6), 3, int(self.lat * 1e7), int(self.lon * 1e7),
+                int((self.home_alt + self.relative_alt) * 1000), 80, 120,
+                int(self.groundspeed * 100), int(self.heading * 100), self.satellites
+            )
+        elif name == 'ATTITUDE':
+            # Небольшой крен в развороте по кругу
+            roll = math.radians(8.0) if not self.landed else 0.0
+            mav.attitude_send(self._boot_ms(now), roll, 0.0, math.radians(self.heading), 0.0, 0.0,
+                              math.radians(6.0) if not self.landed else 0.0)
+        elif name == 'BATTERY_STATUS':
+            voltage = self.EMPTY_VOLTAGE + (self.FULL_VOLTAGE - self.EMPTY_VOLTAGE) * self.battery / 100.0
+            cells = [int(voltage * 1000 / 4)] * 4 + [0xFFFF] * 6
+            mav.battery_status_send(0, mavlink.MAV_BATTERY_FUNCTION_ALL, mavlink.MAV_BATTERY_TYPE_LIPO, 2500,
+                                    cells, 1500 if self.armed else 50, -1, -1, int(self.battery))
+        elif name == 'EKF_STATUS_REPORT':
+            flags = (mavlink.EKF_ATTITUDE | mavlink.EKF_VELOCITY_HORIZ | mavlink.EKF_VELOCITY_VERT |
+                     mavlink.EKF_POS_HORIZ_REL | mavlink.EKF_POS_HORIZ_ABS | mavlink.EKF_POS_VERT_ABS)
+            mav.ekf_status_report_send(flags, 0.05, 0.04, 0.03, 0.02, 0.0)
+        elif name == 'PARAM_VALUE':
+            # Очередной параметр потока PARAM_REQUEST_LIST
+            if self._param_queue:
+                self.send_param(self._param_queue.popleft())
+            if not self._param_queue:
+                self._set_rate('PARAM_VALUE', 0)
+
+    def send_param(self, index):
+        if self.param_loss and self._rng.random() < self.param_loss:
+            # Потеря в радиоканале
+            return
+        name = self.param_names[index]
+        value, param_type = self.params[name]
+        self.mav.param_value_send(name.encode('ascii'), value, param_type, len(self.param_names), index)
+
+    def _set_rate(self, name, rate):
+        self.rates[name] = rate
+        if self.on_rate_change is not None:
+            self.on_rate_change(name)
+
+    def _boot_ms(self, now):
+        return int((now - self.boot_time) * 1000) & 0xFFFFFFFF
+
+    def handle_message(self, msg):
+        """Реакция на сообщение наземной станции, адресованное этому аппарату"""
+        msg_type = msg.get_type()
+        if msg_type == 'COMMAND_LONG':
+            result = self.handle_command(msg.command, (msg.param1, msg.param2, msg.param3, msg.param4,
+                                                       msg.param5, msg.param6, msg.param7))
+            self.mav.command_ack_send(msg.command, result)
+        elif msg_type == 'SET_MODE':
+            self.set_mode(msg.custom_mode)
+        elif msg_type == 'PARAM_REQUEST_LIST':
+            self._param_queue = deque(range(len(self.param_names)))
+            self._set_rate('PARAM_VALUE', PARAM_STREAM_RATE)
+        elif msg_type == 'PARAM_REQUEST_READ':
+            self.handle_param_read(msg.param_id, msg.param_index)
+        elif msg_type.startswith('MISSION_'):
+            self.handle_mission(msg_type, msg)
+
+    def handle_mission(self, msg_type, msg):
+        """Протокол миссий со стороны автопилота: пункты запрашиваются по одному"""
+        gcs = (msg.get_srcSystem(), msg.get_srcComponent())
+        mav = self.mav
+        if msg_type == 'MISSION_COUNT':
+            self._mission_upload = []
+            if msg.count == 0:
+                self.mission = []
+                self._mission_upload = None
+                mav.mission_ack_send(gcs[0], gcs[1], mavlink.MAV_MISSION_ACCEPTED)
+            else:
+                self._mission_count = msg.count
+                mav.mission_request_int_send(gcs[0], gcs[1], 0)
+        elif msg_type in ('MISSION_ITEM_INT', 'MISSION_ITEM') and self._mission_upload is not None:
+            expected = len(self._mission_upload)
+            if msg.seq == expected:
+                self._mission_upload.append((msg.frame, msg.command, msg.autocontinue, msg.param1, msg.param2,
+                                             msg.param3, msg.param4, int(msg.x), int(msg.y), msg.z))
+                expected += 1
+            if expected >= self._mission_count:
+                self.mission = self._mission_upload
+                self._mission_upload = None
+                mav.mission_ack_send(gcs[0], gcs[1], mavlink.MAV_MISSION_ACCEPTED)
+            else:
+                mav.mission_request_int_send(gcs[0], gcs[1], expected)
+        elif msg_type == 'MISSION_REQUEST_LIST':
+            mav.mission_count_send(gcs[0], gcs[1], len(self.mission))
+        elif msg_type in ('MISSION_REQUEST_INT', 'MISSION_REQUEST'):
+            if msg.seq >= len(self.mission):
+                mav.mission_ack_send(gcs[0], gcs[1], mavlink.MAV_MISSION_INVALID_SEQUENCE)
+                return
+            frame, command, autocontinue, p1, p2, p3, p4, x, y, z = self.mission[msg.seq]
+            mav.mission_item_int_send(gcs[0], gcs[1], msg.seq, frame, command, 0, autocontinue, p1, p2, p3, p4,
+                                      x, y, z)
+        elif msg_type == 'MISSION_CLEAR_ALL':
+            self.mission = []
+            mav.mission_ack_send(gcs[0], gcs[1], mavlink.MAV_MISSION_ACCEPTED)
+
+    def handle_param_read(self, name, index):
+        if index < 0 and name == HASH_CHECK:
+            if self.param_hash:
+                self.mav.param_value_send(HASH_CHECK.encode('ascii'), hash_as_value(parameter_hash(self.params)),
+                                          mavlink.MAV_PARAM_TYPE_UINT32, len(self.param_names), 0xFFFF)
+            return
+        if index < 0:
+            if name not in self.params:
+                return
+            index = self.param_names.index(name)
+        if index < len(self.param_names):
+            self.send_param(index)
+
+    def handle_command(self, command, params):
+        """Выполнение COMMAND_LONG; возвращает MAV_RESULT"""
+        if command == mavlink.MAV_CMD_COMPONENT_ARM_DISARM:
+            arm = params[0] == 1
+            force = params[1] == 21196  # "магическое" значение принудительного выполнения
+            if not arm and not self.landed and not force:
+                return mavlink.MAV_RESULT_DENIED
+            self.armed = arm
+            if not arm:
+                self.target_alt = 0.0
+            return mavlink.MAV_RESULT_ACCEPTED
+
+        if command == mavlink.MAV_CMD_NAV_TAKEOFF:
+            if not self.armed or not self.landed:
+                return mavlink.MAV_RESULT_DENIED
+            self.target_alt = max(1.0, params[6])
+            if self.mode not in (COPTER_MODES['GUIDED'], COPTER_MODES['AUTO']):
+                self.mode = COPTER_MODES['GUIDED']
+            return mavlink.MAV_RESULT_ACCEPTED
+
+        if command == mavlink.MAV_CMD_NAV_LAND:
+            self.set_mode(COPTER_MODES['LAND'])
+            return mavlink.MAV_RESULT_ACCEPTED
+
+        if command == mavlink.MAV_CMD_DO_SET_MODE:
+            return mavlink.MAV_RESULT_ACCEPTED if self.set_mode(int(params[1])) else mavlink.MAV_RESULT_DENIED
+
+        if command == mavlink.MAV_CMD_SET_MESSAGE_INTERVAL:
+            return self.set_message_interval(int(params[0]), params[1])
+
+        if command == mavlink.MAV_CMD_REQUEST_MESSAGE:
+            if int(params[0]) != mavlink.MAVLINK_MSG_ID_AUTOPILOT_VERSION:
+                return mavlink.MAV_RESULT_DENIED
+            self.mav.autopilot_version_send(0, 0x04050000, 0, 0, 0, [0] * 8, [0] * 8, [0] * 8, 0, 0, self.uid)
+            return mavlink.MAV_RESULT_ACCEPTED
+
+        return mavlink.MAV_RESULT_UNSUPPORTED
+
+    def set_message_interval(self, msgid, interval):
+        """MAV_CMD_SET_MESSAGE_INTERVAL: интервал в мкс, -1 - выключить, 0 - частота по умолчанию"""
+        msg_class = mavlink.mavlink_map.get(msgid)
+        name = msg_class.msgname if msg_class is not None else None
+        if name not in STREAMS:
+            return mavlink.MAV_RESULT_DENIED
+        if interval < 0:
+            rate = 0
+        elif interval == 0:
+            rate = self.default_rates.get(name, 0)
+        else:
+            rate = 1e6 / interval
+        self._set_rate(name, rate)
+        return mavlink.MAV_RESULT_ACCEPTED
+
+    def set_mode(self, mode):
+        if mode not in mavutil.mode_mapping_acm:
+            return False
+        self.mode = mode
+        if mode == COPTER_MODES['LAND']:
+            self.target_alt = 0.0
+        return True
+
+
+class _Endpoint:
+    """Транспорт одного симулированного линка (file для pymavlink: только write)"""
+
+    def __init__(self, protocol, host, port):
+        self.protocol = protocol
+        self.host = host
+        self.vehicles = {}
+        self.sent_bytes = 0
+        self.dropped = 0
+        if protocol == "UDP":
+            # Наземная станция слушает (udpin), симулятор отправляет на ее порт
+            if not port:
+                port = free_udp_port(host)
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.sock.bind((host, 0))
+            self.peer = (host, port)
+        elif protocol == "TCP":
+            # Наземная станция - TCP клиент, симулятор - сервер
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.sock.bind((host, port))
+            self.sock.listen(8)
+            port = self.sock.getsockname()[1]
+            self.clients = {}
+        elif protocol == "SERIAL":
+            # Пара псевдотерминалов вместо радиомодема: станция открывает подчиненный конец
+            # как COM-порт, port - номинальная скорость в бодах (скорость не ограничивается)
+            import tty
+            self.master, self.slave = os.openpty()
+            tty.setraw(self.slave)
+            os.set_blocking(self.master, False)
+            self.host = os.ttyname(self.slave)
+            self.port = port or 57600
+            self.parser = mavlink.MAVLink(None)
+            self.parser.robust_parsing = True
+            return
+        else:
+            raise ValueError(f"невідомий протокол {protocol}")
+        self.sock.setblocking(False)
+        self.port = port
+        self.parser = mavlink.MAVLink(None)
+        self.parser.robust_parsing = True
+
+    def write(self, buf):
+        if self.protocol == "SERIAL":
+            try:
+                os.write(self.master, buf)
+                self.sent_bytes += len(buf)
+            except BlockingIOError:
+                # Станция не успевает читать порт
+                self.dropped += 1
+            except OSError:
+                self.dropped += 1
+            return
+        if self.protocol == "UDP":
+            try:
+                self.sock.sendto(buf, self.peer)
+                self.sent_bytes += len(buf)
+            except OSError:
+                # Станция еще не слушает порт (ICMP port unreachable)
+                self.dropped += 1
+            return
+        for client in list(self.clients):
+            try:
+                client.send(buf)
+                self.sent_bytes += len(buf)
+            except BlockingIOError:
+                # Клиент не успевает читать - кадр теряется, как в радиоканале
+                self.dropped += 1
+            except OSError:
+                self._drop_client(client)
+
+    def register(self, selector):
+        if self.protocol == "SERIAL":
+            selector.register(self.master, selectors.EVENT_READ, self._on_pty_readable)
+            return
+        selector.register(self.sock, selectors.EVENT_READ, self._on_server_readable)
+
+    def _on_pty_readable(self, selector):
+        try:
+            data = os.read(self.master, 65536)
+        except OSError:
+            return
+        self._dispatch(self.parser, data)
+
+    def _on_server_readable(self, selector):
+        if self.protocol == "UDP":
+            try:
+                while True:
+                    data = self.sock.recv(65536)
+                    self._dispatch(self.parser, data)
+            except OSError:
+                return
+        try:
+            client, _ = self.sock.accept()
+        except OSError:
+            return
+        client.setblocking(False)
+        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        parser = mavlink.MAVLink(None)
+        parser.robust_parsing = True
+        self.clients[client] = parser
+        selector.register(client, selectors.EVENT_READ, lambda sel, c=client: self._on_client_readable(sel, c))
+
+    def _on_client_readable(self, selector, client):
+        try:
+            data = client.recv(65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b''
+        if not data:
+            selector.unregister(client)
+            self._drop_client(client)
+            return
+        self._dispatch(self.clients[client], data)
+
+    def _drop_client(self, client):
+        self.clients.pop(client, None)
+        try:
+            client.close()
+        except OSError:
+            pass
+
+    def _dispatch(self, parser, data):
+        for msg in parser.parse_buffer(data) or ():
+            if msg.get_type() == 'BAD_DATA':
+                continue
+            target = getattr(msg, 'target_system', None)
+            if target is None:
+                continue
+            if target == 0:
+                for vehicle in self.vehicles.values():
+                    vehicle.handle_message(msg)
+            else:
+                vehicle = self.vehicles.get(target)
+                if vehicle is not None:
+                    vehicle.handle_message(msg)
+
+    def close(self):
+        if self.protocol == "SERIAL":
+            os.close(self.master)
+            os.close(self.slave)
+            return
+        if self.protocol == "TCP":
+            for client in list(self.clients):
+                self._drop_client(client)
+        self.sock.close()
+
+
+def free_udp_port(host="127.0.0.1"):
+    """Свободный UDP порт для udpin наземной станции"""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+class SimulatorFleet:
+    """Набор симулированных аппаратов в одном процессе и одном потоке
+
+    vehicles аппаратов распределяются по links линкам (у каждого линка свой
+    порт; sysid уникальны в пределах линка). Все сообщения планируются в одной
+    куче по времени отправки, поэтому сотни аппаратов обслуживает один поток.
+    """
+    MAX_VEHICLES_PER_LINK = 254
+
+    def __init__(self, vehicles=1, links=1, protocol="TCP", host="127.0.0.1", port=0, rates=None, param_loss=0.0,
+                 param_hash=True):
+        per_link = -(-vehicles // links)
+        if per_link > self.MAX_VEHICLES_PER_LINK:
+            raise ValueError(f"не більше {self.MAX_VEHICLES_PER_LINK} апаратів на лінк")
+        self.rates = dict(DEFAULT_RATES if rates is None else rates)
+        self.endpoints = []
+        self.vehicles = []
+        for index in range(links):
+            # Для SERIAL port - скорость, одинаковая для всех линков
+            endpoint = _Endpoint(protocol, host, port + index if port and protocol != "SERIAL" else port)
+            self.endpoints.append(endpoint)
+        for index in range(vehicles):
+            endpoint = self.endpoints[index % links]
+            sysid = len(endpoint.vehicles) + 1
+            vehicle = SimulatedVehicle(sysid, endpoint, rng=random.Random(index), rates=self.rates,
+                                       on_rate_change=lambda name, index=index: self._rate_changes.append((index, name)),
+                                       uid=0x5100000000 + index + 1, param_loss=param_loss, param_hash=param_hash)
+            endpoint.vehicles[sysid] = vehicle
+            self.vehicles.append(vehicle)
+
+        self._selector = selectors.DefaultSelector()
+        for endpoint in self.endpoints:
+            endpoint.register(self._selector)
+        self._schedule = []
+        # Поколение расписания (аппарат, сообщение): записи старых поколений выбрасываются
+        self._generations = {}
+        self._rate_changes = []
+        self._running = False
+        self._thread = None
+
+    @property
+    def addresses(self):
+        """(protocol, host, port) каждого линка - параметры для LinkManager.create_link"""
+        return [(e.protocol, e.host, e.port) for e in self.endpoints]
+
+    def start(self):
+        if self._running:
+            return self
+        self._running = True
+        now = time.monotonic()
+        rng = random.Random(0)
+        self._schedule = []
+        self._generations = {}
+        for index, vehicle in enumerate(self.vehicles):
+            for name, rate in vehicle.rates.items():
+                if rate > 0:
+                    # Разносим отправки по времени, чтобы аппараты не шли пачкой
+                    self._schedule.append((now + rng.uniform(0, 1.0 / rate), index, name, 0))
+                    self._generations[(index, name)] = 0
+        heapq.heapify(self._schedule)
+        self._thread = threading.Thread(target=self._run, name="mavlink-sim", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        schedule = self._schedule
+        while self._running:
+            now = time.monotonic()
+            timeout = min(0.05, max(0.0, schedule[0][0] - now)) if schedule else 0.05
+            for key, _ in self._selector.select(timeout):
+                key.data(self._selector)
+
+            now = time.monotonic()
+            if self._rate_changes:
+                self._reschedule(now)
+            while schedule and schedule[0][0] <= now:
+                due, index, name, generation = schedule[0]
+                rate = self.vehicles[index].rates.get(name, 0)
+                if generation != self._generations.get((index, name)) or rate <= 0:
+                    # Частоту изменили или сообщение выключили
+                    heapq.heappop(schedule)
+                    continue
+                vehicle = self.vehicles[index]
+                vehicle.update(now)
+                vehicle.send(name, now)
+                period = 1.0 / rate
+                due += period
+                if due < now:
+                    # Поток не успевает - пропускаем отставание, а не догоняем пачкой
+                    due = now + period
+                heapq.heapreplace(schedule, (due, index, name, generation))
+
+    def _reschedule(self, now):
+        """Новая частота действует сразу: старая запись расписания становится устаревшей"""
+        changes, self._rate_changes = self._rate_changes, []
+        for index, name in set(changes):
+            generation = self._generations.get((index, name), -1) + 1
+            self._generations[(index, name)] = generation
+            if self.vehicles[index].rates.get(name, 0) > 0:
+                heapq.heappush(self._schedule, (now, index, name, generation))
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        self._thread = None
+        for endpoint in self.endpoints:
+            endpoint.close()
+        self._selector.close()
+
+    def messages_per_second(self):
+        return sum(sum(vehicle.rates.values()) for vehicle in self.vehicles)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Локальний флот симульованих MAVLink апаратів")
+    parser.add_argument("--vehicles", type=int, default=1)
+    parser.add_argument("--links", type=int, default=1)
+    parser.add_argument("--protocol", choices=("TCP", "UDP", "SERIAL"), default="TCP",
+                        help="SERIAL - пара псевдотерміналів, виводиться пристрій для підключення")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None,
+                        help="перший порт (за замовчуванням 5760); для SERIAL - швидкість, бод")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="частота всіх потоків телеметрії, Гц (HEARTBEAT завжди 1 Гц)")
+    parser.add_argument("--param-loss", type=float, default=0.0, help="частка втрачених PARAM_VALUE, 0..1")
+    parser.add_argument("--no-param-hash", action="store_true", help="без _HASH_CHECK, як ArduPilot")
+    args = parser.parse_args()
+
+    rates = dict(DEFAULT_RATES)
+    if args.rate is not None:
+        rates = {name: (rate if name == 'HEARTBEAT' else args.rate) for name, rate in rates.items()}
+    port = args.port if args.port is not None else (57600 if args.protocol == "SERIAL" else 5760)
+    fleet = SimulatorFleet(args.vehicles, args.links, args.protocol, args.host, port, rates,
+                           param_loss=args.param_loss, param_hash=not args.no_param_hash).start()
+    for protocol, host, port in fleet.addresses:
+        print(f"{protocol}://{host}:{port}", flush=True)
+    print(f"{len(fleet.vehicles)} апаратів, ~{fleet.messages_per_second():.0f} повідомлень/с", flush=True)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        fleet.stop()
@@ -0,0 +1,81 @@
+import builtins
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupProfile:
+    """Время запуска программы: импорты модулей и этапы настройки окна
+
+    step() замеряет этап настройки, mark() - момент от начала запуска
+    (например, первый показ окна). С track_imports подменяется __import__ и
+    для каждого модуля, который импортирует сам main.py, считается время
+    загрузки вместе со всеми вложенными импортами. Подмена снимается
+    stop_imports() - после запуска импорты ничего не стоят.
+    """
+
+    def __init__(self, track_imports=False):
+        self.start = time.perf_counter()
+        self.imports = []  # (модуль, мс) в порядке импорта
+        self.steps = []  # (этап, мс)
+        self.marks = []  # (метка, мс от начала запуска)
+        self._depth = 0
+        self._import = None
+        if track_imports:
+            self._import = builtins.__import__
+            builtins.__import__ = self._timed_import
+
+    @property
+    def tracking_imports(self):
+        return self._import is not None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Учитываются только модули верхнего уровня, которых еще нет в sys.modules
+        if self._depth or level or name in sys.modules:
+            self._depth += 1
+            try:
+                return self._import(name, globals, locals, fromlist, level)
+            finally:
+                self._depth -= 1
+        started = time.perf_counter()
+        self._depth += 1
+        try:
+            return self._import(name, globals, locals, fromlist, level)
+        finally:
+            self._depth -= 1
+            self.imports.append((name, (time.perf_counter() - started) * 1000))
+
+    def stop_imports(self):
+        if self._import is not None:
+            builtins.__import__ = self._import
+            self._import = None
+
+    @contextmanager
+    def step(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((name, (time.perf_counter() - started) * 1000))
+
+    def mark(self, name):
+        elapsed = (time.perf_counter() - self.start) * 1000
+        self.marks.append((name, elapsed))
+        return elapsed
+
+    def report(self):
+        """Строки отчета: импорты (самые долгие сначала), этапы и метки"""
+        lines = []
+        if self.imports:
+            total = sum(ms for _, ms in self.imports)
+            lines.append(f"Імпорт модулів: {total:.0f} мс")
+            for name, ms in sorted(self.imports, key=lambda item: -item[1]):
+                lines.append(f"  {name:<28} {ms:8.1f} мс")
+        if self.steps:
+            total = sum(ms for _, ms in self.steps)
+            lines.append(f"Налаштування вікна: {total:.0f} мс")
+            for name, ms in self.steps:
+                lines.append(f"  {name:<28} {ms:8.1f} мс")
+        for name, ms in self.marks:
+            lines.append(f"{name}: {ms:.0f} мс від запуску")
+        return lines
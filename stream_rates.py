@@ -0,0 +1,244 @@
+import threading
+from mavlink_dialect import mavutil
+from command_dispatcher import result_name
+from message_handlers import message_id
+
+
+mavlink = mavutil.mavlink
+
+# Профиль частот по умолчанию, Гц: только сообщения, которые декодирует HUD
+DEFAULT_PROFILE = {
+    'ATTITUDE': 25,
+    'GLOBAL_POSITION_INT': 5,
+    'VFR_HUD': 5,
+    'GPS_RAW_INT': 2,
+    'SYS_STATUS': 1,
+    'BATTERY_STATUS': 1,
+    'EKF_STATUS_REPORT': 1,
+}
+
+# Группы REQUEST_DATA_STREAM (как их раскладывает ArduPilot) для автопилотов без SET_MESSAGE_INTERVAL
+LEGACY_STREAMS = {
+    'SYS_STATUS': mavlink.MAV_DATA_STREAM_EXTENDED_STATUS,
+    'GPS_RAW_INT': mavlink.MAV_DATA_STREAM_EXTENDED_STATUS,
+    'GLOBAL_POSITION_INT': mavlink.MAV_DATA_STREAM_POSITION,
+    'ATTITUDE': mavlink.MAV_DATA_STREAM_EXTRA1,
+    'VFR_HUD': mavlink.MAV_DATA_STREAM_EXTRA2,
+    'BATTERY_STATUS': mavlink.MAV_DATA_STREAM_EXTRA3,
+    'EKF_STATUS_REPORT': mavlink.MAV_DATA_STREAM_EXTRA3,
+}
+
+
+class _VehicleRates:
+    """Запрошенные и подтвержденные частоты одного аппарата"""
+
+    def __init__(self, key, profile=None):
+        self.key = key
+        self.profile = profile  # собственный профиль аппарата или None - профиль линка
+        self.requested = {}  # сообщение -> частота, отправленная в последней команде
+        self.confirmed = {}  # сообщение -> частота, подтвержденная COMMAND_ACK
+        self.rejected = {}  # сообщение -> MAV_RESULT или текст ошибки
+        self.outstanding = 0
+        self.legacy = False
+
+
+class StreamRateController:
+    """Частоты сообщений аппаратов линка через MAV_CMD_SET_MESSAGE_INTERVAL
+
+    Для каждого аппарата отправляется по команде на сообщение профиля;
+    частота считается установленной только после COMMAND_ACK с
+    MAV_RESULT_ACCEPTED. Если аппарат не принял ни одной команды, запрос
+    повторяется устаревшим REQUEST_DATA_STREAM по группам потоков.
+
+    tick() раз в WINDOW секунд измеряет входящий поток и потери линка (по
+    счетчикам seq MAVLink). При потерях выше LOSS_STEP_DOWN или превышении
+    bandwidth_limit линка профиль всех аппаратов линка понижается на уровень
+    LEVELS; после CALM_WINDOWS спокойных окон - повышается обратно.
+    """
+    LEVELS = (1.0, 0.5, 0.25, 0.1)  # множители частот профиля
+    MIN_RATE = 0.5  # Гц, ниже понижение не опускает (но и не поднимает выше профиля)
+    WINDOW = 5.0  # секунд на одно измерение линка
+    LOSS_STEP_DOWN = 0.05
+    LOSS_STEP_UP = 0.01
+    BANDWIDTH_HEADROOM = 0.8  # доля bandwidth_limit, которую можно занимать
+    CALM_WINDOWS = 3
+
+    def __init__(self, link, profile=None):
+        self.link = link
+        self.profile = dict(DEFAULT_PROFILE) if profile is None else profile
+        self.level = 0
+        self.vehicles = {}  # (sysid, compid) -> _VehicleRates
+        # Последнее измерение линка
+        self.bandwidth = 0.0  # байт/с
+        self.loss = 0.0
+        self._lock = threading.Lock()
+        self._window = None
+        self._calm = 0
+
+    def rates_for(self, key):
+        """Частоты аппарата с учетом текущего уровня понижения"""
+        state = self.vehicles.get(key)
+        profile = state.profile if state is not None and state.profile is not None else self.profile
+        if not profile:
+            return {}
+        factor = self.LEVELS[self.level]
+        return {name: min(rate, max(self.MIN_RATE, rate * factor)) if rate > 0 else 0
+                for name, rate in profile.items()}
+
+    def set_profile(self, key, profile):
+        """Собственный профиль аппарата (None - вернуть профиль линка)"""
+        with self._lock:
+            state = self.vehicles.setdefault(key, _VehicleRates(key))
+            state.profile = dict(profile) if profile is not None else None
+        if self.link.connected:
+            self.apply(key)
+
+    def apply(self, key):
+        """Отправка SET_MESSAGE_INTERVAL для сообщений, частота которых еще не подтверждена"""
+        rates = self.rates_for(key)
+        submit = []
+        with self._lock:
+            state = self.vehicles.setdefault(key, _VehicleRates(key))
+            if state.legacy:
+                legacy = True
+            else:
+                legacy = False
+                for name, rate in rates.items():
+                    if state.confirmed.get(name) == rate or state.requested.get(name) == rate:
+                        continue
+                    state.requested[name] = rate
+                    state.outstanding += 1
+                    submit.append((name, rate))
+        if legacy:
+            self._request_legacy(key, rates)
+            return
+        for name, rate in submit:
+            # -1 отключает сообщение, иначе интервал в микросекундах
+            interval = 1e6 / rate if rate > 0 else -1
+            self.link.commands.submit(
+                key, mavlink.MAV_CMD_SET_MESSAGE_INTERVAL, (message_id(name), interval, 0, 0, 0, 0, 0),
+                callback=lambda pending, name=name, rate=rate: self._on_result(key, name, rate, pending)
+            )
+
+    def _on_result(self, key, name, rate, pending):
+        """Результат одной команды (поток, завершивший команду)"""
+        if pending.cancelled():
+            result = "скасовано"
+        elif pending.exception() is not None:
+            result = str(pending.exception())
+        else:
+            result = pending.result()
+        with self._lock:
+            state = self.vehicles.get(key)
+            if state is None or name not in state.requested:
+                # Ответ на запрос, сброшенный reset()/forget()
+                return
+            state.outstanding -= 1
+            if state.requested.get(name) == rate:
+                del state.requested[name]
+                if result == mavlink.MAV_RESULT_ACCEPTED:
+                    state.confirmed[name] = rate
+                    state.rejected.pop(name, None)
+                else:
+                    state.confirmed.pop(name, None)
+                    state.rejected[name] = result
+            if state.outstanding:
+                return
+            confirmed = len(state.confirmed)
+            rejected = dict(state.rejected)
+            fallback = not confirmed and rejected and not state.legacy
+            if fallback:
+                state.legacy = True
+
+        if fallback:
+            self.link.message_received.emit(
+                f"⚠️ system={key[0]}: SET_MESSAGE_INTERVAL не підтримується, запит REQUEST_DATA_STREAM")
+            self._request_legacy(key, self.rates_for(key))
+            return
+        text = f"📊 Частоти потоків system={key[0]}: підтверджено {confirmed}/{confirmed + len(rejected)}"
+        if self.level:
+            text += f" (рівень {self.LEVELS[self.level]:.0%})"
+        self.link.message_received.emit(text)
+        for failed, reason in rejected.items():
+            if isinstance(reason, int):
+                reason = result_name(reason)
+            self.link.message_received.emit(f"⚠️ system={key[0]}: {failed} не встановлено ({reason})")
+
+    def _request_legacy(self, key, rates):
+        """REQUEST_DATA_STREAM по группам: частота группы - максимальная среди ее сообщений"""
+        streams = {}
+        for name, rate in rates.items():
+            stream = LEGACY_STREAMS.get(name)
+            if stream is not None:
+                streams[stream] = max(streams.get(stream, 0), rate)
+        connection = self.link.connection
+        if connection is None:
+            return
+        with self.link._send_lock:
+            for stream, rate in streams.items():
+                connection.mav.request_data_stream_send(
+                    key[0], key[1], stream, max(1, round(rate)) if rate > 0 else 0, 1 if rate > 0 else 0)
+
+    def forget(self, key):
+        """Аппарат пропал (мог перезагрузиться): его частоты нужно будет задать заново"""
+        with self._lock:
+            state = self.vehicles.get(key)
+            if state is not None:
+                self.vehicles[key] = _VehicleRates(key, state.profile)
+
+    def reset(self):
+        """Линк закрыт: подтверждения больше не действительны"""
+        with self._lock:
+            self.vehicles = {key: _VehicleRates(key, state.profile) for key, state in self.vehicles.items()
+                             if state.profile is not None}
+            self._window = None
+            self._calm = 0
+
+    def tick(self, now):
+        """Измерение линка и понижение/повышение профиля (поток ввода-вывода)"""
+        connection = self.link.connection
+        if connection is None or not self.vehicles or not self.link.connected:
+            return
+        counters = (connection.mav.total_bytes_received, connection.mav_count, connection.mav_loss)
+        if self._window is None:
+            self._window = (now, counters)
+            return
+        start, base = self._window
+        elapsed = now - start
+        if elapsed < self.WINDOW:
+            return
+        self._window = (now, counters)
+
+        received = counters[1] - base[1]
+        lost = counters[2] - base[2]
+        self.bandwidth = (counters[0] - base[0]) / elapsed
+        self.loss = lost / (received + lost) if received + lost else 0.0
+
+        limit = self.link.bandwidth_limit
+        budget = limit * self.BANDWIDTH_HEADROOM if limit else None
+        if self.loss > self.LOSS_STEP_DOWN or (budget is not None and self.bandwidth > budget):
+            self._calm = 0
+            if self.level < len(self.LEVELS) - 1:
+                self._set_level(self.level + 1)
+            return
+        # Повышение удвоит поток - проверяем, что он поместится в бюджет
+        factor = self.LEVELS[self.level - 1] / self.LEVELS[self.level] if self.level else 1.0
+        if self.level and self.loss < self.LOSS_STEP_UP and (budget is None or self.bandwidth * factor < budget):
+            self._calm += 1
+            if self._calm >= self.CALM_WINDOWS:
+                self._calm = 0
+                self._set_level(self.level - 1)
+        else:
+            self._calm = 0
+
+    def _set_level(self, level):
+        lowered = level > self.level
+        self.level = level
+        # Следующее измерение - уже с новыми частотами
+        self._window = None
+        arrow = "📉" if lowered else "📈"
+        self.link.message_received.emit(
+            f"{arrow} {self.link.link_id}: втрати {self.loss:.1%}, {self.bandwidth / 1024:.1f} КБ/с - "
+            f"частоти потоків {self.LEVELS[level]:.0%} профілю")
+        for key in list(self.vehicles):
+            self.apply(key)
@@ -0,0 +1,75 @@
+import threading
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+
+class TelemetryCoalescer(QObject):
+    """Объединение изменений телеметрии в кадры фиксированной частоты
+
+    Поток приема только отмечает измененные поля (update), а таймер GUI потока
+    публикует не больше одного кадра на аппарат за такт и только с теми полями,
+    которые изменились с прошлого кадра. Пока окно скрыто, частота снижается.
+    """
+    frame_ready = pyqtSignal(object, dict)
+
+    DEFAULT_RATE = 30  # Гц
+    HIDDEN_RATE = 2  # Гц, когда окно свернуто или скрыто
+
+    def __init__(self, rate_hz=DEFAULT_RATE, hidden_rate_hz=HIDDEN_RATE, parent=None):
+        super().__init__(parent)
+        self.rate_hz = rate_hz
+        self.hidden_rate_hz = hidden_rate_hz
+        self.visible = True
+        self._dirty = {}
+        self._lock = threading.Lock()
+        # Трассировка задержек (LatencyTracer), только пока включена
+        self.tracer = None
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self.flush)
+        self._apply_rate()
+        self._timer.start()
+
+    def update(self, vehicle_id, changed):
+        """Отметка измененных полей (можно вызывать из любого потока)"""
+        with self._lock:
+            pending = self._dirty.get(vehicle_id)
+            if pending is None:
+                self._dirty[vehicle_id] = dict(changed)
+            else:
+                pending.update(changed)
+
+    def forget(self, vehicle_id):
+        with self._lock:
+            self._dirty.pop(vehicle_id, None)
+
+    def set_rate(self, rate_hz):
+        """Частота кадров для видимого окна (например 20/30/60 Гц)"""
+        self.rate_hz = rate_hz
+        self._apply_rate()
+
+    def set_visible(self, visible):
+        if visible != self.visible:
+            self.visible = visible
+            self._apply_rate()
+
+    def current_rate(self):
+        return self.rate_hz if self.visible else min(self.rate_hz, self.hidden_rate_hz)
+
+    def _apply_rate(self):
+        self._timer.setInterval(max(1, int(1000 / self.current_rate())))
+
+    def flush(self):
+        """Публикация накопленных изменений (GUI поток)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            frames, self._dirty = self._dirty, {}
+        tracer = self.tracer
+        for vehicle_id, changed in frames.items():
+            if tracer is not None:
+                tracer.emitted(vehicle_id)
+            self.frame_ready.emit(vehicle_id, changed)
+
+    def stop(self):
+        self._timer.stop()
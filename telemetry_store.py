@@ -0,0 +1,192 @@
+import threading
+import time
+from array import array
+import numpy as np
+
+
+# Поля телеметрии и их значения по умолчанию
+TELEMETRY_FIELDS = {
+    'lat': 0.0,
+    'lon': 0.0,
+    'alt': 0.0,
+    'relative_alt': 0.0,
+    'heading': 0.0,
+    'groundspeed': 0.0,
+    'airspeed': 0.0,
+    'battery_voltage': 0.0,
+    'battery_current': 0.0,
+    'battery_remaining': 0,
+    'mode': 'UNKNOWN',
+    'armed': False,
+    'gps_fix': 0,
+    'satellites': 0,
+    'roll': 0.0,
+    'pitch': 0.0,
+    'yaw': 0.0,
+    'ekf_flags': 0,
+    'ekf_ok': False,
+}
+
+# Значения, которые пишутся в историю (bool - подкласс int); остальные пропускаются
+HISTORY_TYPES = (int, float, np.integer, np.floating)
+
+# Тип колонки истории (код array); строковые поля в историю не пишутся
+FIELD_TYPECODES = {
+    'battery_remaining': 'i',
+    'gps_fix': 'i',
+    'satellites': 'i',
+    'ekf_flags': 'i',
+    'armed': 'b',
+    'ekf_ok': 'b',
+}
+
+
+class TelemetrySnapshot:
+    """Последние значения телеметрии аппарата (запись со __slots__ вместо копий dict)
+
+    Поля, добавленные сторонними декодерами, хранятся в extra.
+    """
+    __slots__ = tuple(TELEMETRY_FIELDS) + ('timestamp', 'extra')
+
+    def __init__(self):
+        for field, default in TELEMETRY_FIELDS.items():
+            setattr(self, field, default)
+        self.timestamp = 0.0
+        self.extra = {}
+
+    def get(self, field, default=None):
+        if field in TELEMETRY_FIELDS:
+            return getattr(self, field)
+        return self.extra.get(field, default)
+
+    def update(self, values, timestamp=None):
+        for field, value in values.items():
+            if field in TELEMETRY_FIELDS:
+                setattr(self, field, value)
+            else:
+                self.extra[field] = value
+        if timestamp is not None:
+            self.timestamp = timestamp
+
+    def copy(self):
+        snapshot = TelemetrySnapshot.__new__(TelemetrySnapshot)
+        for field in TELEMETRY_FIELDS:
+            setattr(snapshot, field, getattr(self, field))
+        snapshot.timestamp = self.timestamp
+        snapshot.extra = dict(self.extra)
+        return snapshot
+
+    def as_dict(self):
+        values = {field: getattr(self, field) for field in TELEMETRY_FIELDS}
+        values.update(self.extra)
+        return values
+
+
+class RingColumn:
+    """Кольцевой буфер (время, значение) на заранее выделенных типизированных массивах"""
+
+    def __init__(self, capacity, typecode='d'):
+        self.capacity = capacity
+        self.times = array('d', bytes(8 * capacity))
+        self.values = array(typecode, bytes(array(typecode).itemsize * capacity))
+        self.head = 0  # индекс следующей записи
+        self.count = 0
+
+    def append(self, timestamp, value):
+        head = self.head
+        self.times[head] = timestamp
+        self.values[head] = value
+        head += 1
+        self.head = 0 if head == self.capacity else head
+        if self.count < self.capacity:
+            self.count += 1
+
+    def ordered(self):
+        """Копия содержимого в хронологическом порядке (numpy массивы)"""
+        times = np.frombuffer(self.times, dtype=np.float64)
+        values = np.frombuffer(self.values, dtype=np.dtype(self.values.typecode))
+        if self.count < self.capacity:
+            return times[:self.count].copy(), values[:self.count].copy()
+        head = self.head
+        return (np.concatenate((times[head:], times[:head])),
+                np.concatenate((values[head:], values[:head])))
+
+
+class VehicleHistory:
+    """История телеметрии одного аппарата: по колонке на поле, с временными метками"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.columns = {}
+        self._lock = threading.Lock()
+
+    def append(self, changed, timestamp):
+        with self._lock:
+            for field, value in changed.items():
+                if not isinstance(value, HISTORY_TYPES):
+                    # Строки и значения нестандартных декодеров (списки, dict) в историю не пишутся
+                    continue
+                column = self.columns.get(field)
+                if column is None:
+                    column = RingColumn(self.capacity, FIELD_TYPECODES.get(field, 'd'))
+                    self.columns[field] = column
+                column.append(timestamp, value)
+
+    def window(self, field, seconds, now=None):
+        """Значения поля за последние seconds секунд: (times, values)"""
+        with self._lock:
+            column = self.columns.get(field)
+            if column is None:
+                return np.empty(0), np.empty(0)
+            times, values = column.ordered()
+        if now is None:
+            now = time.time()
+        start = np.searchsorted(times, now - seconds, side='left')
+        return times[start:], values[start:]
+
+    def fields(self):
+        with self._lock:
+            return list(self.columns)
+
+    def memory_bytes(self):
+        with self._lock:
+            return sum(c.times.itemsize * c.capacity + c.values.itemsize * c.capacity
+                       for c in self.columns.values())
+
+
+class TelemetryStore:
+    """История телеметрии всех аппаратов с ограниченной памятью на аппарат
+
+    append() вызывается из потока приема и стоит O(1) на поле, запросы окна
+    (например, "последние 60 с relative_alt") выполняются векторно через NumPy.
+    """
+    DEFAULT_CAPACITY = 4096  # отсчетов на поле (~7 минут при 10 Гц)
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._vehicles = {}
+        self._lock = threading.Lock()
+
+    def vehicle(self, vehicle_id):
+        history = self._vehicles.get(vehicle_id)
+        if history is None:
+            with self._lock:
+                history = self._vehicles.setdefault(vehicle_id, VehicleHistory(self.capacity))
+        return history
+
+    def append(self, vehicle_id, changed, timestamp):
+        self.vehicle(vehicle_id).append(changed, timestamp)
+
+    def window(self, vehicle_id, field, seconds, now=None):
+        history = self._vehicles.get(vehicle_id)
+        if history is None:
+            return np.empty(0), np.empty(0)
+        return history.window(field, seconds, now)
+
+    def vehicle_ids(self):
+        with self._lock:
+            return list(self._vehicles)
+
+    def forget(self, vehicle_id):
+        with self._lock:
+            self._vehicles.pop(vehicle_id, None)
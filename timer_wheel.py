@@ -0,0 +1,89 @@
+import math
+
+
+class TimerWheel:
+    """Хешированное колесо таймеров для большого числа однотипных таймаутов
+
+    Ключ попадает в корзину своего срока; advance() просматривает только
+    корзины прошедших тактов. Перенос срока на более поздний (новый heartbeat)
+    - запись в словарь без перестановки: ключ перекладывается в нужную
+    корзину, когда до него дойдет колесо. Не потокобезопасно - используется
+    из потока ввода-вывода линка.
+    """
+
+    def __init__(self, tick=0.05, slots=256):
+        self.tick = tick
+        self.slots = slots
+        self._wheel = [set() for _ in range(slots)]
+        self._deadlines = {}  # ключ -> срок (time.monotonic)
+        self._slotted = {}  # ключ -> номер такта корзины, в которой он лежит
+        self._current = None
+
+    def __len__(self):
+        return len(self._deadlines)
+
+    def __contains__(self, key):
+        return key in self._deadlines
+
+    def _tick_of(self, moment):
+        return math.ceil(moment / self.tick)
+
+    def _insert(self, key, tick):
+        if self._current is not None and tick <= self._current:
+            tick = self._current + 1
+        self._slotted[key] = tick
+        self._wheel[tick % self.slots].add(key)
+
+    def schedule(self, key, deadline):
+        """Установка или перенос срока ключа"""
+        self._deadlines[key] = deadline
+        tick = self._tick_of(deadline)
+        slotted = self._slotted.get(key)
+        if slotted is None:
+            self._insert(key, tick)
+        elif tick < slotted:
+            # Срок приблизился - перекладываем сразу, иначе колесо пропустит его
+            self._wheel[slotted % self.slots].discard(key)
+            self._insert(key, tick)
+
+    def cancel(self, key):
+        self._deadlines.pop(key, None)
+        slotted = self._slotted.pop(key, None)
+        if slotted is not None:
+            self._wheel[slotted % self.slots].discard(key)
+
+    def clear(self):
+        for slot in self._wheel:
+            slot.clear()
+        self._deadlines.clear()
+        self._slotted.clear()
+
+    def advance(self, now):
+        """Ключи, срок которых истек к моменту now (они снимаются с колеса)"""
+        target = int(now / self.tick)
+        if self._current is None:
+            self._current = target - 1
+        if target <= self._current:
+            return []
+        # После долгой паузы достаточно одного оборота: сверяются номера тактов
+        first = max(self._current + 1, target - self.slots + 1)
+        self._current = target
+        expired = []
+        for tick in range(first, target + 1):
+            slot = self._wheel[tick % self.slots]
+            if not slot:
+                continue
+            for key in list(slot):
+                if self._slotted[key] > target:
+                    # Ключ следующего оборота колеса
+                    continue
+                slot.discard(key)
+                deadline = self._deadlines[key]
+                if deadline <= now:
+                    del self._slotted[key]
+                    del self._deadlines[key]
+                    expired.append(key)
+                else:
+                    # Срок переносили - кладем в корзину нового срока
+                    self._insert(key, self._tick_of(deadline))
+        return expired
@@ -0,0 +1,248 @@
+import bisect
+import datetime
+import mmap
+import os
+import re
+import struct
+import threading
+
+
+# Каждая запись tlog: 8 байт времени приема (мкс, big-endian) + сырой кадр MAVLink
+TIMESTAMP = struct.Struct('>Q')
+INDEX_ENTRY = struct.Struct('<QQ')  # время (мкс), смещение записи в .tlog
+INDEX_MAGIC = b'TLIX0001'
+
+# Скорость воспроизведения "без ожидания": кадры отдаются сразу
+REPLAY_MAX_SPEED = 0
+
+MAVLINK_V1_MAGIC = 0xFE
+MAVLINK_V2_MAGIC = 0xFD
+
+
+def frame_length(buf, offset):
+    """Длина кадра MAVLink по заголовку или 0, если по смещению нет кадра"""
+    if offset + 2 > len(buf):
+        return 0
+    magic = buf[offset]
+    if magic == MAVLINK_V1_MAGIC:
+        return buf[offset + 1] + 8
+    if magic == MAVLINK_V2_MAGIC:
+        if offset + 3 > len(buf):
+            return 0
+        signed = buf[offset + 2] & 0x01
+        return buf[offset + 1] + 12 + (13 if signed else 0)
+    return 0
+
+
+class TlogRecorder:
+    """Запись сырых кадров одного линка в append-only tlog через mmap
+
+    record() вызывается в потоке приема и только дописывает кадр в буфер в
+    памяти; в файл буфер переносит flush() из отдельного потока записи.
+    Рядом пишется разреженный индекс времени (.idx), по которому любой момент
+    многочасового полета открывается без полного просмотра файла.
+    """
+    CHUNK_SIZE = 8 * 1024 * 1024  # файл растет блоками
+    INDEX_INTERVAL = 1.0  # секунд между записями индекса
+
+    def __init__(self, path):
+        self.path = path
+        self.index_path = path + '.idx'
+        self._pending = bytearray()
+        self._pending_index = []
+        self._last_index_us = -1
+        self._offset_in_pending = 0
+        self._lock = threading.Lock()
+
+        self._file = open(path, 'w+b')
+        self._index_file = open(self.index_path, 'wb')
+        self._index_file.write(INDEX_MAGIC)
+        self._size = 0
+        self._capacity = 0
+        self._map = None
+        self._grow(self.CHUNK_SIZE)
+        self.frames = 0
+        self.closed = False
+
+    def record(self, timestamp, frame):
+        """Добавление кадра в буфер (поток приема)"""
+        usec = int(timestamp * 1e6)
+        with self._lock:
+            if usec - self._last_index_us >= self.INDEX_INTERVAL * 1e6:
+                # Смещение будущей записи в файле: уже записанное + буфер
+                self._pending_index.append((usec, self._offset_in_pending + len(self._pending)))
+                self._last_index_us = usec
+            self._pending += TIMESTAMP.pack(usec)
+            self._pending += frame
+            self.frames += 1
+
+    def flush(self):
+        """Перенос буфера в файл (поток записи)"""
+        with self._lock:
+            if not self._pending:
+                return
+            data, self._pending = self._pending, bytearray()
+            index, self._pending_index = self._pending_index, []
+            self._offset_in_pending += len(data)
+        if self.closed:
+            return
+
+        end = self._size + len(data)
+        if end > self._capacity:
+            self._grow(max(end, self._capacity + self.CHUNK_SIZE))
+        self._map[self._size:end] = data
+        self._size = end
+
+        if index:
+            self._index_file.write(b''.join(INDEX_ENTRY.pack(usec, offset) for usec, offset in index))
+            self._index_file.flush()
+
+    def _grow(self, capacity):
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+        self._file.truncate(capacity)
+        self._capacity = capacity
+        self._map = mmap.mmap(self._file.fileno(), capacity)
+
+    def close(self):
+        """Сброс буфера и обрезка файла до реального размера"""
+        if self.closed:
+            return
+        self.flush()
+        self.closed = True
+        self._map.flush()
+        self._map.close()
+        self._map = None
+        self._file.truncate(self._size)
+        self._file.close()
+        self._index_file.close()
+
+
+class RecordingSession:
+    """Запись всех линков сеанса в отдельные tlog с общим потоком записи"""
+    FLUSH_INTERVAL = 0.25  # секунд
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.started = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.recorders = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._flush_loop, name="tlog-writer", daemon=True)
+        self._thread.start()
+
+    def recorder_for(self, link_id):
+        """Recorder линка (создается при первом обращении)"""
+        with self._lock:
+            recorder = self.recorders.get(link_id)
+            if recorder is None:
+                name = re.sub(r'[^A-Za-z0-9_.-]+', '_', link_id).strip('_')
+                path = os.path.join(self.directory, f"{self.started}_{name}.tlog")
+                recorder = TlogRecorder(path)
+                self.recorders[link_id] = recorder
+            return recorder
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.FLUSH_INTERVAL):
+            with self._lock:
+                recorders = list(self.recorders.values())
+            for recorder in recorders:
+                recorder.flush()
+
+    def close(self):
+        self._stop.set()
+        self._thread.join(timeout=2)
+        with self._lock:
+            for recorder in self.recorders.values():
+                recorder.close()
+
+
+class TlogReader:
+    """Чтение tlog через mmap с переходом к моменту времени по индексу"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ) if size else b''
+        self.index_times, self.index_offsets = self._load_index(path + '.idx')
+        if not self.index_times:
+            self._build_index()
+
+    def _load_index(self, index_path):
+        times, offsets = [], []
+        try:
+            with open(index_path, 'rb') as f:
+                if f.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+                    return times, offsets
+                data = f.read()
+        except OSError:
+            return times, offsets
+        usable = len(data) - len(data) % INDEX_ENTRY.size
+        for usec, offset in INDEX_ENTRY.iter_unpack(data[:usable]):
+            if offset >= len(self._map):
+                break
+            times.append(usec)
+            offsets.append(offset)
+        return times, offsets
+
+    def _build_index(self):
+        """Индекс для файла без .idx (один проход по заголовкам кадров)"""
+        last = -1
+        for usec, offset, _ in self._scan(0):
+            if usec - last >= TlogRecorder.INDEX_INTERVAL * 1e6:
+                self.index_times.append(usec)
+                self.index_offsets.append(offset)
+                last = usec
+
+    @property
+    def start_time(self):
+        return self.index_times[0] / 1e6 if self.index_times else 0.0
+
+    @property
+    def end_time(self):
+        """Время последнего кадра (просмотр только хвоста после последней точки индекса)"""
+        if not self.index_times:
+            return 0.0
+        last = self.index_times[-1]
+        for usec, _, _ in self._scan(self.index_offsets[-1]):
+            last = usec
+        return last / 1e6
+
+    def offset_for(self, timestamp):
+        """Смещение ближайшей точки индекса не позже timestamp"""
+        if not self.index_times:
+            return 0
+        pos = bisect.bisect_right(self.index_times, int(timestamp * 1e6)) - 1
+        return self.index_offsets[max(pos, 0)]
+
+    def frames(self, start_time=None):
+        """Генератор (время приема, сырой кадр) начиная с момента start_time"""
+        offset = 0 if start_time is None else self.offset_for(start_time)
+        start_us = None if start_time is None else int(start_time * 1e6)
+        header = TIMESTAMP.size
+        for usec, record_offset, length in self._scan(offset):
+            if start_us is not None and usec < start_us:
+                continue
+            frame_offset = record_offset + header
+            yield usec / 1e6, self._map[frame_offset:frame_offset + length]
+
+    def _scan(self, offset):
+        buf = self._map
+        size = len(buf)
+        header = TIMESTAMP.size
+        while offset + header < size:
+            usec = TIMESTAMP.unpack_from(buf, offset)[0]
+            length = frame_length(buf, offset + header)
+            # Нулевая длина - конец данных (хвост файла после аварийного завершения)
+            if usec == 0 or length == 0 or offset + header + length > size:
+                return
+            yield usec, offset, length
+            offset += header + length
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file '/root/package/UI_HUD.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.10
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_DroneControlWindow(object):
+    def setupUi(self, DroneControlWindow):
+        DroneControlWindow.setObjectName("DroneControlWindow")
+        DroneControlWindow.resize(1200, 800)
+        DroneControlWindow.setMinimumSize(QtCore.QSize(800, 600))
+        self.centralwidget = QtWidgets.QWidget(DroneControlWindow)
+        self.centralwidget.setStyleSheet("\n"
+"QWidget#centralwidget {\n"
+"    background-color: #0f1619;\n"
+"    color: #dbe7f3;\n"
+"    font-family: \"Inter\", \"Roboto\", \"Segoe UI\", sans-serif;\n"
+"    font-size: 12pt;\n"
+"}\n"
+"\n"
+"QFrame#leftPanel, QFrame#centerPanel, QFrame#rightPanel {\n"
+"    background-color: rgba(20,28,33,0.7);\n"
+"    border-radius: 12px;\n"
+"    border: 1px solid rgba(255,255,255,0.04);\n"
+"    margin: 6px;\n"
+"}\n"
+"\n"
+"QFrame#hudFrame {\n"
+"    background-color: rgba(10,14,16,0.6);\n"
+"    border-top: 1px solid rgba(255,255,255,0.03);\n"
+"}\n"
+"\n"
+"QLabel#radarTitle, QLabel#videoTitle, QLabel#settingsTitle {\n"
+"    color: #e6f0fa;\n"
+"    font-size: 16pt;\n"
+"    font-weight: 700;\n"
+"}\n"
+"\n"
+"QPushButton {\n"
+"    background-color: #1e2a30;\n"
+"    color: #dbe7f3;\n"
+"    border-radius: 8px;\n"
+"    padding: 6px 12px;\n"
+"    min-height: 32px;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #26343d;\n"
+"}\n"
+"QPushButton:pressed {\n"
+"    background-color: #1a2429;\n"
+"}\n"
+"\n"
+"QTextEdit, QPlainTextEdit {\n"
+"    background-color: rgba(30,42,48,0.8);\n"
+"    border: 1px solid rgba(255,255,255,0.1);\n"
+"    border-radius: 8px;\n"
+"    color: #dbe7f3;\n"
+"    padding: 8px;\n"
+"    font-family: \"Consolas\", \"Monaco\", monospace;\n"
+"    font-size: 11pt;\n"
+"}\n"
+"    ")
+        self.centralwidget.setObjectName("centralwidget")
+        self.mainVerticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.mainVerticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.mainVerticalLayout.setSpacing(0)
+        self.mainVerticalLayout.setObjectName("mainVerticalLayout")
+        self.mainHorizontalLayout = QtWidgets.QHBoxLayout()
+        self.mainHorizontalLayout.setSpacing(0)
+        self.mainHorizontalLayout.setObjectName("mainHorizontalLayout")
+        self.leftPanel = QtWidgets.QFrame(self.centralwidget)
+        self.leftPanel.setMinimumSize(QtCore.QSize(250, 0))
+        self.leftPanel.setMaximumSize(QtCore.QSize(350, 16777215))
+        self.leftPanel.setObjectName("leftPanel")
+        self.leftPanelLayout = QtWidgets.QVBoxLayout(self.leftPanel)
+        self.leftPanelLayout.setContentsMargins(12, 12, 12, 12)
+        self.leftPanelLayout.setSpacing(12)
+        self.leftPanelLayout.setObjectName("leftPanelLayout")
+        self.radarTitle = QtWidgets.QLabel(self.leftPanel)
+        self.radarTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.radarTitle.setObjectName("radarTitle")
+        self.leftPanelLayout.addWidget(self.radarTitle)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.leftPanelLayout.addItem(spacerItem)
+        self.mainHorizontalLayout.addWidget(self.leftPanel)
+        self.centerPanel = QtWidgets.QFrame(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.centerPanel.sizePolicy().hasHeightForWidth())
+        self.centerPanel.setSizePolicy(sizePolicy)
+        self.centerPanel.setMinimumSize(QtCore.QSize(300, 0))
+        self.centerPanel.setObjectName("centerPanel")
+        self.centerPanelLayout = QtWidgets.QVBoxLayout(self.centerPanel)
+        self.centerPanelLayout.setContentsMargins(12, 12, 12, 12)
+        self.centerPanelLayout.setSpacing(12)
+        self.centerPanelLayout.setObjectName("centerPanelLayout")
+        self.videoTitle = QtWidgets.QLabel(self.centerPanel)
+        self.videoTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.videoTitle.setObjectName("videoTitle")
+        self.centerPanelLayout.addWidget(self.videoTitle)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.centerPanelLayout.addItem(spacerItem1)
+        self.armDisarmLayout = QtWidgets.QHBoxLayout()
+        self.armDisarmLayout.setObjectName("armDisarmLayout")
+        self.armButton = QtWidgets.QPushButton(self.centerPanel)
+        self.armButton.setEnabled(True)
+        self.armButton.setObjectName("armButton")
+        self.armDisarmLayout.addWidget(self.armButton)
+        self.disarmButton = QtWidgets.QPushButton(self.centerPanel)
+        self.disarmButton.setEnabled(True)
+        self.disarmButton.setObjectName("disarmButton")
+        self.armDisarmLayout.addWidget(self.disarmButton)
+        self.centerPanelLayout.addLayout(self.armDisarmLayout)
+        self.connectionLayout = QtWidgets.QHBoxLayout()
+        self.connectionLayout.setObjectName("connectionLayout")
+        self.stopButton = QtWidgets.QPushButton(self.centerPanel)
+        self.stopButton.setObjectName("stopButton")
+        self.connectionLayout.addWidget(self.stopButton)
+        self.connectButton = QtWidgets.QPushButton(self.centerPanel)
+        self.connectButton.setObjectName("connectButton")
+        self.connectionLayout.addWidget(self.connectButton)
+        self.centerPanelLayout.addLayout(self.connectionLayout)
+        self.startButton = QtWidgets.QPushButton(self.centerPanel)
+        self.startButton.setStyleSheet("\n"
+"QPushButton {\n"
+"    background-color: #2e7d32;\n"
+"    color: white;\n"
+"    border: none;\n"
+"    border-radius: 8px;\n"
+"    padding: 8px 16px;\n"
+"    font-weight: bold;\n"
+"    min-height: 36px;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #388e3c;\n"
+"}\n"
+"QPushButton:pressed {\n"
+"    background-color: #1b5e20;\n"
+"}\n"
+"            ")
+        self.startButton.setObjectName("startButton")
+        self.centerPanelLayout.addWidget(self.startButton)
+        self.mainHorizontalLayout.addWidget(self.centerPanel)
+        self.rightPanel = QtWidgets.QFrame(self.centralwidget)
+        self.rightPanel.setMinimumSize(QtCore.QSize(250, 0))
+        self.rightPanel.setMaximumSize(QtCore.QSize(400, 16777215))
+        self.rightPanel.setObjectName("rightPanel")
+        self.rightPanelLayout = QtWidgets.QVBoxLayout(self.rightPanel)
+        self.rightPanelLayout.setContentsMargins(12, 12, 12, 12)
+        self.rightPanelLayout.setSpacing(12)
+        self.rightPanelLayout.setObjectName("rightPanelLayout")
+        self.settingsTitle = QtWidgets.QLabel(self.rightPanel)
+        self.settingsTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.settingsTitle.setObjectName("settingsTitle")
+        self.rightPanelLayout.addWidget(self.settingsTitle)
+        self.logsTextEdit = QtWidgets.QPlainTextEdit(self.rightPanel)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.logsTextEdit.sizePolicy().hasHeightForWidth())
+        self.logsTextEdit.setSizePolicy(sizePolicy)
+        self.logsTextEdit.setMinimumSize(QtCore.QSize(0, 200))
+        self.logsTextEdit.setReadOnly(True)
+        self.logsTextEdit.setObjectName("logsTextEdit")
+        self.rightPanelLayout.addWidget(self.logsTextEdit)
+        self.mainHorizontalLayout.addWidget(self.rightPanel)
+        self.mainVerticalLayout.addLayout(self.mainHorizontalLayout)
+        self.hudFrame = QtWidgets.QFrame(self.centralwidget)
+        self.hudFrame.setMinimumSize(QtCore.QSize(0, 80))
+        self.hudFrame.setMaximumSize(QtCore.QSize(16777215, 120))
+        self.hudFrame.setObjectName("hudFrame")
+        self.hudLayout = QtWidgets.QHBoxLayout(self.hudFrame)
+        self.hudLayout.setContentsMargins(12, 12, 12, 12)
+        self.hudLayout.setSpacing(12)
+        self.hudLayout.setObjectName("hudLayout")
+        self.statusLabel = QtWidgets.QLabel(self.hudFrame)
+        self.statusLabel.setStyleSheet("font: 26pt \"MS Shell Dlg 2\";")
+        self.statusLabel.setObjectName("statusLabel")
+        self.hudLayout.addWidget(self.statusLabel)
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.hudLayout.addItem(spacerItem2)
+        self.settingsButton = QtWidgets.QPushButton(self.hudFrame)
+        self.settingsButton.setMaximumSize(QtCore.QSize(200, 16777215))
+        self.settingsButton.setObjectName("settingsButton")
+        self.hudLayout.addWidget(self.settingsButton)
+        self.mainVerticalLayout.addWidget(self.hudFrame)
+        DroneControlWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(DroneControlWindow)
+        QtCore.QMetaObject.connectSlotsByName(DroneControlWindow)
+
+    def retranslateUi(self, DroneControlWindow):
+        _translate = QtCore.QCoreApplication.translate
+        DroneControlWindow.setWindowTitle(_translate("DroneControlWindow", "Інтерфейс Управління Дронами"))
+        self.radarTitle.setText(_translate("DroneControlWindow", "Телеметрiя"))
+        self.videoTitle.setText(_translate("DroneControlWindow", "Список дронiв"))
+        self.armButton.setText(_translate("DroneControlWindow", "🔫 ARM"))
+        self.disarmButton.setText(_translate("DroneControlWindow", "🛡️ DISARM"))
+        self.stopButton.setText(_translate("DroneControlWindow", "Підключити"))
+        self.connectButton.setText(_translate("DroneControlWindow", "Відключити"))
+        self.startButton.setText(_translate("DroneControlWindow", "🚁 Швидке підключення"))
+        self.settingsTitle.setText(_translate("DroneControlWindow", "Логи"))
+        self.logsTextEdit.setPlainText(_translate("DroneControlWindow", "Система готова до роботи...\n"
+"Очікування підключення дрона..."))
+        self.statusLabel.setText(_translate("DroneControlWindow", "Готовий"))
+        self.settingsButton.setText(_translate("DroneControlWindow", "⚙ Налаштування"))
+
+
+UI_SOURCE_HASH = '0637143db64efaddca39cea72be8cdbc11e33e15'